@@ -0,0 +1,52 @@
+# benchmarks/conftest.py
+"""Shared setup for the benchmark suite.
+
+Benchmarks use pytest-benchmark and are kept out of the default test run
+(``testpaths = tests``). Run them explicitly:
+- Installed mode (default): ``poetry run poe bench``
+- Standalone mode: ``RUNTIME_MODE=singlefile poetry run poe bench``
+
+``poe bench:save`` saves a baseline for both modes and ``poe bench:compare``
+fails if a benchmark got more than 20% slower than it.
+"""
+
+import io
+import logging
+import sys
+import uuid
+from collections.abc import Generator
+from typing import TYPE_CHECKING
+
+import pytest
+
+from tests.utils import runtime_swap
+
+
+# early jank hook, same as tests/conftest.py
+runtime_swap()
+
+# Import after runtime_swap to ensure we get the right module
+import apathetic_logging as mod_alogs  # noqa: E402
+
+
+if TYPE_CHECKING:
+    from apathetic_logging import Logger  # noqa: ICN003
+else:
+    Logger = mod_alogs.Logger
+
+
+@pytest.fixture
+def null_streams(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Point stdout/stderr at throwaway buffers so benchmarks don't hit a tty."""
+    monkeypatch.setattr(sys, "stdout", io.StringIO())
+    monkeypatch.setattr(sys, "stderr", io.StringIO())
+
+
+@pytest.fixture
+def bench_logger(null_streams: None) -> Generator[Logger, None, None]:  # noqa: ARG001
+    """Create a fresh apathetic Logger at DETAIL level writing to null streams."""
+    name = f"bench_logger_{uuid.uuid4().hex[:6]}"
+    logger = Logger(name, enable_color=False)
+    logger.setLevel("detail")
+    yield logger
+    logging.Logger.manager.loggerDict.pop(name, None)
@@ -0,0 +1,41 @@
+# benchmarks/test_bench_async_handler.py
+"""Benchmarks for caller-side latency in sync vs async mode."""
+
+from collections.abc import Generator
+from typing import TYPE_CHECKING
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+import apathetic_logging as mod_alogs
+
+
+if TYPE_CHECKING:
+    from apathetic_logging import Logger  # noqa: ICN003
+else:
+    Logger = mod_alogs.Logger
+
+
+@pytest.fixture
+def async_mode(request: pytest.FixtureRequest) -> Generator[bool, None, None]:
+    """Enable async mode for the benchmark when parametrized with True."""
+    enabled: bool = request.param
+    mod_alogs.registerAsyncMode(async_mode=enabled)
+    yield enabled
+    mod_alogs.registerAsyncMode(async_mode=False)
+    mod_alogs.stopAsyncWriter()
+
+
+@pytest.mark.parametrize(
+    "async_mode", [False, True], ids=["sync", "async"], indirect=True
+)
+def test_bench_logger_info_caller_latency(
+    benchmark: BenchmarkFixture,
+    bench_logger: Logger,
+    async_mode: bool,  # noqa: ARG001, FBT001
+) -> None:
+    """Time spent on the calling thread for one info() record."""
+    bench_logger.info("warm up")
+    benchmark(bench_logger.info, "benchmark message %s", "arg")
+    for handler in bench_logger.handlers:
+        handler.flush()
@@ -0,0 +1,86 @@
+# benchmarks/test_bench_asyncio.py
+"""Benchmarks for logging from many concurrent asyncio tasks."""
+
+import asyncio
+import io
+import sys
+import time
+from collections.abc import Generator
+from typing import TYPE_CHECKING
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+import apathetic_logging as mod_alogs
+
+
+if TYPE_CHECKING:
+    from apathetic_logging import Logger  # noqa: ICN003
+else:
+    Logger = mod_alogs.Logger
+
+TASKS = 1000
+RECORDS_PER_TASK = 5
+
+
+class _SlowStream(io.StringIO):
+    """A stream whose writes take a little while, like a busy pipe or tty."""
+
+    def write(self, s: str) -> int:
+        time.sleep(0.00002)
+        return super().write(s)
+
+
+@pytest.fixture
+def stop_writer() -> Generator[None, None, None]:
+    """Write anything still queued once the benchmark is done."""
+    yield
+    mod_alogs.stopAsyncWriter()
+
+
+async def _sync_task(logger: Logger, task_id: int) -> None:
+    for i in range(RECORDS_PER_TASK):
+        logger.info("task %d record %d", task_id, i)
+        await asyncio.sleep(0)
+
+
+async def _awaitable_task(logger: Logger, task_id: int) -> None:
+    for i in range(RECORDS_PER_TASK):
+        await logger.ainfo("task %d record %d", task_id, i)
+        await asyncio.sleep(0)
+
+
+@pytest.mark.parametrize("stream", ["fast", "slow"])
+@pytest.mark.parametrize("impl", ["info", "ainfo"])
+def test_bench_concurrent_tasks(
+    benchmark: BenchmarkFixture,
+    monkeypatch: pytest.MonkeyPatch,
+    bench_logger: Logger,
+    stop_writer: None,  # noqa: ARG001
+    impl: str,
+    stream: str,
+) -> None:
+    """Time for TASKS tasks each logging RECORDS_PER_TASK records, written.
+
+    With a slow stream, info() stalls every task for each write while
+    ainfo() only hands the record to the writer thread, which writes while
+    the tasks keep running. Each round waits for the writer to finish, so
+    no record is written after the test's streams are restored.
+    """
+    if stream == "slow":
+        monkeypatch.setattr(sys, "stdout", _SlowStream())
+    task = _sync_task if impl == "info" else _awaitable_task
+
+    async def main() -> None:
+        await asyncio.gather(*(task(bench_logger, n) for n in range(TASKS)))
+
+    def run() -> None:
+        asyncio.run(main())
+        mod_alogs.getAsyncWriter().flush()
+
+    bench_logger.info("warm up")
+    benchmark.pedantic(  # type: ignore[no-untyped-call]
+        run,
+        rounds=5,
+        iterations=1,
+    )
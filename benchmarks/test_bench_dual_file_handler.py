@@ -0,0 +1,56 @@
+# benchmarks/test_bench_dual_file_handler.py
+"""Benchmarks for DualFileHandler vs the stdlib RotatingFileHandler."""
+
+import logging
+import logging.handlers
+from collections.abc import Generator
+from pathlib import Path
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+import apathetic_logging as mod_alogs
+
+
+def _make_record() -> logging.LogRecord:
+    return logging.LogRecord(
+        name="bench_dual_file_handler",
+        level=logging.INFO,
+        pathname="",
+        lineno=0,
+        msg="benchmark message %s",
+        args=("arg",),
+        exc_info=None,
+    )
+
+
+@pytest.fixture(params=["stdlib", "dual_file", "dual_file_rotating"])
+def file_handler(
+    request: pytest.FixtureRequest, tmp_path: Path
+) -> Generator[logging.Handler, None, None]:
+    """A size-rotating file handler writing to a temporary directory."""
+    path = tmp_path / "bench.log"
+    handler: logging.Handler
+    if request.param == "stdlib":
+        handler = logging.handlers.RotatingFileHandler(
+            path, maxBytes=64 * 1024 * 1024, backupCount=2
+        )
+    elif request.param == "dual_file":
+        handler = mod_alogs.DualFileHandler(path, max_bytes=64 * 1024 * 1024)
+    else:
+        # rotates (and gzips in the background) about every 10,000 records
+        handler = mod_alogs.DualFileHandler(
+            path, max_bytes=256 * 1024, backup_count=2, compress=True
+        )
+    handler.setFormatter(logging.Formatter("%(levelname)s %(name)s: %(message)s"))
+    yield handler
+    handler.close()
+
+
+def test_bench_file_handler_handle(
+    benchmark: BenchmarkFixture,
+    file_handler: logging.Handler,
+) -> None:
+    """Cost of writing one INFO record through a rotating file handler."""
+    record = _make_record()
+    benchmark(file_handler.handle, record)
@@ -0,0 +1,66 @@
+# benchmarks/test_bench_dual_stream_handler.py
+"""Benchmarks for DualStreamHandler.emit routing."""
+
+import logging
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+import apathetic_logging as mod_alogs
+
+
+def _make_record(level: int) -> logging.LogRecord:
+    record = logging.LogRecord(
+        name="bench_dual_stream_handler",
+        level=level,
+        pathname="",
+        lineno=0,
+        msg="benchmark message %s",
+        args=("arg",),
+        exc_info=None,
+    )
+    record.levelname = logging.getLevelName(level)
+    return record
+
+
+@pytest.mark.parametrize(
+    "level",
+    [
+        mod_alogs.apathetic_logging.DETAIL_LEVEL,
+        logging.INFO,
+        logging.DEBUG,
+        logging.WARNING,
+    ],
+    ids=["detail", "info", "debug", "warning"],
+)
+def test_bench_dual_stream_handler_emit(
+    benchmark: BenchmarkFixture,
+    null_streams: None,  # noqa: ARG001
+    level: int,
+) -> None:
+    """Cost of routing and writing one record through DualStreamHandler."""
+    handler = mod_alogs.apathetic_logging.DualStreamHandler()
+    handler.setFormatter(mod_alogs.apathetic_logging.TagFormatter("%(message)s"))
+    record = _make_record(level)
+    benchmark(handler.emit, record)
+
+
+@pytest.mark.parametrize("buffered", [False, True], ids=["unbuffered", "buffered"])
+def test_bench_dual_stream_handler_detail_burst(
+    benchmark: BenchmarkFixture,
+    null_streams: None,  # noqa: ARG001
+    buffered: bool,  # noqa: FBT001
+) -> None:
+    """Cost of 1000 DETAIL records, flushed once at the end when buffered."""
+    handler = mod_alogs.apathetic_logging.DualStreamHandler(
+        buffered=buffered, flush_interval=60
+    )
+    handler.setFormatter(mod_alogs.apathetic_logging.TagFormatter("%(message)s"))
+    record = _make_record(mod_alogs.apathetic_logging.DETAIL_LEVEL)
+
+    def burst() -> None:
+        for _ in range(1000):
+            handler.handle(record)
+        handler.flush()
+
+    benchmark(burst)
@@ -0,0 +1,50 @@
+# benchmarks/test_bench_ensure_handlers.py
+"""Benchmarks for handler validation on the Logger._log hot path."""
+
+from typing import TYPE_CHECKING
+
+from pytest_benchmark.fixture import BenchmarkFixture
+
+import apathetic_logging as mod_alogs
+
+
+if TYPE_CHECKING:
+    from apathetic_logging import Logger  # noqa: ICN003
+else:
+    Logger = mod_alogs.Logger
+
+
+def test_bench_ensure_handlers_full_check(
+    benchmark: BenchmarkFixture, bench_logger: Logger
+) -> None:
+    """Cost of a full ensureHandlers() stream-identity validation."""
+    bench_logger.ensureHandlers()
+    benchmark(bench_logger.ensureHandlers)
+    assert len(bench_logger.handlers) == 1
+
+
+def test_bench_log_steady_state(
+    benchmark: BenchmarkFixture, bench_logger: Logger
+) -> None:
+    """Cost of an enabled record once handlers are attached (epoch fast path)."""
+    bench_logger.info("warm up")
+    benchmark(bench_logger.info, "steady %s", "state")
+    assert len(bench_logger.handlers) == 1
+
+
+def test_bench_log_forced_validation(
+    benchmark: BenchmarkFixture, bench_logger: Logger
+) -> None:
+    """Cost of an enabled record that re-validates handlers every call.
+
+    Mirrors the pre-epoch behavior; compare against
+    test_bench_log_steady_state for the per-call saving.
+    """
+    bench_logger.info("warm up")
+
+    def log_with_validation() -> None:
+        bench_logger.ensureHandlers()
+        bench_logger.info("steady %s", "state")
+
+    benchmark(log_with_validation)
+    assert len(bench_logger.handlers) == 1
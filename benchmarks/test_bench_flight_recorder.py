@@ -0,0 +1,53 @@
+# benchmarks/test_bench_flight_recorder.py
+"""Benchmarks for the cost of the flight recorder on the logging hot path."""
+
+from collections.abc import Generator
+from typing import TYPE_CHECKING
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+import apathetic_logging as mod_alogs
+
+
+if TYPE_CHECKING:
+    from apathetic_logging import Logger  # noqa: ICN003
+else:
+    Logger = mod_alogs.Logger
+
+
+@pytest.fixture
+def flight_recorder(request: pytest.FixtureRequest) -> Generator[bool, None, None]:
+    """Enable the flight recorder for the benchmark when parametrized with True."""
+    enabled: bool = request.param
+    mod_alogs.registerFlightRecorder(enabled=enabled)
+    yield enabled
+    mod_alogs.registerFlightRecorder(enabled=False)
+
+
+@pytest.mark.parametrize(
+    "flight_recorder", [False, True], ids=["off", "on"], indirect=True
+)
+def test_bench_logger_info_with_flight_recorder(
+    benchmark: BenchmarkFixture,
+    bench_logger: Logger,
+    flight_recorder: bool,  # noqa: ARG001, FBT001
+) -> None:
+    """An info() record that is written, with and without the recorder."""
+    bench_logger.setLevel("info")
+    bench_logger.info("warm up")
+    benchmark(bench_logger.info, "benchmark message %s", "arg")
+
+
+@pytest.mark.parametrize(
+    "flight_recorder", [False, True], ids=["off", "on"], indirect=True
+)
+def test_bench_logger_trace_below_level(
+    benchmark: BenchmarkFixture,
+    bench_logger: Logger,
+    flight_recorder: bool,  # noqa: ARG001, FBT001
+) -> None:
+    """A trace() record below the level: dropped (off) or stored (on)."""
+    bench_logger.setLevel("info")
+    bench_logger.info("warm up")
+    benchmark(bench_logger.trace, "benchmark message %s", "arg")
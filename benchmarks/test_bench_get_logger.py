@@ -0,0 +1,17 @@
+# benchmarks/test_bench_get_logger.py
+"""Benchmarks for getLogger() name resolution."""
+
+from pytest_benchmark.fixture import BenchmarkFixture
+
+import apathetic_logging as mod_alogs
+
+
+def test_bench_get_logger_explicit_name(benchmark: BenchmarkFixture) -> None:
+    """getLogger(__name__) for a logger that already exists."""
+    mod_alogs.getLogger("bench_get_logger")
+    benchmark(mod_alogs.getLogger, "bench_get_logger")
+
+
+def test_bench_get_default_logger_name_inferred(benchmark: BenchmarkFixture) -> None:
+    """Inferring the logger name from the caller's __package__."""
+    benchmark(mod_alogs.getDefaultLoggerName, check_registry=False)
@@ -0,0 +1,129 @@
+# benchmarks/test_bench_hot_path.py
+"""Benchmarks for one logging call end to end, the numbers regressions show in.
+
+These go through the public API (level methods, logDynamic(), getLogger())
+rather than one component, so a slowdown in _log(), ensureHandlers(),
+DualStreamHandler.emit() or TagFormatter.format() moves them. Save a
+baseline with ``poe bench:save`` and check against it with
+``poe bench:compare``.
+"""
+
+import logging
+import uuid
+from collections.abc import Generator
+from typing import TYPE_CHECKING
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+import apathetic_logging as mod_alogs
+
+
+if TYPE_CHECKING:
+    from apathetic_logging import Logger  # noqa: ICN003
+else:
+    Logger = mod_alogs.Logger
+
+
+@pytest.fixture
+def color_logger(
+    null_streams: None,  # noqa: ARG001
+    request: pytest.FixtureRequest,
+) -> Generator[Logger, None, None]:
+    """Fresh Logger at DETAIL level, colored or plain per the param."""
+    name = f"bench_hot_path_{uuid.uuid4().hex[:6]}"
+    logger = Logger(name, enable_color=request.param)
+    logger.setLevel("detail")
+    yield logger
+    logging.Logger.manager.loggerDict.pop(name, None)
+
+
+@pytest.mark.parametrize("method", ["trace", "debug"])
+def test_bench_disabled_level(
+    benchmark: BenchmarkFixture,
+    bench_logger: Logger,
+    method: str,
+) -> None:
+    """A call below the logger level: should cost almost nothing."""
+    benchmark(getattr(bench_logger, method), "not logged %s", "arg")
+
+
+@pytest.mark.parametrize("method", ["info", "detail", "warning"])
+def test_bench_enabled_to_null_stream(
+    benchmark: BenchmarkFixture,
+    bench_logger: Logger,
+    method: str,
+) -> None:
+    """A record formatted and written to a throwaway stdout/stderr."""
+    log = getattr(bench_logger, method)
+    log("warm up")
+    benchmark(log, "benchmark message %s", "arg")
+
+
+@pytest.mark.parametrize(
+    "color_logger", [False, True], ids=["plain", "colored"], indirect=True
+)
+def test_bench_enabled_color(
+    benchmark: BenchmarkFixture,
+    color_logger: Logger,
+) -> None:
+    """A tagged (DETAIL) record with and without ANSI colors."""
+    color_logger.detail("warm up")
+    benchmark(color_logger.detail, "benchmark message %s", "arg")
+
+
+@pytest.mark.parametrize(
+    "fmt",
+    ["%(message)s", "%(funcName)s:%(lineno)d %(message)s"],
+    ids=["no_caller_info", "caller_info"],
+)
+def test_bench_caller_info(
+    benchmark: BenchmarkFixture,
+    bench_logger: Logger,
+    fmt: str,
+) -> None:
+    """info() with a format that skips findCaller() and one that needs it."""
+    bench_logger.info("warm up")
+    bench_logger.handlers[0].setFormatter(mod_alogs.TagFormatter(fmt))
+    benchmark(bench_logger.info, "benchmark message %s", "arg")
+
+
+@pytest.mark.parametrize("call", ["wants_caller_info", "find_caller"])
+def test_bench_caller_info_decision(
+    benchmark: BenchmarkFixture,
+    bench_logger: Logger,
+    call: str,
+) -> None:
+    """The cached skip decision next to the findCaller() walk it saves."""
+    bench_logger.info("warm up")
+    if call == "wants_caller_info":
+        benchmark(bench_logger._wantsCallerInfo)  # noqa: SLF001
+    else:
+        benchmark(bench_logger.findCaller)
+
+
+@pytest.mark.parametrize("level", ["trace", "info"], ids=["disabled", "enabled"])
+def test_bench_log_dynamic_string(
+    benchmark: BenchmarkFixture,
+    bench_logger: Logger,
+    level: str,
+) -> None:
+    """logDynamic() with a level name, below and above the logger level."""
+    bench_logger.logDynamic(level, "warm up")
+    benchmark(bench_logger.logDynamic, level, "benchmark message %s", "arg")
+
+
+def test_bench_get_logger_inferred(benchmark: BenchmarkFixture) -> None:
+    """getLogger() with no name, inferred from this module."""
+
+    def get_logger() -> Logger:
+        return mod_alogs.getLogger()
+
+    get_logger()
+    benchmark(get_logger)
+
+
+def test_bench_get_logger_named(benchmark: BenchmarkFixture) -> None:
+    """getLogger(name) for a logger that already exists."""
+    mod_alogs.getLogger("bench_hot_path_named")
+    benchmark(mod_alogs.getLogger, "bench_hot_path_named")
@@ -0,0 +1,53 @@
+# benchmarks/test_bench_json_formatter.py
+"""Benchmarks for JsonFormatter.format, against json.dumps of the record."""
+
+import json
+import logging
+from typing import Any
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+import apathetic_logging as mod_alogs
+
+
+class _DictJsonFormatter(logging.Formatter):
+    """The usual approach: json.dumps() of the whole record __dict__."""
+
+    def format(self, record: logging.LogRecord, *args: Any, **kwargs: Any) -> str:  # noqa: ARG002
+        record.message = record.getMessage()
+        return json.dumps(record.__dict__, default=str)
+
+
+def _make_record(*, extras: bool) -> logging.LogRecord:
+    record = logging.LogRecord(
+        name="bench_json_formatter",
+        level=logging.INFO,
+        pathname=__file__,
+        lineno=0,
+        msg="benchmark message %s",
+        args=("arg",),
+        exc_info=None,
+    )
+    if extras:
+        record.request_id = "3f2a9c"
+        record.attempt = 2
+    return record
+
+
+@pytest.mark.parametrize("extras", [False, True], ids=["plain", "extras"])
+@pytest.mark.parametrize("impl", ["json_formatter", "json_dumps_dict"])
+def test_bench_json_formatter_format(
+    benchmark: BenchmarkFixture,
+    impl: str,
+    *,
+    extras: bool,
+) -> None:
+    """Records/sec for JsonFormatter.format vs json.dumps(record.__dict__)."""
+    if impl == "json_formatter":
+        formatter: logging.Formatter = mod_alogs.JsonFormatter()
+    else:
+        formatter = _DictJsonFormatter()
+    record = _make_record(extras=extras)
+    result = benchmark(formatter.format, record)
+    assert json.loads(result)["message"] == "benchmark message arg"
@@ -0,0 +1,36 @@
+# benchmarks/test_bench_lazy.py
+"""Benchmarks for disabled TRACE calls with eager vs lazy payloads."""
+
+import json
+from typing import TYPE_CHECKING
+
+from pytest_benchmark.fixture import BenchmarkFixture
+
+import apathetic_logging as mod_alogs
+
+
+if TYPE_CHECKING:
+    from apathetic_logging import Logger  # noqa: ICN003
+else:
+    Logger = mod_alogs.Logger
+
+
+_PAYLOAD = {f"key_{i}": list(range(20)) for i in range(50)}
+
+
+def test_bench_trace_disabled_eager_payload(
+    benchmark: BenchmarkFixture,
+    bench_logger: Logger,
+) -> None:
+    """Serializing the payload up front, even though TRACE is off."""
+    benchmark(lambda: bench_logger.trace("state=%s", json.dumps(_PAYLOAD)))
+
+
+def test_bench_trace_disabled_lazy_payload(
+    benchmark: BenchmarkFixture,
+    bench_logger: Logger,
+) -> None:
+    """Deferring the payload with lazy(); never serialized while TRACE is off."""
+    benchmark(
+        lambda: bench_logger.trace("state=%s", mod_alogs.lazy(json.dumps, _PAYLOAD))
+    )
@@ -0,0 +1,20 @@
+# benchmarks/test_bench_level_lookup.py
+"""Benchmarks for level name/number resolution."""
+
+import logging
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+import apathetic_logging as mod_alogs
+
+
+@pytest.mark.parametrize("name", ["detail", "DEBUG", "Trace"])
+def test_bench_get_level_number(benchmark: BenchmarkFixture, name: str) -> None:
+    """Resolving a level name string (cached after the first call)."""
+    benchmark(mod_alogs.getLevelNumber, name)
+
+
+def test_bench_get_level_name(benchmark: BenchmarkFixture) -> None:
+    """Resolving a numeric level to its name (cached after the first call)."""
+    benchmark(mod_alogs.getLevelName, logging.DEBUG)
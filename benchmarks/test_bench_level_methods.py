@@ -0,0 +1,51 @@
+# benchmarks/test_bench_level_methods.py
+"""Benchmarks for Logger methods that resolve string levels."""
+
+from typing import TYPE_CHECKING
+
+from pytest_benchmark.fixture import BenchmarkFixture
+
+import apathetic_logging as mod_alogs
+
+
+if TYPE_CHECKING:
+    from apathetic_logging import Logger  # noqa: ICN003
+else:
+    Logger = mod_alogs.Logger
+
+
+def test_bench_set_level_string(
+    benchmark: BenchmarkFixture,
+    bench_logger: Logger,
+) -> None:
+    """setLevel() with a level name."""
+    benchmark(bench_logger.setLevel, "detail")
+
+
+def test_bench_log_dynamic_string_disabled(
+    benchmark: BenchmarkFixture,
+    bench_logger: Logger,
+) -> None:
+    """logDynamic() with a level name below the logger level."""
+    benchmark(bench_logger.logDynamic, "trace", "not logged")
+
+
+def test_bench_use_level_string(
+    benchmark: BenchmarkFixture,
+    bench_logger: Logger,
+) -> None:
+    """Entering and leaving useLevel() with a level name."""
+
+    def use_level() -> None:
+        with bench_logger.useLevel("debug"):
+            pass
+
+    benchmark(use_level)
+
+
+def test_bench_get_logger_of_type(
+    benchmark: BenchmarkFixture,
+    bench_logger: Logger,
+) -> None:
+    """getLoggerOfType() for an existing logger."""
+    benchmark(mod_alogs.getLoggerOfType, bench_logger.name, type(bench_logger))
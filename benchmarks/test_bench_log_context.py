@@ -0,0 +1,49 @@
+# benchmarks/test_bench_log_context.py
+"""Benchmarks for adding request fields to every record."""
+
+import logging
+from collections.abc import Generator
+from typing import TYPE_CHECKING
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+import apathetic_logging as mod_alogs
+
+
+if TYPE_CHECKING:
+    from apathetic_logging import Logger  # noqa: ICN003
+else:
+    Logger = mod_alogs.Logger
+
+
+@pytest.fixture
+def clean_context() -> Generator[None, None, None]:
+    """Leave no bound fields behind."""
+    mod_alogs.clearLogContext()
+    yield
+    mod_alogs.clearLogContext()
+
+
+@pytest.mark.parametrize("impl", ["none", "log_context", "extra", "adapter"])
+def test_bench_info_with_request_fields(
+    benchmark: BenchmarkFixture,
+    bench_logger: Logger,
+    clean_context: None,  # noqa: ARG001
+    impl: str,
+) -> None:
+    """One info() record carrying a request id, by mechanism."""
+    fields = {"request_id": "abc123", "job": 7}
+    bench_logger.info("warm up")
+    if impl == "none":
+        benchmark(bench_logger.info, "benchmark message %s", "arg")
+    elif impl == "log_context":
+        with mod_alogs.logContext(**fields):
+            benchmark(bench_logger.info, "benchmark message %s", "arg")
+    elif impl == "extra":
+        benchmark(
+            lambda: bench_logger.info("benchmark message %s", "arg", extra=fields)
+        )
+    else:
+        adapter = logging.LoggerAdapter(bench_logger, fields)
+        benchmark(adapter.info, "benchmark message %s", "arg")
@@ -0,0 +1,20 @@
+# benchmarks/test_bench_logger_construction.py
+"""Benchmarks for logger construction and level resolution."""
+
+import uuid
+
+from pytest_benchmark.fixture import BenchmarkFixture
+
+import apathetic_logging as mod_alogs
+
+
+def test_bench_determine_log_level(benchmark: BenchmarkFixture) -> None:
+    """Resolving the level from the memoized registry snapshot."""
+    logger = mod_alogs.Logger(f"bench_level_{uuid.uuid4().hex[:6]}")
+    benchmark(logger.determineLogLevel)
+
+
+def test_bench_logger_construction(benchmark: BenchmarkFixture) -> None:
+    """Constructing a Logger (resolves its level from the registry)."""
+    name = f"bench_construct_{uuid.uuid4().hex[:6]}"
+    benchmark(mod_alogs.Logger, name)
@@ -0,0 +1,39 @@
+# benchmarks/test_bench_metrics.py
+"""Benchmarks for logging with metrics off (the default) and on."""
+
+from collections.abc import Generator
+from typing import TYPE_CHECKING
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+import apathetic_logging as mod_alogs
+
+
+if TYPE_CHECKING:
+    from apathetic_logging import Logger  # noqa: ICN003
+else:
+    Logger = mod_alogs.Logger
+
+
+@pytest.fixture(params=[False, True], ids=["metrics_off", "metrics_on"])
+def metrics(request: pytest.FixtureRequest) -> Generator[bool, None, None]:
+    """Enable metrics for the benchmark or leave them off."""
+    enabled: bool = request.param
+    mod_alogs.registerMetrics(enabled=enabled)
+    yield enabled
+    mod_alogs.registerMetrics(enabled=False)
+    mod_alogs.resetLoggingStats()
+
+
+@pytest.mark.parametrize("method", ["info", "trace"], ids=["enabled", "disabled"])
+def test_bench_level_call_with_metrics(
+    benchmark: BenchmarkFixture,
+    bench_logger: Logger,
+    metrics: bool,  # noqa: ARG001, FBT001
+    method: str,
+) -> None:
+    """One info() written to a null stream, or one trace() below the level."""
+    log = getattr(bench_logger, method)
+    log("warm up")
+    benchmark(log, "benchmark message %s", "arg")
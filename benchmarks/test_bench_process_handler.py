@@ -0,0 +1,38 @@
+# benchmarks/test_bench_process_handler.py
+"""Benchmarks for the child-side cost of sending a record to the parent."""
+
+import logging
+import pickle
+import queue
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+import apathetic_logging as mod_alogs
+
+
+def _make_record() -> logging.LogRecord:
+    return logging.LogRecord(
+        name="bench_process_handler",
+        level=logging.INFO,
+        pathname=__file__,
+        lineno=0,
+        msg="benchmark message %s",
+        args=("arg",),
+        exc_info=None,
+    )
+
+
+@pytest.mark.parametrize("impl", ["payload", "pickled_record"])
+def test_bench_process_queue_handler_prepare(
+    benchmark: BenchmarkFixture,
+    impl: str,
+) -> None:
+    """Minimal payload vs pickling the whole LogRecord."""
+    record = _make_record()
+    if impl == "payload":
+        handler = mod_alogs.ProcessQueueHandler(queue.Queue())
+        result = benchmark(handler.prepare, record)
+    else:
+        result = benchmark(pickle.dumps, record, pickle.HIGHEST_PROTOCOL)
+    assert isinstance(result, bytes)
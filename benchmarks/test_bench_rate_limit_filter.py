@@ -0,0 +1,55 @@
+# benchmarks/test_bench_rate_limit_filter.py
+"""Benchmarks for dropping repeated records vs writing them."""
+
+import logging
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+import apathetic_logging as mod_alogs
+
+
+def _make_record() -> logging.LogRecord:
+    return logging.LogRecord(
+        name="bench_rate_limit",
+        level=logging.WARNING,
+        pathname=__file__,
+        lineno=0,
+        msg="retrying %s",
+        args=("db",),
+        exc_info=None,
+    )
+
+
+@pytest.mark.parametrize("impl", ["suppressed", "format"])
+def test_bench_suppressed_vs_format(
+    benchmark: BenchmarkFixture,
+    impl: str,
+) -> None:
+    """Deciding to drop a repeat vs formatting the same record once."""
+    record = _make_record()
+    if impl == "suppressed":
+        # a huge burst used up and a rate that never refills in time
+        rate_filter = mod_alogs.RateLimitFilter(1e-9, burst=1)
+        rate_filter.filter(record)
+        result = benchmark(rate_filter.filter, record)
+        assert result is False
+    else:
+        formatter = mod_alogs.TagFormatter("%(message)s")
+        benchmark(formatter.format, record)
+
+
+@pytest.mark.parametrize("rate_limit", [None, 1e-9], ids=["unlimited", "flooded"])
+def test_bench_logger_warning_flood(
+    benchmark: BenchmarkFixture,
+    null_streams: None,  # noqa: ARG001
+    rate_limit: float | None,
+) -> None:
+    """One warning() from a call site that floods, with and without a limit."""
+    logger = mod_alogs.getLogger(
+        "bench_rate_limit_flood", rate_limit=rate_limit, rate_limit_burst=1
+    )
+    logger.warning("retrying %s", "db")
+    benchmark(logger.warning, "retrying %s", "db")
+    for existing in list(logger.filters):
+        logger.removeFilter(existing)
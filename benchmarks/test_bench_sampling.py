@@ -0,0 +1,40 @@
+# benchmarks/test_bench_sampling.py
+"""Benchmarks for sampled-out records vs records that are written."""
+
+from collections.abc import Generator
+from typing import TYPE_CHECKING
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+import apathetic_logging as mod_alogs
+
+
+if TYPE_CHECKING:
+    from apathetic_logging import Logger  # noqa: ICN003
+else:
+    Logger = mod_alogs.Logger
+
+
+@pytest.fixture
+def sampling(request: pytest.FixtureRequest) -> Generator[float | None, None, None]:
+    """Register a TRACE sampling rate for the benchmark (None for no sampling)."""
+    rate: float | None = request.param
+    if rate is not None:
+        mod_alogs.registerSampling({"trace": rate})
+    yield rate
+    mod_alogs.registerSampling({})
+
+
+@pytest.mark.parametrize(
+    "sampling", [None, 0.0, 1.0], ids=["unsampled", "dropped", "kept"], indirect=True
+)
+def test_bench_trace_sampling(
+    benchmark: BenchmarkFixture,
+    bench_logger: Logger,
+    sampling: float | None,  # noqa: ARG001
+) -> None:
+    """One trace() record with no sampling, always dropped, or always kept."""
+    bench_logger.setLevel("trace")
+    bench_logger.trace("warm up")
+    benchmark(bench_logger.trace, "benchmark message %s", "arg")
@@ -0,0 +1,69 @@
+# benchmarks/test_bench_segment_handler.py
+"""Benchmarks for MmapSegmentHandler (text and binary) vs file handlers."""
+
+import logging
+from collections.abc import Generator
+from pathlib import Path
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+import apathetic_logging as mod_alogs
+
+
+def _make_record() -> logging.LogRecord:
+    return logging.LogRecord(
+        name="bench_segment_handler",
+        level=logging.INFO,
+        pathname="",
+        lineno=0,
+        msg="benchmark message %s",
+        args=("arg",),
+        exc_info=None,
+    )
+
+
+@pytest.fixture(params=["file", "dual_file", "segment", "segment_binary"])
+def segment_or_file_handler(
+    request: pytest.FixtureRequest, tmp_path: Path
+) -> Generator[logging.Handler, None, None]:
+    """A handler writing INFO records under a temporary directory."""
+    handler: logging.Handler
+    if request.param == "file":
+        # stdlib: one write() and flush() per record
+        handler = logging.FileHandler(tmp_path / "bench.log")
+    elif request.param == "dual_file":
+        handler = mod_alogs.DualFileHandler(tmp_path / "bench.log")
+    elif request.param == "segment":
+        handler = mod_alogs.MmapSegmentHandler(tmp_path)
+    else:
+        # template interned once, then level, time delta and args per record
+        handler = mod_alogs.MmapSegmentHandler(tmp_path, record_format="binary")
+    handler.setFormatter(logging.Formatter("%(levelname)s %(name)s: %(message)s"))
+    yield handler
+    handler.close()
+
+
+def test_bench_segment_handler_handle(
+    benchmark: BenchmarkFixture,
+    segment_or_file_handler: logging.Handler,
+) -> None:
+    """Cost of appending one INFO record."""
+    record = _make_record()
+    benchmark(segment_or_file_handler.handle, record)
+
+
+@pytest.mark.parametrize("record_format", ["text", "binary"])
+def test_bench_segment_handler_record_format(
+    benchmark: BenchmarkFixture,
+    tmp_path: Path,
+    record_format: str,
+) -> None:
+    """Cost of one record with a timestamped TagFormatter vs binary encoding."""
+    handler = mod_alogs.MmapSegmentHandler(tmp_path, record_format=record_format)
+    handler.setFormatter(
+        mod_alogs.TagFormatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+    )
+    record = _make_record()
+    benchmark(handler.handle, record)
+    handler.close()
@@ -0,0 +1,88 @@
+# benchmarks/test_bench_slot_record.py
+"""Benchmarks for logging.LogRecord vs SlotLogRecord: time and memory.
+
+The memory benchmark records ``bytes_per_record`` and
+``allocations_per_record`` (tracemalloc, records kept alive) in
+``extra_info``; see them with ``--benchmark-json`` or in a saved run.
+"""
+
+import logging
+import tracemalloc
+from collections.abc import Callable, Generator
+from typing import TYPE_CHECKING
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+import apathetic_logging as mod_alogs
+
+
+if TYPE_CHECKING:
+    from apathetic_logging import Logger  # noqa: ICN003
+else:
+    Logger = mod_alogs.Logger
+
+
+_RecordFactory = Callable[..., logging.LogRecord]
+
+_MEMORY_RECORDS = 10_000
+
+
+@pytest.fixture(
+    params=[logging.LogRecord, mod_alogs.SlotLogRecord],
+    ids=["LogRecord", "SlotLogRecord"],
+)
+def record_factory(
+    request: pytest.FixtureRequest,
+) -> Generator[_RecordFactory, None, None]:
+    """Install a record factory for the benchmark."""
+    factory: _RecordFactory = request.param
+    original = mod_alogs.getLogRecordFactory()
+    mod_alogs.setLogRecordFactory(factory)
+    yield factory
+    mod_alogs.setLogRecordFactory(original)
+
+
+def _make(factory: _RecordFactory) -> logging.LogRecord:
+    return factory(
+        "bench", logging.INFO, __file__, 1, "benchmark message %s", ("arg",), None
+    )
+
+
+def _measure_memory(factory: _RecordFactory) -> tuple[float, float]:
+    # bytes and allocations per record still alive after creation
+    records: list[logging.LogRecord | None] = [None] * _MEMORY_RECORDS
+    _make(factory)  # warm up caches outside the trace
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        for i in range(_MEMORY_RECORDS):
+            records[i] = _make(factory)
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    stats = after.compare_to(before, "filename")
+    size = sum(stat.size_diff for stat in stats)
+    count = sum(stat.count_diff for stat in stats)
+    return size / _MEMORY_RECORDS, count / _MEMORY_RECORDS
+
+
+def test_bench_record_factory_memory(
+    benchmark: BenchmarkFixture,
+    record_factory: _RecordFactory,
+) -> None:
+    """Creating one record; bytes and allocations per record in extra_info."""
+    size, count = _measure_memory(record_factory)
+    benchmark.extra_info["bytes_per_record"] = round(size, 1)
+    benchmark.extra_info["allocations_per_record"] = round(count, 2)
+    benchmark(_make, record_factory)
+
+
+def test_bench_record_factory_info(
+    benchmark: BenchmarkFixture,
+    bench_logger: Logger,
+    record_factory: _RecordFactory,  # noqa: ARG001
+) -> None:
+    """One info() through the default TagFormatter and DualStreamHandler."""
+    bench_logger.info("warm up")
+    benchmark(bench_logger.info, "benchmark message %s", "arg")
@@ -0,0 +1,65 @@
+# benchmarks/test_bench_tag_formatter.py
+"""Benchmarks for TagFormatter.format, against the pre-cache implementation."""
+
+import logging
+from typing import Any
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+import apathetic_logging as mod_alogs
+
+
+class _UncachedTagFormatter(logging.Formatter):
+    """The previous TagFormatter.format: rebuilds the prefix every record."""
+
+    def format(self, record: logging.LogRecord, *args: Any, **kwargs: Any) -> str:
+        tag_styles = mod_alogs.apathetic_logging.TAG_STYLES
+        reset = mod_alogs.apathetic_logging.ANSIColors.RESET
+        tag_color, tag_text = tag_styles.get(record.levelname, ("", ""))
+        msg = super().format(record, *args, **kwargs)
+        if tag_text:
+            if getattr(record, "enable_color", False) and tag_color:
+                prefix = f"{tag_color}{tag_text}{reset}"
+            else:
+                prefix = tag_text
+            return f"{prefix} {msg}"
+        return msg
+
+
+def _make_record(level: int, *, enable_color: bool) -> logging.LogRecord:
+    record = logging.LogRecord(
+        name="bench_tag_formatter",
+        level=level,
+        pathname="",
+        lineno=0,
+        msg="benchmark message %s",
+        args=("arg",),
+        exc_info=None,
+    )
+    record.enable_color = enable_color
+    return record
+
+
+@pytest.mark.parametrize("enable_color", [False, True], ids=["plain", "colored"])
+@pytest.mark.parametrize(
+    "level", [logging.DEBUG, logging.INFO], ids=["tagged", "untagged"]
+)
+@pytest.mark.parametrize("impl", ["cached", "uncached"])
+def test_bench_tag_formatter_format(
+    benchmark: BenchmarkFixture,
+    impl: str,
+    level: int,
+    *,
+    enable_color: bool,
+) -> None:
+    """Records/sec for TagFormatter.format vs the uncached implementation."""
+    if impl == "cached":
+        formatter: logging.Formatter = mod_alogs.apathetic_logging.TagFormatter(
+            "%(message)s"
+        )
+    else:
+        formatter = _UncachedTagFormatter("%(message)s")
+    record = _make_record(level, enable_color=enable_color)
+    result = benchmark(formatter.format, record)
+    assert result.endswith("benchmark message arg")
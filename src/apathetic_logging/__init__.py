@@ -58,7 +58,18 @@ NOTSET_LEVEL = apathetic_logging.NOTSET_LEVEL
 ANSIColors = apathetic_logging.ANSIColors
 
 # Classes
+AsyncQueueHandler = apathetic_logging.AsyncQueueHandler
+AsyncWriter = apathetic_logging.AsyncWriter
+ConfigSnapshot = apathetic_logging.ConfigSnapshot
+DualFileHandler = apathetic_logging.DualFileHandler
 DualStreamHandler = apathetic_logging.DualStreamHandler
+FlightRecorderHandler = apathetic_logging.FlightRecorderHandler
+JsonFormatter = apathetic_logging.JsonFormatter
+Lazy = apathetic_logging.Lazy
+ProcessLogListener = apathetic_logging.ProcessLogListener
+ProcessQueueHandler = apathetic_logging.ProcessQueueHandler
+RateLimitFilter = apathetic_logging.RateLimitFilter
+SlotLogRecord = apathetic_logging.SlotLogRecord
 TagFormatter = apathetic_logging.TagFormatter
 # Logger is a nested class in ApatheticLogging_Internal_Logger that
 # inherits from logging.Logger.
@@ -96,25 +107,82 @@ warn = apathetic_logging.warn
 warning = apathetic_logging.warning
 
 # Functions (camelCase - library functions)
-getDefaultLogLevel = apathetic_logging.getDefaultLogLevel
+bindLogContext = apathetic_logging.bindLogContext
+clearLogContext = apathetic_logging.clearLogContext
+getAsyncMode = apathetic_logging.getAsyncMode
+getAsyncOverflow = apathetic_logging.getAsyncOverflow
+getAsyncQueueSize = apathetic_logging.getAsyncQueueSize
+getAsyncWriter = apathetic_logging.getAsyncWriter
+getBufferedOutput = apathetic_logging.getBufferedOutput
+getBufferFlushInterval = apathetic_logging.getBufferFlushInterval
+getBufferSize = apathetic_logging.getBufferSize
 getCompatibilityMode = apathetic_logging.getCompatibilityMode
+getConfigSnapshot = apathetic_logging.getConfigSnapshot
+getDefaultLogLevel = apathetic_logging.getDefaultLogLevel
 getDefaultLoggerName = apathetic_logging.getDefaultLoggerName
 getDefaultPropagate = apathetic_logging.getDefaultPropagate
+getFlightRecorder = apathetic_logging.getFlightRecorder
+getFlightRecorderCapacity = apathetic_logging.getFlightRecorderCapacity
+getFlightRecorderLevel = apathetic_logging.getFlightRecorderLevel
 getLevelNumber = apathetic_logging.getLevelNumber
+getLogContext = apathetic_logging.getLogContext
 getLogLevelEnvVars = apathetic_logging.getLogLevelEnvVars
 getLoggerOfType = apathetic_logging.getLoggerOfType
+getOutputFormat = apathetic_logging.getOutputFormat
+getProcessQueue = apathetic_logging.getProcessQueue
 getRegisteredLoggerName = apathetic_logging.getRegisteredLoggerName
+getSampling = apathetic_logging.getSampling
+getLoggingStats = apathetic_logging.getLoggingStats
+getMetrics = apathetic_logging.getMetrics
+resetLoggingStats = apathetic_logging.resetLoggingStats
+formatOpenMetrics = apathetic_logging.formatOpenMetrics
+dumpLoggingStats = apathetic_logging.dumpLoggingStats
+registerMetrics = apathetic_logging.registerMetrics
+MmapSegmentHandler = apathetic_logging.MmapSegmentHandler
+getSegmentHandler = apathetic_logging.getSegmentHandler
+closeSegmentHandler = apathetic_logging.closeSegmentHandler
+readSegmentHeader = apathetic_logging.readSegmentHeader
+iterSegmentRecords = apathetic_logging.iterSegmentRecords
+iterSegments = apathetic_logging.iterSegments
+registerSegmentOutput = apathetic_logging.registerSegmentOutput
+getSegmentOutput = apathetic_logging.getSegmentOutput
+getSegmentDirectory = apathetic_logging.getSegmentDirectory
+getSegmentSize = apathetic_logging.getSegmentSize
+getSegmentSyncInterval = apathetic_logging.getSegmentSyncInterval
+getSegmentSyncLevel = apathetic_logging.getSegmentSyncLevel
+getSegmentRecordFormat = apathetic_logging.getSegmentRecordFormat
+listSegments = apathetic_logging.listSegments
+decodeSegment = apathetic_logging.decodeSegment
+BinaryRecordEncoder = apathetic_logging.BinaryRecordEncoder
+BinaryRecordDecoder = apathetic_logging.BinaryRecordDecoder
+decodeBinaryRecords = apathetic_logging.decodeBinaryRecords
+runCli = apathetic_logging.runCli
+getSamplingKey = apathetic_logging.getSamplingKey
 getTargetPythonVersion = apathetic_logging.getTargetPythonVersion
 hasLogger = apathetic_logging.hasLogger
+invalidateCallerInfo = apathetic_logging.invalidateCallerInfo
+invalidateConfigSnapshot = apathetic_logging.invalidateConfigSnapshot
+invalidateLevelNameCache = apathetic_logging.invalidateLevelNameCache
+lazy = apathetic_logging.lazy
+logContext = apathetic_logging.logContext
 makeSafeTrace = apathetic_logging.makeSafeTrace
 registerDefaultLogLevel = apathetic_logging.registerDefaultLogLevel
 registerLogLevelEnvVars = apathetic_logging.registerLogLevelEnvVars
 registerLogger = apathetic_logging.registerLogger
+registerAsyncMode = apathetic_logging.registerAsyncMode
+registerBufferedOutput = apathetic_logging.registerBufferedOutput
 registerCompatibilityMode = apathetic_logging.registerCompatibilityMode
+registerFlightRecorder = apathetic_logging.registerFlightRecorder
+registerOutputFormat = apathetic_logging.registerOutputFormat
+registerProcessQueue = apathetic_logging.registerProcessQueue
 registerPropagate = apathetic_logging.registerPropagate
+registerSampling = apathetic_logging.registerSampling
+reinitAfterFork = apathetic_logging.reinitAfterFork
 registerTargetPythonVersion = apathetic_logging.registerTargetPythonVersion
 removeLogger = apathetic_logging.removeLogger
 safeLog = apathetic_logging.safeLog
+stopAsyncWriter = apathetic_logging.stopAsyncWriter
+unbindLogContext = apathetic_logging.unbindLogContext
 
 
 __all__ = [
@@ -130,53 +198,121 @@ __all__ = [
     "TEST_LEVEL",
     "TRACE_LEVEL",
     "ANSIColors",
+    "AsyncQueueHandler",
+    "AsyncWriter",
+    "BinaryRecordDecoder",
+    "BinaryRecordEncoder",
+    "ConfigSnapshot",
+    "DualFileHandler",
     "DualStreamHandler",
+    "FlightRecorderHandler",
+    "JsonFormatter",
+    "Lazy",
     "Logger",
+    "MmapSegmentHandler",
+    "ProcessLogListener",
+    "ProcessQueueHandler",
+    "RateLimitFilter",
+    "SlotLogRecord",
     "TagFormatter",
     "addLevelName",
     "apathetic_logging",
     "basicConfig",
+    "bindLogContext",
     "captureWarnings",
+    "clearLogContext",
+    "closeSegmentHandler",
     "critical",
     "currentframe",
     "debug",
+    "decodeBinaryRecords",
+    "decodeSegment",
     "disable",
+    "dumpLoggingStats",
     "error",
     "exception",
     "fatal",
+    "formatOpenMetrics",
+    "getAsyncMode",
+    "getAsyncOverflow",
+    "getAsyncQueueSize",
+    "getAsyncWriter",
+    "getBufferFlushInterval",
+    "getBufferSize",
+    "getBufferedOutput",
     "getCompatibilityMode",
+    "getConfigSnapshot",
     "getDefaultLogLevel",
     "getDefaultLoggerName",
     "getDefaultPropagate",
+    "getFlightRecorder",
+    "getFlightRecorderCapacity",
+    "getFlightRecorderLevel",
     "getHandlerByName",
     "getHandlerNames",
     "getLevelName",
     "getLevelNamesMapping",
     "getLevelNumber",
+    "getLogContext",
     "getLogLevelEnvVars",
     "getLogRecordFactory",
     "getLogger",
     "getLoggerClass",
     "getLoggerOfType",
+    "getLoggingStats",
+    "getMetrics",
+    "getOutputFormat",
+    "getProcessQueue",
     "getRegisteredLoggerName",
+    "getSampling",
+    "getSamplingKey",
+    "getSegmentDirectory",
+    "getSegmentHandler",
+    "getSegmentOutput",
+    "getSegmentRecordFormat",
+    "getSegmentSize",
+    "getSegmentSyncInterval",
+    "getSegmentSyncLevel",
     "getTargetPythonVersion",
     "hasLogger",
     "info",
+    "invalidateCallerInfo",
+    "invalidateConfigSnapshot",
+    "invalidateLevelNameCache",
+    "iterSegmentRecords",
+    "iterSegments",
+    "lazy",
+    "listSegments",
     "log",
+    "logContext",
     "makeLogRecord",
     "makeSafeTrace",
+    "readSegmentHeader",
+    "registerAsyncMode",
+    "registerBufferedOutput",
     "registerCompatibilityMode",
     "registerDefaultLogLevel",
+    "registerFlightRecorder",
     "registerLogLevelEnvVars",
     "registerLogger",
+    "registerMetrics",
+    "registerOutputFormat",
+    "registerProcessQueue",
     "registerPropagate",
+    "registerSampling",
+    "registerSegmentOutput",
     "registerTargetPythonVersion",
+    "reinitAfterFork",
     "removeLogger",
+    "resetLoggingStats",
+    "runCli",
     "safeLog",
     "safeTrace",
     "setLogRecordFactory",
     "setLoggerClass",
     "shutdown",
+    "stopAsyncWriter",
+    "unbindLogContext",
     "warn",
     "warning",
 ]
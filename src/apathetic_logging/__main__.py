@@ -0,0 +1,17 @@
+# src/apathetic_logging/__main__.py
+"""Entry point for ``python -m apathetic_logging``."""
+
+from __future__ import annotations
+
+import sys
+
+from . import runCli
+
+
+def main() -> int:
+    """Run the command line with sys.argv; see runCli()."""
+    return runCli()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
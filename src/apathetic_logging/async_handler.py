@@ -0,0 +1,416 @@
+# src/apathetic_logging/async_handler.py
+"""AsyncQueueHandler class for Apathetic Logging.
+
+Docstrings are adapted from the standard library logging.handlers.QueueHandler
+documentation licensed under the Python Software Foundation License Version 2.
+"""
+
+from __future__ import annotations
+
+import copy
+import logging
+import sys
+import threading
+from typing import TYPE_CHECKING, Any, ClassVar, TypeAlias
+
+from .caller_info import (
+    ApatheticLogging_Internal_CallerInfo,
+)
+from .constants import (
+    ApatheticLogging_Internal_Constants,
+)
+from .dual_stream_handler import (
+    ApatheticLogging_Internal_DualStreamHandler,
+)
+from .registry_data import (
+    ApatheticLogging_Internal_RegistryData,
+)
+from .safe_logging import (
+    ApatheticLogging_Internal_SafeLogging,
+)
+
+
+if TYPE_CHECKING:
+    import queue
+
+
+# anything with handle(record): a Handler, or a Logger for Logger.alog()
+_Writable: TypeAlias = "logging.Handler | logging.Logger"
+
+
+class ApatheticLogging_Internal_AsyncHandler:  # noqa: N801  # pyright: ignore[reportUnusedClass]
+    """Mixin class that provides the async writer and its queue front-end.
+
+    This class contains the AsyncWriter and AsyncQueueHandler implementations
+    as nested classes. When mixed into apathetic_logging, it provides
+    apathetic_logging.AsyncWriter, apathetic_logging.AsyncQueueHandler and
+    apathetic_logging.getAsyncWriter.
+    """
+
+    _async_writer: ApatheticLogging_Internal_AsyncHandler.AsyncWriter | None = None
+    # held while _async_writer is created or cleared, so threads logging
+    # their first records at once share one writer
+    _async_writer_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    # argument types AsyncQueueHandler.prepare() leaves unmerged
+    _IMMUTABLE_ARG_TYPES: frozenset[type] = frozenset(
+        {str, int, float, bool, type(None), bytes}
+    )
+
+    class AsyncWriter:
+        """Single background thread that writes queued records to their handlers.
+
+        Records are queued as (handler, record) pairs and written in order by
+        one daemon thread, so output from every async logger keeps its
+        original ordering and stdout/stderr routing is still decided by the
+        real handler (usually a DualStreamHandler), with the stream picked
+        on the thread that logged the record.
+
+        The queue is bounded; ``overflow`` decides what happens when it is
+        full (see ASYNC_OVERFLOW_POLICIES).
+        """
+
+        def __init__(self, queue_size: int, overflow: str) -> None:
+            """Initialize the writer. The thread starts on the first record.
+
+            Args:
+                queue_size: Maximum number of records waiting to be written
+                    (must be > 0)
+                overflow: One of ASYNC_OVERFLOW_POLICIES
+
+            Raises:
+                ValueError: If queue_size <= 0 or overflow is unknown
+            """
+            _constants = ApatheticLogging_Internal_Constants
+            if queue_size <= 0:
+                msg = f"Async queue size must be > 0, got {queue_size}"
+                raise ValueError(msg)
+            if overflow not in _constants.ASYNC_OVERFLOW_POLICIES:
+                msg = (
+                    f"Unknown async overflow policy: {overflow!r}. "
+                    f"Expected one of {_constants.ASYNC_OVERFLOW_POLICIES}"
+                )
+                raise ValueError(msg)
+
+            self.queue_size = queue_size
+            self.overflow = overflow
+            self.dropped = 0
+            """Number of records discarded by a drop-* overflow policy."""
+
+            # deferred: queue is only needed once async mode is used
+            import queue  # noqa: PLC0415
+
+            self._queue: queue.Queue[tuple[_Writable, logging.LogRecord] | None] = (
+                queue.Queue(maxsize=queue_size)
+            )
+            self._queue_full: type[Exception] = queue.Full
+            self._queue_empty: type[Exception] = queue.Empty
+            self._thread: threading.Thread | None = None
+            self._lock = threading.Lock()
+
+        @property
+        def running(self) -> bool:
+            """Return True if the writer thread is alive."""
+            return self._thread is not None and self._thread.is_alive()
+
+        def start(self) -> None:
+            """Start the writer thread if it isn't already running."""
+            with self._lock:
+                if self.running:
+                    return
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name="apathetic-logging-writer",
+                    daemon=True,
+                )
+                self._thread.start()
+
+        def isWriterThread(self) -> bool:
+            """Return True when called from this writer's own thread."""
+            return threading.current_thread() is self._thread
+
+        def submit(self, handler: _Writable, record: logging.LogRecord) -> None:
+            """Queue a record to be written by ``handler`` on the writer thread.
+
+            Applies the overflow policy when the queue is full.
+
+            Args:
+                handler: The handler (or logger) that will write the record
+                record: The (already prepared) LogRecord
+            """
+            if self._thread is None:
+                self.start()
+
+            item = (handler, record)
+            if self.overflow == "block":
+                self._queue.put(item)
+                return
+
+            try:
+                self._queue.put_nowait(item)
+            except self._queue_full:
+                if self.overflow == "drop-newest":
+                    self.dropped += 1
+                    return
+                # drop-oldest: make room, retrying if other threads race us
+                while True:
+                    try:
+                        self._queue.get_nowait()
+                        self._queue.task_done()
+                        self.dropped += 1
+                    except self._queue_empty:
+                        pass
+                    try:
+                        self._queue.put_nowait(item)
+                    except self._queue_full:
+                        continue
+                    return
+
+        async def asubmit(self, handler: _Writable, record: logging.LogRecord) -> None:
+            """Queue a record from a coroutine without blocking the event loop.
+
+            Like submit(), but with the "block" policy a full queue is waited
+            on in the loop's default executor, so other tasks keep running
+            while this one waits for room. The drop-* policies never wait.
+
+            Args:
+                handler: The handler (or logger) that will write the record
+                record: The (already prepared) LogRecord
+            """
+            if self._thread is None:
+                self.start()
+
+            item = (handler, record)
+            try:
+                self._queue.put_nowait(item)
+            except self._queue_full:
+                if self.overflow != "block":
+                    self.submit(handler, record)
+                    return
+                # whoever runs the loop imported asyncio already; importing it
+                # here would add ~50ms to every program's startup
+                loop = sys.modules["asyncio"].get_running_loop()
+                await loop.run_in_executor(None, self._queue.put, item)
+
+        def flush(self) -> None:
+            """Block until every queued record has been written.
+
+            If the writer thread isn't running, the queue is drained on the
+            calling thread instead.
+            """
+            if self.isWriterThread():
+                # called from inside a handler on the writer thread
+                return
+            if not self.running:
+                self._drain()
+                return
+            self._queue.join()
+
+        def stop(self, timeout: float | None = None) -> None:
+            """Write everything still queued, then stop the writer thread.
+
+            Args:
+                timeout: Seconds to wait for the thread to exit, or None
+            """
+            thread = self._thread
+            if thread is None or not thread.is_alive():
+                self._drain()
+                self._thread = None
+                return
+            self._queue.put(None)
+            thread.join(timeout)
+            self._thread = None
+
+        def _write(self, item: tuple[_Writable, logging.LogRecord]) -> None:
+            handler, record = item
+            try:
+                handler.handle(record)
+            except Exception as e:  # noqa: BLE001
+                # never let one bad record kill the writer thread
+                ApatheticLogging_Internal_SafeLogging.safeLog(
+                    f"[apathetic_logging] async writer failed: {e!r}"
+                )
+
+        def _drain(self) -> None:
+            while True:
+                try:
+                    item = self._queue.get_nowait()
+                except self._queue_empty:
+                    return
+                try:
+                    if item is not None:
+                        self._write(item)
+                finally:
+                    self._queue.task_done()
+
+        def _run(self) -> None:
+            while True:
+                item = self._queue.get()
+                try:
+                    if item is None:
+                        return
+                    self._write(item)
+                finally:
+                    self._queue.task_done()
+
+    class AsyncQueueHandler(
+        ApatheticLogging_Internal_CallerInfo._WatchedHandler,  # noqa: SLF001
+        logging.Handler,
+    ):
+        """Queue front-end that hands records to an AsyncWriter.
+
+        The caller's thread only merges the message arguments (renders any
+        traceback, and picks the stream a DualStreamHandler target writes
+        to) before queueing; the wrapped ``target`` handler does the
+        formatting and writing on the writer thread.
+
+        Flushing waits for the writer to catch up, so ``shutdown()`` (and the
+        ``atexit`` hook the logging module installs) writes every queued
+        record before the process exits.
+        """
+
+        def __init__(
+            self,
+            target: logging.Handler,
+            *args: Any,
+            writer: ApatheticLogging_Internal_AsyncHandler.AsyncWriter | None = None,
+            **kwargs: Any,
+        ) -> None:
+            """Initialize the handler.
+
+            Args:
+                target: Handler that writes records on the writer thread
+                *args: Additional positional arguments (for future-proofing)
+                writer: Writer to queue records on, or None to use the shared
+                    writer from getAsyncWriter()
+                **kwargs: Additional keyword arguments (for future-proofing)
+            """
+            super().__init__(*args, **kwargs)
+            self.target = target
+            self.writer = writer
+
+        def _getWriter(self) -> ApatheticLogging_Internal_AsyncHandler.AsyncWriter:
+            if self.writer is not None:
+                return self.writer
+            return ApatheticLogging_Internal_AsyncHandler.getAsyncWriter()
+
+        def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+            """Return a copy of the record that is safe to hand to another thread.
+
+            The message is merged with its arguments now, so later changes
+            to mutable arguments don't leak into the output, and exception
+            info is rendered to ``exc_text`` so traceback objects stay on
+            this thread. A str message whose arguments are all immutable
+            scalars (str, int, float, bool, None, bytes) is kept as template
+            and arguments: nothing can change them, and templates let a
+            binary segment intern the call site.
+
+            For a DualStreamHandler target, the stream is chosen now (see
+            DualStreamHandler.streamFor()) and kept as ``output_stream``, so
+            output follows sys.stdout/sys.stderr as this thread sees them
+            (e.g. inside contextlib.redirect_stdout()).
+
+            Args:
+                record: The LogRecord to prepare
+
+            Returns:
+                The prepared copy
+            """
+            _immutable = ApatheticLogging_Internal_AsyncHandler._IMMUTABLE_ARG_TYPES
+            args = record.args
+            prepared = copy.copy(record)
+            if not (
+                type(record.msg) is str
+                and type(args) is tuple
+                and all(type(arg) in _immutable for arg in args)
+            ):
+                prepared.msg = record.getMessage()
+                prepared.args = None
+            if prepared.exc_info:
+                if not prepared.exc_text:
+                    formatter = self.target.formatter or logging.Formatter()
+                    prepared.exc_text = formatter.formatException(prepared.exc_info)
+                prepared.exc_info = None
+            target = self.target
+            if isinstance(
+                target, ApatheticLogging_Internal_DualStreamHandler.DualStreamHandler
+            ):
+                prepared.output_stream = target.streamFor(record)
+            return prepared
+
+        def emit(self, record: logging.LogRecord) -> None:
+            """Queue the record for the writer thread.
+
+            logging.Handler.emit() implementation:
+            https://docs.python.org/3.10/library/logging.html#logging.Handler.emit
+            """
+            try:
+                writer = self._getWriter()
+                if writer.isWriterThread():
+                    # already on the writer (e.g. a record from Logger.alog());
+                    # queueing again could wait on ourselves
+                    self.target.handle(record)
+                    return
+                writer.submit(self.target, self.prepare(record))
+            except Exception:  # noqa: BLE001
+                self.handleError(record)
+
+        def flush(self) -> None:
+            """Wait until the writer has written every queued record."""
+            self._getWriter().flush()
+            self.target.flush()
+
+        def close(self) -> None:
+            """Flush queued records, then close this handler."""
+            try:
+                self.flush()
+            finally:
+                super().close()
+
+    @staticmethod
+    def getAsyncWriter() -> ApatheticLogging_Internal_AsyncHandler.AsyncWriter:
+        """Return the process-wide AsyncWriter, creating it if necessary.
+
+        The writer is configured from the registry (see registerAsyncMode())
+        the first time it's needed.
+
+        Returns:
+            The shared AsyncWriter
+        """
+        _constants = ApatheticLogging_Internal_Constants
+        _registry_data = ApatheticLogging_Internal_RegistryData
+        writer = ApatheticLogging_Internal_AsyncHandler._async_writer
+        if writer is not None:
+            return writer
+        with ApatheticLogging_Internal_AsyncHandler._async_writer_lock:
+            # another thread may have created it while we waited
+            writer = ApatheticLogging_Internal_AsyncHandler._async_writer
+            if writer is None:
+                writer = ApatheticLogging_Internal_AsyncHandler.AsyncWriter(
+                    _registry_data.registered_internal_async_queue_size
+                    or _constants.DEFAULT_ASYNC_QUEUE_SIZE,
+                    _registry_data.registered_internal_async_overflow
+                    or _constants.DEFAULT_ASYNC_OVERFLOW,
+                )
+                ApatheticLogging_Internal_AsyncHandler._async_writer = writer
+        return writer
+
+    @staticmethod
+    def stopAsyncWriter(timeout: float | None = None) -> None:
+        """Write everything queued and stop the shared writer thread.
+
+        The next async record creates a fresh writer from the current
+        registry settings.
+
+        Args:
+            timeout: Seconds to wait for the thread to exit, or None
+        """
+        writer = ApatheticLogging_Internal_AsyncHandler._async_writer
+        if writer is None:
+            return
+        # stop before forgetting it: records still queued (e.g. from
+        # Logger.alog()) must find this writer, not start a new one
+        writer.stop(timeout)
+        with ApatheticLogging_Internal_AsyncHandler._async_writer_lock:
+            if ApatheticLogging_Internal_AsyncHandler._async_writer is writer:
+                ApatheticLogging_Internal_AsyncHandler._async_writer = None
@@ -0,0 +1,449 @@
+# src/apathetic_logging/binary_format.py
+"""BinaryRecordEncoder class and binary record decoder for Apathetic Logging."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from .constants import (
+    ApatheticLogging_Internal_Constants,
+)
+
+
+class ApatheticLogging_Internal_BinaryFormat:  # noqa: N801  # pyright: ignore[reportUnusedClass]
+    """Mixin class that provides the binary log record format.
+
+    This class contains the BinaryRecordEncoder implementation as a nested
+    class and the BinaryRecordDecoder that turns its entries back into
+    LogRecords. When mixed into apathetic_logging, it provides
+    apathetic_logging.BinaryRecordEncoder,
+    apathetic_logging.BinaryRecordDecoder and
+    apathetic_logging.decodeBinaryRecords.
+
+    An encoded stream is a series of entries, each starting with a
+    BinaryTags type byte. Strings are a varint byte length and UTF-8 bytes;
+    varints are little-endian base 128, signed ones zigzag encoded.
+
+    - TEMPLATE: varint template id, logger name, message template
+    - EVENT: level (one byte, or 0xFF and a signed varint), signed varint
+      of microseconds since the previous event, varint argument count,
+      tagged arguments, varint template id (0: logger name and merged
+      message follow), flags byte, then the fields the flags announce
+      (traceback text, stack info, varint count of context key/value pairs)
+    """
+
+    class BinaryRecordEncoder:
+        """Encode LogRecords as compact binary entries.
+
+        A record's logger name and message template are interned: the first
+        record from a call site writes a TEMPLATE entry, and every record
+        after that is an EVENT of a few bytes plus its arguments. Levels are
+        one byte and times are deltas from the previous record.
+
+        Only str, int, float, bool, None and bytes arguments can be rebuilt
+        exactly, so records with other arguments (or mapping arguments, or a
+        non-str message) carry their merged message instead, as do records
+        from call sites beyond ``max_templates``.
+
+        Templates and the time base belong to one stream (e.g. a segment);
+        call reset() when starting the next one.
+        """
+
+        def __init__(self, *, max_templates: int | None = None) -> None:
+            """Initialize the encoder.
+
+            Args:
+                max_templates: Templates to intern per stream, or None for
+                    BINARY_MAX_TEMPLATES
+            """
+            _constants = ApatheticLogging_Internal_Constants
+            self.max_templates = (
+                max_templates
+                if max_templates is not None
+                else _constants.BINARY_MAX_TEMPLATES
+            )
+            # (logger name, message template) -> template id
+            self.templates: dict[tuple[str, str], int] = {}
+            # time of the previous event, in microseconds
+            self._last_time: int = 0
+
+            # deferred: struct is only needed once an encoder is created
+            import struct  # noqa: PLC0415
+
+            self._pack_double = struct.Struct("<d").pack
+            self._exc_formatter = logging.Formatter()
+
+        def reset(self, created: float) -> None:
+            """Start a new stream, forgetting every interned template.
+
+            Args:
+                created: Time base of the stream; the first event's time is
+                    stored relative to it
+            """
+            self.templates = {}
+            self._last_time = int(created * 1_000_000)
+
+        def encode(self, record: logging.LogRecord) -> bytearray:
+            """Return the entries for a record.
+
+            That is its EVENT entry, preceded by a TEMPLATE entry the first
+            time its call site is seen in this stream.
+
+            Args:
+                record: The LogRecord to encode
+
+            Returns:
+                The encoded entries
+            """
+            _varint = ApatheticLogging_Internal_BinaryFormat.writeVarint
+            _string = ApatheticLogging_Internal_BinaryFormat.writeString
+
+            buf = self._startEvent(record)
+            msg = record.msg
+            args = record.args
+            args_start = len(buf)
+            template = None
+            if type(msg) is str and (args is None or type(args) is tuple):
+                if not args:
+                    buf.append(0)
+                    template = (record.name, msg)
+                elif self._writeArgs(buf, args):
+                    template = (record.name, msg)
+                else:
+                    del buf[args_start:]
+                    buf.append(0)
+            else:
+                buf.append(0)
+
+            entry = None
+            template_id = 0
+            if template is not None:
+                template_id = self.templates.get(template, 0)
+                if not template_id:
+                    template_id, entry = self._internTemplate(template)
+                    if not template_id:
+                        # table full: drop the arguments, merge the message
+                        del buf[args_start:]
+                        buf.append(0)
+            _varint(buf, template_id)
+            if not template_id:
+                _string(buf, record.name)
+                _string(buf, record.getMessage())
+
+            if (
+                record.exc_info
+                or record.exc_text
+                or record.stack_info
+                or getattr(record, "log_context", None)
+            ):
+                self._writeExtras(buf, record)
+            else:
+                buf.append(0)
+
+            if entry is not None:
+                entry += buf
+                return entry
+            return buf
+
+        def _startEvent(self, record: logging.LogRecord) -> bytearray:
+            # EVENT type byte, level, and time since the previous event
+            _varint = ApatheticLogging_Internal_BinaryFormat.writeVarint
+            buf = bytearray((ApatheticLogging_Internal_Constants.BinaryTags.EVENT,))
+            levelno = record.levelno
+            if 0 <= levelno < 0xFF:  # noqa: PLR2004
+                buf.append(levelno)
+            else:
+                buf.append(0xFF)
+                _varint(buf, levelno << 1 if levelno >= 0 else ~levelno << 1 | 1)
+            created = int(record.created * 1_000_000)
+            delta = created - self._last_time
+            self._last_time = created
+            zigzag = delta << 1 if delta >= 0 else ~delta << 1 | 1
+            if zigzag < 0x80:  # noqa: PLR2004
+                buf.append(zigzag)
+            else:
+                _varint(buf, zigzag)
+            return buf
+
+        def _internTemplate(
+            self, template: tuple[str, str]
+        ) -> tuple[int, bytearray | None]:
+            # (new id, its TEMPLATE entry), or (0, None) if the table is full
+            _string = ApatheticLogging_Internal_BinaryFormat.writeString
+            if len(self.templates) >= self.max_templates:
+                return 0, None
+            template_id = len(self.templates) + 1
+            self.templates[template] = template_id
+            entry = bytearray(
+                (ApatheticLogging_Internal_Constants.BinaryTags.TEMPLATE,)
+            )
+            ApatheticLogging_Internal_BinaryFormat.writeVarint(entry, template_id)
+            _string(entry, template[0])
+            _string(entry, template[1])
+            return template_id, entry
+
+        def _writeExtras(self, buf: bytearray, record: logging.LogRecord) -> None:
+            # flags byte, then traceback, stack info and context if present
+            _tags = ApatheticLogging_Internal_Constants.BinaryTags
+            _varint = ApatheticLogging_Internal_BinaryFormat.writeVarint
+            _string = ApatheticLogging_Internal_BinaryFormat.writeString
+            if record.exc_info and not record.exc_text:
+                # as logging.Formatter.format() does, cached on the record
+                record.exc_text = self._exc_formatter.formatException(record.exc_info)
+            exc_text = record.exc_text
+            stack_info = record.stack_info
+            context = getattr(record, "log_context", None)
+            buf.append(
+                (_tags.HAS_EXC_TEXT if exc_text else 0)
+                | (_tags.HAS_STACK_INFO if stack_info else 0)
+                | (_tags.HAS_CONTEXT if context else 0)
+            )
+            if exc_text:
+                _string(buf, exc_text)
+            if stack_info:
+                _string(buf, stack_info)
+            if context:
+                # values as TagFormatter renders them
+                _varint(buf, len(context))
+                for key, value in context.items():
+                    _string(buf, str(key))
+                    _string(buf, str(value))
+
+        def _writeArgs(self, buf: bytearray, args: tuple[Any, ...]) -> bool:
+            # False (buf left partly written) if an argument can't be rebuilt
+            _tags = ApatheticLogging_Internal_Constants.BinaryTags
+            _varint = ApatheticLogging_Internal_BinaryFormat.writeVarint
+            _varint(buf, len(args))
+            for arg in args:
+                # exact types only: subclasses (enums, ...) format differently
+                arg_type = type(arg)
+                if arg_type is str:
+                    data = arg.encode("utf-8", "surrogatepass")
+                    buf.append(_tags.STR)
+                    if len(data) < 0x80:  # noqa: PLR2004
+                        buf.append(len(data))
+                    else:
+                        _varint(buf, len(data))
+                    buf += data
+                elif arg_type is int:
+                    buf.append(_tags.INT)
+                    zigzag = arg << 1 if arg >= 0 else ~arg << 1 | 1
+                    if zigzag < 0x80:  # noqa: PLR2004
+                        buf.append(zigzag)
+                    else:
+                        _varint(buf, zigzag)
+                elif arg_type is float:
+                    buf.append(_tags.FLOAT)
+                    buf += self._pack_double(arg)
+                elif arg is None or arg_type is bool:
+                    buf.append(
+                        _tags.NONE
+                        if arg is None
+                        else _tags.TRUE
+                        if arg
+                        else _tags.FALSE
+                    )
+                elif arg_type is bytes:
+                    buf.append(_tags.BYTES)
+                    _varint(buf, len(arg))
+                    buf += arg
+                else:
+                    return False
+            return True
+
+    class BinaryRecordDecoder:
+        """Turn BinaryRecordEncoder output back into LogRecords.
+
+        Rebuilt records carry the logger name, level, time, message template
+        and arguments, traceback text, stack info and log context of the
+        originals; other attributes (pathname, lineno, process, thread, ...)
+        are not stored. Format them with the same formatter to get the same
+        text, e.g. TagFormatter.
+        """
+
+        def __init__(self, created: float) -> None:
+            """Initialize the decoder for one stream.
+
+            Args:
+                created: Time base the encoder was reset with
+            """
+            # template id -> (logger name, message template)
+            self.templates: dict[int, tuple[str, str]] = {}
+            # time of the previous event, in microseconds
+            self._last_time = int(created * 1_000_000)
+            # deferred: struct is only needed once a decoder is created
+            import struct  # noqa: PLC0415
+
+            self._double = struct.Struct("<d")
+            self._data = b""
+            self._pos = 0
+
+        def decode(
+            self, chunk: bytes | bytearray | memoryview
+        ) -> list[logging.LogRecord]:
+            """Decode one chunk of encoder output (the result of one encode()).
+
+            Template entries are remembered for the chunks that follow.
+
+            Args:
+                chunk: Encoded entries
+
+            Returns:
+                A LogRecord for each event in the chunk
+
+            Raises:
+                ValueError: If the chunk is malformed
+            """
+            _tags = ApatheticLogging_Internal_Constants.BinaryTags
+            self._data = data = bytes(chunk)
+            self._pos = 0
+            records: list[logging.LogRecord] = []
+            try:
+                while self._pos < len(data):
+                    kind = data[self._pos]
+                    self._pos += 1
+                    if kind == _tags.TEMPLATE:
+                        template_id = self._readVarint()
+                        name = self._readString()
+                        self.templates[template_id] = (name, self._readString())
+                    elif kind == _tags.EVENT:
+                        records.append(self._readEvent())
+                    else:
+                        msg = f"Unknown binary entry type: {kind:#x}"
+                        raise ValueError(msg)
+            except IndexError as e:
+                msg = "Truncated binary log record"
+                raise ValueError(msg) from e
+            return records
+
+        def _readVarint(self) -> int:
+            data = self._data
+            value = shift = 0
+            while True:
+                byte = data[self._pos]
+                self._pos += 1
+                value |= (byte & 0x7F) << shift
+                if byte < 0x80:  # noqa: PLR2004
+                    return value
+                shift += 7
+
+        def _readSigned(self) -> int:
+            value = self._readVarint()
+            return ~(value >> 1) if value & 1 else value >> 1
+
+        def _readBytes(self) -> bytes:
+            length = self._readVarint()
+            start = self._pos
+            self._pos = end = start + length
+            if end > len(self._data):
+                raise IndexError(end)
+            return self._data[start:end]
+
+        def _readString(self) -> str:
+            return str(self._readBytes(), "utf-8", "surrogatepass")
+
+        def _readArg(self) -> Any:
+            _tags = ApatheticLogging_Internal_Constants.BinaryTags
+            tag = self._data[self._pos]
+            self._pos += 1
+            if tag == _tags.STR:
+                return self._readString()
+            if tag == _tags.INT:
+                return self._readSigned()
+            if tag == _tags.FLOAT:
+                (value,) = self._double.unpack_from(self._data, self._pos)
+                self._pos += self._double.size
+                return value
+            if tag == _tags.BYTES:
+                return self._readBytes()
+            if tag in (_tags.NONE, _tags.TRUE, _tags.FALSE):
+                return None if tag == _tags.NONE else tag == _tags.TRUE
+            msg = f"Unknown binary argument type: {tag:#x}"
+            raise ValueError(msg)
+
+        def _readEvent(self) -> logging.LogRecord:
+            _tags = ApatheticLogging_Internal_Constants.BinaryTags
+            levelno = self._data[self._pos]
+            self._pos += 1
+            if levelno == 0xFF:  # noqa: PLR2004
+                levelno = self._readSigned()
+            self._last_time += self._readSigned()
+            args = tuple(self._readArg() for _ in range(self._readVarint()))
+
+            template_id = self._readVarint()
+            if template_id:
+                template = self.templates.get(template_id)
+                if template is None:
+                    msg = f"Unknown binary template id: {template_id}"
+                    raise ValueError(msg)
+                name, msg = template
+            else:
+                name = self._readString()
+                msg = self._readString()
+
+            flags = self._data[self._pos]
+            self._pos += 1
+            record = logging.LogRecord(name, levelno, "", 0, msg, args, None)
+            record.created = self._last_time / 1_000_000
+            record.msecs = self._last_time % 1_000_000 / 1000
+            if flags & _tags.HAS_EXC_TEXT:
+                record.exc_text = self._readString()
+            if flags & _tags.HAS_STACK_INFO:
+                record.stack_info = self._readString()
+            if flags & _tags.HAS_CONTEXT:
+                record.log_context = {
+                    self._readString(): self._readString()
+                    for _ in range(self._readVarint())
+                }
+            return record
+
+    @staticmethod
+    def writeVarint(buf: bytearray, value: int) -> None:
+        """Append an unsigned varint (little-endian base 128) to a buffer.
+
+        Args:
+            buf: Buffer to append to
+            value: Non-negative integer
+        """
+        while value > 0x7F:  # noqa: PLR2004
+            buf.append(value & 0x7F | 0x80)
+            value >>= 7
+        buf.append(value)
+
+    @staticmethod
+    def writeString(buf: bytearray, text: str) -> None:
+        """Append a varint byte length and the UTF-8 bytes of a string.
+
+        Args:
+            buf: Buffer to append to
+            text: String to append
+        """
+        data = text.encode("utf-8", "surrogatepass")
+        ApatheticLogging_Internal_BinaryFormat.writeVarint(buf, len(data))
+        buf += data
+
+    @staticmethod
+    def decodeBinaryRecords(
+        chunks: Iterable[bytes | bytearray | memoryview],
+        created: float,
+    ) -> Iterator[logging.LogRecord]:
+        """Yield the LogRecords in a stream written by a BinaryRecordEncoder.
+
+        See BinaryRecordDecoder for what the rebuilt records carry.
+
+        Args:
+            chunks: The encoder's output for one stream, in order (e.g.
+                iterSegmentRecords() of a binary segment)
+            created: Time base the encoder was reset with
+
+        Yields:
+            A LogRecord for each event
+
+        Raises:
+            ValueError: If the stream is malformed
+        """
+        decoder = ApatheticLogging_Internal_BinaryFormat.BinaryRecordDecoder(created)
+        for chunk in chunks:
+            yield from decoder.decode(chunk)
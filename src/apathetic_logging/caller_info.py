@@ -0,0 +1,53 @@
+# src/apathetic_logging/caller_info.py
+"""Change tracking for the caller-info decision in Apathetic Logging."""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+
+class ApatheticLogging_Internal_CallerInfo:  # noqa: N801  # pyright: ignore[reportUnusedClass]
+    """Mixin class that tracks changes to what a record's handlers read.
+
+    Logger._log() skips findCaller() when nothing a record reaches reads
+    caller info. Loggers keep that decision until the caller-info epoch
+    moves, so the steady-state check is one integer comparison. The epoch
+    is bumped by Logger.addHandler(), removeHandler(), addFilter() and
+    removeFilter(), by changing a Logger's ``propagate`` or ``parent``, and
+    by setFormatter(), addFilter() and removeFilter() on this package's
+    handlers. A logger whose records reach a standard library logger or
+    handler isn't told about changes to it, so it re-checks those on every
+    record instead.
+
+    When mixed into apathetic_logging, it provides
+    apathetic_logging.invalidateCallerInfo.
+    """
+
+    # bumped by invalidateCallerInfo(); loggers compare it to the epoch
+    # their cached decision was made at
+    _caller_info_epoch: int = 0
+
+    @staticmethod
+    def invalidateCallerInfo() -> None:
+        """Make every logger redo its caller-info decision on its next record.
+
+        Only needed after a change the package can't see, such as assigning
+        ``handler.formatter`` or appending to ``handler.filters`` directly.
+        """
+        ApatheticLogging_Internal_CallerInfo._caller_info_epoch += 1
+
+    class _WatchedHandler(logging.Handler):
+        """Handler base that bumps the caller-info epoch when it changes."""
+
+        def setFormatter(self, fmt: logging.Formatter | None) -> None:
+            super().setFormatter(fmt)
+            ApatheticLogging_Internal_CallerInfo.invalidateCallerInfo()
+
+        def addFilter(self, filter: Any) -> None:  # noqa: A002
+            super().addFilter(filter)
+            ApatheticLogging_Internal_CallerInfo.invalidateCallerInfo()
+
+        def removeFilter(self, filter: Any) -> None:  # noqa: A002
+            super().removeFilter(filter)
+            ApatheticLogging_Internal_CallerInfo.invalidateCallerInfo()
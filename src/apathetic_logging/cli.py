@@ -0,0 +1,121 @@
+# src/apathetic_logging/cli.py
+"""Command-line tools for Apathetic Logging."""
+
+from __future__ import annotations
+
+import logging
+import os
+import sys
+
+from .logger import (
+    ApatheticLogging_Internal_LoggerCore,
+)
+from .segment_handler import (
+    ApatheticLogging_Internal_SegmentHandler,
+)
+from .tag_formatter import (
+    ApatheticLogging_Internal_TagFormatter,
+)
+
+
+class ApatheticLogging_Internal_Cli:  # noqa: N801  # pyright: ignore[reportUnusedClass]
+    """Mixin class that provides the command-line entry point.
+
+    When mixed into apathetic_logging, it provides apathetic_logging.runCli,
+    which ``python -m apathetic_logging`` (and the ``apathetic_logging``
+    script) calls.
+    """
+
+    @staticmethod
+    def runCli(argv: list[str] | None = None) -> int:
+        """Run the ``apathetic_logging`` command line.
+
+        Commands:
+            decode PATH...: Print the records of segment files, or of every
+                segment in a directory. Binary segments are rendered with a
+                TagFormatter (``--format``, default ``%(message)s``, as
+                ensureHandlers() uses), giving the same ``[TRACE]`` and
+                emoji-tagged lines the records would have printed. Text
+                segments are printed as written.
+
+        Args:
+            argv: Arguments after the program name, or None for sys.argv
+
+        Returns:
+            Exit status: 0 on success, 1 if a path couldn't be read
+        """
+        # deferred: argparse is slow to import and only the command line needs it
+        import argparse  # noqa: PLC0415
+
+        parser = argparse.ArgumentParser(
+            prog="apathetic_logging",
+            description="Apathetic Logging command-line tools.",
+        )
+        commands = parser.add_subparsers(dest="command", required=True)
+        decode = commands.add_parser(
+            "decode",
+            help="print the records of log segments",
+            description="Print the records of log segments, oldest first.",
+        )
+        decode.add_argument(
+            "paths",
+            nargs="+",
+            metavar="PATH",
+            help="segment file, or directory of segments",
+        )
+        decode.add_argument(
+            "--format",
+            default="%(message)s",
+            help="logging format string for binary records (default: %(default)s)",
+        )
+        decode.add_argument(
+            "--color",
+            action=argparse.BooleanOptionalAction,
+            default=None,
+            help="color level tags (default: when stdout is a terminal)",
+        )
+        args = parser.parse_args(argv)
+
+        color = (
+            args.color
+            if args.color is not None
+            else ApatheticLogging_Internal_LoggerCore.determineColorEnabled()
+        )
+        formatter = ApatheticLogging_Internal_TagFormatter.TagFormatter(args.format)
+        status = 0
+        for path in args.paths:
+            if not ApatheticLogging_Internal_Cli._printSegments(
+                path, formatter, color=color
+            ):
+                status = 1
+        return status
+
+    @staticmethod
+    def _printSegments(
+        path: str,
+        formatter: logging.Formatter,
+        *,
+        color: bool,
+    ) -> bool:
+        # print a segment, or a directory of them; False if one can't be read
+        _segment_handler = ApatheticLogging_Internal_SegmentHandler
+        write = sys.stdout.write
+        try:
+            segments = (
+                _segment_handler.listSegments(path)
+                if os.path.isdir(path)  # noqa: PTH112
+                else [path]
+            )
+            for segment in segments:
+                header = _segment_handler.readSegmentHeader(segment)
+                if header["record_format"] == "binary":
+                    for record in _segment_handler.decodeSegment(segment):
+                        record.enable_color = color
+                        write(formatter.format(record) + "\n")
+                else:
+                    for view in _segment_handler.iterSegmentRecords(segment):
+                        write(str(view, "utf-8", "backslashreplace") + "\n")
+        except (OSError, ValueError) as e:
+            sys.stderr.write(f"apathetic_logging: {e}\n")
+            return False
+        return True
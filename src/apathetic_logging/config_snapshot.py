@@ -0,0 +1,147 @@
+# src/apathetic_logging/config_snapshot.py
+"""Resolved registry configuration for Apathetic Logging."""
+
+from __future__ import annotations
+
+import sys
+
+from .constants import (
+    ApatheticLogging_Internal_Constants,
+)
+from .registry_data import (
+    ApatheticLogging_Internal_RegistryData,
+)
+
+
+class ApatheticLogging_Internal_ConfigSnapshot:  # noqa: N801  # pyright: ignore[reportUnusedClass]
+    """Mixin class that provides the memoized registry configuration.
+
+    Resolving the registry (namespace lookup plus fallbacks to constants) on
+    every logger construction is wasted work: the values only change when a
+    ``register*()`` function runs. This class resolves them once into a
+    ConfigSnapshot and keeps it until invalidateConfigSnapshot() is called.
+
+    When mixed into apathetic_logging, it provides
+    apathetic_logging.ConfigSnapshot, apathetic_logging.getConfigSnapshot and
+    apathetic_logging.invalidateConfigSnapshot.
+    """
+
+    _config_snapshot: ApatheticLogging_Internal_ConfigSnapshot.ConfigSnapshot | None = (
+        None
+    )
+
+    class ConfigSnapshot:
+        """Registry settings with their defaults already applied.
+
+        Environment variable *values* are not part of the snapshot: only the
+        names to check are cached, and their values are still read when a
+        level is resolved so runtime changes to the environment are honored.
+        """
+
+        __slots__ = (
+            "compatibility_mode",
+            "default_log_level",
+            "log_level_env_vars",
+            "propagate",
+        )
+
+        def __init__(
+            self,
+            *,
+            log_level_env_vars: tuple[str, ...],
+            default_log_level: str,
+            propagate: bool,
+            compatibility_mode: bool,
+        ) -> None:
+            """Initialize the snapshot.
+
+            Args:
+                log_level_env_vars: Environment variable names to check, in order
+                default_log_level: Uppercased default log level name
+                propagate: Propagate setting for new loggers
+                compatibility_mode: Whether stdlib compatibility mode is on
+            """
+            self.log_level_env_vars = log_level_env_vars
+            self.default_log_level = default_log_level
+            self.propagate = propagate
+            self.compatibility_mode = compatibility_mode
+
+        def __repr__(self) -> str:
+            return (
+                f"ConfigSnapshot(log_level_env_vars={self.log_level_env_vars!r}, "
+                f"default_log_level={self.default_log_level!r}, "
+                f"propagate={self.propagate!r}, "
+                f"compatibility_mode={self.compatibility_mode!r})"
+            )
+
+    @staticmethod
+    def _namespaceClass() -> type | None:
+        namespace_module = sys.modules.get("apathetic_logging")
+        return getattr(namespace_module, "apathetic_logging", None)
+
+    @staticmethod
+    def _snapshotOwner() -> type:
+        # Installed and stitched copies of this module can be loaded side by
+        # side; they share the snapshot stored on the active namespace class
+        # so a register*() call in either copy invalidates it for both.
+        namespace_class = ApatheticLogging_Internal_ConfigSnapshot._namespaceClass()
+        if namespace_class is not None:
+            for klass in namespace_class.__mro__:
+                if "_config_snapshot" in klass.__dict__:
+                    return klass
+        return ApatheticLogging_Internal_ConfigSnapshot
+
+    @staticmethod
+    def getConfigSnapshot() -> ApatheticLogging_Internal_ConfigSnapshot.ConfigSnapshot:
+        """Return the resolved registry configuration, building it if necessary.
+
+        The registry is read through the namespace class MRO (so shadowed
+        attributes resolve correctly in both installed and stitched builds),
+        falling back to direct registry access.
+
+        Returns:
+            The current ConfigSnapshot
+        """
+        namespace_class = ApatheticLogging_Internal_ConfigSnapshot._namespaceClass()
+        snapshot: ApatheticLogging_Internal_ConfigSnapshot.ConfigSnapshot | None = (
+            getattr(namespace_class, "_config_snapshot", None)
+            if namespace_class is not None
+            else ApatheticLogging_Internal_ConfigSnapshot._config_snapshot
+        )
+        if snapshot is not None:
+            return snapshot
+
+        _constants = ApatheticLogging_Internal_Constants
+        source: type = namespace_class or ApatheticLogging_Internal_RegistryData
+
+        env_vars = getattr(source, "registered_internal_log_level_env_vars", None)
+        default_level = getattr(source, "registered_internal_default_log_level", None)
+        propagate = getattr(source, "registered_internal_propagate", None)
+        compat_mode = getattr(source, "registered_internal_compatibility_mode", None)
+
+        snapshot = ApatheticLogging_Internal_ConfigSnapshot.ConfigSnapshot(
+            log_level_env_vars=tuple(
+                env_vars or _constants.DEFAULT_APATHETIC_LOG_LEVEL_ENV_VARS
+            ),
+            default_log_level=(
+                default_level or _constants.DEFAULT_APATHETIC_LOG_LEVEL
+            ).upper(),
+            propagate=(
+                propagate if propagate is not None else _constants.DEFAULT_PROPAGATE
+            ),
+            compatibility_mode=bool(compat_mode),
+        )
+        owner = ApatheticLogging_Internal_ConfigSnapshot._snapshotOwner()
+        owner._config_snapshot = snapshot  # type: ignore[attr-defined]  # noqa: SLF001
+        return snapshot
+
+    @staticmethod
+    def invalidateConfigSnapshot() -> None:
+        """Discard the resolved registry configuration.
+
+        Called by every ``register*()`` function. Code that writes the
+        ``registered_internal_*`` attributes directly must call this too.
+        """
+        ApatheticLogging_Internal_ConfigSnapshot._config_snapshot = None
+        owner = ApatheticLogging_Internal_ConfigSnapshot._snapshotOwner()
+        owner._config_snapshot = None  # type: ignore[attr-defined]  # noqa: SLF001
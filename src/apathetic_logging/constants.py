@@ -108,3 +108,223 @@ class ApatheticLogging_Internal_Constants:  # noqa: N801  # pyright: ignore[repo
     When False, loggers do not propagate messages to parent loggers,
     avoiding duplicate root logs.
     """
+
+    DEFAULT_ASYNC_QUEUE_SIZE: int = 10_000
+    """Default maximum number of records waiting for the async writer thread."""
+
+    ASYNC_OVERFLOW_POLICIES: ClassVar[list[str]] = [
+        "block",  # caller waits for room in the queue
+        "drop-oldest",  # discard the oldest queued record to make room
+        "drop-newest",  # discard the record being logged
+    ]
+    """What an async logger does when its queue is full."""
+
+    DEFAULT_ASYNC_OVERFLOW: str = "block"
+    """Default overflow policy for the async writer queue."""
+
+    DEFAULT_BUFFER_SIZE: int = 64 * 1024
+    """Characters a buffered DualStreamHandler collects before writing."""
+
+    DEFAULT_BUFFER_FLUSH_INTERVAL: float = 1.0
+    """Seconds a buffered DualStreamHandler holds output before writing."""
+
+    DEFAULT_FILE_BUFFER_SIZE: int = 256 * 1024
+    """Bytes a DualFileHandler collects per file before writing."""
+
+    DEFAULT_FILE_BACKUP_COUNT: int = 5
+    """Rotated segments a DualFileHandler keeps per file."""
+
+    FILE_ROUTE_SUFFIXES: ClassVar[tuple[str, ...]] = ("", ".err", ".debug")
+    """DualFileHandler file name suffixes, indexed by route code.
+
+    Inserted before the extension: ``app.log``, ``app.err.log`` and
+    ``app.debug.log`` for normal output, warnings and errors, and
+    diagnostics.
+    """
+
+    DEFAULT_SEGMENT_SIZE: int = 16 * 1024 * 1024
+    """Bytes preallocated for each MmapSegmentHandler segment file."""
+
+    DEFAULT_SEGMENT_SYNC_INTERVAL: float = 1.0
+    """Seconds an MmapSegmentHandler waits between syncs to disk."""
+
+    DEFAULT_SEGMENT_SYNC_LEVEL: int = logging.ERROR
+    """Records at or above this level sync an MmapSegmentHandler at once."""
+
+    SEGMENT_FILE_FORMAT: str = "segment-{pid}-{seq:06d}.seg"
+    """Segment file names, by writing process and sequence number."""
+
+    SEGMENT_MAGIC: bytes = b"APLOGSEG"
+    """First bytes of every segment file."""
+
+    SEGMENT_VERSION: int = 1
+    """Segment format version written to the header."""
+
+    SEGMENT_HEADER_SIZE: int = 64
+    """Bytes reserved for the segment header; records start after it."""
+
+    SEGMENT_HEADER_FORMAT: str = "<8sHHIQdQQd"
+    """struct format of the segment header.
+
+    magic, version, header size, flags, capacity (file size in bytes),
+    created (time.time()), then the index: end (offset just past the last
+    record), record count, and time of the last record.
+    """
+
+    SEGMENT_INDEX_OFFSET: int = 32
+    """Offset of the index (end, count, last time) in the header."""
+
+    SEGMENT_INDEX_FORMAT: str = "<QQd"
+    """struct format of the index, rewritten after every record."""
+
+    SEGMENT_RECORD_PREFIX_FORMAT: str = "<I"
+    """struct format of the length written before each record's bytes."""
+
+    SEGMENT_RECORD_FORMATS: ClassVar[list[str]] = [
+        "text",  # each record formatted by the handler's formatter
+        "binary",  # BinaryRecordEncoder entries, rendered when decoded
+    ]
+    """Record formats an MmapSegmentHandler can write."""
+
+    DEFAULT_SEGMENT_RECORD_FORMAT: str = "text"
+    """Default record format for MmapSegmentHandler segments."""
+
+    SEGMENT_FLAG_BINARY: int = 0x1
+    """Segment header flag: records are BinaryRecordEncoder entries."""
+
+    BINARY_MAX_TEMPLATES: int = 4096
+    """Templates a BinaryRecordEncoder interns per segment.
+
+    Records from further call sites are written with their merged message.
+    """
+
+    class BinaryTags:
+        """Type bytes of the binary record format (see BinaryRecordEncoder)."""
+
+        TEMPLATE: int = 0x01
+        """Entry: template id, logger name, and message template."""
+
+        EVENT: int = 0x02
+        """Entry: one log record."""
+
+        NONE: int = 0x00
+        """Argument: None."""
+
+        FALSE: int = 0x01
+        """Argument: False."""
+
+        TRUE: int = 0x02
+        """Argument: True."""
+
+        INT: int = 0x03
+        """Argument: int, as a zigzag varint."""
+
+        FLOAT: int = 0x04
+        """Argument: float, as a little-endian double."""
+
+        STR: int = 0x05
+        """Argument: str, as a varint length and UTF-8 bytes."""
+
+        BYTES: int = 0x06
+        """Argument: bytes, as a varint length and the bytes."""
+
+        HAS_EXC_TEXT: int = 0x01
+        """Event flag: a rendered traceback follows."""
+
+        HAS_STACK_INFO: int = 0x02
+        """Event flag: stack info follows."""
+
+        HAS_CONTEXT: int = 0x04
+        """Event flag: log context fields follow."""
+
+    DEFAULT_FLIGHT_RECORDER_CAPACITY: int = 1000
+    """Records a FlightRecorderHandler keeps for the next dump."""
+
+    DEFAULT_FLIGHT_RECORDER_LEVEL: int = TRACE_LEVEL
+    """Lowest level a registered flight recorder keeps."""
+
+    DEFAULT_FLIGHT_RECORDER_DUMP_LEVEL: int = logging.ERROR
+    """Records at or above this level dump the flight recorder."""
+
+    FLIGHT_RECORDER_FILE_FORMAT: str = "%(asctime)s %(levelname)s %(name)s: %(message)s"
+    """Format for flight recorder dumps written to a file."""
+
+    OUTPUT_FORMATS: ClassVar[list[str]] = [
+        "text",  # TagFormatter: level tags, optional color
+        "json",  # JsonFormatter: one JSON object per line
+    ]
+    """Output formats ensureHandlers() can attach."""
+
+    DEFAULT_OUTPUT_FORMAT: str = "text"
+    """Default output format for logger handlers."""
+
+    JSON_FIELDS: ClassVar[dict[str, str]] = {
+        "time": "created",
+        "level": "levelname",
+        "logger": "name",
+        "message": "message",
+    }
+    """Default JsonFormatter fields: output key -> LogRecord attribute."""
+
+    DEFAULT_RATE_LIMIT_BURST: int = 10
+    """Records a RateLimitFilter lets through back to back for one key."""
+
+    DEFAULT_RATE_LIMIT_MAX_KEYS: int = 1024
+    """Keys a RateLimitFilter tracks before forgetting the least recent."""
+
+    RATE_LIMIT_SUMMARY_FORMAT: str = "[repeated %d more times] %s"
+    """Message of the summary record for suppressed repeats (count, message)."""
+
+    DEFAULT_SAMPLING_KEY: str = "trace_id"
+    """Log context field whose value makes sampling decisions per request."""
+
+    METRICS_OUTCOMES: ClassVar[tuple[str, ...]] = (
+        "emitted",  # passed the logger's filters and went to its handlers
+        "dropped_level",  # below the logger's level
+        "dropped_filter",  # rejected by a filter on the logger
+        "dropped_sampled",  # not selected by registerSampling()
+    )
+    """Record counters kept per logger and level when metrics are enabled."""
+
+    METRICS_LATENCY_BUCKETS: ClassVar[tuple[float, ...]] = (
+        1e-6,
+        2.5e-6,
+        5e-6,
+        1e-5,
+        2.5e-5,
+        5e-5,
+        1e-4,
+        2.5e-4,
+        5e-4,
+        1e-3,
+        1e-2,
+        0.1,
+        1.0,
+    )
+    """Upper bounds (seconds) of the handler write-time histogram buckets."""
+
+    METRICS_PREFIX: str = "apathetic_logging"
+    """Prefix of the metric names written by formatOpenMetrics()."""
+
+    CALLER_INFO_ATTRS: ClassVar[tuple[str, ...]] = (
+        "pathname",
+        "filename",
+        "module",
+        "lineno",
+        "funcName",
+    )
+    """LogRecord attributes filled in by Logger.findCaller()."""
+
+    LOG_RECORD_ATTRS: ClassVar[frozenset[str]] = frozenset(
+        {
+            *logging.LogRecord("", 0, "", 0, "", (), None).__dict__,
+            "asctime",
+            "enable_color",  # set by DualStreamHandler for TagFormatter
+            "log_context",  # set by Logger.makeRecord() for TagFormatter
+            "message",
+            "output_stream",  # set by AsyncQueueHandler for DualStreamHandler
+            "taskName",
+            "test_mode",  # set by ProcessLogListener for DualStreamHandler
+        }
+    )
+    """LogRecord attributes that are not ``extra=`` values."""
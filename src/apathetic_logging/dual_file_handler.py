@@ -0,0 +1,449 @@
+# src/apathetic_logging/dual_file_handler.py
+"""DualFileHandler class for Apathetic Logging.
+
+Docstrings are adapted from the standard library logging.handlers documentation
+licensed under the Python Software Foundation License Version 2.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from contextlib import suppress
+from typing import Any, BinaryIO, cast
+
+from .caller_info import (
+    ApatheticLogging_Internal_CallerInfo,
+)
+from .constants import (
+    ApatheticLogging_Internal_Constants,
+)
+from .dual_stream_handler import (
+    ApatheticLogging_Internal_DualStreamHandler,
+)
+from .metrics import (
+    ApatheticLogging_Internal_Metrics,
+)
+from .registry_data import (
+    ApatheticLogging_Internal_RegistryData,
+)
+from .safe_logging import (
+    ApatheticLogging_Internal_SafeLogging,
+)
+from .tag_formatter import (
+    ApatheticLogging_Internal_TagFormatter,
+)
+
+
+class ApatheticLogging_Internal_DualFileHandler:  # noqa: N801  # pyright: ignore[reportUnusedClass]
+    """Mixin class that provides the DualFileHandler nested class.
+
+    This class contains the DualFileHandler implementation as a nested class.
+    When mixed into apathetic_logging, it provides apathetic_logging.DualFileHandler.
+    """
+
+    class DualFileHandler(
+        ApatheticLogging_Internal_CallerInfo._WatchedHandler,  # noqa: SLF001
+        logging.Handler,
+    ):
+        """Write records to rotating files, split by level like DualStreamHandler.
+
+        Each DualStreamHandler route gets its own file, named with
+        FILE_ROUTE_SUFFIXES: DETAIL, INFO, and MINIMAL go to ``app.log``,
+        WARNING and above to ``app.err.log``, and TEST, TRACE, and DEBUG to
+        ``app.debug.log``. Files are opened on their first record.
+
+        Formatted records are collected per file and written in one call
+        once ``buffer_size`` bytes or ``flush_interval`` seconds have
+        accumulated (by a background thread if nothing else is logged);
+        WARNING and above are written immediately.
+
+        A file is rotated once writing a record would take it past
+        ``max_bytes``, or ``rotate_interval`` seconds after it was opened.
+        Sizes are tracked in memory from the position the file was opened
+        at, so no record costs a stat() call. Rotated segments are kept as
+        ``app.log.1`` (newest) to ``app.log.<backup_count>``; with
+        ``compress=True`` they are gzipped (``app.log.1.gz``) by a
+        background thread, so logging never waits on compression.
+        """
+
+        terminator: str = "\n"
+
+        # suffix of a just-rotated file waiting to be renamed or compressed
+        ROTATING_SUFFIX: str = ".rotating"
+
+        def __init__(
+            self,
+            filename: str | os.PathLike[str],
+            *args: Any,
+            max_bytes: int | None = None,
+            rotate_interval: float | None = None,
+            backup_count: int | None = None,
+            compress: bool = False,
+            buffer_size: int | None = None,
+            flush_interval: float | None = None,
+            encoding: str = "utf-8",
+            **kwargs: Any,
+        ) -> None:
+            """Initialize the handler. No file is opened until it's written to.
+
+            Args:
+                filename: Path of the normal output file; the other routes'
+                    files are named after it (see FILE_ROUTE_SUFFIXES)
+                *args: Additional positional arguments (for future-proofing)
+                max_bytes: Rotate a file before it grows past this size, or
+                    None to never rotate by size
+                rotate_interval: Rotate a file this many seconds after it
+                    was opened, or None to never rotate by time
+                backup_count: Rotated segments to keep per file (must be
+                    > 0), or None for DEFAULT_FILE_BACKUP_COUNT
+                compress: Gzip rotated segments in a background thread
+                buffer_size: Bytes to collect per file before writing, or
+                    None for DEFAULT_FILE_BUFFER_SIZE
+                flush_interval: Seconds to hold output before writing, or
+                    None for DEFAULT_BUFFER_FLUSH_INTERVAL
+                encoding: Encoding of the files
+                **kwargs: Additional keyword arguments (for future-proofing)
+
+            Raises:
+                ValueError: If max_bytes, rotate_interval or backup_count is
+                    not positive
+            """
+            super().__init__(*args, **kwargs)
+            _constants = ApatheticLogging_Internal_Constants
+            if backup_count is None:
+                backup_count = _constants.DEFAULT_FILE_BACKUP_COUNT
+            for label, value in (
+                ("max_bytes", max_bytes),
+                ("rotate_interval", rotate_interval),
+                ("backup_count", backup_count),
+            ):
+                if value is not None and value <= 0:
+                    msg = f"DualFileHandler {label} must be > 0, got {value}"
+                    raise ValueError(msg)
+
+            self.baseFilename = os.path.abspath(os.fspath(filename))  # noqa: PTH100
+            self.max_bytes = max_bytes
+            self.rotate_interval = rotate_interval
+            self.backup_count = backup_count
+            self.compress = compress
+            self.buffer_size = (
+                buffer_size
+                if buffer_size is not None
+                else _constants.DEFAULT_FILE_BUFFER_SIZE
+            )
+            self.flush_interval = (
+                flush_interval
+                if flush_interval is not None
+                else _constants.DEFAULT_BUFFER_FLUSH_INTERVAL
+            )
+            self.encoding = encoding
+
+            stem, ext = os.path.splitext(self.baseFilename)  # noqa: PTH122
+            self.filenames: tuple[str, ...] = tuple(
+                f"{stem}{suffix}{ext}" if suffix else self.baseFilename
+                for suffix in _constants.FILE_ROUTE_SUFFIXES
+            )
+
+            # per route, indexed by ROUTE_* code
+            routes = len(self.filenames)
+            self._files: list[BinaryIO | None] = [None] * routes
+            self._buffers: list[list[bytes]] = [[] for _ in range(routes)]
+            self._buffer_lens: list[int] = [0] * routes
+            self._buffer_started: list[float] = [0.0] * routes
+            # bytes in the file (written, not buffered) and when to rotate it
+            self._sizes: list[int] = [0] * routes
+            self._rollover_at: list[float] = [0.0] * routes
+
+            # levelno -> ROUTE_* code, shared rules with DualStreamHandler
+            self._routes: dict[int, int] = {}
+
+            # rotated files waiting for the compressor thread, oldest first
+            self._rotations: int = 0
+            self._compress_jobs: list[tuple[str, str]] = []
+            self._compress_lock = threading.Lock()
+            self._compressor: threading.Thread | None = None
+
+            # writes buffers that are due when nothing else gets logged
+            self._flusher = ApatheticLogging_Internal_DualStreamHandler._BufferFlusher(  # noqa: SLF001
+                self, self._flushDue
+            )
+
+        def emit(self, record: logging.LogRecord) -> None:
+            """Format the record and write it to its route's file.
+
+            logging.Handler.emit() implementation:
+            https://docs.python.org/3.10/library/logging.html#logging.Handler.emit
+            """
+            # handler write time, only measured with metrics registered
+            started = (
+                time.perf_counter()
+                if ApatheticLogging_Internal_RegistryData.registered_internal_metrics
+                else 0.0
+            )
+            _stream_handler = ApatheticLogging_Internal_DualStreamHandler
+            level = record.levelno
+            route = self._routes.get(level)
+            if route is None:
+                route = self._routes[level] = (
+                    _stream_handler.DualStreamHandler.routeForLevel(level)
+                )
+
+            try:
+                data = (self.format(record) + self.terminator).encode(
+                    self.encoding, "backslashreplace"
+                )
+                self._writeRecord(
+                    route,
+                    data,
+                    immediate=route == _stream_handler.DualStreamHandler.ROUTE_STDERR,
+                )
+            except RecursionError:  # See issue 36272
+                raise
+            except Exception:  # noqa: BLE001
+                self.handleError(record)
+
+            if started:
+                ApatheticLogging_Internal_Metrics.observeHandlerTime(
+                    self.name or type(self).__name__, time.perf_counter() - started
+                )
+
+        def format(self, record: logging.LogRecord) -> str:
+            """Format a record, never with ANSI colors.
+
+            A TagFormatter is told not to color the record, whatever
+            enable_color another handler set on it; the record itself is
+            left alone.
+
+            logging.Handler.format() implementation:
+            https://docs.python.org/3.10/library/logging.html#logging.Handler.format
+            """
+            formatter = self.formatter
+            if isinstance(
+                formatter, ApatheticLogging_Internal_TagFormatter.TagFormatter
+            ):
+                return formatter.format(record, enable_color=False)
+            return super().format(record)
+
+        def _writeRecord(self, route: int, data: bytes, *, immediate: bool) -> None:
+            # called from emit() with the handler lock held
+            if self._files[route] is None:
+                self._openRoute(route)
+            if self.shouldRollover(route, len(data)):
+                self.doRollover(route)
+
+            buffer = self._buffers[route]
+            if not buffer:
+                self._buffer_started[route] = time.monotonic()
+                self._flusher.start()
+            buffer.append(data)
+            self._buffer_lens[route] += len(data)
+
+            if (
+                immediate
+                or self._buffer_lens[route] >= self.buffer_size
+                or time.monotonic() - self._buffer_started[route] >= self.flush_interval
+            ):
+                self._flushRoute(route)
+
+        def _flushDue(self, now: float) -> float | None:
+            # _BufferFlusher callback, with the handler lock held
+            next_due: float | None = None
+            for route, buffer in enumerate(self._buffers):
+                if not buffer:
+                    continue
+                deadline = self._buffer_started[route] + self.flush_interval
+                if now >= deadline:
+                    self._flushRoute(route)
+                elif next_due is None or deadline < next_due:
+                    next_due = deadline
+            return next_due
+
+        def shouldRollover(self, route: int, pending: int = 0) -> bool:
+            """Return True if a route's file should be rotated before writing.
+
+            Args:
+                route: ROUTE_* code of the file
+                pending: Bytes about to be written
+
+            Returns:
+                True if writing ``pending`` more bytes would take a non-empty
+                file past ``max_bytes``, or its ``rotate_interval`` is up
+            """
+            if self.max_bytes is not None:
+                size = self._sizes[route] + self._buffer_lens[route]
+                if size and size + pending > self.max_bytes:
+                    return True
+            return (
+                self.rotate_interval is not None
+                and time.time() >= self._rollover_at[route]
+            )
+
+        def doRollover(self, route: int) -> None:
+            """Rotate a route's file now and start a new one.
+
+            The file is renamed out of the way immediately; shifting the
+            older segments (and compressing this one) happens afterwards,
+            on the compressor thread when ``compress`` is set.
+
+            Args:
+                route: ROUTE_* code of the file
+            """
+            self._flushRoute(route)
+            file = self._files[route]
+            if file is not None:
+                file.close()
+                self._files[route] = None
+
+            path = self.filenames[route]
+            self._rotations += 1
+            pending = f"{path}{self.ROTATING_SUFFIX}.{os.getpid()}.{self._rotations}"
+            try:
+                os.replace(path, pending)  # noqa: PTH105
+            except FileNotFoundError:
+                # removed behind our back; nothing to keep
+                pending = ""
+
+            if pending:
+                if self.compress:
+                    self._submitCompression(path, pending)
+                else:
+                    self._finishRollover(path, pending)
+            self._openRoute(route)
+
+        def _openRoute(self, route: int) -> None:
+            # unbuffered: _buffers[route] is the userspace buffer
+            file = cast("BinaryIO", open(self.filenames[route], "ab", buffering=0))  # noqa: PTH123, SIM115
+            self._files[route] = file
+            # append mode starts at the end, so this is the current size
+            self._sizes[route] = file.tell()
+            if self.rotate_interval is not None:
+                self._rollover_at[route] = time.time() + self.rotate_interval
+
+        def _flushRoute(self, route: int) -> None:
+            buffer = self._buffers[route]
+            file = self._files[route]
+            if not buffer or file is None:
+                return
+            data = b"".join(buffer)
+            buffer.clear()
+            self._buffer_lens[route] = 0
+            file.write(data)
+            self._sizes[route] += len(data)
+
+        def _finishRollover(self, path: str, pending: str) -> None:
+            # shift path.1 .. path.N-1 up one (dropping path.N), then move
+            # the just-rotated file into path.1
+            ext = ".gz" if self.compress else ""
+            for i in range(self.backup_count - 1, 0, -1):
+                with suppress(FileNotFoundError):
+                    os.replace(f"{path}.{i}{ext}", f"{path}.{i + 1}{ext}")  # noqa: PTH105
+            newest = f"{path}.1{ext}"
+            if not self.compress:
+                os.replace(pending, newest)  # noqa: PTH105
+                return
+
+            # deferred: gzip and shutil are only needed once something is
+            # compressed
+            import gzip  # noqa: PLC0415
+            import shutil  # noqa: PLC0415
+
+            tmp_path = f"{newest}.tmp"
+            with (
+                open(pending, "rb") as src,  # noqa: PTH123
+                gzip.open(tmp_path, "wb") as dst,
+            ):
+                shutil.copyfileobj(src, dst)
+            os.replace(tmp_path, newest)  # noqa: PTH105
+            os.remove(pending)  # noqa: PTH107
+
+        def _submitCompression(self, path: str, pending: str) -> None:
+            with self._compress_lock:
+                self._compress_jobs.append((path, pending))
+                if self._compressor is None:
+                    self._compressor = threading.Thread(
+                        target=self._runCompressor,
+                        name="apathetic-logging-compressor",
+                        daemon=True,
+                    )
+                    self._compressor.start()
+
+        def _runCompressor(self) -> None:
+            while True:
+                with self._compress_lock:
+                    if not self._compress_jobs:
+                        self._compressor = None
+                        return
+                    path, pending = self._compress_jobs.pop(0)
+                try:
+                    self._finishRollover(path, pending)
+                except Exception as e:  # noqa: BLE001
+                    # keep going: the rotated file stays under its pending name
+                    ApatheticLogging_Internal_SafeLogging.safeLog(
+                        f"[apathetic_logging] compressing {pending} failed: {e!r}"
+                    )
+
+        def waitForCompression(self, timeout: float | None = None) -> None:
+            """Block until every rotated segment has been compressed.
+
+            Args:
+                timeout: Seconds to wait, or None to wait as long as it takes
+            """
+            thread = self._compressor
+            if thread is not None:
+                thread.join(timeout)
+
+        def discardBuffer(self) -> None:
+            """Drop buffered output without writing it.
+
+            Used in a forked child, where the buffer is a copy of output the
+            parent process still owns and will write itself.
+            """
+            for route, buffer in enumerate(self._buffers):
+                buffer.clear()
+                self._buffer_lens[route] = 0
+            # the parent's compressor thread (and its jobs) didn't survive
+            self._compress_jobs = []
+            self._compress_lock = threading.Lock()
+            self._compressor = None
+            self._flusher.reset()
+
+        def flush(self) -> None:
+            """Write any buffered output to the files.
+
+            logging.Handler.flush() implementation:
+            https://docs.python.org/3.10/library/logging.html#logging.Handler.flush
+            """
+            self.acquire()
+            try:
+                for route in range(len(self._buffers)):
+                    self._flushRoute(route)
+                self._flusher.wake()
+            finally:
+                self.release()
+
+        def close(self) -> None:
+            """Write any buffered output, close the files, and wait for compression.
+
+            logging.Handler.close() implementation:
+            https://docs.python.org/3.10/library/logging.html#logging.Handler.close
+            """
+            self.acquire()
+            try:
+                try:
+                    for route, file in enumerate(self._files):
+                        if file is None:
+                            continue
+                        try:
+                            self._flushRoute(route)
+                        finally:
+                            file.close()
+                            self._files[route] = None
+                    self._flusher.wake()
+                finally:
+                    super().close()
+            finally:
+                self.release()
+            self.waitForCompression()
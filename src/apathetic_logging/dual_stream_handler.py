@@ -9,7 +9,26 @@ from __future__ import annotations
 
 import logging
 import sys
-from typing import Any
+import threading
+import time
+from collections.abc import Callable
+from typing import Any, TextIO
+
+from .caller_info import (
+    ApatheticLogging_Internal_CallerInfo,
+)
+from .constants import (
+    ApatheticLogging_Internal_Constants,
+)
+from .metrics import (
+    ApatheticLogging_Internal_Metrics,
+)
+from .registry_data import (
+    ApatheticLogging_Internal_RegistryData,
+)
+from .safe_logging import (
+    ApatheticLogging_Internal_SafeLogging,
+)
 
 
 class ApatheticLogging_Internal_DualStreamHandler:  # noqa: N801  # pyright: ignore[reportUnusedClass]
@@ -19,7 +38,10 @@ class ApatheticLogging_Internal_DualStreamHandler:  # noqa: N801  # pyright: ign
     When mixed into apathetic_logging, it provides apathetic_logging.DualStreamHandler.
     """
 
-    class DualStreamHandler(logging.StreamHandler):  # type: ignore[type-arg]
+    class DualStreamHandler(
+        ApatheticLogging_Internal_CallerInfo._WatchedHandler,  # noqa: SLF001
+        logging.StreamHandler,  # type: ignore[type-arg]
+    ):
         """Send info to stdout, everything else to stderr.
 
         INFO, MINIMAL, and DETAIL go to stdout (normal program output).
@@ -30,21 +52,166 @@ class ApatheticLogging_Internal_DualStreamHandler:  # noqa: N801  # pyright: ign
         debugging tests without breaking output assertions while still being
         capturable by subprocess.run(capture_output=True).
         WARNING, ERROR, and CRITICAL always use normal stderr, even in TEST mode.
+
+        With ``buffered=True``, formatted records are collected per target
+        stream and written in one call once ``buffer_size`` characters or
+        ``flush_interval`` seconds have accumulated. WARNING and above are
+        written immediately, and the buffer is written before switching
+        between stdout and stderr, so interleaving stays correct. A
+        background thread writes output that has waited ``flush_interval``
+        seconds even if nothing more is logged.
         """
 
         enable_color: bool = False
         """Enable ANSI color output for log messages."""
 
-        def __init__(self, *args: Any, **kwargs: Any) -> None:
+        ROUTE_STDOUT: int = 0
+        """Route code: normal program output (sys.stdout)."""
+
+        ROUTE_STDERR: int = 1
+        """Route code: errors and warnings (sys.stderr, even in TEST mode)."""
+
+        ROUTE_DIAGNOSTIC: int = 2
+        """Route code: TEST/TRACE/DEBUG (sys.stderr, or sys.__stderr__ in TEST mode)."""
+
+        # bumped by invalidateLevelCache() whenever a logger level changes;
+        # always read and written on the base class so subclasses share it
+        _level_epoch: int = 0
+
+        def __init__(
+            self,
+            *args: Any,
+            buffered: bool = False,
+            buffer_size: int | None = None,
+            flush_interval: float | None = None,
+            **kwargs: Any,
+        ) -> None:
             """Initialize the dual stream handler. super().__init__() to StreamHandler.
 
             Args:
                 *args: Additional positional arguments (for future-proofing)
+                buffered: Collect records and write them in batches instead
+                    of writing and flushing each one
+                buffer_size: Characters to collect before writing, or None
+                    for DEFAULT_BUFFER_SIZE (buffered mode only)
+                flush_interval: Seconds to hold output before writing, or None
+                    for DEFAULT_BUFFER_FLUSH_INTERVAL (buffered mode only)
                 **kwargs: Additional keyword arguments (for future-proofing)
             """
             # default to stdout, overridden per record in emit()
             super().__init__(*args, **kwargs)  # pyright: ignore[reportUnknownMemberType]
 
+            _constants = ApatheticLogging_Internal_Constants
+
+            self.buffered = buffered
+            self.buffer_size = (
+                buffer_size
+                if buffer_size is not None
+                else _constants.DEFAULT_BUFFER_SIZE
+            )
+            self.flush_interval = (
+                flush_interval
+                if flush_interval is not None
+                else _constants.DEFAULT_BUFFER_FLUSH_INTERVAL
+            )
+
+            # pending output for buffered mode; all of it goes to _buffer_stream
+            self._buffer: list[str] = []
+            self._buffer_len: int = 0
+            self._buffer_stream: TextIO | None = None
+            self._buffer_started: float = 0.0
+            self._flusher = ApatheticLogging_Internal_DualStreamHandler._BufferFlusher(
+                self, self._flushDue
+            )
+
+            # levelno -> ROUTE_* code, filled lazily for levels we haven't seen
+            self._routes: dict[int, int] = {
+                level: self.routeForLevel(level)
+                for level in (
+                    _constants.TEST_LEVEL,
+                    _constants.TRACE_LEVEL,
+                    logging.DEBUG,
+                    _constants.DETAIL_LEVEL,
+                    logging.INFO,
+                    _constants.MINIMAL_LEVEL,
+                    logging.WARNING,
+                    logging.ERROR,
+                    logging.CRITICAL,
+                )
+            }
+
+            # logger name -> is that logger in TEST mode, valid for one epoch
+            self._test_mode_cache: dict[str, bool] = {}
+            self._test_mode_epoch: int = -1
+
+        @staticmethod
+        def routeForLevel(level: int) -> int:
+            """Return the ROUTE_* code for a numeric level.
+
+            Args:
+                level: The numeric logging level
+
+            Returns:
+                ROUTE_STDERR for WARNING and above, ROUTE_DIAGNOSTIC for DEBUG
+                and below, ROUTE_STDOUT for everything in between
+            """
+            _handler = ApatheticLogging_Internal_DualStreamHandler.DualStreamHandler
+            if level >= logging.WARNING:
+                # WARNING, ERROR, CRITICAL → stderr (always, even in TEST mode)
+                # This ensures they still break tests as expected
+                return _handler.ROUTE_STDERR
+            if level <= logging.DEBUG:
+                # TEST, TRACE, DEBUG → stderr (normal) or __stderr__ (TEST mode)
+                return _handler.ROUTE_DIAGNOSTIC
+            # DETAIL, INFO, MINIMAL → stdout (normal program output)
+            return _handler.ROUTE_STDOUT
+
+        @staticmethod
+        def invalidateLevelCache() -> None:
+            """Drop every handler's cached per-logger TEST-mode state.
+
+            Called by Logger.setLevel() and Logger.__init__(); call it yourself
+            if you change a logger's ``level`` attribute directly.
+            """
+            _handler = ApatheticLogging_Internal_DualStreamHandler.DualStreamHandler
+            _handler._level_epoch += 1  # noqa: SLF001
+
+        def isTestMode(self, logger_name: str) -> bool:
+            """Return True if the named logger is an apathetic Logger at TEST level.
+
+            The answer is cached per logger name until the next
+            invalidateLevelCache().
+
+            Args:
+                logger_name: Name of the logger that created the record
+
+            Returns:
+                True if verbose records from this logger should bypass capture
+            """
+            _constants = ApatheticLogging_Internal_Constants
+            _handler = ApatheticLogging_Internal_DualStreamHandler.DualStreamHandler
+            epoch = _handler._level_epoch  # noqa: SLF001
+            if self._test_mode_epoch != epoch:
+                self._test_mode_cache.clear()
+                self._test_mode_epoch = epoch
+
+            cached = self._test_mode_cache.get(logger_name)
+            if cached is not None:
+                return cached
+
+            # can't use internal getLogger() here
+            #   because then it will call extendLoggingModule again
+            logger_instance = logging.getLogger(logger_name)
+
+            # Use duck typing to check if this is our Logger class
+            # (has test() method) to avoid circular dependency
+            has_test_method = callable(getattr(logger_instance, "test", None))
+            is_test_mode = has_test_method and logger_instance.level == (
+                _constants.TEST_LEVEL
+            )
+            self._test_mode_cache[logger_name] = is_test_mode
+            return is_test_mode
+
         def emit(self, record: logging.LogRecord, *args: Any, **kwargs: Any) -> None:
             """Routes based on log level and handles colorization.
 
@@ -54,8 +221,16 @@ class ApatheticLogging_Internal_DualStreamHandler:  # noqa: N801  # pyright: ign
               - TRACE, DEBUG, WARNING, ERROR, and CRITICAL → stderr
                 (diagnostic/error output)
             - In TEST mode, TEST/TRACE/DEBUG messages bypass pytest capture
-              by writing to sys.__stderr__ instead of sys.stderr
+              by writing to sys.__stderr__ instead of sys.stderr (records
+              with a true ``test_mode`` attribute, as sent from child
+              processes, count as TEST mode too)
             - Sets enable_color attribute on record for TagFormatter integration
+            - A record with an ``output_stream`` attribute (set by
+              AsyncQueueHandler on the thread that logged it) is written
+              to that stream
+
+            Routing is a table lookup; only diagnostic records consult the
+            (cached) TEST-mode state of their logger.
 
             Args:
                 record: The LogRecord to emit
@@ -65,54 +240,206 @@ class ApatheticLogging_Internal_DualStreamHandler:  # noqa: N801  # pyright: ign
             logging.Handler.emit() implementation:
             https://docs.python.org/3.10/library/logging.html#logging.Handler.emit
             """
-            # Import here to avoid circular dependency
-            from .constants import (  # noqa: PLC0415
-                ApatheticLogging_Internal_Constants,
+            # handler write time, only measured with metrics registered
+            started = (
+                time.perf_counter()
+                if ApatheticLogging_Internal_RegistryData.registered_internal_metrics
+                else 0.0
             )
+            level = record.levelno
+            route = self._routes.get(level)
+            if route is None:
+                route = self._routes[level] = self.routeForLevel(level)
 
-            _constants = ApatheticLogging_Internal_Constants
+            # chosen where the record was logged when it was written elsewhere
+            stream = getattr(record, "output_stream", None)
+            self.stream = (
+                stream if stream is not None else self._streamForRoute(record, route)
+            )
+
+            # used by TagFormatter
+            record.enable_color = self.enable_color
+
+            if not self.buffered:
+                super().emit(record, *args, **kwargs)
+            else:
+                try:
+                    self._bufferRecord(record, route)
+                except RecursionError:  # See issue 36272
+                    raise
+                except Exception:  # noqa: BLE001
+                    self.handleError(record)
+
+            if started:
+                ApatheticLogging_Internal_Metrics.observeHandlerTime(
+                    self.name or type(self).__name__, time.perf_counter() - started
+                )
+
+        def streamFor(self, record: logging.LogRecord) -> TextIO:
+            """Return the stream emit() would write a record to right now.
+
+            The answer depends on the current sys.stdout and sys.stderr, so
+            call it on the thread that logged the record. AsyncQueueHandler
+            does, and stores it on the record as ``output_stream`` for the
+            writer thread.
+
+            Args:
+                record: The LogRecord to route
+
+            Returns:
+                sys.stdout, sys.stderr, or sys.__stderr__ (TEST mode)
+            """
             level = record.levelno
+            route = self._routes.get(level)
+            if route is None:
+                route = self._routes[level] = self.routeForLevel(level)
+            return self._streamForRoute(record, route)
 
-            # Check if logger is in TEST mode (bypass capture for verbose levels)
-            logger_name = record.name
-            # from .get_logger import (
-            #     ApatheticLogging_Internal_GetLogger,
-            # )
+        def _streamForRoute(self, record: logging.LogRecord, route: int) -> TextIO:
+            if route == self.ROUTE_STDOUT:
+                return sys.stdout
+            if route == self.ROUTE_STDERR or not (
+                # records from child processes carry their logger's TEST mode
+                getattr(record, "test_mode", False) or self.isTestMode(record.name)
+            ):
+                return sys.stderr
+            # Use __stderr__ so they bypass pytest capsys but are still
+            # capturable by subprocess.run(capture_output=True)
+            return sys.__stderr__  # type: ignore[return-value]
 
-            # logger_instance = ApatheticLogging_Internal_GetLogger.getLogger(
-            #     logger_name, extend=False
-            # )
-            # can't use internal getLogger() here
-            #   because then it will call extendLoggingModule again
-            logger_instance = logging.getLogger(logger_name)
+        def _bufferRecord(self, record: logging.LogRecord, route: int) -> None:
+            # called from emit() with the handler lock held
+            stream = self.stream
+            if self._buffer and stream is not self._buffer_stream:
+                # keep stdout/stderr interleaving in logged order
+                self._flushBuffer()
 
-            # Use duck typing to check if this is our Logger class
-            # (has test() method) to avoid circular dependency
-            has_test_method = hasattr(logger_instance, "test") and callable(
-                getattr(logger_instance, "test", None)
-            )
-            is_test_mode = has_test_method and logger_instance.level == (
-                _constants.TEST_LEVEL
-            )
+            msg = self.format(record) + self.terminator
+            if not self._buffer:
+                self._buffer_stream = stream
+                self._buffer_started = time.monotonic()
+                self._flusher.start()
+            self._buffer.append(msg)
+            self._buffer_len += len(msg)
 
-            # Determine target stream
-            if level >= logging.WARNING:
-                # WARNING, ERROR, CRITICAL → stderr (always, even in TEST mode)
-                # This ensures they still break tests as expected
-                self.stream = sys.stderr
-            elif level <= logging.DEBUG:
-                # TEST, TRACE, DEBUG → stderr (normal) or __stderr__ (TEST mode bypass)
-                # Use __stderr__ so they bypass pytest capsys but are still
-                # capturable by subprocess.run(capture_output=True)
-                if is_test_mode:
-                    self.stream = sys.__stderr__
-                else:
-                    self.stream = sys.stderr
-            else:
-                # DETAIL, INFO, MINIMAL → stdout (normal program output)
-                self.stream = sys.stdout
+            if (
+                route == self.ROUTE_STDERR
+                or self._buffer_len >= self.buffer_size
+                or time.monotonic() - self._buffer_started >= self.flush_interval
+            ):
+                self._flushBuffer()
 
-            # used by TagFormatter
-            record.enable_color = getattr(self, "enable_color", False)
+        def _flushDue(self, now: float) -> float | None:
+            # _BufferFlusher callback, with the handler lock held
+            if not self._buffer:
+                return None
+            deadline = self._buffer_started + self.flush_interval
+            if now < deadline:
+                return deadline
+            self._flushBuffer()
+            return None
+
+        def _flushBuffer(self) -> None:
+            stream = self._buffer_stream
+            if not self._buffer or stream is None:
+                return
+            data = "".join(self._buffer)
+            self._buffer.clear()
+            self._buffer_len = 0
+            self._buffer_stream = None
+            stream.write(data)
+            if hasattr(stream, "flush"):
+                stream.flush()
+
+        def discardBuffer(self) -> None:
+            """Drop buffered output without writing it.
+
+            Used in a forked child, where the buffer is a copy of output the
+            parent process still owns and will write itself.
+            """
+            self._buffer.clear()
+            self._buffer_len = 0
+            self._buffer_stream = None
+            # the parent's flusher thread didn't survive the fork
+            self._flusher.reset()
+
+        def flush(self) -> None:
+            """Write any buffered output, then flush the current stream.
+
+            logging.StreamHandler.flush() implementation:
+            https://docs.python.org/3.10/library/logging.handlers.html#logging.StreamHandler.flush
+            """
+            self.acquire()
+            try:
+                self._flushBuffer()
+                self._flusher.wake()
+            finally:
+                self.release()
+            super().flush()
+
+        def close(self) -> None:
+            """Write any buffered output, then close the handler."""
+            try:
+                self.flush()
+            finally:
+                super().close()
+
+    class _BufferFlusher:
+        """Thread that writes a buffering handler's output once it is due.
+
+        The handler calls start(), with its lock held, when it starts
+        filling an empty buffer. The thread waits until ``due(now)`` says
+        the oldest output may be written, calls it again (it writes
+        whatever is due and returns when the rest will be, or None once
+        nothing is buffered), and exits when nothing is left, so an idle
+        handler has no thread. wake() makes it check again early, e.g.
+        after flush() emptied the buffer.
+        """
+
+        __slots__ = ("_due", "_handler", "_thread", "_wakeup")
+
+        def __init__(
+            self,
+            handler: logging.Handler,
+            due: Callable[[float], float | None],
+        ) -> None:
+            self._handler = handler
+            self._due = due
+            self._thread: threading.Thread | None = None
+            self._wakeup = threading.Condition(handler.lock)
+
+        def start(self) -> None:
+            # called with the handler lock held, which _run() waits on
+            if self._thread is None:
+                self._wakeup = threading.Condition(self._handler.lock)
+                self._thread = threading.Thread(
+                    target=self._run,
+                    args=(self._wakeup,),
+                    name="apathetic-logging-flusher",
+                    daemon=True,
+                )
+                self._thread.start()
+
+        def wake(self) -> None:
+            # called with the handler lock held
+            if self._thread is not None:
+                self._wakeup.notify()
+
+        def reset(self) -> None:
+            """Forget the thread (in a forked child, where it doesn't exist)."""
+            self._thread = None
 
-            super().emit(record, *args, **kwargs)
+        def _run(self, wakeup: threading.Condition) -> None:
+            with wakeup:
+                while True:
+                    try:
+                        deadline = self._due(time.monotonic())
+                    except Exception as e:  # noqa: BLE001
+                        ApatheticLogging_Internal_SafeLogging.safeLog(
+                            f"[apathetic_logging] timed flush failed: {e!r}"
+                        )
+                        deadline = None
+                    if deadline is None:
+                        self._thread = None
+                        return
+                    wakeup.wait(deadline - time.monotonic())
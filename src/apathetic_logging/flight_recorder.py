@@ -0,0 +1,279 @@
+# src/apathetic_logging/flight_recorder.py
+"""FlightRecorderHandler class for Apathetic Logging.
+
+Docstrings are adapted from the standard library logging.handlers.MemoryHandler
+documentation licensed under the Python Software Foundation License Version 2.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+from typing import Any, TypeAlias
+
+from .caller_info import (
+    ApatheticLogging_Internal_CallerInfo,
+)
+from .constants import (
+    ApatheticLogging_Internal_Constants,
+)
+
+
+class ApatheticLogging_Internal_FlightRecorder:  # noqa: N801  # pyright: ignore[reportUnusedClass]
+    """Mixin class that provides the FlightRecorderHandler nested class.
+
+    This class contains the FlightRecorderHandler implementation as a nested
+    class. When mixed into apathetic_logging, it provides
+    apathetic_logging.FlightRecorderHandler.
+    """
+
+    # a stored record, or a storeCall() builder and the call to build from
+    _Entry: TypeAlias = (
+        "logging.LogRecord | tuple[Callable[[Any], logging.LogRecord], Any]"
+    )
+
+    # argument types copied when stored; anything else is kept by reference
+    _COPIED_ARG_TYPES: frozenset[type] = frozenset({list, dict, set, bytearray})
+
+    class FlightRecorderHandler(
+        ApatheticLogging_Internal_CallerInfo._WatchedHandler,  # noqa: SLF001
+        logging.Handler,
+    ):
+        """Keep the last records below the output level and dump them on error.
+
+        Records handed to store() are kept, unformatted, in a fixed-size ring
+        buffer; the oldest record is overwritten once ``capacity`` is reached.
+        Records handed to handle()/emit() are passed straight to ``target``,
+        and any record at or above ``dump_level`` first writes the buffered
+        records (oldest first) to ``dump_target`` so the error comes with
+        the context that led up to it.
+
+        Nothing is formatted until a dump. Lists, dicts, sets and
+        bytearrays among the message arguments are copied (one level deep)
+        when a record is stored, so later changes to them don't show up in
+        the dump; other arguments, including lazy() values, are kept by
+        reference and rendered at dump time.
+
+        Loggers hand calls that are below their own level but at or above
+        the registered recorder level to storeCall() (see
+        registerFlightRecorder()), so no LogRecord is created unless the
+        buffer is dumped. Used on its own, set ``threshold`` and records
+        below it are stored instead of being passed on.
+        """
+
+        def __init__(
+            self,
+            target: logging.Handler,
+            capacity: int | None = None,
+            *args: Any,
+            dump_level: int | None = None,
+            dump_target: logging.Handler | None = None,
+            threshold: int | None = None,
+            **kwargs: Any,
+        ) -> None:
+            """Initialize the handler.
+
+            Args:
+                target: Handler that writes records at or above the output level
+                capacity: Number of records to keep (must be > 0), or None for
+                    DEFAULT_FLIGHT_RECORDER_CAPACITY
+                *args: Additional positional arguments (for future-proofing)
+                dump_level: Records at or above this level dump the buffer,
+                    or None for DEFAULT_FLIGHT_RECORDER_DUMP_LEVEL
+                dump_target: Handler the buffered records are written to, or
+                    None to use ``target``
+                threshold: When set, emit() stores records below this level
+                    instead of passing them to ``target``
+                **kwargs: Additional keyword arguments (for future-proofing)
+
+            Raises:
+                ValueError: If capacity <= 0
+            """
+            super().__init__(*args, **kwargs)
+            _constants = ApatheticLogging_Internal_Constants
+            if capacity is None:
+                capacity = _constants.DEFAULT_FLIGHT_RECORDER_CAPACITY
+            if capacity <= 0:
+                msg = f"Flight recorder capacity must be > 0, got {capacity}"
+                raise ValueError(msg)
+
+            self.target = target
+            self.capacity = capacity
+            self.dump_level = (
+                dump_level
+                if dump_level is not None
+                else _constants.DEFAULT_FLIGHT_RECORDER_DUMP_LEVEL
+            )
+            self.dump_target = dump_target
+            self.threshold = threshold
+
+            # preallocated ring; _next is the slot the next record goes into
+            self._ring: list[ApatheticLogging_Internal_FlightRecorder._Entry | None] = [
+                None
+            ] * capacity
+            self._next = 0
+            self._count = 0
+
+        def store(self, record: logging.LogRecord) -> None:
+            """Keep a record in the ring buffer without writing it.
+
+            Args:
+                record: The LogRecord to keep
+            """
+            args = record.args
+            if args:
+                record.args = self.copyArgs(args)
+            self._put(record)
+
+        def storeCall(
+            self, build: Callable[[Any], logging.LogRecord], call: Any
+        ) -> None:
+            """Keep a call in the ring buffer; ``build(call)`` makes its record.
+
+            The record is only created if the buffer is dumped (or read with
+            records()), so a call that is overwritten costs no LogRecord.
+
+            Args:
+                build: Returns the LogRecord for ``call``
+                call: Everything ``build`` needs, with its message arguments
+                    already passed through copyArgs()
+            """
+            self._put((build, call))
+
+        @staticmethod
+        def copyArgs(args: Any) -> Any:
+            """Copy the mutable containers among a record's message arguments.
+
+            Args:
+                args: A record's ``args``: a tuple, or a single mapping
+
+            Returns:
+                ``args``, or a copy with its lists, dicts, sets and
+                bytearrays copied one level deep
+            """
+            copied = ApatheticLogging_Internal_FlightRecorder._COPIED_ARG_TYPES
+            if type(args) is dict:
+                args = dict(args)
+                for key, value in args.items():
+                    if type(value) in copied:
+                        args[key] = value.copy()
+                return args
+            if type(args) is not tuple:
+                return args
+            for arg in args:
+                if type(arg) in copied:
+                    return tuple(
+                        arg.copy() if type(arg) in copied else arg for arg in args
+                    )
+            return args
+
+        def _put(
+            self,
+            entry: ApatheticLogging_Internal_FlightRecorder._Entry,
+        ) -> None:
+            self.acquire()
+            try:
+                index = self._next
+                self._ring[index] = entry
+                index += 1
+                self._next = 0 if index == self.capacity else index
+                if self._count < self.capacity:
+                    self._count += 1
+            finally:
+                self.release()
+
+        def records(self) -> list[logging.LogRecord]:
+            """Return the buffered records, oldest first.
+
+            Records for calls kept by storeCall() are created here.
+            """
+            self.acquire()
+            try:
+                start = (self._next - self._count) % self.capacity
+                ring = self._ring
+                entries = [
+                    ring[(start + i) % self.capacity] for i in range(self._count)
+                ]
+            finally:
+                self.release()
+            return [
+                entry if isinstance(entry, logging.LogRecord) else entry[0](entry[1])  # type: ignore[index]
+                for entry in entries
+            ]
+
+        def clear(self) -> None:
+            """Discard the buffered records."""
+            self.acquire()
+            try:
+                self._ring = [None] * self.capacity
+                self._next = 0
+                self._count = 0
+            finally:
+                self.release()
+
+        def dump(self) -> None:
+            """Write the buffered records (oldest first) and empty the buffer."""
+            self.acquire()
+            try:
+                buffered = self.records()
+                self.clear()
+            finally:
+                self.release()
+
+            out = self.dump_target if self.dump_target is not None else self.target
+            for record in buffered:
+                out.handle(record)
+
+        def handle(self, record: logging.LogRecord) -> Any:
+            """Filter the record and emit it, without taking this handler's lock.
+
+            emit() only passes the record on (store() and dump() lock for
+            themselves), so the target handler's lock is the only one taken
+            for a normal record.
+
+            logging.Handler.handle() implementation:
+            https://docs.python.org/3.10/library/logging.html#logging.Handler.handle
+            """
+            rv = self.filter(record)
+            if isinstance(rv, logging.LogRecord):
+                # Python 3.12+: a filter may return a replacement record
+                record = rv
+            if rv:
+                self.emit(record)
+            return rv
+
+        def emit(self, record: logging.LogRecord) -> None:
+            """Pass the record to the target, dumping the buffer first on errors.
+
+            logging.Handler.emit() implementation:
+            https://docs.python.org/3.10/library/logging.html#logging.Handler.emit
+            """
+            try:
+                levelno = record.levelno
+                if self.threshold is not None and levelno < self.threshold:
+                    self.store(record)
+                    return
+                if levelno >= self.dump_level and self._count:
+                    self.dump()
+                self.target.handle(record)
+            except Exception:  # noqa: BLE001
+                self.handleError(record)
+
+        def flush(self) -> None:
+            """Flush the target handler (buffered records stay buffered)."""
+            self.target.flush()
+            if self.dump_target is not None:
+                self.dump_target.flush()
+
+        def close(self) -> None:
+            """Flush, close the dump target, then close this handler.
+
+            The ``target`` is left open: it is usually shared with (or rebuilt
+            by) the logger that owns this handler.
+            """
+            try:
+                self.flush()
+                if self.dump_target is not None:
+                    self.dump_target.close()
+            finally:
+                super().close()
@@ -10,12 +10,18 @@ from __future__ import annotations
 import logging
 from typing import Any, TypeVar, cast
 
+from .config_snapshot import (
+    ApatheticLogging_Internal_ConfigSnapshot,
+)
 from .logger_namespace import (
     ApatheticLogging_Internal_Logger,
 )
 from .logging_utils import (
     ApatheticLogging_Internal_LoggingUtils,
 )
+from .rate_limit_filter import (
+    ApatheticLogging_Internal_RateLimitFilter,
+)
 
 
 class ApatheticLogging_Internal_GetLogger:  # noqa: N801  # pyright: ignore[reportUnusedClass]
@@ -83,6 +89,11 @@ class ApatheticLogging_Internal_GetLogger:  # noqa: N801  # pyright: ignore[repo
         """
         _logging_utils = ApatheticLogging_Internal_LoggingUtils
 
+        # Fast path: the logger already exists with the right type
+        existing = logging.Logger.manager.loggerDict.get(register_name)
+        if isinstance(existing, class_type):
+            return existing
+
         logger: logging.Logger | None = None
         registered = _logging_utils.hasLogger(register_name)
         if registered:
@@ -102,27 +113,33 @@ class ApatheticLogging_Internal_GetLogger:  # noqa: N801  # pyright: ignore[repo
         """Apply propagate setting to a logger from registry or default.
 
         Determines the propagate value from the registry (if set) or falls back
-        to the default from constants, then applies it to the logger.
+        to the default from constants, then applies it to the logger. The value
+        comes from the memoized ConfigSnapshot.
 
         Args:
             logger: The logger instance to apply the propagate setting to.
         """
-        from .constants import (  # noqa: PLC0415
-            ApatheticLogging_Internal_Constants,
-        )
-        from .registry_data import (  # noqa: PLC0415
-            ApatheticLogging_Internal_RegistryData,
-        )
+        _config = ApatheticLogging_Internal_ConfigSnapshot
+        logger.propagate = _config.getConfigSnapshot().propagate
 
-        _constants = ApatheticLogging_Internal_Constants
-        _registry_data = ApatheticLogging_Internal_RegistryData
+    @staticmethod
+    def _applyRateLimit(logger: logging.Logger, rate: float, burst: int | None) -> None:
+        """Attach a RateLimitFilter to a logger, or update the attached one.
 
-        if _registry_data.registered_internal_propagate is not None:
-            # Use registered value
-            logger.propagate = _registry_data.registered_internal_propagate
-        else:
-            # Use default from constants
-            logger.propagate = _constants.DEFAULT_PROPAGATE
+        Args:
+            logger: The logger to limit.
+            rate: Records per second allowed for each key.
+            burst: Records allowed back to back, or None for the default.
+        """
+        _filter_class = ApatheticLogging_Internal_RateLimitFilter.RateLimitFilter
+        new_filter = _filter_class(rate, burst)
+        for existing in logger.filters:
+            if isinstance(existing, _filter_class):
+                # keep the existing buckets; just change the limits
+                existing.rate = new_filter.rate
+                existing.burst = new_filter.burst
+                return
+        logger.addFilter(new_filter)
 
     @staticmethod
     def getLogger(
@@ -131,6 +148,8 @@ class ApatheticLogging_Internal_GetLogger:  # noqa: N801  # pyright: ignore[repo
         level: str | int | None = None,
         minimum: bool | None = None,
         extend: bool | None = None,
+        rate_limit: float | None = None,
+        rate_limit_burst: int | None = None,
         **kwargs: Any,
     ) -> ApatheticLogging_Internal_Logger.Logger:
         """Return a logger with the specified name, creating it if necessary.
@@ -159,6 +178,13 @@ class ApatheticLogging_Internal_GetLogger:  # noqa: N801  # pyright: ignore[repo
                 (e.g., DEBUG). If None, defaults to False. Only used when
                 `level` is provided.
             extend: If True (default), extend the logging module.
+            rate_limit: Records per second allowed for each repeated message
+                (see RateLimitFilter). Attaches a RateLimitFilter to the
+                logger, or updates the one already attached. Defaults to None
+                (no limit).
+            rate_limit_burst: Records of one message allowed back to back
+                before ``rate_limit`` applies. Only used when ``rate_limit``
+                is provided.
             **kwargs: Additional keyword arguments (for future-proofing)
 
         Returns:
@@ -179,6 +205,8 @@ class ApatheticLogging_Internal_GetLogger:  # noqa: N801  # pyright: ignore[repo
             level=level,
             minimum=minimum,
             extend=extend,
+            rate_limit=rate_limit,
+            rate_limit_burst=rate_limit_burst,
             **kwargs,
         )
         return cast("ApatheticLogging_Internal_Logger.Logger", result)  # type: ignore[redundant-cast]
@@ -192,6 +220,8 @@ class ApatheticLogging_Internal_GetLogger:  # noqa: N801  # pyright: ignore[repo
         level: str | int | None = None,
         minimum: bool | None = None,
         extend: bool | None = True,
+        rate_limit: float | None = None,
+        rate_limit_burst: int | None = None,
         **kwargs: Any,
     ) -> ApatheticLogging_Internal_GetLogger._LoggerType:
         """Get a logger of the specified type, creating it if necessary.
@@ -223,6 +253,13 @@ class ApatheticLogging_Internal_GetLogger:  # noqa: N801  # pyright: ignore[repo
                 (e.g., DEBUG). If None, defaults to False. Only used when
                 `level` is provided.
             extend: If True (default), extend the logging module.
+            rate_limit: Records per second allowed for each repeated message
+                (see RateLimitFilter). Attaches a RateLimitFilter to the
+                logger, or updates the one already attached. Defaults to None
+                (no limit).
+            rate_limit_burst: Records of one message allowed back to back
+                before ``rate_limit`` applies. Only used when ``rate_limit``
+                is provided.
             **kwargs: Additional keyword arguments (for future-proofing)
 
         Returns:
@@ -232,29 +269,19 @@ class ApatheticLogging_Internal_GetLogger:  # noqa: N801  # pyright: ignore[repo
 
         https://docs.python.org/3.10/library/logging.html#logging.getLogger
         """
+        _config = ApatheticLogging_Internal_ConfigSnapshot
         _logging_utils = ApatheticLogging_Internal_LoggingUtils
 
-        # Check compatibility mode for getLogger(None) behavior
-        from .registry_data import (  # noqa: PLC0415
-            ApatheticLogging_Internal_RegistryData,
-        )
-
-        _registry_data = ApatheticLogging_Internal_RegistryData
-        compatibility_mode = (
-            _registry_data.registered_internal_compatibility_mode
-            if _registry_data.registered_internal_compatibility_mode is not None
-            else False
-        )
-
-        # In compatibility mode, getLogger(None) returns root logger (stdlib behavior)
-        if name is None and compatibility_mode:
-            register_name: str = ""
+        if name is not None:
+            # Explicit name (e.g. getLogger(__name__)): nothing to infer.
+            # Empty string ("") is the root logger, matching stdlib behavior.
+            register_name: str = name
+        elif _config.getConfigSnapshot().compatibility_mode:
+            # In compatibility mode, getLogger(None) returns root logger
+            # (stdlib behavior)
+            register_name = ""
         else:
-            # Resolve logger name (with inference if needed)
-            # Note: Empty string ("") is a special case - getDefaultLoggerName
-            # returns it as-is (root logger, matching stdlib behavior). This is
-            # handled by the
-            # early return in getDefaultLoggerName when logger_name is not None.
+            # Infer the logger name from the caller.
             # skip_frames+1 because: getLoggerOfType -> getDefaultLoggerName -> caller
             # check_registry=True because getLogger() should use a previously registered
             # name if available, which is the expected behavior for "get" operations.
@@ -262,7 +289,7 @@ class ApatheticLogging_Internal_GetLogger:  # noqa: N801  # pyright: ignore[repo
             # infer=True and register=True - getLogger() infers and stores (matches old
             # resolveLoggerName behavior where inferred names were automatically stored)
             register_name_raw = _logging_utils.getDefaultLoggerName(
-                name,
+                None,
                 check_registry=True,
                 skip_frames=skip_frames + 1,
                 raise_on_error=True,
@@ -285,6 +312,11 @@ class ApatheticLogging_Internal_GetLogger:  # noqa: N801  # pyright: ignore[repo
         if level is not None:
             logger.setLevel(level, minimum=minimum)  # type: ignore[call-arg]
 
+        if rate_limit is not None:
+            ApatheticLogging_Internal_GetLogger._applyRateLimit(
+                logger, rate_limit, rate_limit_burst
+            )
+
         # Apply propagate setting from registry or default
         ApatheticLogging_Internal_GetLogger._applyPropagateSetting(logger)
 
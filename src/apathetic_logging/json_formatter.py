@@ -0,0 +1,195 @@
+# src/apathetic_logging/json_formatter.py
+"""JsonFormatter class for Apathetic Logging.
+
+Docstrings are adapted from the standard library logging.Formatter documentation
+licensed under the Python Software Foundation License Version 2.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import re
+from typing import Any, ClassVar
+
+from .constants import (
+    ApatheticLogging_Internal_Constants,
+)
+
+
+class ApatheticLogging_Internal_JsonFormatter:  # noqa: N801  # pyright: ignore[reportUnusedClass]
+    """Mixin class that provides the JsonFormatter nested class.
+
+    This class contains the JsonFormatter implementation as a nested class.
+    When mixed into apathetic_logging, it provides
+    apathetic_logging.JsonFormatter.
+    """
+
+    class JsonFormatter(logging.Formatter):
+        """Formatter that writes each record as one line of JSON.
+
+        The output object holds the fields from ``fields`` (by default
+        JSON_FIELDS: time, level, logger, message), then any ``extra=``
+        values set on the record (sorted by key), then ``exc_info``/``stack_info`` when
+        present. Level names come from the record, so TRACE, DETAIL,
+        MINIMAL, etc. appear as registered.
+
+        The field plan (pre-escaped ``"key":`` prefixes and the record
+        attribute each reads) is built once per formatter. Strings that need
+        no escaping (the common case) are quoted without going through the
+        json module; other strings are escaped with a translation table.
+        Non-ASCII text is written as-is (UTF-8) rather than escaped.
+        """
+
+        # characters that force a string off the fast path
+        _NEEDS_ESCAPE: ClassVar[re.Pattern[str]] = re.compile(r'[\x00-\x1f"\\]')
+        _ESCAPES: ClassVar[dict[int, str]] = {
+            **{code: f"\\u{code:04x}" for code in range(0x20)},
+            ord('"'): '\\"',
+            ord("\\"): "\\\\",
+            ord("\b"): "\\b",
+            ord("\t"): "\\t",
+            ord("\n"): "\\n",
+            ord("\f"): "\\f",
+            ord("\r"): "\\r",
+        }
+
+        _CONSTANTS: ClassVar[dict[bool | None, str]] = {
+            None: "null",
+            True: "true",
+            False: "false",
+        }
+
+        def __init__(
+            self,
+            fields: dict[str, str] | None = None,
+            *args: Any,
+            extras: bool = True,
+            **kwargs: Any,
+        ) -> None:
+            """Initialize the JsonFormatter.
+
+            Args:
+                fields: Output key -> LogRecord attribute, in output order.
+                    ``"message"`` is the merged message and ``"asctime"`` is
+                    the formatted time. If None, uses JSON_FIELDS.
+                *args: Additional positional arguments passed to
+                    logging.Formatter (e.g. datefmt via keyword)
+                extras: Include ``extra=`` values set on the record
+                **kwargs: Additional keyword arguments passed to
+                    logging.Formatter
+            """
+            super().__init__(*args, **kwargs)
+            _constants = ApatheticLogging_Internal_Constants
+            _formatter = ApatheticLogging_Internal_JsonFormatter.JsonFormatter
+            if fields is None:
+                fields = _constants.JSON_FIELDS
+
+            self.fields = dict(fields)
+            self.extras = extras
+            # (pre-escaped '"key":' prefix, record attribute) per field
+            self._plan: tuple[tuple[str, str], ...] = tuple(
+                (_formatter.encodeString(key) + ":", attr)
+                for key, attr in self.fields.items()
+            )
+            self._uses_asctime = "asctime" in self.fields.values()
+            # keys already written by the plan are not repeated as extras
+            self._skip_extras = _constants.LOG_RECORD_ATTRS | set(self.fields)
+
+        @staticmethod
+        def encodeString(value: str) -> str:
+            """Return ``value`` as a quoted JSON string.
+
+            Args:
+                value: String to encode
+
+            Returns:
+                The JSON string literal, including the quotes
+            """
+            _formatter = ApatheticLogging_Internal_JsonFormatter.JsonFormatter
+            if _formatter._NEEDS_ESCAPE.search(value) is None:  # noqa: SLF001
+                return '"' + value + '"'
+            return '"' + value.translate(_formatter._ESCAPES) + '"'  # noqa: SLF001
+
+        @staticmethod
+        def encodeValue(value: Any) -> str:
+            """Return ``value`` as JSON.
+
+            str, int, float, bool and None are encoded directly; anything
+            else goes through json.dumps(), with str() for values it can't
+            serialize. Non-finite floats are written as strings.
+
+            Args:
+                value: Value to encode
+
+            Returns:
+                The JSON text for the value
+            """
+            _formatter = ApatheticLogging_Internal_JsonFormatter.JsonFormatter
+            value_type = type(value)
+            if value_type is str:
+                return _formatter.encodeString(value)
+            if value_type is int:
+                return repr(value)
+            if value_type is float:
+                # NaN/Infinity aren't valid JSON numbers
+                return (
+                    repr(value)
+                    if math.isfinite(value)
+                    else _formatter.encodeString(repr(value))
+                )
+            if value is None or value_type is bool:
+                return _formatter._CONSTANTS[value]  # noqa: SLF001
+            # deferred: json is only needed once a record has such a value
+            import json  # noqa: PLC0415
+
+            return json.dumps(value, default=str, ensure_ascii=False)
+
+        def format(
+            self,
+            record: logging.LogRecord,
+            *args: Any,  # noqa: ARG002
+            **kwargs: Any,  # noqa: ARG002
+        ) -> str:
+            """Format a log record as a single-line JSON object.
+
+            Args:
+                record: LogRecord to format
+                *args: Additional positional arguments (for future-proofing)
+                **kwargs: Additional keyword arguments (for future-proofing)
+
+            Returns:
+                The JSON text for the record
+            """
+            _formatter = ApatheticLogging_Internal_JsonFormatter.JsonFormatter
+            encode_value = _formatter.encodeValue
+            record.message = record.getMessage()
+            if self._uses_asctime:
+                record.asctime = self.formatTime(record, self.datefmt)
+
+            parts = [
+                prefix + encode_value(getattr(record, attr, None))
+                for prefix, attr in self._plan
+            ]
+
+            if self.extras:
+                # the set difference is C-speed and usually empty; sorting
+                # keeps the output stable across runs
+                extra_keys = record.__dict__.keys() - self._skip_extras
+                if extra_keys:
+                    encode_string = _formatter.encodeString
+                    values = record.__dict__
+                    parts.extend(
+                        encode_string(key) + ":" + encode_value(values[key])
+                        for key in sorted(extra_keys)
+                    )
+
+            if record.exc_info and not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+            if record.exc_text:
+                parts.append('"exc_info":' + encode_value(record.exc_text))
+            if record.stack_info:
+                parts.append(
+                    '"stack_info":' + encode_value(self.formatStack(record.stack_info))
+                )
+            return "{" + ",".join(parts) + "}"
@@ -0,0 +1,91 @@
+# src/apathetic_logging/lazy.py
+"""Lazy log message arguments for Apathetic Logging."""
+
+from __future__ import annotations
+
+import operator
+from collections.abc import Callable
+from typing import Any
+
+
+class ApatheticLogging_Internal_Lazy:  # noqa: N801  # pyright: ignore[reportUnusedClass]
+    """Mixin class that provides deferred message arguments.
+
+    This class contains the Lazy implementation as a nested class and the
+    lazy() helper. When mixed into apathetic_logging, it provides
+    apathetic_logging.Lazy and apathetic_logging.lazy.
+    """
+
+    class Lazy:
+        """A log argument whose value is computed only when it is formatted.
+
+        LogRecord.getMessage() runs only after the level check has passed and
+        a handler is writing the record, so the wrapped callable is never
+        called for records that are filtered out. The value is computed at
+        most once and then reused (e.g. by several handlers).
+
+        Works with ``%s``, ``%r``, ``%d``/``%i``, ``%x``, ``%f`` and
+        ``str.format`` specs.
+        """
+
+        __slots__ = ("_args", "_evaluated", "_func", "_kwargs", "_value")
+
+        def __init__(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+            """Wrap ``func(*args, **kwargs)`` without calling it.
+
+            Args:
+                func: Callable that produces the value
+                *args: Positional arguments for ``func``
+                **kwargs: Keyword arguments for ``func``
+            """
+            self._func = func
+            self._args = args
+            self._kwargs = kwargs
+            self._value: Any = None
+            self._evaluated = False
+
+        def value(self) -> Any:
+            """Return the computed value, calling the wrapped callable once."""
+            if not self._evaluated:
+                self._value = self._func(*self._args, **self._kwargs)
+                self._evaluated = True
+            return self._value
+
+        def __str__(self) -> str:
+            return str(self.value())
+
+        def __repr__(self) -> str:
+            return repr(self.value())
+
+        def __format__(self, format_spec: str) -> str:
+            return format(self.value(), format_spec)
+
+        def __int__(self) -> int:
+            return int(self.value())
+
+        def __float__(self) -> float:
+            return float(self.value())
+
+        def __index__(self) -> int:
+            return operator.index(self.value())
+
+    @staticmethod
+    def lazy(
+        func: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> ApatheticLogging_Internal_Lazy.Lazy:
+        """Defer an expensive log argument until the record is formatted.
+
+        Args:
+            func: Callable that produces the value
+            *args: Positional arguments for ``func``
+            **kwargs: Keyword arguments for ``func``
+
+        Returns:
+            A Lazy wrapper to pass as a message argument
+
+        Example:
+            >>> from apathetic_logging import getLogger, lazy
+            >>> logger = getLogger("my_app")
+            >>> logger.trace("state=%s", lazy(json.dumps, state, indent=2))
+        """
+        return ApatheticLogging_Internal_Lazy.Lazy(func, *args, **kwargs)
@@ -0,0 +1,94 @@
+# src/apathetic_logging/log_context.py
+"""Bound context fields for Apathetic Logging."""
+
+from __future__ import annotations
+
+from collections.abc import Generator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from types import MappingProxyType
+from typing import Any
+
+
+class ApatheticLogging_Internal_LogContext:  # noqa: N801  # pyright: ignore[reportUnusedClass]
+    """Mixin class that provides fields added to every record in a context.
+
+    Fields are kept in a ContextVar, so each thread and each asyncio task
+    sees its own set (tasks start with a copy of their creator's fields).
+    The stored dict is never changed in place: binding builds a new dict,
+    so every record made in an unchanged context shares the same one and
+    loggers can attach it without copying.
+
+    When mixed into apathetic_logging, it provides apathetic_logging.logContext,
+    apathetic_logging.bindLogContext, apathetic_logging.unbindLogContext,
+    apathetic_logging.getLogContext and apathetic_logging.clearLogContext.
+    """
+
+    _log_context: ContextVar[dict[str, Any]] = ContextVar(
+        "apathetic_logging_context",
+        default={},  # noqa: B039  # never mutated, see bindLogContext()
+    )
+
+    @staticmethod
+    def getLogContext() -> Mapping[str, Any]:
+        """Return a read-only view of the fields bound in the current context."""
+        return MappingProxyType(ApatheticLogging_Internal_LogContext._log_context.get())
+
+    @staticmethod
+    def bindLogContext(**fields: Any) -> None:
+        """Add fields to every record logged from the current context.
+
+        The fields stay bound until unbound, cleared, or the current
+        logContext() block ends. Bound fields don't leak into the task or
+        thread that created this one.
+
+        Args:
+            **fields: Field names and values to add
+        """
+        var = ApatheticLogging_Internal_LogContext._log_context
+        var.set({**var.get(), **fields})
+
+    @staticmethod
+    def unbindLogContext(*names: str) -> None:
+        """Remove fields from the current context (missing names are ignored).
+
+        Args:
+            *names: Field names to remove
+        """
+        var = ApatheticLogging_Internal_LogContext._log_context
+        current = var.get()
+        if any(name in current for name in names):
+            var.set({k: v for k, v in current.items() if k not in names})
+
+    @staticmethod
+    def clearLogContext() -> None:
+        """Remove every field from the current context."""
+        ApatheticLogging_Internal_LogContext._log_context.set({})
+
+    @staticmethod
+    @contextmanager
+    def logContext(**fields: Any) -> Generator[Mapping[str, Any], None, None]:
+        """Add fields to every record logged inside the block.
+
+        Fields bound inside the block (see bindLogContext()) are discarded
+        when it ends, and the previous fields are restored.
+
+        Args:
+            **fields: Field names and values to add
+
+        Yields:
+            A read-only view of the fields in effect inside the block
+
+        Example:
+            >>> from apathetic_logging import getLogger, logContext
+            >>> logger = getLogger("my_app")
+            >>> with logContext(request_id=request.id):
+            ...     logger.info("handling request")
+        """
+        var = ApatheticLogging_Internal_LogContext._log_context
+        merged = {**var.get(), **fields}
+        token = var.set(merged)
+        try:
+            yield MappingProxyType(merged)
+        finally:
+            var.reset(token)
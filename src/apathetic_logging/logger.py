@@ -10,31 +10,73 @@ licensed under the Python Software Foundation License Version 2.
 
 from __future__ import annotations
 
-import argparse
 import logging
 import os
 import sys
-from collections.abc import Generator
-from contextlib import contextmanager
-from typing import Any, TextIO, cast
-
+import threading
+import time
+from collections.abc import Generator, Mapping
+from contextlib import AbstractContextManager, contextmanager, suppress
+from typing import TYPE_CHECKING, Any, TextIO, cast
+
+from .async_handler import (
+    ApatheticLogging_Internal_AsyncHandler,
+)
+from .caller_info import (
+    ApatheticLogging_Internal_CallerInfo,
+)
+from .config_snapshot import (
+    ApatheticLogging_Internal_ConfigSnapshot,
+)
 from .constants import (
     ApatheticLogging_Internal_Constants,
 )
+from .dual_file_handler import (
+    ApatheticLogging_Internal_DualFileHandler,
+)
 from .dual_stream_handler import (
     ApatheticLogging_Internal_DualStreamHandler,
 )
+from .flight_recorder import (
+    ApatheticLogging_Internal_FlightRecorder,
+)
+from .json_formatter import (
+    ApatheticLogging_Internal_JsonFormatter,
+)
+from .log_context import (
+    ApatheticLogging_Internal_LogContext,
+)
+from .logging_utils import (
+    ApatheticLogging_Internal_LoggingUtils,
+)
+from .metrics import (
+    ApatheticLogging_Internal_Metrics,
+)
+from .process_handler import (
+    ApatheticLogging_Internal_ProcessHandler,
+)
 from .registry_data import (
     ApatheticLogging_Internal_RegistryData,
 )
 from .safe_logging import (
     ApatheticLogging_Internal_SafeLogging,
 )
+from .sampling import (
+    ApatheticLogging_Internal_Sampling,
+)
+from .segment_handler import (
+    ApatheticLogging_Internal_SegmentHandler,
+)
 from .tag_formatter import (
     ApatheticLogging_Internal_TagFormatter,
 )
 
 
+# annotation only: argparse is slow to import and callers already have it
+if TYPE_CHECKING:
+    import argparse
+
+
 class ApatheticLogging_Internal_LoggerCore(logging.Logger):  # noqa: N801  # pyright: ignore[reportUnusedClass]
     """Core Logger implementation for all Apathetic tools.
 
@@ -50,6 +92,28 @@ class ApatheticLogging_Internal_LoggerCore(logging.Logger):  # noqa: N801  # pyr
     # if stdout or stderr are redirected, we need to repoint
     _last_stream_ids: tuple[TextIO, TextIO] | None = None
 
+    # process-wide stream epoch, bumped by notifyStreamsChanged() or when
+    # ensureHandlers() notices a stdout/stderr swap; always read and written
+    # on ApatheticLogging_Internal_LoggerCore so subclasses share one counter
+    _stream_epoch: int = 0
+
+    # epoch this instance last validated its handlers against
+    _handlers_epoch: int = -1
+
+    # sampling rates for this logger (level -> rate) and the sampling epoch
+    # they were resolved at; see _keepSampled()
+    _sample_rates: dict[int, float] | None = None
+    _sample_rates_epoch: int = -1
+
+    # (caller-info epoch, handler/formatter key or None, whether any of them
+    # reads caller info) from the last _wantsCallerInfo() decision; the key
+    # is only kept when something the record reaches doesn't bump the epoch
+    _caller_info: tuple[int, tuple[object, ...] | None, bool] | None = None
+
+    # backing fields for the propagate and parent properties
+    _propagate: bool = True
+    _parent: logging.Logger | None = None
+
     DEFAULT_STACKLEVEL = 2
     """Default stacklevel for errorIfNotDebug/criticalIfNotDebug methods."""
 
@@ -76,6 +140,10 @@ class ApatheticLogging_Internal_LoggerCore(logging.Logger):  # noqa: N801  # pyr
         # now let's init our logger
         super().__init__(name, level)
 
+        # a new logger may replace one of the same name with another level
+        _dual_stream_handler = ApatheticLogging_Internal_DualStreamHandler
+        _dual_stream_handler.DualStreamHandler.invalidateLevelCache()
+
         # default level resolution
         if self.level == logging.NOTSET:
             self.setLevel(self.determineLogLevel())
@@ -95,40 +163,412 @@ class ApatheticLogging_Internal_LoggerCore(logging.Logger):  # noqa: N801  # pyr
         """Ensure handlers are attached to this logger.
 
         DualStreamHandler is what will ensure logs go to the write channel.
+        When async mode is registered (see registerAsyncMode()), it is wrapped
+        in an AsyncQueueHandler so the shared writer thread does the writing.
+        Buffered output (see registerBufferedOutput()) is passed through to
+        the DualStreamHandler. With a flight recorder registered (see
+        registerFlightRecorder()), the result is wrapped in a
+        FlightRecorderHandler, which carries over the old one's records.
+        The formatter is a TagFormatter, or a JsonFormatter when the "json"
+        output format is registered (see registerOutputFormat()). With
+        segment output registered (see registerSegmentOutput()), the shared
+        MmapSegmentHandler takes the place of the DualStreamHandler. In a
+        child process that called registerProcessQueue(), a
+        ProcessQueueHandler takes the place of either.
 
         Rebuilds handlers if they're missing or if stdout/stderr have changed.
+        A detected swap bumps the shared stream epoch so other loggers rebuild
+        on their next record too.
         """
+        _async_handler = ApatheticLogging_Internal_AsyncHandler
         _dual_stream_handler = ApatheticLogging_Internal_DualStreamHandler
-        _tag_formatter = ApatheticLogging_Internal_TagFormatter
+        _flight_recorder = ApatheticLogging_Internal_FlightRecorder
+        _process_handler = ApatheticLogging_Internal_ProcessHandler
+        _registry_data = ApatheticLogging_Internal_RegistryData
         _safe_logging = ApatheticLogging_Internal_SafeLogging
         if self._last_stream_ids is None or not self.handlers:
             rebuild = True
         else:
             last_stdout, last_stderr = self._last_stream_ids
-            rebuild = last_stdout is not sys.stdout or last_stderr is not sys.stderr
+            if last_stdout is not sys.stdout or last_stderr is not sys.stderr:
+                # let every other logger pick up the swap on its next record
+                self.notifyStreamsChanged()
+            epoch = ApatheticLogging_Internal_LoggerCore._stream_epoch
+            rebuild = self._handlers_epoch != epoch
 
         if rebuild:
+            recorded: list[logging.LogRecord] = []
+            for old in self.handlers:
+                if isinstance(old, _flight_recorder.FlightRecorderHandler):
+                    recorded.extend(old.records())
+                    old.close()
+                elif isinstance(
+                    old,
+                    (
+                        _dual_stream_handler.DualStreamHandler,
+                        _async_handler.AsyncQueueHandler,
+                    ),
+                ):
+                    # don't lose buffered/queued output from the old handler
+                    old.flush()
             self.handlers.clear()
-            h = _dual_stream_handler.DualStreamHandler()
-            h.setFormatter(_tag_formatter.TagFormatter("%(message)s"))
-            h.enable_color = self.enable_color
+            h: logging.Handler
+            process_queue = _registry_data.registered_internal_process_queue
+            if process_queue is not None:
+                # the parent's ProcessLogListener formats and writes
+                h = _process_handler.ProcessQueueHandler(process_queue)
+            else:
+                h = self._buildStreamHandler()
+            if _registry_data.registered_internal_flight_recorder:
+                h = self._buildFlightRecorder(h, recorded)
             self.addHandler(h)
             self._last_stream_ids = (sys.stdout, sys.stderr)
             _safe_logging.safeTrace(
                 "ensureHandlers()", f"rebuilt_handlers={self.handlers}"
             )
+        self._handlers_epoch = ApatheticLogging_Internal_LoggerCore._stream_epoch
+
+    def _buildStreamHandler(self) -> logging.Handler:
+        _async_handler = ApatheticLogging_Internal_AsyncHandler
+        _dual_stream_handler = ApatheticLogging_Internal_DualStreamHandler
+        _json_formatter = ApatheticLogging_Internal_JsonFormatter
+        _registry_data = ApatheticLogging_Internal_RegistryData
+        _segment_handler = ApatheticLogging_Internal_SegmentHandler
+        _tag_formatter = ApatheticLogging_Internal_TagFormatter
+        formatter: logging.Formatter
+        if _registry_data.registered_internal_output_format == "json":
+            formatter = _json_formatter.JsonFormatter()
+        else:
+            formatter = _tag_formatter.TagFormatter("%(message)s")
+        h: logging.Handler
+        if _registry_data.registered_internal_segment_output:
+            # one handler for every logger, so they share segments
+            h = _segment_handler.getSegmentHandler()
+            h.setFormatter(formatter)
+        else:
+            dual = _dual_stream_handler.DualStreamHandler(
+                buffered=bool(_registry_data.registered_internal_buffered_output),
+                buffer_size=_registry_data.registered_internal_buffer_size,
+                flush_interval=_registry_data.registered_internal_buffer_flush_interval,
+            )
+            dual.setFormatter(formatter)
+            dual.enable_color = self.enable_color
+            h = dual
+        if _registry_data.registered_internal_async_mode:
+            return _async_handler.AsyncQueueHandler(h)
+        return h
+
+    @staticmethod
+    def _buildFlightRecorder(
+        target: logging.Handler,
+        recorded: list[logging.LogRecord],
+    ) -> logging.Handler:
+        _constants = ApatheticLogging_Internal_Constants
+        _flight_recorder = ApatheticLogging_Internal_FlightRecorder
+        _registry_data = ApatheticLogging_Internal_RegistryData
+        dump_target: logging.Handler | None = None
+        dump_path = _registry_data.registered_internal_flight_recorder_path
+        if dump_path is not None:
+            dump_target = logging.FileHandler(dump_path, delay=True)
+            dump_target.setFormatter(
+                logging.Formatter(_constants.FLIGHT_RECORDER_FILE_FORMAT)
+            )
+        recorder = _flight_recorder.FlightRecorderHandler(
+            target,
+            _registry_data.registered_internal_flight_recorder_capacity,
+            dump_target=dump_target,
+        )
+        for record in recorded:
+            recorder.store(record)
+        return recorder
+
+    def _logIfEnabled(
+        self,
+        level: int,
+        msg: object,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> None:
+        # the body of every level method: write the record if the level is
+        # enabled, otherwise pass it to _logBelowLevel() if a feature that
+        # wants below-level records is registered (one registry flag, kept
+        # by registerFlightRecorder() and registerMetrics())
+        if self.isEnabledFor(level):
+            self._log(level, msg, args, **kwargs)
+        elif (
+            ApatheticLogging_Internal_RegistryData.registered_internal_below_level_hooks
+        ):
+            self._logBelowLevel(level, msg, args, **kwargs)
+
+    def _logBelowLevel(
+        self,
+        level: int,
+        msg: object,
+        args: tuple[Any, ...],
+        **kwargs: Any,
+    ) -> None:
+        # a level method's record that isEnabledFor() turned away; only
+        # called with metrics or a flight recorder registered, so guards in
+        # user code are never counted or recorded
+        if self.disabled:
+            return
+        _constants = ApatheticLogging_Internal_Constants
+        _registry_data = ApatheticLogging_Internal_RegistryData
+        if _registry_data.registered_internal_flight_recorder:
+            recorder_level = _registry_data.registered_internal_flight_recorder_level
+            if recorder_level is None:
+                recorder_level = _constants.DEFAULT_FLIGHT_RECORDER_LEVEL
+            if level >= recorder_level and self.manager.disable < level:
+                self._logToRecorder(level, msg, args, kwargs)
+                return
+        if _registry_data.registered_internal_metrics:
+            _metrics = ApatheticLogging_Internal_Metrics
+            _metrics.countRecord(self.name, level, _metrics.METRIC_DROPPED_LEVEL)
+
+    def _logToRecorder(
+        self,
+        level: int,
+        msg: object,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> None:
+        # a call below this logger's level: only its FlightRecorderHandlers
+        # keep it, and no other handler or parent logger sees it
+        _flight_recorder = ApatheticLogging_Internal_FlightRecorder
+        _metrics = ApatheticLogging_Internal_Metrics
+        _registry_data = ApatheticLogging_Internal_RegistryData
+        if _registry_data.registered_internal_sampling and not self._keepSampled(level):
+            return
+        if (
+            not self.handlers
+            or self._handlers_epoch
+            != ApatheticLogging_Internal_LoggerCore._stream_epoch
+        ):
+            self.ensureHandlers()
+
+        record: logging.LogRecord | None = None
+        call: tuple[Any, ...] | None = None
+        wants_caller_info = self._wantsCallerInfo()
+        if kwargs or wants_caller_info:
+            # exc_info, stack and caller info can't wait for a dump
+            record = self._buildRecord(
+                level, msg, args, caller=wants_caller_info, **kwargs
+            )
+            maybe_record: object = self.filter(record)
+            if not maybe_record:
+                if _registry_data.registered_internal_metrics:
+                    _metrics.countRecord(
+                        self.name, level, _metrics.METRIC_DROPPED_FILTER
+                    )
+                return
+            if isinstance(maybe_record, logging.LogRecord):
+                record = maybe_record
+        else:
+            # the record is only made if the recorder is dumped
+            call = (
+                level,
+                msg,
+                _flight_recorder.FlightRecorderHandler.copyArgs(args),
+                time.time(),
+                threading.current_thread(),
+                ApatheticLogging_Internal_LogContext._log_context.get(),  # noqa: SLF001
+            )
+        if _registry_data.registered_internal_metrics:
+            _metrics.countRecord(self.name, level, _metrics.METRIC_EMITTED)
+
+        for handler in self.handlers:
+            if (
+                isinstance(handler, _flight_recorder.FlightRecorderHandler)
+                and level >= handler.level
+            ):
+                if record is not None:
+                    handler.store(record)
+                else:
+                    handler.storeCall(self._recordFromCall, call)
+
+    def _recordFromCall(self, call: tuple[Any, ...]) -> logging.LogRecord:
+        # FlightRecorderHandler.storeCall() builder: the record as it would
+        # have been made at the time of the call
+        level, msg, args, created, thread, context = call
+        log_context = ApatheticLogging_Internal_LogContext._log_context  # noqa: SLF001
+        token = log_context.set(context)
+        try:
+            record = self._buildRecord(level, msg, args, caller=False)
+        finally:
+            log_context.reset(token)
+        record.relativeCreated -= (record.created - created) * 1000
+        record.created = created
+        record.msecs = int((created - int(created)) * 1000) + 0.0
+        record.thread = thread.ident
+        record.threadName = thread.name
+        return record
+
+    def handle(self, record: logging.LogRecord) -> None:
+        """Call the handlers for the specified record.
+
+        Changed:
+        - With metrics registered (see registerMetrics()), counts the record
+          as emitted or as dropped by one of this logger's filters.
+
+        Wrapper for logging.Logger.handle.
+
+        https://docs.python.org/3.10/library/logging.html#logging.Logger.handle
+        """
+        # logging.Logger.handle(), inlined so metrics add no call when off
+        if self.disabled:
+            return
+        maybe_record: object = self.filter(record)
+        metrics = ApatheticLogging_Internal_RegistryData.registered_internal_metrics
+        if not maybe_record:
+            if metrics:
+                _metrics = ApatheticLogging_Internal_Metrics
+                _metrics.countRecord(
+                    self.name, record.levelno, _metrics.METRIC_DROPPED_FILTER
+                )
+            return
+        if isinstance(maybe_record, logging.LogRecord):
+            # Python 3.12+: a filter may return a replacement record
+            record = maybe_record
+        if metrics:
+            _metrics = ApatheticLogging_Internal_Metrics
+            _metrics.countRecord(self.name, record.levelno, _metrics.METRIC_EMITTED)
+        self.callHandlers(record)
+
+    @staticmethod
+    def notifyStreamsChanged() -> None:
+        """Tell every logger that sys.stdout/sys.stderr have been replaced.
+
+        ``_log()`` only re-validates handlers when the shared stream epoch
+        moves, so the steady-state path never compares stream identities.
+        DualStreamHandler already resolves its target stream per record, so
+        routing follows a swap without this call; use it when handlers should
+        be rebuilt against the new streams (e.g. after redirecting output for
+        a subprocess-style capture).
+        """
+        ApatheticLogging_Internal_LoggerCore.invalidateHandlers()
+
+    @property
+    def propagate(self) -> bool:
+        """Whether records are passed on to the parent logger's handlers.
+
+        Changed:
+        - Changing it makes loggers redo their caller-info decision
+
+        Wrapper for logging.Logger.propagate.
+
+        https://docs.python.org/3.10/library/logging.html#logging.Logger.propagate
+        """
+        return self._propagate
+
+    @propagate.setter
+    def propagate(self, value: bool) -> None:
+        # getLogger() re-applies the setting on every call
+        if value != self._propagate:
+            self._propagate = value
+            ApatheticLogging_Internal_CallerInfo.invalidateCallerInfo()
+
+    @property
+    def parent(self) -> logging.Logger | None:
+        """The logger records are propagated to, set by the logging manager.
+
+        Changed:
+        - Changing it makes loggers redo their caller-info decision
+
+        Wrapper for logging.Logger.parent.
+        """
+        return self._parent
+
+    @parent.setter
+    def parent(self, value: logging.Logger | None) -> None:
+        if value is not self._parent:
+            self._parent = value
+            ApatheticLogging_Internal_CallerInfo.invalidateCallerInfo()
+
+    def addHandler(self, hdlr: logging.Handler) -> None:
+        """Add the specified handler to this logger.
+
+        Changed:
+        - Makes loggers redo their caller-info decision
+
+        Wrapper for logging.Logger.addHandler.
+
+        https://docs.python.org/3.10/library/logging.html#logging.Logger.addHandler
+        """
+        super().addHandler(hdlr)
+        ApatheticLogging_Internal_CallerInfo.invalidateCallerInfo()
+
+    def removeHandler(self, hdlr: logging.Handler) -> None:
+        """Remove the specified handler from this logger.
+
+        Changed:
+        - Makes loggers redo their caller-info decision
+
+        Wrapper for logging.Logger.removeHandler.
+
+        https://docs.python.org/3.10/library/logging.html#logging.Logger.removeHandler
+        """
+        super().removeHandler(hdlr)
+        ApatheticLogging_Internal_CallerInfo.invalidateCallerInfo()
+
+    def addFilter(self, filter: Any) -> None:  # noqa: A002
+        """Add the specified filter to this logger.
+
+        Changed:
+        - Makes loggers redo their caller-info decision
+
+        Wrapper for logging.Logger.addFilter.
+
+        https://docs.python.org/3.10/library/logging.html#logging.Logger.addFilter
+        """
+        super().addFilter(filter)
+        ApatheticLogging_Internal_CallerInfo.invalidateCallerInfo()
+
+    def removeFilter(self, filter: Any) -> None:  # noqa: A002
+        """Remove the specified filter from this logger.
+
+        Changed:
+        - Makes loggers redo their caller-info decision
+
+        Wrapper for logging.Logger.removeFilter.
+
+        https://docs.python.org/3.10/library/logging.html#logging.Logger.removeFilter
+        """
+        super().removeFilter(filter)
+        ApatheticLogging_Internal_CallerInfo.invalidateCallerInfo()
+
+    @staticmethod
+    def invalidateHandlers() -> None:
+        """Make every logger rebuild its handlers on its next record.
+
+        Used when the handler setup itself changes (e.g. registerAsyncMode()).
+        """
+        ApatheticLogging_Internal_LoggerCore._stream_epoch += 1
 
     def _log(  # type: ignore[override]
-        self, level: int, msg: str, args: tuple[Any, ...], **kwargs: Any
+        self,
+        level: int,
+        msg: object,
+        args: tuple[Any, ...],
+        **kwargs: Any,
     ) -> None:
         """Log a message with the specified level.
 
         Changed:
         - Automatically ensures handlers are attached via ensureHandlers()
+          (only when handlers are missing or the stream epoch has moved)
+        - With sampling registered (see registerSampling()), records not
+          selected for their level are dropped here, before a LogRecord is
+          created
+        - findCaller() (and ``stacklevel``) is skipped when no handler or
+          formatter the record reaches reads caller info (see
+          CALLER_INFO_ATTRS), as with the default ``%(message)s``
+          TagFormatter; ``pathname``, ``lineno`` and ``funcName`` are then
+          left at the stdlib's "unknown" values. ``stack_info=True`` always
+          walks the stack.
 
         Args:
             level: The numeric logging level
-            msg: The message format string
+            msg: The message format string, or a lazy() value
             args: Arguments for the message format string
             **kwargs: Additional keyword arguments passed to the base implementation
 
@@ -136,8 +576,239 @@ class ApatheticLogging_Internal_LoggerCore(logging.Logger):  # noqa: N801  # pyr
 
         https://docs.python.org/3.10/library/logging.html#logging.Logger._log
         """
-        self.ensureHandlers()
-        super()._log(level, msg, args, **kwargs)
+        if (
+            ApatheticLogging_Internal_RegistryData.registered_internal_sampling
+            and not self._keepSampled(level)
+        ):
+            return
+        if (
+            not self.handlers
+            or self._handlers_epoch
+            != ApatheticLogging_Internal_LoggerCore._stream_epoch
+        ):
+            self.ensureHandlers()
+        if kwargs.get("stack_info") or self._wantsCallerInfo():
+            super()._log(level, msg, args, **kwargs)
+            return
+        # logging.Logger._log() without findCaller(): nothing would read it
+        self.handle(self._buildRecord(level, msg, args, caller=False, **kwargs))
+
+    def _wantsCallerInfo(self) -> bool:
+        # the decision only changes with the handlers, their formatters or
+        # the filters, so it is kept until the caller-info epoch moves; if a
+        # stdlib logger or handler is reached, the key built from them is
+        # compared too, since changes to those don't bump the epoch
+        epoch = ApatheticLogging_Internal_CallerInfo._caller_info_epoch  # noqa: SLF001
+        cached = self._caller_info
+        if (
+            cached is not None
+            and cached[0] == epoch
+            and (cached[1] is None or cached[1] == self._callerInfoKey())
+        ):
+            return cached[2]
+        handlers = list(ApatheticLogging_Internal_LoggerCore._callerInfoHandlers(self))
+        wanted = bool(self.filters) or any(
+            ApatheticLogging_Internal_LoggerCore._handlerWantsCallerInfo(handler)
+            for handler in handlers
+        )
+        key = None
+        if not ApatheticLogging_Internal_LoggerCore._callerInfoWatched(self, handlers):
+            key = self._callerInfoKey()
+        self._caller_info = (epoch, key, wanted)
+        return wanted
+
+    @staticmethod
+    def _callerInfoWatched(
+        logger: logging.Logger,
+        handlers: list[logging.Handler],
+    ) -> bool:
+        # True if every logger and handler a record reaches bumps the
+        # caller-info epoch when it changes
+        watched = ApatheticLogging_Internal_CallerInfo._WatchedHandler  # noqa: SLF001
+        if not all(isinstance(handler, watched) for handler in handlers):
+            return False
+        current: logging.Logger | None = logger
+        while current is not None:
+            if not isinstance(current, ApatheticLogging_Internal_LoggerCore):
+                return False
+            if not current.propagate:
+                return True
+            current = current.parent
+        return True
+
+    def _callerInfoKey(self) -> tuple[object, ...]:
+        # every handler a record reaches, with its formatter and filter count
+        key: list[object] = [len(self.filters)]
+        for handler in ApatheticLogging_Internal_LoggerCore._callerInfoHandlers(self):
+            key += (handler, handler.formatter, len(handler.filters))
+        return tuple(key)
+
+    @staticmethod
+    def _callerInfoHandlers(
+        logger: logging.Logger,
+    ) -> Generator[logging.Handler, None, None]:
+        # the handlers callHandlers() passes a record to, and the handlers
+        # async and flight recorder handlers pass it on to
+        current: logging.Logger | None = logger
+        while current is not None:
+            pending = list(current.handlers)
+            while pending:
+                handler = pending.pop()
+                yield handler
+                if isinstance(
+                    handler, ApatheticLogging_Internal_AsyncHandler.AsyncQueueHandler
+                ):
+                    pending.append(handler.target)
+                elif isinstance(
+                    handler,
+                    ApatheticLogging_Internal_FlightRecorder.FlightRecorderHandler,
+                ):
+                    pending.append(handler.target)
+                    if handler.dump_target is not None:
+                        pending.append(handler.dump_target)
+            if not current.propagate:
+                return
+            current = current.parent
+
+    @staticmethod
+    def _handlerWantsCallerInfo(handler: logging.Handler) -> bool:
+        if handler.filters:
+            # a filter may key on the call site (e.g. RateLimitFilter)
+            return True
+        handler_type = type(handler)
+        if handler_type in (
+            # their targets are checked on their own
+            ApatheticLogging_Internal_AsyncHandler.AsyncQueueHandler,
+            ApatheticLogging_Internal_FlightRecorder.FlightRecorderHandler,
+            # the payload carries no caller info
+            ApatheticLogging_Internal_ProcessHandler.ProcessQueueHandler,
+            logging.NullHandler,
+        ) or (
+            # nor do binary segment records
+            isinstance(
+                handler, ApatheticLogging_Internal_SegmentHandler.MmapSegmentHandler
+            )
+            and handler.record_format == "binary"
+        ):
+            return False
+        if handler_type in (
+            ApatheticLogging_Internal_DualStreamHandler.DualStreamHandler,
+            ApatheticLogging_Internal_DualFileHandler.DualFileHandler,
+            ApatheticLogging_Internal_SegmentHandler.MmapSegmentHandler,
+            logging.StreamHandler,
+            logging.FileHandler,
+        ):
+            return ApatheticLogging_Internal_LoggerCore._formatterWantsCallerInfo(
+                handler.formatter
+            )
+        # any other handler may read the record however it likes
+        return True
+
+    @staticmethod
+    def _formatterWantsCallerInfo(formatter: logging.Formatter | None) -> bool:
+        _constants = ApatheticLogging_Internal_Constants
+        if formatter is None:
+            # logging's default formatter: %(message)s
+            return False
+        formatter_type = type(formatter)
+        if formatter_type is ApatheticLogging_Internal_JsonFormatter.JsonFormatter:
+            fields = cast(
+                "ApatheticLogging_Internal_JsonFormatter.JsonFormatter", formatter
+            ).fields
+            return any(attr in _constants.CALLER_INFO_ATTRS for attr in fields.values())
+        if formatter_type in (
+            ApatheticLogging_Internal_TagFormatter.TagFormatter,
+            logging.Formatter,
+        ):
+            # any mention counts, whatever the format style
+            fmt = formatter._fmt or ""  # noqa: SLF001
+            return any(attr in fmt for attr in _constants.CALLER_INFO_ATTRS)
+        # a custom formatter may read any attribute
+        return True
+
+    def _keepSampled(self, level: int) -> bool:
+        _sampling = ApatheticLogging_Internal_Sampling
+        epoch = _sampling._sampling_epoch  # noqa: SLF001
+        rates = self._sample_rates
+        if rates is None or self._sample_rates_epoch != epoch:
+            rates = self._sample_rates = _sampling.resolveSampleRates(self.name)
+            self._sample_rates_epoch = epoch
+        rate = rates.get(level)
+        if rate is None or _sampling.keepSample(rate):
+            return True
+        if ApatheticLogging_Internal_RegistryData.registered_internal_metrics:
+            _metrics = ApatheticLogging_Internal_Metrics
+            _metrics.countRecord(self.name, level, _metrics.METRIC_DROPPED_SAMPLED)
+        return False
+
+    def makeRecord(
+        self,
+        name: str,
+        level: int,
+        fn: str,
+        lno: int,
+        msg: object,
+        args: Any,
+        exc_info: Any,
+        func: str | None = None,
+        extra: Mapping[str, object] | None = None,
+        sinfo: str | None = None,
+    ) -> logging.LogRecord:
+        """Create a LogRecord.
+
+        Changed:
+        - Fields bound with logContext()/bind() are added as record
+          attributes (``extra=`` values win), and the whole mapping is kept
+          as ``record.log_context`` for formatters that render it. The
+          mapping is shared, not copied, between records of one context.
+
+        Wrapper for logging.Logger.makeRecord.
+
+        https://docs.python.org/3.10/library/logging.html#logging.Logger.makeRecord
+        """
+        record = super().makeRecord(
+            name, level, fn, lno, msg, args, exc_info, func, extra, sinfo
+        )
+        context = ApatheticLogging_Internal_LogContext._log_context.get()  # noqa: SLF001
+        if context:
+            record_dict = record.__dict__
+            for key, value in context.items():
+                if key not in record_dict:
+                    record_dict[key] = value
+            record.log_context = context
+        return record
+
+    def bind(self, **fields: Any) -> None:
+        """Add fields to every record logged from the current context.
+
+        Same as bindLogContext(): the fields are bound to the current thread
+        or asyncio task, not to this logger, so every logger picks them up.
+
+        Args:
+            **fields: Field names and values to add
+        """
+        ApatheticLogging_Internal_LogContext.bindLogContext(**fields)
+
+    def unbind(self, *names: str) -> None:
+        """Remove fields added by bind() (same as unbindLogContext()).
+
+        Args:
+            *names: Field names to remove
+        """
+        ApatheticLogging_Internal_LogContext.unbindLogContext(*names)
+
+    def logContext(self, **fields: Any) -> AbstractContextManager[Mapping[str, Any]]:
+        """Add fields to every record logged inside the block.
+
+        Same as the module-level logContext().
+
+        Args:
+            **fields: Field names and values to add
+
+        Returns:
+            Context manager yielding a read-only view of the fields
+        """
+        return ApatheticLogging_Internal_LogContext.logContext(**fields)
 
     def setLevel(self, level: int | str, *, minimum: bool | None = False) -> None:
         """Set the logging level of this logger.
@@ -166,10 +837,6 @@ class ApatheticLogging_Internal_LoggerCore(logging.Logger):  # noqa: N801  # pyr
 
         https://docs.python.org/3.10/library/logging.html#logging.Logger.setLevel
         """
-        from .logging_utils import (  # noqa: PLC0415
-            ApatheticLogging_Internal_LoggingUtils,
-        )
-
         _logging_utils = ApatheticLogging_Internal_LoggingUtils
 
         # Resolve string to integer if needed using utility function
@@ -193,6 +860,10 @@ class ApatheticLogging_Internal_LoggerCore(logging.Logger):  # noqa: N801  # pyr
 
         super().setLevel(level)
 
+        # DualStreamHandler caches per-logger TEST-mode state
+        _dual_stream_handler = ApatheticLogging_Internal_DualStreamHandler
+        _dual_stream_handler.DualStreamHandler.invalidateLevelCache()
+
     @classmethod
     def determineColorEnabled(cls) -> bool:
         """Return True if colored output should be enabled."""
@@ -227,10 +898,6 @@ class ApatheticLogging_Internal_LoggerCore(logging.Logger):  # noqa: N801  # pyr
         """
         if level <= 0:
             if level_name is None:
-                from .logging_utils import (  # noqa: PLC0415
-                    ApatheticLogging_Internal_LoggingUtils,
-                )
-
                 level_name = ApatheticLogging_Internal_LoggingUtils.getLevelName(level)
             msg = (
                 f"Level '{level_name}' has value {level}, "
@@ -249,6 +916,7 @@ class ApatheticLogging_Internal_LoggerCore(logging.Logger):  # noqa: N801  # pyr
         - Sets logging.<LEVEL_NAME> attribute for convenience, matching the
           pattern of built-in levels (logging.DEBUG, logging.INFO, etc.)
         - Validates existing attributes to ensure consistency
+        - Clears the cached level name/number lookups
 
         Args:
             level: The numeric level value (must be > 0 for custom levels)
@@ -297,6 +965,8 @@ class ApatheticLogging_Internal_LoggerCore(logging.Logger):  # noqa: N801  # pyr
         # Set convenience attribute matching built-in levels (logging.DEBUG, etc.)
         setattr(logging, level_name, level)
 
+        ApatheticLogging_Internal_LoggingUtils.invalidateLevelNameCache()
+
     @classmethod
     def extendLoggingModule(
         cls,
@@ -360,61 +1030,27 @@ class ApatheticLogging_Internal_LoggerCore(logging.Logger):  # noqa: N801  # pyr
         args: argparse.Namespace | None = None,
         root_log_level: str | None = None,
     ) -> str:
-        """Resolve log level from CLI → env → root config → default."""
-        _registry = ApatheticLogging_Internal_RegistryData
-        _constants = ApatheticLogging_Internal_Constants
+        """Resolve log level from CLI → env → root config → default.
+
+        Registry settings come from the memoized ConfigSnapshot, so this
+        only reads the registered environment variables.
+        """
         args_level = getattr(args, "log_level", None)
         if args_level is not None:
             # cast_hint would cause circular dependency
             return cast("str", args_level).upper()
 
-        # Check registered environment variables, or fall back to "LOG_LEVEL"
-        # Access registry via namespace class MRO to ensure correct resolution
-        # in both installed and stitched builds
-        namespace_module = sys.modules.get("apathetic_logging")
-        if namespace_module is not None:
-            namespace_class = getattr(namespace_module, "apathetic_logging", None)
-            if namespace_class is not None:
-                # Use namespace class MRO to access registry
-                # (handles shadowed attributes correctly)
-                registered_env_vars = getattr(
-                    namespace_class,
-                    "registered_internal_log_level_env_vars",
-                    None,
-                )
-                registered_default = getattr(
-                    namespace_class,
-                    "registered_internal_default_log_level",
-                    None,
-                )
-            else:
-                # Fallback to direct registry access
-                registry_cls = _registry
-                registered_env_vars = (
-                    registry_cls.registered_internal_log_level_env_vars
-                )
-                registered_default = registry_cls.registered_internal_default_log_level
-        else:
-            # Fallback to direct registry access
-            registered_env_vars = _registry.registered_internal_log_level_env_vars
-            registered_default = _registry.registered_internal_default_log_level
-
-        env_vars_to_check = (
-            registered_env_vars or _constants.DEFAULT_APATHETIC_LOG_LEVEL_ENV_VARS
-        )
-        for env_var in env_vars_to_check:
-            env_log_level = os.getenv(env_var)
+        snapshot = ApatheticLogging_Internal_ConfigSnapshot.getConfigSnapshot()
+        environ = os.environ
+        for env_var in snapshot.log_level_env_vars:
+            env_log_level = environ.get(env_var)
             if env_log_level:
                 return env_log_level.upper()
 
         if root_log_level:
             return root_log_level.upper()
 
-        # Use registered default, or fall back to module default
-        default_level: str = (
-            registered_default or _constants.DEFAULT_APATHETIC_LOG_LEVEL
-        )
-        return default_level.upper()
+        return snapshot.default_log_level
 
     @property
     def levelName(self) -> str:
@@ -481,10 +1117,6 @@ class ApatheticLogging_Internal_LoggerCore(logging.Logger):  # noqa: N801  # pyr
 
         See also: levelName property, getEffectiveLevelName
         """
-        from .logging_utils import (  # noqa: PLC0415
-            ApatheticLogging_Internal_LoggingUtils,
-        )
-
         return ApatheticLogging_Internal_LoggingUtils.getLevelName(self.level)
 
     def getEffectiveLevelName(self) -> str:
@@ -500,10 +1132,6 @@ class ApatheticLogging_Internal_LoggerCore(logging.Logger):  # noqa: N801  # pyr
 
         See also: effectiveLevelName property, getEffectiveLevel
         """
-        from .logging_utils import (  # noqa: PLC0415
-            ApatheticLogging_Internal_LoggingUtils,
-        )
-
         return ApatheticLogging_Internal_LoggingUtils.getLevelName(
             self.getEffectiveLevel()
         )
@@ -548,71 +1176,277 @@ class ApatheticLogging_Internal_LoggerCore(logging.Logger):  # noqa: N801  # pyr
             enable_color = self.enable_color
         return f"{color}{text}{_constants.ANSIColors.RESET}" if enable_color else text
 
-    def trace(self, msg: str, *args: Any, **kwargs: Any) -> None:
-        """Log a trace-level message (more verbose than DEBUG)."""
+    def debug(self, msg: object, *args: Any, **kwargs: Any) -> None:
+        """Log 'msg % args' with severity 'DEBUG'.
+
+        Changed:
+        - Below-level records can still reach the flight recorder and metrics
+
+        Wrapper for logging.Logger.debug.
+
+        https://docs.python.org/3.10/library/logging.html#logging.Logger.debug
+        """
+        self._logIfEnabled(logging.DEBUG, msg, args, kwargs)
+
+    def info(self, msg: object, *args: Any, **kwargs: Any) -> None:
+        """Log 'msg % args' with severity 'INFO'.
+
+        Changed:
+        - Below-level records can still reach the flight recorder and metrics
+
+        Wrapper for logging.Logger.info.
+
+        https://docs.python.org/3.10/library/logging.html#logging.Logger.info
+        """
+        self._logIfEnabled(logging.INFO, msg, args, kwargs)
+
+    def warning(self, msg: object, *args: Any, **kwargs: Any) -> None:
+        """Log 'msg % args' with severity 'WARNING'.
+
+        Changed:
+        - Below-level records can still reach the flight recorder and metrics
+
+        Wrapper for logging.Logger.warning.
+
+        https://docs.python.org/3.10/library/logging.html#logging.Logger.warning
+        """
+        self._logIfEnabled(logging.WARNING, msg, args, kwargs)
+
+    def error(self, msg: object, *args: Any, **kwargs: Any) -> None:
+        """Log 'msg % args' with severity 'ERROR'.
+
+        Changed:
+        - Below-level records can still reach the flight recorder and metrics
+
+        Wrapper for logging.Logger.error.
+
+        https://docs.python.org/3.10/library/logging.html#logging.Logger.error
+        """
+        self._logIfEnabled(logging.ERROR, msg, args, kwargs)
+
+    def critical(self, msg: object, *args: Any, **kwargs: Any) -> None:
+        """Log 'msg % args' with severity 'CRITICAL'.
+
+        Changed:
+        - Below-level records can still reach the flight recorder and metrics
+
+        Wrapper for logging.Logger.critical.
+
+        https://docs.python.org/3.10/library/logging.html#logging.Logger.critical
+        """
+        self._logIfEnabled(logging.CRITICAL, msg, args, kwargs)
+
+    fatal = critical
+
+    def log(self, level: int, msg: object, *args: Any, **kwargs: Any) -> None:
+        """Log 'msg % args' with the integer severity 'level'.
+
+        Changed:
+        - Below-level records can still reach the flight recorder and metrics
+
+        Wrapper for logging.Logger.log.
+
+        https://docs.python.org/3.10/library/logging.html#logging.Logger.log
+        """
+        if not isinstance(level, int):  # pyright: ignore[reportUnnecessaryIsInstance]
+            if logging.raiseExceptions:
+                type_msg = "level must be an integer"
+                raise TypeError(type_msg)
+            return
+        self._logIfEnabled(level, msg, args, kwargs)
+
+    def trace(self, msg: object, *args: Any, **kwargs: Any) -> None:
+        """Log a trace-level message (more verbose than DEBUG).
+
+        ``msg`` and ``args`` may be lazy() values; they are not evaluated
+        unless TRACE is enabled and a handler formats the record.
+        """
         _constants = ApatheticLogging_Internal_Constants
-        if self.isEnabledFor(_constants.TRACE_LEVEL):
-            self._log(_constants.TRACE_LEVEL, msg, args, **kwargs)
+        self._logIfEnabled(_constants.TRACE_LEVEL, msg, args, kwargs)
 
-    def detail(self, msg: str, *args: Any, **kwargs: Any) -> None:
-        """Log a detail-level message (more detailed than INFO)."""
+    def detail(self, msg: object, *args: Any, **kwargs: Any) -> None:
+        """Log a detail-level message (more detailed than INFO).
+
+        ``msg`` and ``args`` may be lazy() values.
+        """
         _constants = ApatheticLogging_Internal_Constants
-        if self.isEnabledFor(_constants.DETAIL_LEVEL):
-            self._log(
-                _constants.DETAIL_LEVEL,
-                msg,
-                args,
-                **kwargs,
-            )
+        self._logIfEnabled(_constants.DETAIL_LEVEL, msg, args, kwargs)
 
     def minimal(self, msg: str, *args: Any, **kwargs: Any) -> None:
         """Log a minimal-level message (less detailed than INFO)."""
         _constants = ApatheticLogging_Internal_Constants
-        if self.isEnabledFor(_constants.MINIMAL_LEVEL):
-            self._log(
-                _constants.MINIMAL_LEVEL,
-                msg,
-                args,
-                **kwargs,
-            )
+        self._logIfEnabled(_constants.MINIMAL_LEVEL, msg, args, kwargs)
+
+    def test(self, msg: object, *args: Any, **kwargs: Any) -> None:
+        """Log a test-level message (most verbose, bypasses capture).
 
-    def test(self, msg: str, *args: Any, **kwargs: Any) -> None:
-        """Log a test-level message (most verbose, bypasses capture)."""
+        ``msg`` and ``args`` may be lazy() values.
+        """
         _constants = ApatheticLogging_Internal_Constants
-        if self.isEnabledFor(_constants.TEST_LEVEL):
-            self._log(_constants.TEST_LEVEL, msg, args, **kwargs)
+        self._logIfEnabled(_constants.TEST_LEVEL, msg, args, kwargs)
 
-    def logDynamic(self, level: str | int, msg: str, *args: Any, **kwargs: Any) -> None:
+    def logDynamic(
+        self,
+        level: str | int,
+        msg: object,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
         """Log a message with a dynamically provided log level
            (unlike .info(), .error(), etc.).
 
         Useful when you have a log level (string or numeric) and don't want to resolve
         either the string to int, or the int to a log method.
 
+        Like the level methods, nothing is done (and lazy values are not
+        evaluated) unless the resolved level is enabled.
+
         Args:
             level: Log level as string name or integer
-            msg: Message format string
-            *args: Arguments for message formatting
+            msg: Message format string, or a lazy() value
+            *args: Arguments for message formatting (may contain lazy() values)
             **kwargs: Additional keyword arguments
         """
-        # Resolve level
-        if isinstance(level, str):
-            from .logging_utils import (  # noqa: PLC0415
-                ApatheticLogging_Internal_LoggingUtils,
-            )
+        level_no = self._resolveLevel(level)
+        if level_no is None:
+            return
+        self._logIfEnabled(level_no, msg, args, kwargs)
 
+    def _resolveLevel(self, level: str | int) -> int | None:
+        if isinstance(level, str):
             try:
-                level_no = ApatheticLogging_Internal_LoggingUtils.getLevelNumber(level)
+                return ApatheticLogging_Internal_LoggingUtils.getLevelNumber(level)
             except ValueError:
                 self.error("Unknown log level: %r", level)
-                return
-        elif isinstance(level, int):  # pyright: ignore[reportUnnecessaryIsInstance]
-            level_no = level
-        else:
-            self.error("Invalid log level type: %r", type(level))
+                return None
+        if isinstance(level, int):  # pyright: ignore[reportUnnecessaryIsInstance]
+            return level
+        self.error("Invalid log level type: %r", type(level))
+        return None
+
+    def _buildRecord(
+        self,
+        level: int,
+        msg: object,
+        args: tuple[Any, ...],
+        exc_info: Any = None,
+        extra: dict[str, Any] | None = None,
+        stack_info: bool = False,  # noqa: FBT001, FBT002
+        stacklevel: int = 1,
+        *,
+        caller: bool = True,
+    ) -> logging.LogRecord:
+        # logging.Logger._log() without the final handle() call; caller=False
+        # skips findCaller() when no handler reads caller info
+        fn, lno, func, sinfo = "(unknown file)", 0, "(unknown function)", None
+        if caller or stack_info:
+            with suppress(ValueError):  # no Python frames to inspect
+                fn, lno, func, sinfo = self.findCaller(stack_info, stacklevel)
+        if exc_info:
+            if isinstance(exc_info, BaseException):
+                exc_info = (type(exc_info), exc_info, exc_info.__traceback__)
+            elif not isinstance(exc_info, tuple):
+                exc_info = sys.exc_info()
+        return self.makeRecord(
+            self.name, level, fn, lno, msg, args, exc_info, func, extra, sinfo
+        )
+
+    async def alog(
+        self,
+        level: str | int,
+        msg: object,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        """Log a message from a coroutine without blocking the event loop.
+
+        The record is created (and its message merged with ``args``) on the
+        calling task, then written by the shared async writer thread (see
+        getAsyncWriter()) through this logger's handlers, so level routing,
+        formatting and TEST-mode bypass are the same as for the sync methods.
+        When the writer's queue is full and its overflow policy is "block",
+        the call waits for room without stalling other tasks; the drop-*
+        policies never wait.
+
+        Like logDynamic(), nothing is done (and lazy values are not
+        evaluated) unless the resolved level is enabled. Records are written
+        in order, but after this call returns: use getAsyncWriter().flush() or
+        stopAsyncWriter() before reading the output.
+
+        Args:
+            level: Log level as string name or integer
+            msg: Message format string, or a lazy() value
+            *args: Arguments for message formatting (may contain lazy() values)
+            **kwargs: Keyword arguments accepted by the level methods
+                (exc_info, extra, stack_info, stacklevel)
+        """
+        level_no = self._resolveLevel(level)
+        if level_no is None:
+            return
+        if not self.isEnabledFor(level_no):
+            _registry_data = ApatheticLogging_Internal_RegistryData
+            if _registry_data.registered_internal_below_level_hooks:
+                self._logBelowLevel(level_no, msg, args, **kwargs)
+            return
+        if (
+            ApatheticLogging_Internal_RegistryData.registered_internal_sampling
+            and not self._keepSampled(level_no)
+        ):
             return
+        if (
+            not self.handlers
+            or self._handlers_epoch
+            != ApatheticLogging_Internal_LoggerCore._stream_epoch
+        ):
+            self.ensureHandlers()
+        record = self._buildRecord(
+            level_no, msg, args, caller=self._wantsCallerInfo(), **kwargs
+        )
+        # merge now so later changes to mutable args don't leak into the output
+        record.msg = record.getMessage()
+        record.args = None
+        writer = ApatheticLogging_Internal_AsyncHandler.getAsyncWriter()
+        await writer.asubmit(self, record)
+
+    async def atest(self, msg: object, *args: Any, **kwargs: Any) -> None:
+        """Log a test-level message from a coroutine (see alog())."""
+        _constants = ApatheticLogging_Internal_Constants
+        await self.alog(_constants.TEST_LEVEL, msg, *args, **kwargs)
 
-        self._log(level_no, msg, args, **kwargs)
+    async def atrace(self, msg: object, *args: Any, **kwargs: Any) -> None:
+        """Log a trace-level message from a coroutine (see alog())."""
+        _constants = ApatheticLogging_Internal_Constants
+        await self.alog(_constants.TRACE_LEVEL, msg, *args, **kwargs)
+
+    async def adebug(self, msg: object, *args: Any, **kwargs: Any) -> None:
+        """Log a debug-level message from a coroutine (see alog())."""
+        await self.alog(logging.DEBUG, msg, *args, **kwargs)
+
+    async def adetail(self, msg: object, *args: Any, **kwargs: Any) -> None:
+        """Log a detail-level message from a coroutine (see alog())."""
+        _constants = ApatheticLogging_Internal_Constants
+        await self.alog(_constants.DETAIL_LEVEL, msg, *args, **kwargs)
+
+    async def ainfo(self, msg: object, *args: Any, **kwargs: Any) -> None:
+        """Log an info-level message from a coroutine (see alog())."""
+        await self.alog(logging.INFO, msg, *args, **kwargs)
+
+    async def aminimal(self, msg: object, *args: Any, **kwargs: Any) -> None:
+        """Log a minimal-level message from a coroutine (see alog())."""
+        _constants = ApatheticLogging_Internal_Constants
+        await self.alog(_constants.MINIMAL_LEVEL, msg, *args, **kwargs)
+
+    async def awarning(self, msg: object, *args: Any, **kwargs: Any) -> None:
+        """Log a warning-level message from a coroutine (see alog())."""
+        await self.alog(logging.WARNING, msg, *args, **kwargs)
+
+    async def aerror(self, msg: object, *args: Any, **kwargs: Any) -> None:
+        """Log an error-level message from a coroutine (see alog())."""
+        await self.alog(logging.ERROR, msg, *args, **kwargs)
+
+    async def acritical(self, msg: object, *args: Any, **kwargs: Any) -> None:
+        """Log a critical-level message from a coroutine (see alog())."""
+        await self.alog(logging.CRITICAL, msg, *args, **kwargs)
 
     @contextmanager
     def useLevel(
@@ -634,10 +1468,6 @@ class ApatheticLogging_Internal_LoggerCore(logging.Logger):  # noqa: N801  # pyr
 
         # Resolve level
         if isinstance(level, str):
-            from .logging_utils import (  # noqa: PLC0415
-                ApatheticLogging_Internal_LoggingUtils,
-            )
-
             try:
                 level_no = ApatheticLogging_Internal_LoggingUtils.getLevelNumber(level)
             except ValueError:
@@ -12,6 +12,9 @@ from collections.abc import Callable
 from types import FrameType
 from typing import Any
 
+from .async_handler import (
+    ApatheticLogging_Internal_AsyncHandler,
+)
 from .logging_utils import (
     ApatheticLogging_Internal_LoggingUtils,
 )
@@ -79,11 +82,16 @@ class ApatheticLogging_Internal_StdCamelCase:  # noqa: N801  # pyright: ignore[r
         Perform any cleanup actions in the logging system (e.g. flushing
         buffers). Should be called at application exit.
 
+        Changed:
+        - Also stops the async writer thread (see registerAsyncMode()) once
+          every queued record has been written
+
         Wrapper for logging.shutdown with camelCase naming.
 
         https://docs.python.org/3.10/library/logging.html#logging.shutdown
         """
         logging.shutdown(*args, **kwargs)
+        ApatheticLogging_Internal_AsyncHandler.stopAsyncWriter()
 
     # --- Level Management Functions ---
 
@@ -94,11 +102,15 @@ class ApatheticLogging_Internal_StdCamelCase:  # noqa: N801  # pyright: ignore[r
         Associate 'level_name' with 'level'. This is used when converting
         levels to text during message formatting.
 
+        Changed:
+        - Clears the cached level name/number lookups
+
         Wrapper for logging.addLevelName with camelCase naming.
 
         https://docs.python.org/3.10/library/logging.html#logging.addLevelName
         """
         logging.addLevelName(level, level_name, *args, **kwargs)
+        ApatheticLogging_Internal_LoggingUtils.invalidateLevelNameCache()
 
     @staticmethod
     def getLevelName(level: int, *args: Any, **kwargs: Any) -> str:
@@ -249,6 +261,10 @@ class ApatheticLogging_Internal_StdCamelCase:  # noqa: N801  # pyright: ignore[r
         :param factory: A callable which will be called to instantiate
         a log record.
 
+        Pass SlotLogRecord for records that keep their attributes in slots
+        and compute the file, module, process and thread names only when a
+        formatter reads them; pass logging.LogRecord to go back.
+
         Wrapper for logging.setLogRecordFactory with camelCase naming.
 
         https://docs.python.org/3.10/library/logging.html#logging.setLogRecordFactory
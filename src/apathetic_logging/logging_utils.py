@@ -7,11 +7,16 @@ licensed under the Python Software Foundation License Version 2.
 
 from __future__ import annotations
 
-import inspect
 import logging
 import sys
-from types import FrameType
-from typing import TypeVar
+from typing import Any, ClassVar, TypeVar
+
+from .constants import (
+    ApatheticLogging_Internal_Constants,
+)
+from .registry_data import (
+    ApatheticLogging_Internal_RegistryData,
+)
 
 
 class ApatheticLogging_Internal_LoggingUtils:  # noqa: N801  # pyright: ignore[reportUnusedClass]
@@ -28,6 +33,24 @@ class ApatheticLogging_Internal_LoggingUtils:  # noqa: N801  # pyright: ignore[r
 
     _LoggerType = TypeVar("_LoggerType", bound=logging.Logger)
 
+    # Resolved level lookups (both directions), filled on first use and
+    # cleared by invalidateLevelNameCache() whenever a level is registered.
+    # Level names are cached as passed in and uppercased.
+    _level_number_cache: ClassVar[dict[str, int]] = {}
+    _level_name_cache: ClassVar[dict[int, str]] = {}
+
+    @staticmethod
+    def invalidateLevelNameCache() -> None:
+        """Forget every cached level name/number lookup.
+
+        Logger.addLevelName(), extendLoggingModule() and addLevelName() call
+        this for you. Call it yourself only if you register or remove levels
+        some other way (e.g. stdlib logging.addLevelName(), or setting or
+        deleting logging.<LEVEL_NAME> directly).
+        """
+        ApatheticLogging_Internal_LoggingUtils._level_number_cache.clear()
+        ApatheticLogging_Internal_LoggingUtils._level_name_cache.clear()
+
     @staticmethod
     def getLevelName(level: int | str, *, strict: bool = False) -> str:
         """Return the textual representation of a logging level.
@@ -87,6 +110,10 @@ class ApatheticLogging_Internal_LoggingUtils:  # noqa: N801  # pyright: ignore[r
         if isinstance(level, str):
             return level.upper()
 
+        cached = ApatheticLogging_Internal_LoggingUtils._level_name_cache.get(level)
+        if cached is not None:
+            return cached
+
         # Use logging.getLevelName() which handles all registered levels:
         # - Standard library levels (DEBUG, INFO, etc.)
         # - Custom apathetic levels (TEST, TRACE, etc.)
@@ -103,6 +130,7 @@ class ApatheticLogging_Internal_LoggingUtils:  # noqa: N801  # pyright: ignore[r
             return level_name
 
         # Known level (from stdlib, our custom levels, or user-registered levels)
+        ApatheticLogging_Internal_LoggingUtils._level_name_cache[level] = level_name
         return level_name
 
     @staticmethod
@@ -116,6 +144,9 @@ class ApatheticLogging_Internal_LoggingUtils:  # noqa: N801  # pyright: ignore[r
         Handles all levels registered via logging.addLevelName() (including
         standard library levels, custom apathetic levels, and user-registered levels).
 
+        Resolved names are cached, so repeated lookups are a single dict hit;
+        see invalidateLevelNameCache().
+
         Args:
             level: Log level as string name (case-insensitive) or integer
 
@@ -139,6 +170,11 @@ class ApatheticLogging_Internal_LoggingUtils:  # noqa: N801  # pyright: ignore[r
         if isinstance(level, int):
             return level
 
+        _cache = ApatheticLogging_Internal_LoggingUtils._level_number_cache
+        cached = _cache.get(level)
+        if cached is not None:
+            return cached
+
         level_str = level.upper()
 
         # Use getattr() to find level constants registered via logging.addLevelName():
@@ -150,6 +186,7 @@ class ApatheticLogging_Internal_LoggingUtils:  # noqa: N801  # pyright: ignore[r
         # - User-registered levels via setattr(logging, level_str, value)
         resolved = getattr(logging, level_str, None)
         if isinstance(resolved, int):
+            _cache[level] = _cache[level_str] = resolved
             return resolved
 
         msg = f"Unknown log level: {level!r}"
@@ -193,33 +230,18 @@ class ApatheticLogging_Internal_LoggingUtils:  # noqa: N801  # pyright: ignore[r
         return package
 
     @staticmethod
-    def _infer_from_frame(skip_frames: int, frame: FrameType | None) -> str | None:
-        """Infer logger name from caller's frame.
+    def _infer_from_globals(caller_globals: dict[str, Any]) -> str | None:
+        """Infer logger name from the caller's module globals.
 
         Args:
-            skip_frames: Number of frames to skip to get to actual caller
-            frame: Frame to start from, or None
+            caller_globals: The calling frame's ``f_globals``
 
         Returns:
             Inferred logger name or None if cannot be inferred
         """
-        if frame is None:
-            return None
-        try:
-            # Skip the specified number of frames to get to the actual caller
-            caller_frame = frame.f_back
-            for _ in range(skip_frames):
-                if caller_frame is None:
-                    break
-                caller_frame = caller_frame.f_back
-            if caller_frame is None:
-                return None
-            caller_package = caller_frame.f_globals.get("__package__")
-            return ApatheticLogging_Internal_LoggingUtils._extract_top_level_package(
-                caller_package
-            )
-        finally:
-            del frame
+        return ApatheticLogging_Internal_LoggingUtils._extract_top_level_package(
+            caller_globals.get("__package__")
+        )
 
     @staticmethod
     def getDefaultLoggerName(
@@ -267,11 +289,6 @@ class ApatheticLogging_Internal_LoggingUtils:  # noqa: N801  # pyright: ignore[r
         Raises:
             RuntimeError: If logger name cannot be resolved and raise_on_error=True.
         """
-        # Import locally to avoid circular import
-        from .registry_data import (  # noqa: PLC0415
-            ApatheticLogging_Internal_RegistryData,
-        )
-
         _registry_data = ApatheticLogging_Internal_RegistryData
 
         # If explicit name provided, return it (never store explicit names)
@@ -298,11 +315,21 @@ class ApatheticLogging_Internal_LoggingUtils:  # noqa: N801  # pyright: ignore[r
                 raise RuntimeError(error_msg)
             return None
 
-        # Get current frame (this function's frame) and skip to caller
-        frame = inspect.currentframe()
-        inferred_name = ApatheticLogging_Internal_LoggingUtils._infer_from_frame(
-            skip_frames, frame
+        # Jump straight to the caller's frame (depth 0 is this function).
+        # Unlike walking f_back, this doesn't build a frame object for every
+        # level in between.
+        try:
+            caller_frame = sys._getframe(skip_frames + 1)  # noqa: SLF001
+        except ValueError:
+            caller_frame = None
+        inferred_name = (
+            ApatheticLogging_Internal_LoggingUtils._infer_from_globals(
+                caller_frame.f_globals
+            )
+            if caller_frame is not None
+            else None
         )
+        del caller_frame
 
         # Store inferred name in registry if requested
         if inferred_name is not None and register:
@@ -352,14 +379,6 @@ class ApatheticLogging_Internal_LoggingUtils:  # noqa: N801  # pyright: ignore[r
             >>> checkPythonVersionRequirement((3, 11), "get_level_names_mapping")
             # Raises if target version < 3.11 or runtime version < 3.11
         """
-        # Import locally to avoid circular imports
-        from .constants import (  # noqa: PLC0415
-            ApatheticLogging_Internal_Constants,
-        )
-        from .registry_data import (  # noqa: PLC0415
-            ApatheticLogging_Internal_RegistryData,
-        )
-
         _constants = ApatheticLogging_Internal_Constants
         _registry_data = ApatheticLogging_Internal_RegistryData
 
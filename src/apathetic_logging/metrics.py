@@ -0,0 +1,277 @@
+# src/apathetic_logging/metrics.py
+"""Record counters and handler timings for Apathetic Logging."""
+
+from __future__ import annotations
+
+import math
+import os
+import threading
+from typing import Any, ClassVar, TypeAlias
+
+from .constants import (
+    ApatheticLogging_Internal_Constants,
+)
+from .logging_utils import (
+    ApatheticLogging_Internal_LoggingUtils,
+)
+
+
+class ApatheticLogging_Internal_Metrics:  # noqa: N801  # pyright: ignore[reportUnusedClass]
+    """Mixin class that provides logging metrics.
+
+    With metrics enabled (see registerMetrics()), loggers count records per
+    level and outcome (METRICS_OUTCOMES) and DualStreamHandlers record how
+    long each write took in a histogram. Every thread writes to its own
+    shard, so counting takes no lock; getLoggingStats() adds the shards up.
+    The shards of threads that have exited are folded into one, so
+    thread-per-task programs don't keep a shard per thread they ever ran.
+    With metrics disabled nothing is counted, and the only cost on the
+    logging path is one registry check per record written.
+
+    When mixed into apathetic_logging, it provides
+    apathetic_logging.getLoggingStats, apathetic_logging.resetLoggingStats,
+    apathetic_logging.formatOpenMetrics and
+    apathetic_logging.dumpLoggingStats.
+    """
+
+    # slots in each (logger name, level) counter list, in METRICS_OUTCOMES order
+    METRIC_EMITTED: int = 0
+    METRIC_DROPPED_LEVEL: int = 1
+    METRIC_DROPPED_FILTER: int = 2
+    METRIC_DROPPED_SAMPLED: int = 3
+
+    # (counters, timings): (logger name, level) -> counts per outcome, and
+    # handler name -> histogram
+    _Shard: TypeAlias = (
+        "tuple[dict[tuple[str, int], list[int]], dict[str, list[float]]]"
+    )
+
+    # per thread: its shard; see _metricsShard()
+    _metrics_local: ClassVar[threading.local] = threading.local()
+    # (thread, shard) for every thread that may still be counting
+    _metrics_shards: ClassVar[
+        list[tuple[threading.Thread, ApatheticLogging_Internal_Metrics._Shard]]
+    ] = []
+    # the counts of threads that have exited; see _retireShards()
+    _metrics_retired: ClassVar[ApatheticLogging_Internal_Metrics._Shard] = ({}, {})
+    _metrics_lock: ClassVar[threading.Lock] = threading.Lock()
+    # bumped by resetLoggingStats() so threads start new shards
+    _metrics_generation: int = 0
+
+    @staticmethod
+    def _metricsShard() -> ApatheticLogging_Internal_Metrics._Shard:
+        local = ApatheticLogging_Internal_Metrics._metrics_local
+        generation = ApatheticLogging_Internal_Metrics._metrics_generation
+        if getattr(local, "generation", -1) != generation:
+            local.shard = ({}, {})
+            local.generation = generation
+            with ApatheticLogging_Internal_Metrics._metrics_lock:
+                # a new thread is a good time to let go of finished ones
+                ApatheticLogging_Internal_Metrics._retireShards()
+                ApatheticLogging_Internal_Metrics._metrics_shards.append(
+                    (threading.current_thread(), local.shard)
+                )
+        return local.shard  # type: ignore[no-any-return]
+
+    @staticmethod
+    def _retireShards() -> None:
+        # fold the shards of threads that have exited into _metrics_retired;
+        # they can't be written to any more. Call with _metrics_lock held.
+        live: list[
+            tuple[threading.Thread, ApatheticLogging_Internal_Metrics._Shard]
+        ] = []
+        for thread, shard in ApatheticLogging_Internal_Metrics._metrics_shards:
+            if thread.is_alive():
+                live.append((thread, shard))
+            else:
+                ApatheticLogging_Internal_Metrics._mergeShard(
+                    ApatheticLogging_Internal_Metrics._metrics_retired, shard
+                )
+        ApatheticLogging_Internal_Metrics._metrics_shards[:] = live
+
+    @staticmethod
+    def _mergeShard(
+        into: ApatheticLogging_Internal_Metrics._Shard,
+        shard: ApatheticLogging_Internal_Metrics._Shard,
+    ) -> None:
+        # add one shard's counters and histograms to another's
+        into_counters, into_timings = into
+        shard_counters, shard_timings = shard
+        # list(): the owning thread may add keys while we read
+        for key, counts in list(shard_counters.items()):
+            total = into_counters.setdefault(key, [0] * len(counts))
+            for i, count in enumerate(counts):
+                total[i] += count
+        for name, histogram in list(shard_timings.items()):
+            merged = into_timings.setdefault(name, [0.0] * len(histogram))
+            for i, value in enumerate(histogram):
+                merged[i] += value
+
+    @staticmethod
+    def countRecord(logger_name: str, level: int, outcome: int) -> None:
+        """Count one record for a logger and level.
+
+        Args:
+            logger_name: Name of the logger
+            level: Level number of the record
+            outcome: METRIC_EMITTED, METRIC_DROPPED_LEVEL,
+                METRIC_DROPPED_FILTER or METRIC_DROPPED_SAMPLED
+        """
+        counters = ApatheticLogging_Internal_Metrics._metricsShard()[0]
+        key = (logger_name, level)
+        counts = counters.get(key)
+        if counts is None:
+            counts = counters[key] = [0, 0, 0, 0]
+        counts[outcome] += 1
+
+    @staticmethod
+    def observeHandlerTime(handler_name: str, seconds: float) -> None:
+        """Add one write duration to a handler's histogram.
+
+        Args:
+            handler_name: Name the handler is reported under
+            seconds: Time the handler spent formatting and writing a record
+        """
+        buckets = ApatheticLogging_Internal_Constants.METRICS_LATENCY_BUCKETS
+        timings = ApatheticLogging_Internal_Metrics._metricsShard()[1]
+        # [count, sum, per-bucket counts..., +Inf count]
+        histogram = timings.get(handler_name)
+        if histogram is None:
+            histogram = timings[handler_name] = [0.0] * (len(buckets) + 3)
+        histogram[0] += 1
+        histogram[1] += seconds
+        index = 0
+        for bound in buckets:
+            if seconds <= bound:
+                break
+            index += 1
+        histogram[2 + index] += 1
+
+    @staticmethod
+    def getLoggingStats() -> dict[str, Any]:
+        """Return the counters and handler timings of every thread, added up.
+
+        Shards are read without stopping the threads writing to them, so a
+        record counted during the call may or may not be included.
+
+        Returns:
+            ``{"loggers": {name: {level name: {outcome: count}}},
+            "handlers": {name: {"count": n, "sum": seconds,
+            "buckets": {upper bound: cumulative count}}}}``, with outcomes
+            from METRICS_OUTCOMES and a final ``math.inf`` bucket.
+        """
+        _constants = ApatheticLogging_Internal_Constants
+        outcomes = _constants.METRICS_OUTCOMES
+        bounds = (*_constants.METRICS_LATENCY_BUCKETS, math.inf)
+
+        totals: ApatheticLogging_Internal_Metrics._Shard = ({}, {})
+        with ApatheticLogging_Internal_Metrics._metrics_lock:
+            ApatheticLogging_Internal_Metrics._retireShards()
+            ApatheticLogging_Internal_Metrics._mergeShard(
+                totals, ApatheticLogging_Internal_Metrics._metrics_retired
+            )
+            for _thread, shard in ApatheticLogging_Internal_Metrics._metrics_shards:
+                ApatheticLogging_Internal_Metrics._mergeShard(totals, shard)
+        counters, timings = totals
+
+        loggers: dict[str, dict[str, dict[str, int]]] = {}
+        for (name, level), counts in sorted(counters.items()):
+            level_name = ApatheticLogging_Internal_LoggingUtils.getLevelName(level)
+            loggers.setdefault(name, {})[level_name] = dict(
+                zip(outcomes, counts, strict=True)
+            )
+        handlers: dict[str, dict[str, Any]] = {}
+        for name, histogram in sorted(timings.items()):
+            cumulative = 0
+            buckets: dict[float, int] = {}
+            for bound, bucket_count in zip(bounds, histogram[2:], strict=True):
+                cumulative += int(bucket_count)
+                buckets[bound] = cumulative
+            handlers[name] = {
+                "count": int(histogram[0]),
+                "sum": histogram[1],
+                "buckets": buckets,
+            }
+        return {"loggers": loggers, "handlers": handlers}
+
+    @staticmethod
+    def resetLoggingStats() -> None:
+        """Forget every counter and timing collected so far."""
+        with ApatheticLogging_Internal_Metrics._metrics_lock:
+            ApatheticLogging_Internal_Metrics._metrics_shards.clear()
+            ApatheticLogging_Internal_Metrics._metrics_retired = ({}, {})
+            ApatheticLogging_Internal_Metrics._metrics_generation += 1
+
+    @staticmethod
+    def formatOpenMetrics(stats: dict[str, Any] | None = None) -> str:
+        """Return logging stats in the OpenMetrics text format.
+
+        Writes a ``<prefix>_records`` counter labelled by logger, level and
+        outcome, and a ``<prefix>_handler_seconds`` histogram labelled by
+        handler, where the prefix is METRICS_PREFIX.
+
+        Args:
+            stats: Stats from getLoggingStats(), or None to read them now
+
+        Returns:
+            The exposition text, ending with ``# EOF``
+        """
+        _constants = ApatheticLogging_Internal_Constants
+        if stats is None:
+            stats = ApatheticLogging_Internal_Metrics.getLoggingStats()
+        prefix = _constants.METRICS_PREFIX
+
+        def label(value: object) -> str:
+            text = str(value).replace("\\", "\\\\").replace('"', '\\"')
+            return text.replace("\n", "\\n")
+
+        def number(value: float) -> str:
+            if value == math.inf:
+                return "+Inf"
+            return repr(value)
+
+        records = f"{prefix}_records"
+        lines = [
+            f"# TYPE {records} counter",
+            f"# HELP {records} Log records by logger, level and outcome.",
+        ]
+        for name, levels in stats["loggers"].items():
+            for level_name, outcomes in levels.items():
+                for outcome, count in outcomes.items():
+                    lines.append(
+                        f'{records}_total{{logger="{label(name)}",'
+                        f'level="{label(level_name)}",outcome="{outcome}"}} {count}'
+                    )
+        seconds = f"{prefix}_handler_seconds"
+        lines += [
+            f"# TYPE {seconds} histogram",
+            f"# UNIT {seconds} seconds",
+            f"# HELP {seconds} Time handlers spent formatting and writing a record.",
+        ]
+        for name, histogram in stats["handlers"].items():
+            handler = f'handler="{label(name)}"'
+            for bound, count in histogram["buckets"].items():
+                lines.append(
+                    f'{seconds}_bucket{{{handler},le="{number(bound)}"}} {count}'
+                )
+            lines.append(f"{seconds}_count{{{handler}}} {histogram['count']}")
+            lines.append(f"{seconds}_sum{{{handler}}} {number(histogram['sum'])}")
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def dumpLoggingStats(path: str | os.PathLike[str]) -> None:
+        """Write logging stats to a file in the OpenMetrics text format.
+
+        The file is replaced atomically, so a collector reading it (e.g.
+        the node_exporter textfile collector) never sees a partial write.
+
+        Args:
+            path: File to write
+        """
+        text = ApatheticLogging_Internal_Metrics.formatOpenMetrics()
+        tmp_path = f"{os.fspath(path)}.tmp"
+        # os rather than pathlib, which logging doesn't already import
+        with open(tmp_path, "w", encoding="utf-8") as f:  # noqa: PTH123
+            f.write(text)
+        os.replace(tmp_path, path)  # noqa: PTH105
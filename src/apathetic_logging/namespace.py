@@ -10,15 +10,47 @@ licensed under the Python Software Foundation License Version 2.
 
 from __future__ import annotations
 
+import os
+
+from .async_handler import (
+    ApatheticLogging_Internal_AsyncHandler,
+)
+from .binary_format import (
+    ApatheticLogging_Internal_BinaryFormat,
+)
+from .caller_info import (
+    ApatheticLogging_Internal_CallerInfo,
+)
+from .cli import (
+    ApatheticLogging_Internal_Cli,
+)
+from .config_snapshot import (
+    ApatheticLogging_Internal_ConfigSnapshot,
+)
 from .constants import (
     ApatheticLogging_Internal_Constants,
 )
+from .dual_file_handler import (
+    ApatheticLogging_Internal_DualFileHandler,
+)
 from .dual_stream_handler import (
     ApatheticLogging_Internal_DualStreamHandler,
 )
+from .flight_recorder import (
+    ApatheticLogging_Internal_FlightRecorder,
+)
 from .get_logger import (
     ApatheticLogging_Internal_GetLogger,
 )
+from .json_formatter import (
+    ApatheticLogging_Internal_JsonFormatter,
+)
+from .lazy import (
+    ApatheticLogging_Internal_Lazy,
+)
+from .log_context import (
+    ApatheticLogging_Internal_LogContext,
+)
 from .logger_namespace import (
     ApatheticLogging_Internal_Logger,
 )
@@ -28,6 +60,15 @@ from .logging_std_camel import (
 from .logging_utils import (
     ApatheticLogging_Internal_LoggingUtils,
 )
+from .metrics import (
+    ApatheticLogging_Internal_Metrics,
+)
+from .process_handler import (
+    ApatheticLogging_Internal_ProcessHandler,
+)
+from .rate_limit_filter import (
+    ApatheticLogging_Internal_RateLimitFilter,
+)
 from .registry import (
     ApatheticLogging_Internal_Registry,
 )
@@ -37,6 +78,15 @@ from .registry_data import (
 from .safe_logging import (
     ApatheticLogging_Internal_SafeLogging,
 )
+from .sampling import (
+    ApatheticLogging_Internal_Sampling,
+)
+from .segment_handler import (
+    ApatheticLogging_Internal_SegmentHandler,
+)
+from .slot_record import (
+    ApatheticLogging_Internal_SlotRecord,
+)
 from .tag_formatter import (
     ApatheticLogging_Internal_TagFormatter,
 )
@@ -46,14 +96,30 @@ from .tag_formatter import (
 
 
 class apathetic_logging(  # noqa: N801
+    ApatheticLogging_Internal_AsyncHandler,
+    ApatheticLogging_Internal_BinaryFormat,
+    ApatheticLogging_Internal_CallerInfo,
+    ApatheticLogging_Internal_Cli,
+    ApatheticLogging_Internal_ConfigSnapshot,
     ApatheticLogging_Internal_Constants,
+    ApatheticLogging_Internal_DualFileHandler,
     ApatheticLogging_Internal_DualStreamHandler,
+    ApatheticLogging_Internal_FlightRecorder,
     ApatheticLogging_Internal_GetLogger,
+    ApatheticLogging_Internal_JsonFormatter,
+    ApatheticLogging_Internal_Lazy,
+    ApatheticLogging_Internal_LogContext,
     ApatheticLogging_Internal_Logger,
     ApatheticLogging_Internal_LoggingUtils,
+    ApatheticLogging_Internal_Metrics,
+    ApatheticLogging_Internal_ProcessHandler,
+    ApatheticLogging_Internal_RateLimitFilter,
     ApatheticLogging_Internal_Registry,
     ApatheticLogging_Internal_RegistryData,
     ApatheticLogging_Internal_SafeLogging,
+    ApatheticLogging_Internal_Sampling,
+    ApatheticLogging_Internal_SegmentHandler,
+    ApatheticLogging_Internal_SlotRecord,
     ApatheticLogging_Internal_TagFormatter,
     ApatheticLogging_Internal_StdCamelCase,  # keep last
 ):
@@ -65,13 +131,58 @@ class apathetic_logging(  # noqa: N801
     **Classes:**
     - ``Logger`` → ``ApatheticLogging_Internal_Logger``
     - ``TagFormatter`` → ``ApatheticLogging_Internal_TagFormatter``
+    - ``JsonFormatter`` → ``ApatheticLogging_Internal_JsonFormatter``
+    - ``DualFileHandler`` → ``ApatheticLogging_Internal_DualFileHandler``
     - ``DualStreamHandler`` → ``ApatheticLogging_Internal_DualStreamHandler``
+    - ``AsyncQueueHandler`` → ``ApatheticLogging_Internal_AsyncHandler``
+    - ``AsyncWriter`` → ``ApatheticLogging_Internal_AsyncHandler``
+    - ``FlightRecorderHandler`` → ``ApatheticLogging_Internal_FlightRecorder``
+    - ``MmapSegmentHandler`` → ``ApatheticLogging_Internal_SegmentHandler``
+    - ``BinaryRecordEncoder`` → ``ApatheticLogging_Internal_BinaryFormat``
+    - ``BinaryRecordDecoder`` → ``ApatheticLogging_Internal_BinaryFormat``
+    - ``ProcessQueueHandler`` → ``ApatheticLogging_Internal_ProcessHandler``
+    - ``ProcessLogListener`` → ``ApatheticLogging_Internal_ProcessHandler``
+    - ``RateLimitFilter`` → ``ApatheticLogging_Internal_RateLimitFilter``
+    - ``SlotLogRecord`` → ``ApatheticLogging_Internal_SlotRecord``
+    - ``Lazy`` → ``ApatheticLogging_Internal_Lazy``
+    - ``ConfigSnapshot`` → ``ApatheticLogging_Internal_ConfigSnapshot``
 
     **Static Methods:**
     - ``getLogger()`` → ``ApatheticLogging_Internal_GetLogger``
     - ``registerDefaultLogLevel()`` → ``ApatheticLogging_Internal_Registry``
     - ``registerLogLevelEnvVars()`` → ``ApatheticLogging_Internal_Registry``
     - ``registerLogger()`` → ``ApatheticLogging_Internal_Registry``
+    - ``registerAsyncMode()`` → ``ApatheticLogging_Internal_Registry``
+    - ``registerBufferedOutput()`` → ``ApatheticLogging_Internal_Registry``
+    - ``registerFlightRecorder()`` → ``ApatheticLogging_Internal_Registry``
+    - ``registerOutputFormat()`` → ``ApatheticLogging_Internal_Registry``
+    - ``registerProcessQueue()`` → ``ApatheticLogging_Internal_Registry``
+    - ``registerSampling()`` → ``ApatheticLogging_Internal_Registry``
+    - ``registerMetrics()`` → ``ApatheticLogging_Internal_Registry``
+    - ``registerSegmentOutput()`` → ``ApatheticLogging_Internal_Registry``
+    - ``reinitAfterFork()`` → ``ApatheticLogging_Internal_ProcessHandler``
+    - ``getAsyncWriter()`` → ``ApatheticLogging_Internal_AsyncHandler``
+    - ``getConfigSnapshot()`` → ``ApatheticLogging_Internal_ConfigSnapshot``
+    - ``invalidateConfigSnapshot()`` → ``ApatheticLogging_Internal_ConfigSnapshot``
+    - ``lazy()`` → ``ApatheticLogging_Internal_Lazy``
+    - ``logContext()`` → ``ApatheticLogging_Internal_LogContext``
+    - ``bindLogContext()`` → ``ApatheticLogging_Internal_LogContext``
+    - ``unbindLogContext()`` → ``ApatheticLogging_Internal_LogContext``
+    - ``getLogContext()`` → ``ApatheticLogging_Internal_LogContext``
+    - ``clearLogContext()`` → ``ApatheticLogging_Internal_LogContext``
+    - ``getLoggingStats()`` → ``ApatheticLogging_Internal_Metrics``
+    - ``resetLoggingStats()`` → ``ApatheticLogging_Internal_Metrics``
+    - ``formatOpenMetrics()`` → ``ApatheticLogging_Internal_Metrics``
+    - ``dumpLoggingStats()`` → ``ApatheticLogging_Internal_Metrics``
+    - ``getSegmentHandler()`` → ``ApatheticLogging_Internal_SegmentHandler``
+    - ``closeSegmentHandler()`` → ``ApatheticLogging_Internal_SegmentHandler``
+    - ``readSegmentHeader()`` → ``ApatheticLogging_Internal_SegmentHandler``
+    - ``iterSegmentRecords()`` → ``ApatheticLogging_Internal_SegmentHandler``
+    - ``listSegments()`` → ``ApatheticLogging_Internal_SegmentHandler``
+    - ``iterSegments()`` → ``ApatheticLogging_Internal_SegmentHandler``
+    - ``decodeSegment()`` → ``ApatheticLogging_Internal_SegmentHandler``
+    - ``decodeBinaryRecords()`` → ``ApatheticLogging_Internal_BinaryFormat``
+    - ``runCli()`` → ``ApatheticLogging_Internal_Cli``
     - ``safeLog()`` → ``ApatheticLogging_Internal_SafeLogging``
     - ``safeTrace()`` → ``ApatheticLogging_Internal_SafeLogging``
     - ``makeSafeTrace()`` → ``ApatheticLogging_Internal_SafeLogging``
@@ -98,6 +209,10 @@ class apathetic_logging(  # noqa: N801
 # The method is idempotent, so safe to call multiple times if needed
 apathetic_logging.Logger.extendLoggingModule()
 
+# Reset inherited writer threads and buffers in forked children (not on Windows)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=apathetic_logging.reinitAfterFork)
+
 # Note: All exports are handled in __init__.py
 # - For library builds (installed/singlefile): __init__.py is included, exports happen
 # - For embedded builds: __init__.py is excluded, no exports (only class available)
@@ -0,0 +1,360 @@
+# src/apathetic_logging/process_handler.py
+"""Multiprocessing support for Apathetic Logging.
+
+Docstrings are adapted from the standard library logging.handlers.QueueHandler
+and QueueListener documentation licensed under the Python Software Foundation
+License Version 2.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Any, cast
+
+from .async_handler import (
+    ApatheticLogging_Internal_AsyncHandler,
+)
+from .caller_info import (
+    ApatheticLogging_Internal_CallerInfo,
+)
+from .constants import (
+    ApatheticLogging_Internal_Constants,
+)
+from .dual_file_handler import (
+    ApatheticLogging_Internal_DualFileHandler,
+)
+from .dual_stream_handler import (
+    ApatheticLogging_Internal_DualStreamHandler,
+)
+from .flight_recorder import (
+    ApatheticLogging_Internal_FlightRecorder,
+)
+from .safe_logging import (
+    ApatheticLogging_Internal_SafeLogging,
+)
+from .segment_handler import (
+    ApatheticLogging_Internal_SegmentHandler,
+)
+
+
+class ApatheticLogging_Internal_ProcessHandler:  # noqa: N801  # pyright: ignore[reportUnusedClass]
+    """Mixin class that provides child-to-parent logging for process pools.
+
+    This class contains the ProcessQueueHandler (child side) and
+    ProcessLogListener (parent side) implementations as nested classes, and
+    the fork hook that resets inherited handler state. When mixed into
+    apathetic_logging, it provides apathetic_logging.ProcessQueueHandler,
+    apathetic_logging.ProcessLogListener and
+    apathetic_logging.reinitAfterFork.
+    """
+
+    class ProcessQueueHandler(
+        ApatheticLogging_Internal_CallerInfo._WatchedHandler,  # noqa: SLF001
+        logging.Handler,
+    ):
+        """Child-side handler that sends records to a ProcessLogListener.
+
+        Each record is reduced to a small pickled payload (logger name,
+        level, merged message, time, process, rendered traceback, TEST-mode
+        flag, and ``extra=`` values) on the calling thread and put on a
+        multiprocessing queue. Nothing is written in the child, so lines from
+        different processes can't interleave; the parent writes each record
+        whole.
+
+        Installed automatically by ensureHandlers() once registerProcessQueue()
+        has been called in the child (e.g. as a ProcessPoolExecutor
+        initializer).
+        """
+
+        def __init__(self, queue: Any, *args: Any, **kwargs: Any) -> None:
+            """Initialize the handler.
+
+            Args:
+                queue: Queue shared with the parent's ProcessLogListener
+                    (anything with a ``put()`` method that crosses processes)
+                *args: Additional positional arguments (for future-proofing)
+                **kwargs: Additional keyword arguments (for future-proofing)
+            """
+            super().__init__(*args, **kwargs)
+            self.queue = queue
+            # deferred: pickle is only needed by process pools (and is
+            # already imported in a child that received a process queue)
+            import pickle  # noqa: PLC0415
+
+            self._pickle = pickle
+
+        @staticmethod
+        def _isTestMode(logger_name: str) -> bool:
+            _constants = ApatheticLogging_Internal_Constants
+            logger_instance = logging.getLogger(logger_name)
+            return callable(getattr(logger_instance, "test", None)) and (
+                logger_instance.level == _constants.TEST_LEVEL
+            )
+
+        def prepare(self, record: logging.LogRecord) -> bytes:
+            """Return the pickled payload for a record.
+
+            Args:
+                record: The LogRecord to send
+
+            Returns:
+                Payload bytes for ProcessLogListener.makeRecord()
+            """
+            _constants = ApatheticLogging_Internal_Constants
+            if record.exc_info and not record.exc_text:
+                formatter = self.formatter or logging.Formatter()
+                record.exc_text = formatter.formatException(record.exc_info)
+            # TEST mode only changes where diagnostic records go
+            test_mode = record.levelno <= logging.DEBUG and self._isTestMode(
+                record.name
+            )
+            extras = {
+                key: value
+                for key, value in record.__dict__.items()
+                if key not in _constants.LOG_RECORD_ATTRS
+            }
+            log_context = getattr(record, "log_context", None)
+            if log_context:
+                # the fields are already extras; this keeps them grouped
+                # for the parent's TagFormatter
+                extras["log_context"] = log_context
+            payload = (
+                record.name,
+                record.levelno,
+                record.levelname,
+                record.getMessage(),
+                record.created,
+                record.process,
+                record.processName,
+                record.exc_text,
+                record.stack_info,
+                test_mode,
+                extras or None,
+            )
+            _pickle = self._pickle
+            try:
+                return cast("bytes", _pickle.dumps(payload, _pickle.HIGHEST_PROTOCOL))
+            except Exception:  # noqa: BLE001
+                # an extra= value that can't be pickled; send its repr()
+                payload = (
+                    *payload[:-1],
+                    {key: repr(value) for key, value in extras.items()},
+                )
+                return cast("bytes", _pickle.dumps(payload, _pickle.HIGHEST_PROTOCOL))
+
+        def emit(self, record: logging.LogRecord) -> None:
+            """Put the record's payload on the queue.
+
+            logging.Handler.emit() implementation:
+            https://docs.python.org/3.10/library/logging.html#logging.Handler.emit
+            """
+            try:
+                self.queue.put(self.prepare(record))
+            except Exception:  # noqa: BLE001
+                self.handleError(record)
+
+    class ProcessLogListener:
+        """Parent-side thread that writes records sent by child processes.
+
+        Payloads from ProcessQueueHandler are turned back into LogRecords and
+        passed to ``handler`` if one is given, or else to the parent's logger
+        of the same name, so the parent's handlers (DualStreamHandler routing,
+        formatter, buffering, async mode) decide how each record is written.
+        The child already applied its level, so the parent's isn't applied
+        again (a parent flight recorder passes them through). Records sent by
+        a child logger at TEST level keep bypassing capture.
+
+        Example:
+            >>> from concurrent.futures import ProcessPoolExecutor
+            >>> from apathetic_logging import ProcessLogListener
+            >>> from apathetic_logging import registerProcessQueue
+            >>> with ProcessLogListener() as listener:
+            ...     with ProcessPoolExecutor(
+            ...         initializer=registerProcessQueue,
+            ...         initargs=(listener.queue,),
+            ...     ) as pool:
+            ...         pool.map(work, items)
+        """
+
+        def __init__(
+            self,
+            queue: Any | None = None,
+            handler: logging.Handler | None = None,
+        ) -> None:
+            """Initialize the listener. Call start() to begin writing.
+
+            Args:
+                queue: Queue the children put payloads on, or None to create
+                    a multiprocessing.Queue
+                handler: Handler that writes every record, or None to use the
+                    parent's logger with the record's name
+            """
+            if queue is None:
+                # deferred: multiprocessing is slow to import and only
+                # process pools need it
+                import multiprocessing  # noqa: PLC0415
+
+                queue = multiprocessing.Queue()
+            self.queue: Any = queue
+            self.handler = handler
+            self._thread: threading.Thread | None = None
+
+        @property
+        def running(self) -> bool:
+            """Return True if the listener thread is alive."""
+            return self._thread is not None and self._thread.is_alive()
+
+        def start(self) -> None:
+            """Start the listener thread if it isn't already running."""
+            if self.running:
+                return
+            self._thread = threading.Thread(
+                target=self._run,
+                name="apathetic-logging-listener",
+                daemon=True,
+            )
+            self._thread.start()
+
+        def stop(self, timeout: float | None = None) -> None:
+            """Write every payload already queued, then stop the thread.
+
+            Args:
+                timeout: Seconds to wait for the thread to exit, or None
+            """
+            thread = self._thread
+            if thread is None or not thread.is_alive():
+                self._thread = None
+                return
+            self.queue.put(None)
+            thread.join(timeout)
+            self._thread = None
+
+        def __enter__(
+            self,
+        ) -> ApatheticLogging_Internal_ProcessHandler.ProcessLogListener:
+            self.start()
+            return self
+
+        def __exit__(self, *exc_info: object) -> None:
+            self.stop()
+
+        @staticmethod
+        def makeRecord(payload: bytes) -> logging.LogRecord:
+            """Rebuild a LogRecord from a ProcessQueueHandler payload.
+
+            Args:
+                payload: Bytes produced by ProcessQueueHandler.prepare()
+
+            Returns:
+                A LogRecord with the child's name, level, message, and time
+            """
+            # deferred: pickle is only needed by process pools
+            import pickle  # noqa: PLC0415
+
+            (
+                name,
+                levelno,
+                levelname,
+                msg,
+                created,
+                process,
+                process_name,
+                exc_text,
+                stack_info,
+                test_mode,
+                extras,
+            ) = pickle.loads(payload)  # noqa: S301  # payloads come from our own children
+            record = logging.LogRecord(
+                name, levelno, "", 0, msg, None, None, sinfo=stack_info
+            )
+            record.levelname = levelname
+            record.created = created
+            record.msecs = (created - int(created)) * 1000
+            record.process = process
+            record.processName = process_name
+            record.exc_text = exc_text
+            if test_mode:
+                record.test_mode = True
+            if extras:
+                record.__dict__.update(extras)
+            return record
+
+        def handlePayload(self, payload: bytes) -> None:
+            """Rebuild and write one record.
+
+            Args:
+                payload: Bytes produced by ProcessQueueHandler.prepare()
+            """
+            record = self.makeRecord(payload)
+            handler = self.handler
+            if handler is not None:
+                if record.levelno >= handler.level:
+                    handler.handle(record)
+                return
+            logger = logging.getLogger(record.name)
+            ensure_handlers = getattr(logger, "ensureHandlers", None)
+            if ensure_handlers is not None:
+                ensure_handlers()
+            logger.handle(record)
+
+        def _run(self) -> None:
+            while True:
+                payload = self.queue.get()
+                if payload is None:
+                    return
+                try:
+                    self.handlePayload(payload)
+                except Exception as e:  # noqa: BLE001
+                    # never let one bad payload kill the listener thread
+                    ApatheticLogging_Internal_SafeLogging.safeLog(
+                        f"[apathetic_logging] process listener failed: {e!r}"
+                    )
+
+    @staticmethod
+    def reinitAfterFork() -> None:
+        """Reset handler state a forked child inherited from its parent.
+
+        Registered with os.register_at_fork() on import. The parent's writer
+        thread doesn't exist in the child, and buffered or recorded records
+        are copies of output the parent still owns, so the child starts with
+        a fresh async writer and empty buffers. Segment handlers start a
+        segment of their own instead of writing into the parent's. Handler
+        locks are already reinitialized by the logging module.
+        """
+        _async_handler = ApatheticLogging_Internal_AsyncHandler
+        _dual_file_handler = ApatheticLogging_Internal_DualFileHandler
+        _dual_stream_handler = ApatheticLogging_Internal_DualStreamHandler
+        _flight_recorder = ApatheticLogging_Internal_FlightRecorder
+        _segment_handler = ApatheticLogging_Internal_SegmentHandler
+        # the parent's queue and its locks may be mid-use by a dead thread
+        _async_handler._async_writer = None  # noqa: SLF001
+
+        loggers: list[logging.Logger] = [logging.getLogger("")]
+        loggers.extend(
+            logger
+            for logger in list(logging.Logger.manager.loggerDict.values())
+            if isinstance(logger, logging.Logger)
+        )
+        for logger in loggers:
+            for handler in logger.handlers:
+                # walk wrapper chains (recorder -> async -> dual stream)
+                current: logging.Handler | None = handler
+                while current is not None:
+                    if isinstance(
+                        current,
+                        (
+                            _dual_stream_handler.DualStreamHandler,
+                            _dual_file_handler.DualFileHandler,
+                        ),
+                    ):
+                        current.discardBuffer()
+                    elif isinstance(current, _flight_recorder.FlightRecorderHandler):
+                        current.clear()
+                    elif isinstance(current, _segment_handler.MmapSegmentHandler):
+                        # the parent is still writing that segment
+                        current.detachSegment()
+                    elif isinstance(current, _async_handler.AsyncQueueHandler):
+                        # a private writer's thread didn't survive either
+                        current.writer = None
+                    current = getattr(current, "target", None)
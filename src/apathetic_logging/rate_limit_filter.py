@@ -0,0 +1,214 @@
+# src/apathetic_logging/rate_limit_filter.py
+"""RateLimitFilter class for Apathetic Logging.
+
+Docstrings are adapted from the standard library logging.Filter documentation
+licensed under the Python Software Foundation License Version 2.
+"""
+
+from __future__ import annotations
+
+import copy
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+from .constants import (
+    ApatheticLogging_Internal_Constants,
+)
+
+
+class ApatheticLogging_Internal_RateLimitFilter:  # noqa: N801  # pyright: ignore[reportUnusedClass]
+    """Mixin class that provides the RateLimitFilter nested class.
+
+    This class contains the RateLimitFilter implementation as a nested class.
+    When mixed into apathetic_logging, it provides
+    apathetic_logging.RateLimitFilter.
+    """
+
+    class RateLimitFilter(logging.Filter):
+        """Drop repeats of the same message once they exceed a rate.
+
+        Records are grouped by (logger name, level, message template), so
+        ``logger.warning("retrying %s", host)`` is one key whatever ``host``
+        is. Each key has a token bucket: up to ``burst`` records pass back to
+        back, then ``rate`` records per second. Records over the limit are
+        counted and dropped; the next record of that key to pass is preceded
+        by a summary record (``[repeated N more times] <last message>``,
+        with ``record.repeated = N``) sent through the same logger.
+
+        Keys are kept in a least-recently-used table of at most ``max_keys``
+        entries, so memory stays flat however many distinct messages are
+        logged. A key forgotten with suppressed repeats emits its summary.
+
+        Attach it to a logger (e.g. ``getLogger(name, rate_limit=5)``):
+        summaries are handled by ``logging.getLogger(record.name)``.
+        """
+
+        def __init__(
+            self,
+            rate: float,
+            burst: int | None = None,
+            *,
+            max_keys: int | None = None,
+            name: str = "",
+        ) -> None:
+            """Initialize the filter.
+
+            Args:
+                rate: Records per second allowed for each key once the burst
+                    is used up (must be > 0)
+                burst: Records allowed back to back for each key (must be
+                    > 0), or None for DEFAULT_RATE_LIMIT_BURST
+                max_keys: Keys to track (must be > 0), or None for
+                    DEFAULT_RATE_LIMIT_MAX_KEYS
+                name: Only limit records from this logger and its children
+                    (see logging.Filter); "" limits every record
+
+            Raises:
+                ValueError: If rate, burst or max_keys is not positive
+            """
+            super().__init__(name)
+            _constants = ApatheticLogging_Internal_Constants
+            if burst is None:
+                burst = _constants.DEFAULT_RATE_LIMIT_BURST
+            if max_keys is None:
+                max_keys = _constants.DEFAULT_RATE_LIMIT_MAX_KEYS
+            for label, value in (
+                ("rate", rate),
+                ("burst", burst),
+                ("max_keys", max_keys),
+            ):
+                if value <= 0:
+                    msg = f"Rate limit {label} must be > 0, got {value}"
+                    raise ValueError(msg)
+
+            self.rate = rate
+            self.burst = burst
+            self.max_keys = max_keys
+            # total records dropped since creation
+            self.suppressed = 0
+
+            # key -> [tokens, last refill time, suppressed count, last dropped]
+            self._buckets: OrderedDict[tuple[str, int, object], list[Any]] = (
+                OrderedDict()
+            )
+            self._lock = threading.Lock()
+
+        @staticmethod
+        def keyFor(record: logging.LogRecord) -> tuple[str, int, object]:
+            """Return the key a record is rate limited under.
+
+            Args:
+                record: The LogRecord being filtered
+
+            Returns:
+                (logger name, level, message template); records whose message
+                isn't a string (e.g. a lazy() value) use their call site as
+                the template so the message is never evaluated here
+            """
+            msg = record.msg
+            template = msg if isinstance(msg, str) else (record.pathname, record.lineno)
+            return (record.name, record.levelno, template)
+
+        def filter(self, record: logging.LogRecord) -> bool:
+            """Return False if the record's key is over its rate.
+
+            logging.Filter.filter() implementation:
+            https://docs.python.org/3.10/library/logging.html#logging.Filter.filter
+            """
+            if self.nlen and not super().filter(record):
+                return True
+            if "repeated" in record.__dict__:
+                # our own summary record coming back through the logger
+                return True
+
+            # keyFor(), inlined: this runs for every record
+            msg = record.msg
+            key = (
+                record.name,
+                record.levelno,
+                msg if isinstance(msg, str) else (record.pathname, record.lineno),
+            )
+            now = time.monotonic()
+            # at most one summary: for an evicted key or for this one
+            pending: tuple[int, logging.LogRecord] | None = None
+            lock = self._lock
+            lock.acquire()
+            try:
+                buckets = self._buckets
+                bucket = buckets.get(key)
+                if bucket is None:
+                    buckets[key] = [self.burst - 1.0, now, 0, None]
+                    if len(buckets) > self.max_keys:
+                        _, evicted = buckets.popitem(last=False)
+                        if evicted[2]:
+                            pending = (evicted[2], evicted[3])
+                else:
+                    buckets.move_to_end(key)
+                    tokens = bucket[0] + (now - bucket[1]) * self.rate
+                    tokens = min(tokens, self.burst)
+                    bucket[1] = now
+                    if tokens < 1.0:
+                        # suppressed path: nothing formatted or allocated
+                        bucket[0] = tokens
+                        bucket[2] += 1
+                        bucket[3] = record
+                        self.suppressed += 1
+                        return False
+                    bucket[0] = tokens - 1.0
+                    if bucket[2]:
+                        pending = (bucket[2], bucket[3])
+                        bucket[2] = 0
+                        bucket[3] = None
+            finally:
+                lock.release()
+
+            if pending is not None:
+                # outside the lock: handling a summary runs this filter again
+                self._emitSummary(*pending)
+            return True
+
+        def flushSummaries(self) -> None:
+            """Emit a summary for every key with suppressed repeats now.
+
+            Useful before shutdown, or from a periodic task, so a burst that
+            stops without another record of its key is still reported.
+            """
+            pending: list[tuple[int, logging.LogRecord]] = []
+            with self._lock:
+                for bucket in self._buckets.values():
+                    if bucket[2]:
+                        pending.append((bucket[2], bucket[3]))
+                        bucket[2] = 0
+                        bucket[3] = None
+            for count, last in pending:
+                self._emitSummary(count, last)
+
+        @staticmethod
+        def makeSummary(count: int, last: logging.LogRecord) -> logging.LogRecord:
+            """Return the summary record for suppressed repeats.
+
+            Args:
+                count: Number of records dropped
+                last: The last record dropped
+
+            Returns:
+                A copy of ``last`` with the summary message and ``repeated``
+            """
+            _constants = ApatheticLogging_Internal_Constants
+            summary = copy.copy(last)
+            summary.msg = _constants.RATE_LIMIT_SUMMARY_FORMAT
+            summary.args = (count, last.getMessage())
+            summary.exc_info = None
+            summary.exc_text = None
+            summary.stack_info = None
+            summary.repeated = count
+            return summary
+
+        def _emitSummary(self, count: int, last: logging.LogRecord) -> None:
+            summary = self.makeSummary(count, last)
+            # the logger already handled records of this key, so its
+            # handlers are in place
+            logging.getLogger(summary.name).handle(summary)
@@ -4,8 +4,22 @@
 from __future__ import annotations
 
 import logging
-from typing import TypeVar
+import os
+from collections.abc import Mapping
+from typing import Any, TypeVar
 
+from .async_handler import (
+    ApatheticLogging_Internal_AsyncHandler,
+)
+from .config_snapshot import (
+    ApatheticLogging_Internal_ConfigSnapshot,
+)
+from .constants import (
+    ApatheticLogging_Internal_Constants,
+)
+from .logger import (
+    ApatheticLogging_Internal_LoggerCore,
+)
 from .logging_utils import (
     ApatheticLogging_Internal_LoggingUtils,
 )
@@ -15,6 +29,12 @@ from .registry_data import (
 from .safe_logging import (
     ApatheticLogging_Internal_SafeLogging,
 )
+from .sampling import (
+    ApatheticLogging_Internal_Sampling,
+)
+from .segment_handler import (
+    ApatheticLogging_Internal_SegmentHandler,
+)
 
 
 class ApatheticLogging_Internal_Registry:  # noqa: N801  # pyright: ignore[reportUnusedClass]
@@ -34,6 +54,12 @@ class ApatheticLogging_Internal_Registry:  # noqa: N801  # pyright: ignore[repor
     - ``registerTargetPythonVersion()``: Register target Python version
     - ``registerPropagate()``: Register propagate setting
     - ``registerCompatibilityMode()``: Register compatibility mode setting
+    - ``registerAsyncMode()``: Register async (background writer) mode
+    - ``registerBufferedOutput()``: Register buffered DualStreamHandler output
+    - ``registerFlightRecorder()``: Register the TRACE/DEBUG flight recorder
+    - ``registerOutputFormat()``: Register text or JSON handler output
+    - ``registerProcessQueue()``: Send a child process's records to its parent
+    - ``registerSegmentOutput()``: Write records to memory-mapped segment files
     """
 
     _LoggerType = TypeVar("_LoggerType", bound=logging.Logger)
@@ -57,6 +83,7 @@ class ApatheticLogging_Internal_Registry:  # noqa: N801  # pyright: ignore[repor
         _safe_logging = ApatheticLogging_Internal_SafeLogging
 
         _registry_data.registered_internal_default_log_level = default_level
+        ApatheticLogging_Internal_ConfigSnapshot.invalidateConfigSnapshot()
         _safe_logging.safeTrace(
             "registerDefaultLogLevel() called",
             f"default_level={default_level}",
@@ -87,6 +114,7 @@ class ApatheticLogging_Internal_Registry:  # noqa: N801  # pyright: ignore[repor
         _safe_logging = ApatheticLogging_Internal_SafeLogging
 
         _registry_data.registered_internal_log_level_env_vars = env_vars
+        ApatheticLogging_Internal_ConfigSnapshot.invalidateConfigSnapshot()
         _safe_logging.safeTrace(
             "registerLogLevelEnvVars() called",
             f"env_vars={env_vars}",
@@ -189,8 +217,6 @@ class ApatheticLogging_Internal_Registry:  # noqa: N801  # pyright: ignore[repor
         _registry.registerPropagate(propagate=propagate)
         _registry.registerCompatibilityMode(compat_mode=compat_mode)
 
-        # Import Logger locally to avoid circular import
-
         # Track if name was auto-inferred
         was_explicit = logger_name is not None
 
@@ -296,6 +322,7 @@ class ApatheticLogging_Internal_Registry:  # noqa: N801  # pyright: ignore[repor
         _safe_logging = ApatheticLogging_Internal_SafeLogging
 
         _registry_data.registered_internal_propagate = propagate
+        ApatheticLogging_Internal_ConfigSnapshot.invalidateConfigSnapshot()
         _safe_logging.safeTrace(
             "registerPropagate() called",
             f"propagate={propagate}",
@@ -327,11 +354,560 @@ class ApatheticLogging_Internal_Registry:  # noqa: N801  # pyright: ignore[repor
         _safe_logging = ApatheticLogging_Internal_SafeLogging
 
         _registry_data.registered_internal_compatibility_mode = compat_mode
+        ApatheticLogging_Internal_ConfigSnapshot.invalidateConfigSnapshot()
         _safe_logging.safeTrace(
             "registerCompatibilityMode() called",
             f"compat_mode={compat_mode}",
         )
 
+    @staticmethod
+    def registerAsyncMode(
+        *,
+        async_mode: bool | None,
+        queue_size: int | None = None,
+        overflow: str | None = None,
+    ) -> None:
+        """Register async mode, where a background thread writes all log output.
+
+        When enabled, ensureHandlers() wraps each logger's DualStreamHandler in
+        an AsyncQueueHandler. Records are queued on the caller's thread and a
+        single writer thread formats and writes them, preserving stdout/stderr
+        routing and the order records were logged in. Queued records are
+        written on flush(), shutdown(), and at interpreter exit.
+
+        Existing loggers switch on their next record. Changing the queue size
+        or overflow policy stops the current writer (after writing what it
+        has queued); the next async record starts a new one.
+
+        Args:
+            async_mode: Enable (True) or disable (False) async mode. If None,
+                only the queue settings below are changed.
+            queue_size: Maximum number of records waiting to be written.
+                If None, keeps the registered value (default
+                DEFAULT_ASYNC_QUEUE_SIZE).
+            overflow: What to do when the queue is full: "block" waits for
+                room, "drop-oldest" discards the oldest queued record,
+                "drop-newest" discards the record being logged. If None, keeps
+                the registered value (default DEFAULT_ASYNC_OVERFLOW).
+
+        Raises:
+            ValueError: If queue_size <= 0 or overflow is not one of
+                ASYNC_OVERFLOW_POLICIES
+
+        Example:
+            >>> from apathetic_logging import registerAsyncMode
+            >>> registerAsyncMode(async_mode=True, overflow="drop-oldest")
+        """
+        if async_mode is None and queue_size is None and overflow is None:
+            return
+
+        _async_handler = ApatheticLogging_Internal_AsyncHandler
+        _constants = ApatheticLogging_Internal_Constants
+        _logger_core = ApatheticLogging_Internal_LoggerCore
+        _registry_data = ApatheticLogging_Internal_RegistryData
+        _safe_logging = ApatheticLogging_Internal_SafeLogging
+
+        if queue_size is not None and queue_size <= 0:
+            msg = f"Async queue size must be > 0, got {queue_size}"
+            raise ValueError(msg)
+        if overflow is not None and overflow not in _constants.ASYNC_OVERFLOW_POLICIES:
+            msg = (
+                f"Unknown async overflow policy: {overflow!r}. "
+                f"Expected one of {_constants.ASYNC_OVERFLOW_POLICIES}"
+            )
+            raise ValueError(msg)
+
+        if queue_size is not None or overflow is not None:
+            # the shared writer is built from these; replace it on next use
+            _async_handler.stopAsyncWriter()
+            if queue_size is not None:
+                _registry_data.registered_internal_async_queue_size = queue_size
+            if overflow is not None:
+                _registry_data.registered_internal_async_overflow = overflow
+
+        if async_mode is not None:
+            _registry_data.registered_internal_async_mode = async_mode
+            _logger_core.invalidateHandlers()
+
+        _safe_logging.safeTrace(
+            "registerAsyncMode() called",
+            f"async_mode={async_mode}",
+            f"queue_size={queue_size}",
+            f"overflow={overflow}",
+        )
+
+    @staticmethod
+    def registerBufferedOutput(
+        *,
+        buffered: bool | None,
+        buffer_size: int | None = None,
+        flush_interval: float | None = None,
+    ) -> None:
+        """Register buffered output for the DualStreamHandler.
+
+        When enabled, ensureHandlers() creates DualStreamHandlers that collect
+        formatted records per stream and write them in one call instead of
+        writing and flushing every record. Output is written when the buffer
+        reaches ``buffer_size`` characters, ``flush_interval`` seconds after
+        the buffer started (by a background thread if nothing else is
+        logged), immediately for WARNING and above, before switching between
+        stdout and stderr, and on flush()/shutdown().
+
+        Existing loggers switch on their next record.
+
+        Args:
+            buffered: Enable (True) or disable (False) buffered output. If
+                None, only the thresholds below are changed.
+            buffer_size: Characters to collect before writing. If None, keeps
+                the registered value (default DEFAULT_BUFFER_SIZE).
+            flush_interval: Seconds to hold output before writing. If None,
+                keeps the registered value (default
+                DEFAULT_BUFFER_FLUSH_INTERVAL).
+
+        Raises:
+            ValueError: If buffer_size <= 0 or flush_interval < 0
+
+        Example:
+            >>> from apathetic_logging import registerBufferedOutput
+            >>> registerBufferedOutput(buffered=True, buffer_size=256 * 1024)
+        """
+        if buffered is None and buffer_size is None and flush_interval is None:
+            return
+
+        _logger_core = ApatheticLogging_Internal_LoggerCore
+        _registry_data = ApatheticLogging_Internal_RegistryData
+        _safe_logging = ApatheticLogging_Internal_SafeLogging
+
+        if buffer_size is not None and buffer_size <= 0:
+            msg = f"Buffer size must be > 0, got {buffer_size}"
+            raise ValueError(msg)
+        if flush_interval is not None and flush_interval < 0:
+            msg = f"Buffer flush interval must be >= 0, got {flush_interval}"
+            raise ValueError(msg)
+
+        if buffered is not None:
+            _registry_data.registered_internal_buffered_output = buffered
+        if buffer_size is not None:
+            _registry_data.registered_internal_buffer_size = buffer_size
+        if flush_interval is not None:
+            _registry_data.registered_internal_buffer_flush_interval = flush_interval
+        _logger_core.invalidateHandlers()
+
+        _safe_logging.safeTrace(
+            "registerBufferedOutput() called",
+            f"buffered={buffered}",
+            f"buffer_size={buffer_size}",
+            f"flush_interval={flush_interval}",
+        )
+
+    @staticmethod
+    def registerFlightRecorder(
+        *,
+        enabled: bool | None,
+        capacity: int | None = None,
+        level: str | int | None = None,
+        dump_path: str | None = None,
+    ) -> None:
+        """Register a flight recorder that keeps recent low-level records.
+
+        When enabled, the level methods (debug(), trace(), log(), ...) also
+        keep calls below the logger's own level, down to ``level``: the most
+        recent ``capacity`` of them are held, unformatted, in a
+        FlightRecorderHandler. isEnabledFor() is not changed. They aren't
+        written unless an ERROR or CRITICAL record is logged (including
+        errorIfNotDebug() and criticalIfNotDebug()); then the buffered
+        records are written first, oldest first, so the error comes with
+        the context that led up to it.
+
+        Running at INFO with the recorder on costs one ring-buffer store for
+        each TRACE/DEBUG call. The LogRecord is only created if the buffer is
+        dumped, unless the call passes exc_info, extra or stack_info, or a
+        handler reads caller info.
+
+        Existing loggers switch on their next record.
+
+        Args:
+            enabled: Enable (True) or disable (False) the flight recorder. If
+                None, only the settings below are changed.
+            capacity: Records to keep per logger. If None, keeps the
+                registered value (default DEFAULT_FLIGHT_RECORDER_CAPACITY).
+            level: Lowest level to keep (name or number). If None, keeps the
+                registered value (default DEFAULT_FLIGHT_RECORDER_LEVEL).
+            dump_path: File to append dumps to. If None, keeps the registered
+                value (default: dumps go through the logger's own handler).
+
+        Raises:
+            ValueError: If capacity <= 0 or level is unknown
+
+        Example:
+            >>> from apathetic_logging import registerFlightRecorder
+            >>> registerFlightRecorder(enabled=True, capacity=500, level="trace")
+        """
+        if enabled is None and capacity is None and level is None and dump_path is None:
+            return
+
+        _logger_core = ApatheticLogging_Internal_LoggerCore
+        _logging_utils = ApatheticLogging_Internal_LoggingUtils
+        _registry_data = ApatheticLogging_Internal_RegistryData
+        _safe_logging = ApatheticLogging_Internal_SafeLogging
+
+        if capacity is not None and capacity <= 0:
+            msg = f"Flight recorder capacity must be > 0, got {capacity}"
+            raise ValueError(msg)
+        level_no = _logging_utils.getLevelNumber(level) if level is not None else None
+
+        if enabled is not None:
+            _registry_data.registered_internal_flight_recorder = enabled
+            ApatheticLogging_Internal_Registry._updateBelowLevelHooks()
+        if capacity is not None:
+            _registry_data.registered_internal_flight_recorder_capacity = capacity
+        if level_no is not None:
+            _registry_data.registered_internal_flight_recorder_level = level_no
+        if dump_path is not None:
+            _registry_data.registered_internal_flight_recorder_path = dump_path
+        _logger_core.invalidateHandlers()
+
+        _safe_logging.safeTrace(
+            "registerFlightRecorder() called",
+            f"enabled={enabled}",
+            f"capacity={capacity}",
+            f"level={level}",
+            f"dump_path={dump_path}",
+        )
+
+    @staticmethod
+    def registerOutputFormat(*, output_format: str | None) -> None:
+        """Register the output format for logger handlers.
+
+        ``"text"`` (the default) attaches a TagFormatter: level tags and
+        optional color, for people reading a terminal. ``"json"`` attaches a
+        JsonFormatter instead, writing one JSON object per line for log
+        shippers. stdout/stderr routing is the same for both.
+
+        Existing loggers switch on their next record.
+
+        Args:
+            output_format: One of OUTPUT_FORMATS. If None, returns
+                immediately without making any changes.
+
+        Raises:
+            ValueError: If output_format is not one of OUTPUT_FORMATS
+
+        Example:
+            >>> from apathetic_logging import registerOutputFormat
+            >>> registerOutputFormat(output_format="json")
+        """
+        if output_format is None:
+            return
+
+        _constants = ApatheticLogging_Internal_Constants
+        _logger_core = ApatheticLogging_Internal_LoggerCore
+        _registry_data = ApatheticLogging_Internal_RegistryData
+        _safe_logging = ApatheticLogging_Internal_SafeLogging
+
+        if output_format not in _constants.OUTPUT_FORMATS:
+            msg = (
+                f"Unknown output format: {output_format!r}. "
+                f"Expected one of {_constants.OUTPUT_FORMATS}"
+            )
+            raise ValueError(msg)
+
+        _registry_data.registered_internal_output_format = output_format
+        _logger_core.invalidateHandlers()
+
+        _safe_logging.safeTrace(
+            "registerOutputFormat() called",
+            f"output_format={output_format}",
+        )
+
+    @staticmethod
+    def registerProcessQueue(queue: Any | None) -> None:
+        """Send this process's records to a parent ProcessLogListener.
+
+        Call it in each child process, typically as the ProcessPoolExecutor
+        (or multiprocessing.Pool) initializer. ensureHandlers() then installs
+        a ProcessQueueHandler instead of a DualStreamHandler, so the child
+        never writes to the stdout/stderr it inherited and the parent writes
+        every record whole, with its usual routing.
+
+        Existing loggers switch on their next record.
+
+        Args:
+            queue: The listener's ``queue``. If None, returns immediately
+                without making any changes.
+
+        Example:
+            >>> from concurrent.futures import ProcessPoolExecutor
+            >>> from apathetic_logging import ProcessLogListener
+            >>> from apathetic_logging import registerProcessQueue
+            >>> with ProcessLogListener() as listener:
+            ...     with ProcessPoolExecutor(
+            ...         initializer=registerProcessQueue,
+            ...         initargs=(listener.queue,),
+            ...     ) as pool:
+            ...         pool.map(work, items)
+        """
+        if queue is None:
+            return
+
+        _logger_core = ApatheticLogging_Internal_LoggerCore
+        _registry_data = ApatheticLogging_Internal_RegistryData
+        _safe_logging = ApatheticLogging_Internal_SafeLogging
+
+        _registry_data.registered_internal_process_queue = queue
+        _logger_core.invalidateHandlers()
+
+        _safe_logging.safeTrace(
+            "registerProcessQueue() called",
+            f"queue={queue!r}",
+        )
+
+    @staticmethod
+    def registerSampling(
+        rates: Mapping[str | int, float] | None,
+        *,
+        logger_name: str | None = None,
+        key: str | None = None,
+    ) -> None:
+        """Register the fraction of records to keep, per level.
+
+        Useful for high-volume levels: ``{"trace": 0.01}`` keeps about 1% of
+        TRACE records instead of all or nothing via setLevel(). The decision
+        is made before the LogRecord is created, so dropped records cost a
+        dict lookup and a random draw. Levels without a rate are not sampled.
+
+        When the current log context (see logContext()) has a ``key`` field,
+        e.g. a trace or request ID, records are kept or dropped by a hash of
+        its value, so each request is logged completely or not at all.
+
+        Sampling applies before the flight recorder, so dropped records are
+        not recorded either.
+
+        Args:
+            rates: Level name or number -> fraction to keep (0.0 to 1.0).
+                Replaces the rates for ``logger_name``; an empty mapping
+                removes them. If None, rates are left unchanged.
+            logger_name: Apply the rates to this logger and its children
+                (overriding rates registered for all loggers or for its
+                ancestors, level by level). If None, apply to all loggers.
+            key: Log context field that makes sampling deterministic. If
+                None, left unchanged (DEFAULT_SAMPLING_KEY by default).
+
+        Raises:
+            ValueError: If a rate is outside 0.0 to 1.0, or a level name is
+                unknown
+
+        Example:
+            >>> from apathetic_logging import registerSampling
+            >>> registerSampling({"trace": 0.01, "detail": 0.1})
+            >>> registerSampling({"trace": 1.0}, logger_name="my_app.db")
+        """
+        if rates is None and key is None:
+            return
+
+        _logging_utils = ApatheticLogging_Internal_LoggingUtils
+        _registry_data = ApatheticLogging_Internal_RegistryData
+        _safe_logging = ApatheticLogging_Internal_SafeLogging
+        _sampling = ApatheticLogging_Internal_Sampling
+
+        if rates is not None:
+            level_rates: dict[int, float] = {}
+            for level, rate in rates.items():
+                if not 0.0 <= rate <= 1.0:
+                    msg = f"Sampling rate for {level!r} must be 0.0-1.0, got {rate}"
+                    raise ValueError(msg)
+                level_no = (
+                    _logging_utils.getLevelNumber(level)
+                    if isinstance(level, str)
+                    else level
+                )
+                level_rates[level_no] = float(rate)
+
+            scope = logger_name or ""
+            registered = dict(_registry_data.registered_internal_sampling or {})
+            if level_rates:
+                registered[scope] = level_rates
+            else:
+                registered.pop(scope, None)
+            _registry_data.registered_internal_sampling = registered or None
+
+        if key is not None:
+            _registry_data.registered_internal_sampling_key = key
+
+        _sampling.invalidateSamplingCache()
+
+        _safe_logging.safeTrace(
+            "registerSampling() called",
+            f"rates={rates}",
+            f"logger_name={logger_name}",
+            f"key={key}",
+        )
+
+    @staticmethod
+    def _updateBelowLevelHooks() -> None:
+        # one flag for the level methods to check; add any new feature that
+        # wants records below a logger's level here
+        _registry_data = ApatheticLogging_Internal_RegistryData
+        _registry_data.registered_internal_below_level_hooks = bool(
+            _registry_data.registered_internal_flight_recorder
+            or _registry_data.registered_internal_metrics
+        )
+
+    @staticmethod
+    def registerMetrics(*, enabled: bool | None) -> None:
+        """Register whether loggers and handlers collect metrics.
+
+        When enabled, every logger counts its records per level: emitted,
+        dropped by level, dropped by a filter on the logger, and dropped by
+        sampling. DualStreamHandlers also record how long each record took to
+        format and write. Read the numbers with getLoggingStats(), or export
+        them with formatOpenMetrics() / dumpLoggingStats().
+
+        Counting is per thread and takes no lock. When disabled (the default)
+        nothing is counted.
+
+        Args:
+            enabled: Enable (True) or disable (False) metrics. If None, the
+                setting is not changed.
+
+        Example:
+            >>> from apathetic_logging import getLoggingStats, registerMetrics
+            >>> registerMetrics(enabled=True)
+            >>> getLoggingStats()["loggers"]["myapp"]["INFO"]["emitted"]
+        """
+        if enabled is None:
+            return
+
+        _registry_data = ApatheticLogging_Internal_RegistryData
+        _safe_logging = ApatheticLogging_Internal_SafeLogging
+
+        _registry_data.registered_internal_metrics = enabled
+        ApatheticLogging_Internal_Registry._updateBelowLevelHooks()
+
+        _safe_logging.safeTrace("registerMetrics() called", f"enabled={enabled}")
+
+    @staticmethod
+    def registerSegmentOutput(
+        *,
+        enabled: bool | None,
+        directory: str | os.PathLike[str] | None = None,
+        segment_size: int | None = None,
+        sync_interval: float | None = None,
+        sync_level: str | int | None = None,
+        record_format: str | None = None,
+    ) -> None:
+        """Register memory-mapped segment files as the output for loggers.
+
+        When enabled, ensureHandlers() installs the shared MmapSegmentHandler
+        (see getSegmentHandler()) in place of a DualStreamHandler: records
+        from every logger are appended to preallocated segment files in
+        ``directory`` with no write() call per record, and read back with
+        iterSegments(). Async mode and the flight recorder wrap it as usual.
+
+        Existing loggers switch on their next record. Changing any setting
+        closes the current segment.
+
+        Args:
+            enabled: Enable (True) or disable (False) segment output. If
+                None, only the settings below are changed.
+            directory: Directory to write segments to. If None, keeps the
+                registered value (required before enabling).
+            segment_size: Bytes to preallocate per segment. If None, keeps
+                the registered value (default DEFAULT_SEGMENT_SIZE).
+            sync_interval: Seconds between syncs to disk. If None, keeps the
+                registered value (default DEFAULT_SEGMENT_SYNC_INTERVAL).
+            sync_level: Records at or above this level (name or number) sync
+                at once. If None, keeps the registered value (default
+                DEFAULT_SEGMENT_SYNC_LEVEL).
+            record_format: One of SEGMENT_RECORD_FORMATS. "binary" stores
+                message templates and arguments instead of formatted text;
+                read it back with decodeSegment() or
+                ``python -m apathetic_logging decode``. If None, keeps the
+                registered value (default DEFAULT_SEGMENT_RECORD_FORMAT).
+
+        Raises:
+            ValueError: If enabling without a directory, segment_size is not
+                larger than SEGMENT_HEADER_SIZE, sync_interval < 0, or
+                sync_level or record_format is unknown
+
+        Example:
+            >>> from apathetic_logging import registerSegmentOutput
+            >>> registerSegmentOutput(enabled=True, directory="/var/log/batch")
+        """
+        if (
+            enabled is None
+            and directory is None
+            and segment_size is None
+            and sync_interval is None
+            and sync_level is None
+            and record_format is None
+        ):
+            return
+
+        _constants = ApatheticLogging_Internal_Constants
+        _logger_core = ApatheticLogging_Internal_LoggerCore
+        _logging_utils = ApatheticLogging_Internal_LoggingUtils
+        _registry_data = ApatheticLogging_Internal_RegistryData
+        _safe_logging = ApatheticLogging_Internal_SafeLogging
+        _segment_handler = ApatheticLogging_Internal_SegmentHandler
+
+        if (
+            enabled
+            and directory is None
+            and _registry_data.registered_internal_segment_directory is None
+        ):
+            msg = "Segment output needs a directory"
+            raise ValueError(msg)
+        if segment_size is not None and segment_size <= _constants.SEGMENT_HEADER_SIZE:
+            msg = (
+                f"Segment size must be > {_constants.SEGMENT_HEADER_SIZE},"
+                f" got {segment_size}"
+            )
+            raise ValueError(msg)
+        if sync_interval is not None and sync_interval < 0:
+            msg = f"Segment sync interval must be >= 0, got {sync_interval}"
+            raise ValueError(msg)
+        if (
+            record_format is not None
+            and record_format not in _constants.SEGMENT_RECORD_FORMATS
+        ):
+            msg = (
+                f"Unknown segment record format: {record_format!r}. "
+                f"Expected one of {_constants.SEGMENT_RECORD_FORMATS}"
+            )
+            raise ValueError(msg)
+        level_no = (
+            _logging_utils.getLevelNumber(sync_level)
+            if sync_level is not None
+            else None
+        )
+
+        if enabled is not None:
+            _registry_data.registered_internal_segment_output = enabled
+        if directory is not None:
+            _registry_data.registered_internal_segment_directory = os.fspath(directory)
+        if segment_size is not None:
+            _registry_data.registered_internal_segment_size = segment_size
+        if sync_interval is not None:
+            _registry_data.registered_internal_segment_sync_interval = sync_interval
+        if level_no is not None:
+            _registry_data.registered_internal_segment_sync_level = level_no
+        if record_format is not None:
+            _registry_data.registered_internal_segment_record_format = record_format
+        # the shared handler is built from these; replace it on next use
+        _segment_handler.closeSegmentHandler()
+        _logger_core.invalidateHandlers()
+
+        _safe_logging.safeTrace(
+            "registerSegmentOutput() called",
+            f"enabled={enabled}",
+            f"directory={directory}",
+            f"segment_size={segment_size}",
+            f"sync_interval={sync_interval}",
+            f"sync_level={sync_level}",
+            f"record_format={record_format}",
+        )
+
     @staticmethod
     def getLogLevelEnvVars() -> list[str]:
         """Get the environment variable names to check for log level.
@@ -349,13 +925,6 @@ class ApatheticLogging_Internal_Registry:  # noqa: N801  # pyright: ignore[repor
             >>> print(env_vars)
             ["LOG_LEVEL"]
         """
-        from .constants import (  # noqa: PLC0415
-            ApatheticLogging_Internal_Constants,
-        )
-        from .registry_data import (  # noqa: PLC0415
-            ApatheticLogging_Internal_RegistryData,
-        )
-
         _constants = ApatheticLogging_Internal_Constants
         _registry_data = ApatheticLogging_Internal_RegistryData
 
@@ -381,13 +950,6 @@ class ApatheticLogging_Internal_Registry:  # noqa: N801  # pyright: ignore[repor
             >>> print(level)
             "detail"
         """
-        from .constants import (  # noqa: PLC0415
-            ApatheticLogging_Internal_Constants,
-        )
-        from .registry_data import (  # noqa: PLC0415
-            ApatheticLogging_Internal_RegistryData,
-        )
-
         _constants = ApatheticLogging_Internal_Constants
         _registry_data = ApatheticLogging_Internal_RegistryData
 
@@ -413,10 +975,6 @@ class ApatheticLogging_Internal_Registry:  # noqa: N801  # pyright: ignore[repor
             >>> if name is None:
             ...     print("No logger name registered")
         """
-        from .registry_data import (  # noqa: PLC0415
-            ApatheticLogging_Internal_RegistryData,
-        )
-
         _registry_data = ApatheticLogging_Internal_RegistryData
 
         return _registry_data.registered_internal_logger_name
@@ -439,13 +997,6 @@ class ApatheticLogging_Internal_Registry:  # noqa: N801  # pyright: ignore[repor
             >>> print(version)
             (3, 10)  # or None if checks are disabled
         """
-        from .constants import (  # noqa: PLC0415
-            ApatheticLogging_Internal_Constants,
-        )
-        from .registry_data import (  # noqa: PLC0415
-            ApatheticLogging_Internal_RegistryData,
-        )
-
         _constants = ApatheticLogging_Internal_Constants
         _registry_data = ApatheticLogging_Internal_RegistryData
 
@@ -471,13 +1022,6 @@ class ApatheticLogging_Internal_Registry:  # noqa: N801  # pyright: ignore[repor
             >>> print(propagate)
             False
         """
-        from .constants import (  # noqa: PLC0415
-            ApatheticLogging_Internal_Constants,
-        )
-        from .registry_data import (  # noqa: PLC0415
-            ApatheticLogging_Internal_RegistryData,
-        )
-
         _constants = ApatheticLogging_Internal_Constants
         _registry_data = ApatheticLogging_Internal_RegistryData
 
@@ -504,10 +1048,6 @@ class ApatheticLogging_Internal_Registry:  # noqa: N801  # pyright: ignore[repor
             >>> print(compat_mode)
             False
         """
-        from .registry_data import (  # noqa: PLC0415
-            ApatheticLogging_Internal_RegistryData,
-        )
-
         _registry_data = ApatheticLogging_Internal_RegistryData
 
         return (
@@ -515,3 +1055,307 @@ class ApatheticLogging_Internal_Registry:  # noqa: N801  # pyright: ignore[repor
             if _registry_data.registered_internal_compatibility_mode is not None
             else False
         )
+
+    @staticmethod
+    def getAsyncMode() -> bool:
+        """Get the async mode setting.
+
+        Returns the registered async mode setting, or False (records written
+        on the caller's thread) if not registered.
+
+        Returns:
+            Async mode setting (True or False).
+            Defaults to False if not registered.
+
+        Example:
+            >>> from apathetic_logging import getAsyncMode
+            >>> async_mode = getAsyncMode()
+            >>> print(async_mode)
+            False
+        """
+        _registry_data = ApatheticLogging_Internal_RegistryData
+
+        return (
+            _registry_data.registered_internal_async_mode
+            if _registry_data.registered_internal_async_mode is not None
+            else False
+        )
+
+    @staticmethod
+    def getAsyncQueueSize() -> int:
+        """Get the maximum number of records the async writer queue holds.
+
+        Returns:
+            Registered queue size, or DEFAULT_ASYNC_QUEUE_SIZE if not registered.
+        """
+        _constants = ApatheticLogging_Internal_Constants
+        _registry_data = ApatheticLogging_Internal_RegistryData
+
+        return (
+            _registry_data.registered_internal_async_queue_size
+            or _constants.DEFAULT_ASYNC_QUEUE_SIZE
+        )
+
+    @staticmethod
+    def getAsyncOverflow() -> str:
+        """Get the overflow policy used when the async writer queue is full.
+
+        Returns:
+            Registered overflow policy, or DEFAULT_ASYNC_OVERFLOW if not
+            registered.
+        """
+        _constants = ApatheticLogging_Internal_Constants
+        _registry_data = ApatheticLogging_Internal_RegistryData
+
+        return (
+            _registry_data.registered_internal_async_overflow
+            or _constants.DEFAULT_ASYNC_OVERFLOW
+        )
+
+    @staticmethod
+    def getBufferedOutput() -> bool:
+        """Get the buffered output setting.
+
+        Returns:
+            Buffered output setting (True or False).
+            Defaults to False if not registered.
+        """
+        _registry_data = ApatheticLogging_Internal_RegistryData
+
+        return (
+            _registry_data.registered_internal_buffered_output
+            if _registry_data.registered_internal_buffered_output is not None
+            else False
+        )
+
+    @staticmethod
+    def getBufferSize() -> int:
+        """Get the number of characters a buffered handler collects before writing.
+
+        Returns:
+            Registered buffer size, or DEFAULT_BUFFER_SIZE if not registered.
+        """
+        _constants = ApatheticLogging_Internal_Constants
+        _registry_data = ApatheticLogging_Internal_RegistryData
+
+        return (
+            _registry_data.registered_internal_buffer_size
+            or _constants.DEFAULT_BUFFER_SIZE
+        )
+
+    @staticmethod
+    def getBufferFlushInterval() -> float:
+        """Get the seconds a buffered handler holds output before writing.
+
+        Returns:
+            Registered flush interval, or DEFAULT_BUFFER_FLUSH_INTERVAL if not
+            registered.
+        """
+        _constants = ApatheticLogging_Internal_Constants
+        _registry_data = ApatheticLogging_Internal_RegistryData
+
+        interval = _registry_data.registered_internal_buffer_flush_interval
+        return (
+            interval
+            if interval is not None
+            else _constants.DEFAULT_BUFFER_FLUSH_INTERVAL
+        )
+
+    @staticmethod
+    def getFlightRecorder() -> bool:
+        """Get the flight recorder setting.
+
+        Returns:
+            Flight recorder setting (True or False).
+            Defaults to False if not registered.
+        """
+        _registry_data = ApatheticLogging_Internal_RegistryData
+
+        return bool(_registry_data.registered_internal_flight_recorder)
+
+    @staticmethod
+    def getFlightRecorderCapacity() -> int:
+        """Get the number of records each logger's flight recorder keeps.
+
+        Returns:
+            Registered capacity, or DEFAULT_FLIGHT_RECORDER_CAPACITY if not
+            registered.
+        """
+        _constants = ApatheticLogging_Internal_Constants
+        _registry_data = ApatheticLogging_Internal_RegistryData
+
+        return (
+            _registry_data.registered_internal_flight_recorder_capacity
+            or _constants.DEFAULT_FLIGHT_RECORDER_CAPACITY
+        )
+
+    @staticmethod
+    def getFlightRecorderLevel() -> int:
+        """Get the lowest level the flight recorder keeps.
+
+        Returns:
+            Registered level, or DEFAULT_FLIGHT_RECORDER_LEVEL if not registered.
+        """
+        _constants = ApatheticLogging_Internal_Constants
+        _registry_data = ApatheticLogging_Internal_RegistryData
+
+        level = _registry_data.registered_internal_flight_recorder_level
+        return level if level is not None else _constants.DEFAULT_FLIGHT_RECORDER_LEVEL
+
+    @staticmethod
+    def getOutputFormat() -> str:
+        """Get the output format for logger handlers.
+
+        Returns:
+            Registered output format, or DEFAULT_OUTPUT_FORMAT if not
+            registered.
+        """
+        _constants = ApatheticLogging_Internal_Constants
+        _registry_data = ApatheticLogging_Internal_RegistryData
+
+        return (
+            _registry_data.registered_internal_output_format
+            or _constants.DEFAULT_OUTPUT_FORMAT
+        )
+
+    @staticmethod
+    def getProcessQueue() -> Any | None:
+        """Get the queue this process sends its records to.
+
+        Returns:
+            The registered queue, or None if this process writes its own
+            records.
+        """
+        _registry_data = ApatheticLogging_Internal_RegistryData
+
+        return _registry_data.registered_internal_process_queue
+
+    @staticmethod
+    def getSampling(logger_name: str | None = None) -> dict[int, float]:
+        """Get the sampling rates that apply to a logger.
+
+        Args:
+            logger_name: Logger to resolve rates for, or None for the rates
+                registered for all loggers
+
+        Returns:
+            Level number -> fraction of records kept; levels not listed are
+            not sampled.
+        """
+        _sampling = ApatheticLogging_Internal_Sampling
+
+        return _sampling.resolveSampleRates(logger_name or "")
+
+    @staticmethod
+    def getSamplingKey() -> str:
+        """Get the log context field that makes sampling deterministic.
+
+        Returns:
+            Registered key, or DEFAULT_SAMPLING_KEY if not registered.
+        """
+        _constants = ApatheticLogging_Internal_Constants
+        _registry_data = ApatheticLogging_Internal_RegistryData
+
+        return (
+            _registry_data.registered_internal_sampling_key
+            or _constants.DEFAULT_SAMPLING_KEY
+        )
+
+    @staticmethod
+    def getMetrics() -> bool:
+        """Get the metrics setting.
+
+        Returns:
+            Metrics setting (True or False).
+            Defaults to False if not registered.
+        """
+        _registry_data = ApatheticLogging_Internal_RegistryData
+
+        return bool(_registry_data.registered_internal_metrics)
+
+    @staticmethod
+    def getSegmentOutput() -> bool:
+        """Get the segment output setting.
+
+        Returns:
+            Segment output setting (True or False).
+            Defaults to False if not registered.
+        """
+        _registry_data = ApatheticLogging_Internal_RegistryData
+
+        return bool(_registry_data.registered_internal_segment_output)
+
+    @staticmethod
+    def getSegmentDirectory() -> str | None:
+        """Get the directory segment output writes to.
+
+        Returns:
+            Registered directory, or None if not registered.
+        """
+        _registry_data = ApatheticLogging_Internal_RegistryData
+
+        return _registry_data.registered_internal_segment_directory
+
+    @staticmethod
+    def getSegmentSize() -> int:
+        """Get the number of bytes preallocated per segment file.
+
+        Returns:
+            Registered segment size, or DEFAULT_SEGMENT_SIZE if not registered.
+        """
+        _constants = ApatheticLogging_Internal_Constants
+        _registry_data = ApatheticLogging_Internal_RegistryData
+
+        return (
+            _registry_data.registered_internal_segment_size
+            or _constants.DEFAULT_SEGMENT_SIZE
+        )
+
+    @staticmethod
+    def getSegmentSyncInterval() -> float:
+        """Get the seconds between syncs of the current segment.
+
+        Returns:
+            Registered interval, or DEFAULT_SEGMENT_SYNC_INTERVAL if not
+            registered.
+        """
+        _constants = ApatheticLogging_Internal_Constants
+        _registry_data = ApatheticLogging_Internal_RegistryData
+
+        interval = _registry_data.registered_internal_segment_sync_interval
+        return (
+            interval
+            if interval is not None
+            else _constants.DEFAULT_SEGMENT_SYNC_INTERVAL
+        )
+
+    @staticmethod
+    def getSegmentSyncLevel() -> int:
+        """Get the level at or above which records sync the segment at once.
+
+        Returns:
+            Registered level, or DEFAULT_SEGMENT_SYNC_LEVEL if not registered.
+        """
+        _constants = ApatheticLogging_Internal_Constants
+        _registry_data = ApatheticLogging_Internal_RegistryData
+
+        level = _registry_data.registered_internal_segment_sync_level
+        return level if level is not None else _constants.DEFAULT_SEGMENT_SYNC_LEVEL
+
+    @staticmethod
+    def getSegmentRecordFormat() -> str:
+        """Get the record format of segments written by segment output.
+
+        Returns:
+            Registered format, or DEFAULT_SEGMENT_RECORD_FORMAT if not
+            registered.
+        """
+        _constants = ApatheticLogging_Internal_Constants
+        _registry_data = ApatheticLogging_Internal_RegistryData
+
+        record_format = _registry_data.registered_internal_segment_record_format
+        return (
+            record_format
+            if record_format is not None
+            else _constants.DEFAULT_SEGMENT_RECORD_FORMAT
+        )
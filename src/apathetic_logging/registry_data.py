@@ -3,6 +3,8 @@
 
 from __future__ import annotations
 
+from typing import Any
+
 
 class ApatheticLogging_Internal_RegistryData:  # noqa: N801  # pyright: ignore[reportUnusedClass]
     """Mixin class that provides registry storage for configurable settings.
@@ -60,3 +62,162 @@ class ApatheticLogging_Internal_RegistryData:  # noqa: N801  # pyright: ignore[r
     (e.g., getLogger(None) returns root logger).
     Set via registerCompatibilityMode() or register_compatibility_mode().
     """
+    registered_internal_async_mode: bool | None = None
+    """Async mode setting for logger handlers.
+
+    If None, defaults to False (records are written on the caller's thread).
+    When True, ensureHandlers() installs an AsyncQueueHandler front-end and a
+    single background writer thread owns the real DualStreamHandler output.
+    Set via registerAsyncMode().
+    """
+    registered_internal_async_queue_size: int | None = None
+    """Maximum number of records waiting for the async writer thread.
+
+    If None, falls back to DEFAULT_ASYNC_QUEUE_SIZE from constants.py.
+    Set via registerAsyncMode().
+    """
+    registered_internal_async_overflow: str | None = None
+    """Overflow policy used when the async writer queue is full.
+
+    One of ASYNC_OVERFLOW_POLICIES. If None, falls back to
+    DEFAULT_ASYNC_OVERFLOW from constants.py. Set via registerAsyncMode().
+    """
+
+    registered_internal_buffered_output: bool | None = None
+    """Buffered output setting for DualStreamHandler.
+
+    If None, defaults to False (write and flush every record).
+    When True, ensureHandlers() creates buffered DualStreamHandlers.
+    Set via registerBufferedOutput().
+    """
+
+    registered_internal_buffer_size: int | None = None
+    """Characters a buffered DualStreamHandler collects before writing.
+
+    If None, falls back to DEFAULT_BUFFER_SIZE from constants.py.
+    Set via registerBufferedOutput().
+    """
+
+    registered_internal_buffer_flush_interval: float | None = None
+    """Seconds a buffered DualStreamHandler holds output before writing.
+
+    If None, falls back to DEFAULT_BUFFER_FLUSH_INTERVAL from constants.py.
+    Set via registerBufferedOutput().
+    """
+
+    registered_internal_flight_recorder: bool | None = None
+    """Flight recorder setting for logger handlers.
+
+    If None, defaults to False. When True, loggers keep records below their
+    level (down to the recorder level) in a FlightRecorderHandler and write
+    them out when an ERROR or CRITICAL record is logged.
+    Set via registerFlightRecorder().
+    """
+
+    registered_internal_flight_recorder_capacity: int | None = None
+    """Records each logger's flight recorder keeps.
+
+    If None, falls back to DEFAULT_FLIGHT_RECORDER_CAPACITY from constants.py.
+    Set via registerFlightRecorder().
+    """
+
+    registered_internal_flight_recorder_level: int | None = None
+    """Lowest level the flight recorder keeps.
+
+    If None, falls back to DEFAULT_FLIGHT_RECORDER_LEVEL from constants.py.
+    Set via registerFlightRecorder().
+    """
+
+    registered_internal_flight_recorder_path: str | None = None
+    """File the flight recorder dumps to.
+
+    If None, dumps go through the logger's normal handler (TRACE and DEBUG
+    records end up on stderr). Set via registerFlightRecorder().
+    """
+
+    registered_internal_metrics: bool | None = None
+    """Metrics setting for loggers and handlers.
+
+    If None, defaults to False. When True, loggers count records per level
+    and outcome, and DualStreamHandlers time their writes; read them with
+    getLoggingStats(). Set via registerMetrics().
+    """
+
+    registered_internal_below_level_hooks: bool | None = None
+    """Whether a registered feature wants records below a logger's level.
+
+    True while the flight recorder or metrics are enabled; the level
+    methods check only this before calling Logger._logBelowLevel(). Kept
+    up to date by registerFlightRecorder() and registerMetrics().
+    """
+
+    registered_internal_output_format: str | None = None
+    """Output format for logger handlers.
+
+    One of OUTPUT_FORMATS. If None, falls back to DEFAULT_OUTPUT_FORMAT from
+    constants.py ("text": TagFormatter). "json" attaches a JsonFormatter.
+    Set via registerOutputFormat().
+    """
+
+    registered_internal_process_queue: Any | None = None
+    """Queue this (child) process sends its records to.
+
+    If None, records are written by this process. When set, ensureHandlers()
+    installs a ProcessQueueHandler that sends each record to the parent's
+    ProcessLogListener. Set via registerProcessQueue().
+    """
+
+    registered_internal_segment_output: bool | None = None
+    """Segment output setting for logger handlers.
+
+    If None, defaults to False. When True, ensureHandlers() installs the
+    shared MmapSegmentHandler (see getSegmentHandler()) in place of a
+    DualStreamHandler. Set via registerSegmentOutput().
+    """
+
+    registered_internal_segment_directory: str | None = None
+    """Directory the shared MmapSegmentHandler writes segments to.
+
+    Set via registerSegmentOutput().
+    """
+
+    registered_internal_segment_size: int | None = None
+    """Bytes preallocated per segment file.
+
+    If None, falls back to DEFAULT_SEGMENT_SIZE from constants.py.
+    Set via registerSegmentOutput().
+    """
+
+    registered_internal_segment_sync_interval: float | None = None
+    """Seconds between syncs of the current segment to disk.
+
+    If None, falls back to DEFAULT_SEGMENT_SYNC_INTERVAL from constants.py.
+    Set via registerSegmentOutput().
+    """
+
+    registered_internal_segment_sync_level: int | None = None
+    """Records at or above this level sync the current segment at once.
+
+    If None, falls back to DEFAULT_SEGMENT_SYNC_LEVEL from constants.py.
+    Set via registerSegmentOutput().
+    """
+
+    registered_internal_segment_record_format: str | None = None
+    """Record format of the shared MmapSegmentHandler's segments.
+
+    If None, falls back to DEFAULT_SEGMENT_RECORD_FORMAT from constants.py.
+    Set via registerSegmentOutput().
+    """
+
+    registered_internal_sampling: dict[str, dict[int, float]] | None = None
+    """Sampling rates: logger name ("" for all loggers) -> level -> rate.
+
+    If None, every enabled record is logged. Set via registerSampling().
+    """
+
+    registered_internal_sampling_key: str | None = None
+    """Log context field used to make sampling decisions per request.
+
+    If None, falls back to DEFAULT_SAMPLING_KEY from constants.py.
+    Set via registerSampling().
+    """
@@ -0,0 +1,102 @@
+# src/apathetic_logging/sampling.py
+"""Per-level record sampling for Apathetic Logging."""
+
+from __future__ import annotations
+
+from .constants import (
+    ApatheticLogging_Internal_Constants,
+)
+from .log_context import (
+    ApatheticLogging_Internal_LogContext,
+)
+from .registry_data import (
+    ApatheticLogging_Internal_RegistryData,
+)
+
+
+class ApatheticLogging_Internal_Sampling:  # noqa: N801  # pyright: ignore[reportUnusedClass]
+    """Mixin class that provides the sampling decision for log records.
+
+    Sampling rates are registered per level, for all loggers or for a logger
+    and its children (see registerSampling()). Loggers resolve their rates
+    once and keep them until invalidateSamplingCache() is called, so the
+    decision in Logger._log() is a dict lookup plus one random draw, made
+    before the LogRecord is created.
+
+    When mixed into apathetic_logging, it provides
+    apathetic_logging.resolveSampleRates, apathetic_logging.keepSample and
+    apathetic_logging.invalidateSamplingCache.
+    """
+
+    # bumped by invalidateSamplingCache(); loggers compare it to the epoch
+    # their cached rates were resolved at
+    _sampling_epoch: int = 0
+
+    # crc32() values are spread evenly over [0, 2**32)
+    _CRC32_RANGE: float = float(2**32)
+
+    @staticmethod
+    def invalidateSamplingCache() -> None:
+        """Make every logger re-resolve its sampling rates on its next record.
+
+        Called by registerSampling().
+        """
+        ApatheticLogging_Internal_Sampling._sampling_epoch += 1
+
+    @staticmethod
+    def resolveSampleRates(logger_name: str) -> dict[int, float]:
+        """Return the sampling rates that apply to a logger.
+
+        Rates registered for all loggers apply first; rates registered for
+        the logger's ancestors and then the logger itself override them,
+        level by level.
+
+        Args:
+            logger_name: Name of the logger
+
+        Returns:
+            Level number -> fraction of records to keep
+        """
+        registered = ApatheticLogging_Internal_RegistryData.registered_internal_sampling
+        if not registered:
+            return {}
+        resolved = dict(registered.get("", {}))
+        if logger_name:
+            parts = logger_name.split(".")
+            for i in range(1, len(parts) + 1):
+                scoped = registered.get(".".join(parts[:i]))
+                if scoped:
+                    resolved.update(scoped)
+        return resolved
+
+    @staticmethod
+    def keepSample(rate: float) -> bool:
+        """Decide whether to keep one record sampled at ``rate``.
+
+        If the current log context (see logContext()) has the sampling key
+        field, the decision comes from a hash of its value: every record for
+        that request or trace is kept or dropped together, in every process,
+        and a request kept at a low rate is also kept at any higher rate.
+        Otherwise the decision is random.
+
+        Args:
+            rate: Fraction of records to keep (0.0 to 1.0)
+
+        Returns:
+            True if the record should be logged
+        """
+        key_field = (
+            ApatheticLogging_Internal_RegistryData.registered_internal_sampling_key
+            or ApatheticLogging_Internal_Constants.DEFAULT_SAMPLING_KEY
+        )
+        context = ApatheticLogging_Internal_LogContext._log_context.get()  # noqa: SLF001
+        key = context.get(key_field) if context else None
+        # deferred: random and zlib are only needed once a sampled level is logged
+        if key is None:
+            import random  # noqa: PLC0415
+
+            return random.random() < rate  # noqa: S311
+        import zlib  # noqa: PLC0415
+
+        _range = ApatheticLogging_Internal_Sampling._CRC32_RANGE
+        return zlib.crc32(str(key).encode()) < rate * _range
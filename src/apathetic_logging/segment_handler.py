@@ -0,0 +1,610 @@
+# src/apathetic_logging/segment_handler.py
+"""MmapSegmentHandler class and segment reader for Apathetic Logging.
+
+Docstrings are adapted from the standard library logging.Handler documentation
+licensed under the Python Software Foundation License Version 2.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import suppress
+from typing import TYPE_CHECKING, Any, BinaryIO, ClassVar, cast
+
+from .binary_format import (
+    ApatheticLogging_Internal_BinaryFormat,
+)
+from .caller_info import (
+    ApatheticLogging_Internal_CallerInfo,
+)
+from .constants import (
+    ApatheticLogging_Internal_Constants,
+)
+from .metrics import (
+    ApatheticLogging_Internal_Metrics,
+)
+from .registry_data import (
+    ApatheticLogging_Internal_RegistryData,
+)
+from .tag_formatter import (
+    ApatheticLogging_Internal_TagFormatter,
+)
+
+
+if TYPE_CHECKING:
+    import mmap
+
+
+class ApatheticLogging_Internal_SegmentHandler:  # noqa: N801  # pyright: ignore[reportUnusedClass]
+    """Mixin class that provides the MmapSegmentHandler nested class.
+
+    This class contains the MmapSegmentHandler implementation as a nested
+    class, the process-wide handler ensureHandlers() installs when segment
+    output is registered (see registerSegmentOutput()), and the functions
+    that read segments back. When mixed into apathetic_logging, it provides
+    apathetic_logging.MmapSegmentHandler, apathetic_logging.getSegmentHandler,
+    apathetic_logging.closeSegmentHandler, apathetic_logging.readSegmentHeader,
+    apathetic_logging.listSegments, apathetic_logging.iterSegmentRecords,
+    apathetic_logging.iterSegments and apathetic_logging.decodeSegment.
+
+    A segment file is a SEGMENT_HEADER_SIZE header (see
+    SEGMENT_HEADER_FORMAT) followed by records, each a little-endian 4-byte
+    length and that many bytes of formatted record. The header's index
+    (end offset, record count, last record time) is rewritten after every
+    record, so readers know where the records end without scanning. In
+    binary segments (SEGMENT_FLAG_BINARY) each record is the output of a
+    BinaryRecordEncoder instead.
+    """
+
+    # shared handler built from the registry by getSegmentHandler()
+    _segment_handler: (
+        ApatheticLogging_Internal_SegmentHandler.MmapSegmentHandler | None
+    ) = None
+    # held while _segment_handler is created or cleared, so loggers writing
+    # their first records at once share one handler
+    _segment_handler_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    class MmapSegmentHandler(
+        ApatheticLogging_Internal_CallerInfo._WatchedHandler,  # noqa: SLF001
+        logging.Handler,
+    ):
+        """Append records to preallocated memory-mapped segment files.
+
+        Each record is formatted, encoded, and copied into the current
+        segment's mapping: no write() call per record. When a record doesn't
+        fit, the segment is closed (truncated to the bytes used) and a new
+        ``segment_size`` file is created and mapped, named by
+        SEGMENT_FILE_FORMAT so several processes can share a directory.
+
+        The operating system writes mapped pages back on its own schedule.
+        The handler also syncs them (msync) ``sync_interval`` seconds after
+        the last sync, immediately for records at or above ``sync_level``,
+        and on flush()/close(), so at most that window is lost if the
+        machine goes down.
+
+        With ``record_format="binary"`` records are not formatted here:
+        a BinaryRecordEncoder stores their templates and arguments, and
+        decodeSegment() (or ``python -m apathetic_logging decode``) renders
+        them later. The formatter is then unused.
+        """
+
+        def __init__(
+            self,
+            directory: str | os.PathLike[str],
+            *args: Any,
+            segment_size: int | None = None,
+            sync_interval: float | None = None,
+            sync_level: int | None = None,
+            record_format: str | None = None,
+            encoding: str = "utf-8",
+            **kwargs: Any,
+        ) -> None:
+            """Initialize the handler. No segment is created until it's written to.
+
+            Args:
+                directory: Directory the segment files are created in
+                    (created if missing)
+                *args: Additional positional arguments (for future-proofing)
+                segment_size: Bytes to preallocate per segment (must be
+                    larger than SEGMENT_HEADER_SIZE), or None for
+                    DEFAULT_SEGMENT_SIZE
+                sync_interval: Seconds between syncs (0 syncs every record),
+                    or None for DEFAULT_SEGMENT_SYNC_INTERVAL
+                sync_level: Records at or above this level sync at once, or
+                    None for DEFAULT_SEGMENT_SYNC_LEVEL
+                record_format: One of SEGMENT_RECORD_FORMATS, or None for
+                    DEFAULT_SEGMENT_RECORD_FORMAT
+                encoding: Encoding of the formatted records
+                **kwargs: Additional keyword arguments (for future-proofing)
+
+            Raises:
+                ValueError: If segment_size is too small, sync_interval < 0,
+                    or record_format is unknown
+            """
+            super().__init__(*args, **kwargs)
+            _constants = ApatheticLogging_Internal_Constants
+            if segment_size is None:
+                segment_size = _constants.DEFAULT_SEGMENT_SIZE
+            if sync_interval is None:
+                sync_interval = _constants.DEFAULT_SEGMENT_SYNC_INTERVAL
+            if segment_size <= _constants.SEGMENT_HEADER_SIZE:
+                msg = (
+                    f"Segment size must be > {_constants.SEGMENT_HEADER_SIZE},"
+                    f" got {segment_size}"
+                )
+                raise ValueError(msg)
+            if sync_interval < 0:
+                msg = f"Segment sync interval must be >= 0, got {sync_interval}"
+                raise ValueError(msg)
+            if record_format is None:
+                record_format = _constants.DEFAULT_SEGMENT_RECORD_FORMAT
+            if record_format not in _constants.SEGMENT_RECORD_FORMATS:
+                msg = (
+                    f"Unknown segment record format: {record_format!r}. "
+                    f"Expected one of {_constants.SEGMENT_RECORD_FORMATS}"
+                )
+                raise ValueError(msg)
+
+            self.directory = os.path.abspath(os.fspath(directory))  # noqa: PTH100
+            self.segment_size = segment_size
+            self.sync_interval = sync_interval
+            self.sync_level = (
+                sync_level
+                if sync_level is not None
+                else _constants.DEFAULT_SEGMENT_SYNC_LEVEL
+            )
+            self.record_format = record_format
+            self.encoding = encoding
+            # templates are interned per segment: reset by _openSegment()
+            self._encoder = (
+                ApatheticLogging_Internal_BinaryFormat.BinaryRecordEncoder()
+                if record_format == "binary"
+                else None
+            )
+            self._flags = _constants.SEGMENT_FLAG_BINARY if self._encoder else 0
+
+            # deferred: mmap and struct are only needed once a handler is created
+            import mmap  # noqa: PLC0415
+            import struct  # noqa: PLC0415
+
+            self._mmap_module = mmap
+            self._header = struct.Struct(_constants.SEGMENT_HEADER_FORMAT)
+            self._index = struct.Struct(_constants.SEGMENT_INDEX_FORMAT)
+            self._prefix = struct.Struct(_constants.SEGMENT_RECORD_PREFIX_FORMAT)
+
+            # the current segment; _mmap is None until the first record
+            self.path: str | None = None
+            self._file: BinaryIO | None = None
+            self._mmap: mmap.mmap | None = None
+            self._capacity: int = 0
+            self._created: float = 0.0
+            self._end: int = 0
+            self._count: int = 0
+            self._last_time: float = 0.0
+            # everything before _synced has been synced to disk
+            self._synced: int = 0
+            self._last_sync: float = 0.0
+            self._seq: int = 0
+
+        def emit(self, record: logging.LogRecord) -> None:
+            """Append the formatted record to the current segment.
+
+            logging.Handler.emit() implementation:
+            https://docs.python.org/3.10/library/logging.html#logging.Handler.emit
+            """
+            # handler write time, only measured with metrics registered
+            started = (
+                time.perf_counter()
+                if ApatheticLogging_Internal_RegistryData.registered_internal_metrics
+                else 0.0
+            )
+            try:
+                encoder = self._encoder
+                data: bytes | bytearray
+                if encoder is None:
+                    data = self.format(record).encode(self.encoding, "backslashreplace")
+                else:
+                    data = encoder.encode(record)
+                    while (
+                        self._mmap is None
+                        or self._end + self._prefix.size + len(data) > self._capacity
+                    ):
+                        # the record's templates must be in its own segment
+                        self._openSegment(self._prefix.size + len(data))
+                        data = encoder.encode(record)
+                self._append(data, record.created)
+                if (
+                    record.levelno >= self.sync_level
+                    or time.monotonic() - self._last_sync >= self.sync_interval
+                ):
+                    self.sync()
+            except RecursionError:  # See issue 36272
+                raise
+            except Exception:  # noqa: BLE001
+                self.handleError(record)
+
+            if started:
+                ApatheticLogging_Internal_Metrics.observeHandlerTime(
+                    self.name or type(self).__name__, time.perf_counter() - started
+                )
+
+        def format(self, record: logging.LogRecord) -> str:
+            """Format a record for a text segment, never with ANSI colors.
+
+            logging.Handler.format() implementation:
+            https://docs.python.org/3.10/library/logging.html#logging.Handler.format
+            """
+            formatter = self.formatter
+            if isinstance(
+                formatter, ApatheticLogging_Internal_TagFormatter.TagFormatter
+            ):
+                return formatter.format(record, enable_color=False)
+            return super().format(record)
+
+        def _append(self, data: bytes | bytearray, created: float) -> None:
+            # called from emit() with the handler lock held
+            size = self._prefix.size + len(data)
+            mm = self._mmap
+            if mm is None or self._end + size > self._capacity:
+                mm = self._openSegment(size)
+            end = self._end
+            self._prefix.pack_into(mm, end, len(data))
+            mm[end + self._prefix.size : end + size] = data
+            self._end = end + size
+            self._count += 1
+            self._last_time = created
+            self._index.pack_into(
+                mm,
+                ApatheticLogging_Internal_Constants.SEGMENT_INDEX_OFFSET,
+                self._end,
+                self._count,
+                created,
+            )
+
+        def _openSegment(self, min_size: int) -> mmap.mmap:
+            _constants = ApatheticLogging_Internal_Constants
+            self._closeSegment()
+            os.makedirs(self.directory, exist_ok=True)  # noqa: PTH103
+            capacity = max(self.segment_size, _constants.SEGMENT_HEADER_SIZE + min_size)
+            pid = os.getpid()
+            while True:
+                self._seq += 1
+                name = _constants.SEGMENT_FILE_FORMAT.format(pid=pid, seq=self._seq)
+                path = os.path.join(self.directory, name)  # noqa: PTH118
+                try:
+                    # "x": never reuse a segment left by an earlier run
+                    file = cast("BinaryIO", open(path, "x+b"))  # noqa: PTH123, SIM115
+                except FileExistsError:
+                    continue
+                break
+
+            file.truncate(capacity)
+            if hasattr(os, "posix_fallocate"):
+                # reserve the blocks now so a full disk fails here, not in
+                # the middle of a record (as SIGBUS)
+                with suppress(OSError):
+                    os.posix_fallocate(file.fileno(), 0, capacity)
+            _mmap = self._mmap_module
+            mm = cast("mmap.mmap", _mmap.mmap(file.fileno(), capacity))
+            created = time.time()
+            self._header.pack_into(
+                mm,
+                0,
+                _constants.SEGMENT_MAGIC,
+                _constants.SEGMENT_VERSION,
+                _constants.SEGMENT_HEADER_SIZE,
+                self._flags,
+                capacity,
+                created,
+                _constants.SEGMENT_HEADER_SIZE,
+                0,
+                created,
+            )
+            if self._encoder is not None:
+                self._encoder.reset(created)
+            self.path = path
+            self._created = created
+            self._file = file
+            self._mmap = mm
+            self._capacity = capacity
+            self._end = _constants.SEGMENT_HEADER_SIZE
+            self._count = 0
+            self._synced = 0
+            return mm
+
+        def _closeSegment(self) -> None:
+            mm = self._mmap
+            file = self._file
+            if mm is None or file is None:
+                return
+            # record the final size, sync, and give back the unused tail
+            _constants = ApatheticLogging_Internal_Constants
+            self._header.pack_into(
+                mm,
+                0,
+                _constants.SEGMENT_MAGIC,
+                _constants.SEGMENT_VERSION,
+                _constants.SEGMENT_HEADER_SIZE,
+                self._flags,
+                self._end,
+                self._created,
+                self._end,
+                self._count,
+                self._last_time,
+            )
+            mm.flush()
+            mm.close()
+            file.truncate(self._end)
+            file.close()
+            self._mmap = None
+            self._file = None
+            self._capacity = 0
+            self._last_sync = time.monotonic()
+
+        def sync(self) -> None:
+            """Write the current segment's new records to disk now.
+
+            Only the pages written since the last sync (and the header) are
+            synced.
+            """
+            self.acquire()
+            try:
+                mm = self._mmap
+                if mm is None:
+                    return
+                granularity = self._mmap_module.ALLOCATIONGRANULARITY
+                start = self._synced - self._synced % granularity
+                if start:
+                    mm.flush(0, ApatheticLogging_Internal_Constants.SEGMENT_HEADER_SIZE)
+                mm.flush(start, self._end - start)
+                self._synced = self._end
+                self._last_sync = time.monotonic()
+            finally:
+                self.release()
+
+        def detachSegment(self) -> None:
+            """Forget the current segment without writing to it again.
+
+            Used in a forked child, whose mapping is shared with the parent
+            still writing that segment; the child's next record starts a
+            segment of its own.
+            """
+            mm = self._mmap
+            file = self._file
+            self._mmap = None
+            self._file = None
+            self._capacity = 0
+            self._seq = 0
+            if mm is not None:
+                mm.close()
+            if file is not None:
+                file.close()
+
+        def flush(self) -> None:
+            """Sync the current segment to disk.
+
+            logging.Handler.flush() implementation:
+            https://docs.python.org/3.10/library/logging.html#logging.Handler.flush
+            """
+            self.sync()
+
+        def close(self) -> None:
+            """Sync and close the current segment, then close the handler.
+
+            logging.Handler.close() implementation:
+            https://docs.python.org/3.10/library/logging.html#logging.Handler.close
+            """
+            self.acquire()
+            try:
+                try:
+                    self._closeSegment()
+                finally:
+                    super().close()
+            finally:
+                self.release()
+
+    @staticmethod
+    def getSegmentHandler() -> (
+        ApatheticLogging_Internal_SegmentHandler.MmapSegmentHandler
+    ):
+        """Return the process-wide MmapSegmentHandler, creating it if necessary.
+
+        Every logger's handler chain writes to this one handler, so records
+        from all loggers share segments. It's configured from the registry
+        (see registerSegmentOutput()) the first time it's needed.
+
+        Returns:
+            The shared MmapSegmentHandler
+
+        Raises:
+            ValueError: If no segment directory is registered
+        """
+        _registry_data = ApatheticLogging_Internal_RegistryData
+        handler = ApatheticLogging_Internal_SegmentHandler._segment_handler
+        if handler is not None:
+            return handler
+        with ApatheticLogging_Internal_SegmentHandler._segment_handler_lock:
+            # another thread may have created it while we waited
+            handler = ApatheticLogging_Internal_SegmentHandler._segment_handler
+            if handler is None:
+                directory = _registry_data.registered_internal_segment_directory
+                if directory is None:
+                    msg = "No segment directory registered; see registerSegmentOutput()"
+                    raise ValueError(msg)
+                handler = ApatheticLogging_Internal_SegmentHandler.MmapSegmentHandler(
+                    directory,
+                    segment_size=_registry_data.registered_internal_segment_size,
+                    sync_interval=_registry_data.registered_internal_segment_sync_interval,
+                    sync_level=_registry_data.registered_internal_segment_sync_level,
+                    record_format=_registry_data.registered_internal_segment_record_format,
+                )
+                ApatheticLogging_Internal_SegmentHandler._segment_handler = handler
+        return handler
+
+    @staticmethod
+    def closeSegmentHandler() -> None:
+        """Close the shared MmapSegmentHandler's current segment.
+
+        The next record creates a fresh handler from the current registry
+        settings.
+        """
+        with ApatheticLogging_Internal_SegmentHandler._segment_handler_lock:
+            handler = ApatheticLogging_Internal_SegmentHandler._segment_handler
+            ApatheticLogging_Internal_SegmentHandler._segment_handler = None
+        if handler is not None:
+            handler.close()
+
+    @staticmethod
+    def readSegmentHeader(path: str | os.PathLike[str]) -> dict[str, Any]:
+        """Return the header of a segment file.
+
+        Args:
+            path: Segment file
+
+        Returns:
+            ``{"version", "record_format", "capacity", "created", "end",
+            "count", "last_time"}``; ``end`` is the offset just past the
+            last record
+
+        Raises:
+            ValueError: If the file isn't a segment
+        """
+        _constants = ApatheticLogging_Internal_Constants
+        # deferred: struct is only needed to read segments
+        import struct  # noqa: PLC0415
+
+        header = struct.Struct(_constants.SEGMENT_HEADER_FORMAT)
+        with open(path, "rb") as f:  # noqa: PTH123
+            data = f.read(header.size)
+        if len(data) < header.size or not data.startswith(_constants.SEGMENT_MAGIC):
+            msg = f"Not a log segment: {os.fspath(path)}"
+            raise ValueError(msg)
+        _, version, _, flags, capacity, created, end, count, last_time = header.unpack(
+            data
+        )
+        return {
+            "version": version,
+            "record_format": (
+                "binary" if flags & _constants.SEGMENT_FLAG_BINARY else "text"
+            ),
+            "capacity": capacity,
+            "created": created,
+            "end": end,
+            "count": count,
+            "last_time": last_time,
+        }
+
+    @staticmethod
+    def iterSegmentRecords(path: str | os.PathLike[str]) -> Iterator[memoryview]:
+        """Yield the records of a segment file without copying them.
+
+        The file is mapped read-only and each record is a memoryview into
+        the mapping (``bytes(view)`` or ``str(view, "utf-8")`` to copy it).
+        Works on a segment another process is still writing: records up to
+        its last index update are yielded.
+
+        Args:
+            path: Segment file
+
+        Yields:
+            The bytes of each record, oldest first
+
+        Raises:
+            ValueError: If the file isn't a segment
+        """
+        _constants = ApatheticLogging_Internal_Constants
+        # deferred: mmap and struct are only needed to read segments
+        import mmap  # noqa: PLC0415
+        import struct  # noqa: PLC0415
+
+        prefix = struct.Struct(_constants.SEGMENT_RECORD_PREFIX_FORMAT)
+        end = ApatheticLogging_Internal_SegmentHandler.readSegmentHeader(path)["end"]
+
+        with open(path, "rb") as f:  # noqa: PTH123
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(mm)
+        try:
+            end = min(end, len(view))
+            offset = _constants.SEGMENT_HEADER_SIZE
+            while offset + prefix.size <= end:
+                (length,) = prefix.unpack_from(view, offset)
+                start = offset + prefix.size
+                if not length or start + length > end:
+                    break
+                yield view[start : start + length]
+                offset = start + length
+        finally:
+            view.release()
+            # BufferError: the caller kept a record view; the mapping goes
+            # when the last one does
+            with suppress(BufferError):
+                mm.close()
+
+    @staticmethod
+    def listSegments(directory: str | os.PathLike[str]) -> list[str]:
+        """Return the segment files in a directory, in the order they were created.
+
+        Args:
+            directory: Directory holding the segment files
+
+        Returns:
+            Paths of the segments; other files are skipped
+        """
+        _segment_handler = ApatheticLogging_Internal_SegmentHandler
+        segments: list[tuple[float, str]] = []
+        for entry in os.scandir(directory):
+            if not entry.is_file():
+                continue
+            try:
+                header = _segment_handler.readSegmentHeader(entry.path)
+            except ValueError:
+                # not a segment (or one just created, header not yet written)
+                continue
+            segments.append((header["created"], entry.path))
+        return [path for _, path in sorted(segments)]
+
+    @staticmethod
+    def iterSegments(directory: str | os.PathLike[str]) -> Iterator[memoryview]:
+        """Yield the records of every segment in a directory, segment by segment.
+
+        Segments are read in the order they were created (see
+        iterSegmentRecords()). With several processes writing to the
+        directory, their records are not interleaved by time.
+
+        Args:
+            directory: Directory holding the segment files
+
+        Yields:
+            The bytes of each record
+        """
+        _segment_handler = ApatheticLogging_Internal_SegmentHandler
+        for path in _segment_handler.listSegments(directory):
+            yield from _segment_handler.iterSegmentRecords(path)
+
+    @staticmethod
+    def decodeSegment(path: str | os.PathLike[str]) -> Iterator[logging.LogRecord]:
+        """Yield the records of a binary segment as LogRecords.
+
+        See decodeBinaryRecords() for what the rebuilt records carry.
+
+        Args:
+            path: Segment file written with ``record_format="binary"``
+
+        Yields:
+            A LogRecord for each record, oldest first
+
+        Raises:
+            ValueError: If the file isn't a binary segment, or is malformed
+        """
+        _segment_handler = ApatheticLogging_Internal_SegmentHandler
+        header = _segment_handler.readSegmentHeader(path)
+        if header["record_format"] != "binary":
+            msg = f"Not a binary log segment: {os.fspath(path)}"
+            raise ValueError(msg)
+        yield from ApatheticLogging_Internal_BinaryFormat.decodeBinaryRecords(
+            _segment_handler.iterSegmentRecords(path), header["created"]
+        )
@@ -0,0 +1,362 @@
+# src/apathetic_logging/slot_record.py
+"""Slotted LogRecord factory for Apathetic Logging."""
+
+from __future__ import annotations
+
+import logging
+import os
+import sys
+import threading
+import time
+from collections.abc import Iterator, Mapping, MutableMapping
+from contextlib import suppress
+from typing import Any
+
+
+class ApatheticLogging_Internal_SlotRecord:  # noqa: N801  # pyright: ignore[reportUnusedClass]
+    """Mixin class that provides the slotted LogRecord factory.
+
+    This class contains the SlotLogRecord implementation as a nested class.
+    When mixed into apathetic_logging, it provides
+    apathetic_logging.SlotLogRecord.
+    """
+
+    # LogRecord.__dict__'s descriptor: the real instance dict, where
+    # attributes that aren't slots (``extra=`` values) are kept
+    _instance_dict: Any = logging.LogRecord.__dict__["__dict__"]
+
+    # relativeCreated is measured from when logging was imported
+    _probe = logging.LogRecord("", 0, "", 0, "", (), None)
+    _START_TIME: float = _probe.created - _probe.relativeCreated / 1000
+    del _probe
+
+    class SlotLogRecord(logging.LogRecord):
+        """LogRecord that keeps its attributes in slots.
+
+        logging.LogRecord fills a per-instance ``__dict__`` and computes
+        every attribute as it is created: the file name and module (string
+        splitting on the path), the process id and name, and the thread
+        name. This record stores its attributes in ``__slots__`` and
+        computes ``filename``, ``module``, ``process``, ``processName`` and
+        ``threadName`` the first time they are read, which for a
+        ``%(message)s`` TagFormatter is never. ``thread`` (the ident) and
+        ``taskName`` are captured when the record is made, since they can't
+        be recovered afterwards.
+
+        Install it as the record factory::
+
+            apathetic_logging.setLogRecordFactory(apathetic_logging.SlotLogRecord)
+
+        ``record.__dict__`` is a mapping over the slots and any ``extra=``
+        values, so formatters, ``extra=`` and makeLogRecord() work as with
+        a plain LogRecord; writes to it set attributes. Formatters that
+        take every field at once (``{``-style and ``$``-style) compute the
+        lazy fields each time they format.
+
+        ``threadName`` read from another thread (an async writer) is looked
+        up by ident, and is None once the logging thread has exited.
+        """
+
+        __slots__ = (
+            "_filename",
+            "_module",
+            "_process",
+            "_processName",
+            "_threadName",
+            "args",
+            "asctime",
+            "created",
+            "enable_color",
+            "exc_info",
+            "exc_text",
+            "funcName",
+            "levelname",
+            "levelno",
+            "lineno",
+            "log_context",
+            "message",
+            "msecs",
+            "msg",
+            "name",
+            "pathname",
+            "relativeCreated",
+            "stack_info",
+            "taskName",
+            "test_mode",
+            "thread",
+        )
+
+        _filename: str
+        _module: str
+        _process: int | None
+        _processName: str | None
+        _threadName: str | None
+
+        def __init__(
+            self,
+            name: str,
+            level: int,
+            pathname: str,
+            lineno: int,
+            msg: object,
+            args: Any,
+            exc_info: Any,
+            func: str | None = None,
+            sinfo: str | None = None,
+            **kwargs: Any,  # noqa: ARG002
+        ) -> None:
+            """Initialize a logging record, leaving the lazy fields unset.
+
+            Wrapper for logging.LogRecord.__init__.
+
+            https://docs.python.org/3.10/library/logging.html#logging.LogRecord
+            """
+            # LogRecord.__init__ isn't called: it would fill every field
+            ct = time.time_ns()
+            self.name = name
+            self.msg = msg
+            if args and len(args) == 1 and isinstance(args[0], Mapping) and args[0]:
+                args = args[0]
+            self.args = args
+            self.levelname = logging.getLevelName(level)
+            self.levelno = level
+            self.pathname = pathname
+            self.lineno = lineno
+            self.funcName = func  # type: ignore[assignment]
+            self.exc_info = exc_info
+            self.exc_text = None
+            self.stack_info = sinfo
+            self.created = ct / 1e9
+            self.msecs = (ct % 1_000_000_000) // 1_000_000 + 0.0
+            self.relativeCreated = (
+                self.created - ApatheticLogging_Internal_SlotRecord._START_TIME
+            ) * 1000
+            self.thread = threading.get_ident() if logging.logThreads else None
+            self.taskName = None
+            # logAsyncioTasks is new in Python 3.12
+            if getattr(logging, "logAsyncioTasks", False):
+                asyncio = sys.modules.get("asyncio")
+                if asyncio is not None:
+                    with suppress(Exception):
+                        self.taskName = asyncio.current_task().get_name()
+
+        @property
+        def __dict__(self) -> MutableMapping[str, Any]:  # type: ignore[override]
+            """Mapping over the record's slots and ``extra=`` values."""
+            return ApatheticLogging_Internal_SlotRecord._SlotRecordDict(self)
+
+        def __getstate__(self) -> tuple[dict[str, Any], dict[str, Any]]:
+            # copy.copy() and pickle hand the record to another thread or
+            # process, so read the fields that depend on where it was made;
+            # filename and module can still be computed later
+            _ = self.process, self.processName, self.threadName
+            slots = {
+                key: getattr(self, key)
+                for key in ApatheticLogging_Internal_SlotRecord.SlotLogRecord.__slots__
+                if hasattr(self, key)
+            }
+            extras = ApatheticLogging_Internal_SlotRecord._instance_dict.__get__(self)
+            return slots, dict(extras)
+
+        def __setstate__(self, state: tuple[dict[str, Any], dict[str, Any]]) -> None:
+            slots, extras = state
+            for key, value in slots.items():
+                setattr(self, key, value)
+            ApatheticLogging_Internal_SlotRecord._instance_dict.__get__(self).update(
+                extras
+            )
+
+        @property
+        def filename(self) -> str:
+            """File name portion of pathname, computed when first read."""
+            try:
+                return self._filename
+            except AttributeError:
+                pass
+            try:
+                self._filename = os.path.basename(self.pathname)  # noqa: PTH119
+            except (TypeError, ValueError, AttributeError):
+                self._filename = self.pathname
+            return self._filename
+
+        @filename.setter
+        def filename(self, value: str) -> None:
+            self._filename = value
+
+        @property
+        def module(self) -> str:
+            """Module (file name without extension), computed when first read."""
+            try:
+                return self._module
+            except AttributeError:
+                pass
+            try:
+                self._module = os.path.splitext(self.filename)[0]  # noqa: PTH122
+            except (TypeError, ValueError, AttributeError):
+                self._module = "Unknown module"
+            return self._module
+
+        @module.setter
+        def module(self, value: str) -> None:
+            self._module = value
+
+        @property
+        def process(self) -> int | None:
+            """Process id, read when first needed."""
+            try:
+                return self._process
+            except AttributeError:
+                pass
+            self._process = os.getpid() if logging.logProcesses else None
+            return self._process
+
+        @process.setter
+        def process(self, value: int | None) -> None:
+            self._process = value
+
+        @property
+        def processName(self) -> str | None:
+            """Process name, read when first needed."""
+            try:
+                return self._processName
+            except AttributeError:
+                pass
+            process_name = None
+            if logging.logMultiprocessing:
+                process_name = "MainProcess"
+                mp = sys.modules.get("multiprocessing")
+                if mp is not None:
+                    with suppress(Exception):
+                        process_name = mp.current_process().name
+            self._processName = process_name
+            return process_name
+
+        @processName.setter
+        def processName(self, value: str | None) -> None:
+            self._processName = value
+
+        @property
+        def threadName(self) -> str | None:
+            """Name of the thread that made the record, looked up by ident."""
+            try:
+                return self._threadName
+            except AttributeError:
+                pass
+            ident = self.thread
+            thread_name = None
+            if ident is None:
+                pass
+            elif ident == threading.get_ident():
+                thread_name = threading.current_thread().name
+            else:
+                for thread in threading.enumerate():
+                    if thread.ident == ident:
+                        thread_name = thread.name
+                        break
+            self._threadName = thread_name
+            return thread_name
+
+        @threadName.setter
+        def threadName(self, value: str | None) -> None:
+            self._threadName = value
+
+    class _SlotRecordDict(MutableMapping[str, Any]):
+        """``SlotLogRecord.__dict__``: its slots, then its ``extra=`` values.
+
+        Lazy fields are computed when read, so they are always present.
+        """
+
+        __slots__ = ("_extras", "_record")
+
+        # fields that are present once set
+        _SLOT_FIELDS: tuple[str, ...] = (
+            "name",
+            "msg",
+            "args",
+            "levelname",
+            "levelno",
+            "pathname",
+            "exc_info",
+            "exc_text",
+            "stack_info",
+            "lineno",
+            "funcName",
+            "created",
+            "msecs",
+            "relativeCreated",
+            "thread",
+            "taskName",
+            "message",
+            "asctime",
+            "enable_color",
+            "log_context",
+            "test_mode",
+        )
+
+        # fields computed when first read
+        _LAZY_FIELDS: tuple[str, ...] = (
+            "filename",
+            "module",
+            "threadName",
+            "processName",
+            "process",
+        )
+
+        _FIELDS: frozenset[str] = frozenset(_SLOT_FIELDS + _LAZY_FIELDS)
+
+        def __init__(
+            self, record: ApatheticLogging_Internal_SlotRecord.SlotLogRecord
+        ) -> None:
+            self._record = record
+            self._extras: dict[str, Any] = (
+                ApatheticLogging_Internal_SlotRecord._instance_dict.__get__(record)
+            )
+
+        def __getitem__(self, key: str) -> Any:
+            if key in self._FIELDS:
+                try:
+                    return getattr(self._record, key)
+                except AttributeError:
+                    raise KeyError(key) from None
+            return self._extras[key]
+
+        def __setitem__(self, key: str, value: Any) -> None:
+            # attributes that aren't slots land in the instance dict
+            setattr(self._record, key, value)
+
+        def __delitem__(self, key: str) -> None:
+            if key not in self._FIELDS:
+                del self._extras[key]
+                return
+            try:
+                delattr(self._record, key)
+            except AttributeError:
+                raise KeyError(key) from None
+
+        def __contains__(self, key: object) -> bool:
+            if key in self._LAZY_FIELDS:
+                return True
+            if key in self._FIELDS:
+                return hasattr(self._record, key)
+            return key in self._extras
+
+        def __iter__(self) -> Iterator[str]:
+            record = self._record
+            for key in self._SLOT_FIELDS:
+                if hasattr(record, key):
+                    yield key
+            yield from self._LAZY_FIELDS
+            yield from self._extras
+
+        def __len__(self) -> int:
+            return sum(1 for _ in self)
+
+        def __or__(self, other: Mapping[str, Any]) -> dict[str, Any]:
+            return {**self, **other}
+
+        def __ror__(self, other: Mapping[str, Any]) -> dict[str, Any]:
+            # PercentStyle merges a formatter's defaults with ``defaults | d``
+            return {**other, **self}
+
+        def __repr__(self) -> str:
+            return repr(dict(self))
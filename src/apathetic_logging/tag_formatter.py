@@ -8,6 +8,7 @@ licensed under the Python Software Foundation License Version 2.
 from __future__ import annotations
 
 import logging
+from collections.abc import Mapping
 from typing import Any
 
 from .constants import (
@@ -28,8 +29,19 @@ class ApatheticLogging_Internal_TagFormatter:  # noqa: N801  # pyright: ignore[r
         Adds colored or plain text tags (e.g., [DEBUG], [ERROR]) based on
         log level. Color support is controlled by the enable_color attribute
         on the LogRecord.
+
+        Prefixes are built once per level name from TAG_STYLES and cached;
+        call invalidatePrefixCache() after changing TAG_STYLES.
+
+        Fields bound with logContext()/bind() are appended to the message as
+        ``[key=value ...]``. The rendered text is reused while records keep
+        sharing the same context mapping.
         """
 
+        # bumped by invalidatePrefixCache(); always read and written on the
+        # base class so subclasses share it
+        _styles_epoch: int = 0
+
         def __init__(self, *args: Any, **kwargs: Any) -> None:
             """Initialize the TagFormatter.
 
@@ -37,10 +49,92 @@ class ApatheticLogging_Internal_TagFormatter:  # noqa: N801  # pyright: ignore[r
             """
             super().__init__(*args, **kwargs)
 
+            # levelname -> (plain prefix, colored prefix), "" when untagged
+            self._prefixes: dict[str, tuple[str, str]] = {}
+            self._prefix_epoch: int = -1
+            self._buildPrefixes()
+
+            # last rendered log_context mapping and its text, as one tuple so
+            # threads sharing this formatter never see a mismatched pair
+            # (holding the mapping keeps its id from being reused)
+            self._context_cache: tuple[Mapping[str, Any] | None, str] = (None, "")
+
+        @staticmethod
+        def invalidatePrefixCache() -> None:
+            """Rebuild every formatter's cached prefixes on its next record.
+
+            Call this after adding, removing, or replacing TAG_STYLES entries.
+            """
+            _formatter = ApatheticLogging_Internal_TagFormatter.TagFormatter
+            _formatter._styles_epoch += 1  # noqa: SLF001
+
+        @staticmethod
+        def buildPrefix(level_name: str) -> tuple[str, str]:
+            """Return the (plain, colored) prefix for a level name.
+
+            Each prefix includes its trailing space; both are empty strings
+            for levels without a tag.
+
+            Args:
+                level_name: Level name as found on LogRecord.levelname
+
+            Returns:
+                Tuple of (plain prefix, colored prefix)
+            """
+            _constants = ApatheticLogging_Internal_Constants
+            tag_color, tag_text = _constants.TAG_STYLES.get(level_name, ("", ""))
+            if not tag_text:
+                return ("", "")
+            plain = f"{tag_text} "
+            if not tag_color:
+                return (plain, plain)
+            return (plain, f"{tag_color}{tag_text}{_constants.ANSIColors.RESET} ")
+
+        def _buildPrefixes(self) -> None:
+            """Rebuild the prefix cache from TAG_STYLES."""
+            _constants = ApatheticLogging_Internal_Constants
+            _formatter = ApatheticLogging_Internal_TagFormatter.TagFormatter
+            self._prefixes = {
+                level_name: self.buildPrefix(level_name)
+                for level_name in _constants.TAG_STYLES
+            }
+            self._prefix_epoch = _formatter._styles_epoch  # noqa: SLF001
+
+        @staticmethod
+        def renderContext(context: Mapping[str, Any]) -> str:
+            """Return the text appended to messages for bound context fields.
+
+            Args:
+                context: Fields bound with logContext()/bind()
+
+            Returns:
+                ``" [key=value ...]"``, or an empty string for no fields
+            """
+            if not context:
+                return ""
+            pairs = " ".join(f"{key}={value}" for key, value in context.items())
+            return f" [{pairs}]"
+
+        def formatMessage(self, record: logging.LogRecord) -> str:
+            """Format the message part of the record, adding context fields.
+
+            Wrapper for logging.Formatter.formatMessage.
+            """
+            msg = super().formatMessage(record)
+            context = getattr(record, "log_context", None)
+            if not context:
+                return msg
+            cached_context, text = self._context_cache
+            if context is not cached_context:
+                text = self.renderContext(context)
+                self._context_cache = (context, text)
+            return msg + text
+
         def format(
             self,
             record: logging.LogRecord,
             *args: Any,
+            enable_color: bool | None = None,
             **kwargs: Any,
         ) -> str:
             """Format a log record with level tag prefix.
@@ -48,18 +142,26 @@ class ApatheticLogging_Internal_TagFormatter:  # noqa: N801  # pyright: ignore[r
             Args:
                 record: LogRecord to format
                 *args: Additional positional arguments (for future-proofing)
+                enable_color: Use the colored prefix, or None to follow the
+                    record's enable_color attribute (set by DualStreamHandler)
                 **kwargs: Additional keyword arguments (for future-proofing)
 
             Returns:
                 Formatted message with optional level tag prefix
             """
-            _constants = ApatheticLogging_Internal_Constants
-            tag_color, tag_text = _constants.TAG_STYLES.get(record.levelname, ("", ""))
+            _formatter = ApatheticLogging_Internal_TagFormatter.TagFormatter
+            if self._prefix_epoch != _formatter._styles_epoch:  # noqa: SLF001
+                self._buildPrefixes()
+
+            level_name = record.levelname
+            prefixes = self._prefixes.get(level_name)
+            if prefixes is None:
+                prefixes = self._prefixes[level_name] = self.buildPrefix(level_name)
+
             msg = super().format(record, *args, **kwargs)
-            if tag_text:
-                if getattr(record, "enable_color", False) and tag_color:
-                    prefix = f"{tag_color}{tag_text}{_constants.ANSIColors.RESET}"
-                else:
-                    prefix = tag_text
-                return f"{prefix} {msg}"
+            if enable_color is None:
+                enable_color = getattr(record, "enable_color", False)
+            prefix = prefixes[1] if enable_color else prefixes[0]
+            if prefix:
+                return prefix + msg
             return msg
@@ -0,0 +1,109 @@
+# tests/00_tooling/test_lint__no_function_local_imports.py
+"""Custom lint rule: No import statements inside functions in the package.
+
+This test acts as a "poor person's linter" since ruff's PLC0415 can be
+silenced with a noqa comment. It enforces that every module in
+src/apathetic_logging/ imports at module level only.
+
+Why this matters:
+- Methods like setLevel(), logDynamic(), useLevel(), DualStreamHandler.emit(),
+  getLoggerOfType() and getDefaultLoggerName() run on hot paths; a
+  function-local `from .x import ...` costs a sys.modules lookup and an
+  attribute fetch on every call.
+- The package's internal modules form an acyclic graph (constants,
+  registry_data, logging_utils, ... have no package imports of their own),
+  so there is no circular import to dodge.
+
+Imports inside `if TYPE_CHECKING:` blocks are allowed. So are the plain
+`import <stdlib module>` statements listed in DEFERRED_IMPORTS: modules that
+are slow to import and only some features need, loaded on first use to keep
+`import apathetic_logging` cheap (see tests/90_integration/test_import_time.py).
+Each one carries a `# deferred:` comment saying why.
+"""
+
+import ast
+from pathlib import Path
+
+
+SRC_DIR = Path(__file__).parents[2] / "src" / "apathetic_logging"
+
+# file name -> stdlib modules it may import inside a function
+DEFERRED_IMPORTS: dict[str, set[str]] = {
+    "async_handler.py": {"queue"},
+    "binary_format.py": {"struct"},
+    "cli.py": {"argparse"},
+    "dual_file_handler.py": {"gzip", "shutil"},
+    "json_formatter.py": {"json"},
+    "process_handler.py": {"multiprocessing", "pickle"},
+    "sampling.py": {"random", "zlib"},
+    "segment_handler.py": {"mmap", "struct"},
+}
+
+
+class FunctionImportChecker(ast.NodeVisitor):
+    """Visitor that records import statements nested inside functions."""
+
+    def __init__(self, allowed: set[str] | None = None) -> None:
+        self.allowed = allowed or set()
+        self.bad_imports: list[tuple[str, int]] = []
+        self.function_stack: list[str] = []
+
+    def _visit_function(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> None:
+        self.function_stack.append(node.name)
+        self.generic_visit(node)
+        self.function_stack.pop()
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        self._visit_function(node)
+
+    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
+        self._visit_function(node)
+
+    def visit_If(self, node: ast.If) -> None:
+        # Skip `if TYPE_CHECKING:` bodies entirely
+        if isinstance(node.test, ast.Name) and node.test.id == "TYPE_CHECKING":
+            for stmt in node.orelse:
+                self.visit(stmt)
+            return
+        self.generic_visit(node)
+
+    def _check(self, node: ast.Import | ast.ImportFrom) -> None:
+        if self.function_stack:
+            self.bad_imports.append((self.function_stack[-1], node.lineno))
+
+    def visit_Import(self, node: ast.Import) -> None:
+        # an allowlisted deferred import: `import mod`, no alias
+        if all(
+            alias.name in self.allowed and alias.asname is None for alias in node.names
+        ):
+            return
+        self._check(node)
+
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        self._check(node)
+
+
+def test_no_function_local_imports_in_package() -> None:
+    """Enforce module-level imports for every module in the package."""
+    bad: list[str] = []
+
+    for path in sorted(SRC_DIR.glob("*.py")):
+        tree = ast.parse(path.read_text(encoding="utf-8"))
+        checker = FunctionImportChecker(DEFERRED_IMPORTS.get(path.name))
+        checker.visit(tree)
+        bad.extend(
+            f"{path.name}:{lineno} in {func}()" for func, lineno in checker.bad_imports
+        )
+
+    if bad:
+        print("\n❌ Import statements found inside functions:")
+        for entry in bad:
+            print(f"  - {entry}")
+        print(
+            "\nMove these to module level. The internal module graph is"
+            " acyclic, so no local import is needed to avoid a cycle. A slow"
+            " stdlib import only some features need can be deferred by adding"
+            " it to DEFERRED_IMPORTS."
+        )
+        xmsg = f"{len(bad)} function-local import(s) found in {SRC_DIR}."
+        raise AssertionError(xmsg)
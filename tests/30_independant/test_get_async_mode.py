@@ -0,0 +1,34 @@
+# tests/30_independant/test_get_async_mode.py
+"""Test getAsyncMode, getAsyncQueueSize and getAsyncOverflow functions."""
+
+from __future__ import annotations
+
+import apathetic_logging as mod_alogs
+
+
+def test_get_async_mode_returns_default_when_not_registered() -> None:
+    """Test that getAsyncMode returns False when not registered."""
+    assert mod_alogs.getAsyncMode() is False
+
+
+def test_get_async_mode_returns_registered_value() -> None:
+    """Test that getAsyncMode returns registered value when set."""
+    mod_alogs.registerAsyncMode(async_mode=True)
+    assert mod_alogs.getAsyncMode() is True
+
+    mod_alogs.registerAsyncMode(async_mode=False)
+    assert mod_alogs.getAsyncMode() is False
+
+
+def test_get_async_queue_settings_return_defaults_when_not_registered() -> None:
+    """Test that the queue getters fall back to the constants."""
+    _constants = mod_alogs.apathetic_logging
+    assert mod_alogs.getAsyncQueueSize() == _constants.DEFAULT_ASYNC_QUEUE_SIZE
+    assert mod_alogs.getAsyncOverflow() == _constants.DEFAULT_ASYNC_OVERFLOW
+
+
+def test_get_async_queue_settings_return_registered_values() -> None:
+    """Test that the queue getters return registered values when set."""
+    mod_alogs.registerAsyncMode(async_mode=None, queue_size=3, overflow="drop-oldest")
+    assert mod_alogs.getAsyncQueueSize() == 3  # noqa: PLR2004
+    assert mod_alogs.getAsyncOverflow() == "drop-oldest"
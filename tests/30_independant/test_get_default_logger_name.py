@@ -128,3 +128,50 @@ def test_get_default_logger_name_check_registry_parameter() -> None:
 
     # Reset
     _registry.registered_internal_logger_name = None
+
+
+def _infer_in(module_globals: dict[str, object]) -> str | None:
+    # skip_frames=0: infer from the exec'd code, whose globals we control
+    module_globals["getDefaultLoggerName"] = mod_alogs.getDefaultLoggerName
+    exec(  # noqa: S102
+        "result = getDefaultLoggerName(check_registry=False, skip_frames=0)",
+        module_globals,
+    )
+    return module_globals["result"]  # type: ignore[return-value]
+
+
+def test_get_default_logger_name_repeated_inference_from_same_module() -> None:
+    """Repeated inference from one module should keep returning its package."""
+    # --- setup ---
+    module_globals: dict[str, object] = {"__package__": "pkg_cached.sub"}
+
+    # --- execute ---
+    first = _infer_in(module_globals)
+    second = _infer_in(module_globals)
+
+    # --- verify ---
+    assert first == "pkg_cached"
+    assert second == "pkg_cached"
+
+
+def test_get_default_logger_name_sees_package_change() -> None:
+    """A changed __package__ should not return a stale cached name."""
+    # --- setup ---
+    module_globals: dict[str, object] = {"__package__": "pkg_before"}
+    assert _infer_in(module_globals) == "pkg_before"
+
+    # --- execute ---
+    module_globals["__package__"] = "pkg_after.sub"
+    result = _infer_in(module_globals)
+
+    # --- verify ---
+    assert result == "pkg_after"
+
+
+def test_get_default_logger_name_distinguishes_modules() -> None:
+    """Different modules should each infer their own package."""
+    # --- execute ---
+    results = [_infer_in({"__package__": f"pkg_{i}.sub"}) for i in range(300)]
+
+    # --- verify ---
+    assert results == [f"pkg_{i}" for i in range(300)]
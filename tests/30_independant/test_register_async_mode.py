@@ -0,0 +1,77 @@
+# tests/30_independant/test_register_async_mode.py
+"""Tests for registerAsyncMode function."""
+
+import pytest
+
+import apathetic_logging as mod_alogs
+import apathetic_logging.registry_data as mod_registry
+
+
+def test_register_async_mode_stores_value() -> None:
+    """registerAsyncMode() should store the async mode setting."""
+    # --- execute ---
+    mod_alogs.registerAsyncMode(async_mode=True)
+
+    # --- verify ---
+    _registry = mod_registry.ApatheticLogging_Internal_RegistryData
+    assert _registry.registered_internal_async_mode is True
+
+
+def test_register_async_mode_stores_queue_settings() -> None:
+    """registerAsyncMode() should store queue size and overflow policy."""
+    # --- execute ---
+    mod_alogs.registerAsyncMode(async_mode=None, queue_size=42, overflow="drop-oldest")
+
+    # --- verify ---
+    _registry = mod_registry.ApatheticLogging_Internal_RegistryData
+    assert _registry.registered_internal_async_mode is None
+    assert _registry.registered_internal_async_queue_size == 42  # noqa: PLR2004
+    assert _registry.registered_internal_async_overflow == "drop-oldest"
+
+
+def test_register_async_mode_accepts_none() -> None:
+    """registerAsyncMode() should return early when every argument is None."""
+    # --- setup ---
+    mod_alogs.registerAsyncMode(async_mode=True, queue_size=5)
+    _registry = mod_registry.ApatheticLogging_Internal_RegistryData
+
+    # --- execute ---
+    mod_alogs.registerAsyncMode(async_mode=None)
+
+    # --- verify ---
+    assert _registry.registered_internal_async_mode is True
+    assert _registry.registered_internal_async_queue_size == 5  # noqa: PLR2004
+
+
+def test_register_async_mode_replaces_writer_on_new_settings() -> None:
+    """Changing the queue settings should build a new shared writer."""
+    # --- setup ---
+    old_writer = mod_alogs.getAsyncWriter()
+
+    # --- execute ---
+    mod_alogs.registerAsyncMode(async_mode=None, queue_size=7, overflow="drop-newest")
+    new_writer = mod_alogs.getAsyncWriter()
+
+    # --- verify ---
+    assert new_writer is not old_writer
+    assert new_writer.queue_size == 7  # noqa: PLR2004
+    assert new_writer.overflow == "drop-newest"
+
+
+@pytest.mark.parametrize(
+    ("queue_size", "overflow"),
+    [(0, None), (-1, None), (None, "explode")],
+)
+def test_register_async_mode_rejects_invalid_settings(
+    queue_size: int | None,
+    overflow: str | None,
+) -> None:
+    """registerAsyncMode() should raise ValueError for invalid queue settings."""
+    # --- execute and verify ---
+    with pytest.raises(ValueError, match=r"Async queue size|overflow policy"):
+        mod_alogs.registerAsyncMode(
+            async_mode=True, queue_size=queue_size, overflow=overflow
+        )
+
+    _registry = mod_registry.ApatheticLogging_Internal_RegistryData
+    assert _registry.registered_internal_async_mode is None
@@ -0,0 +1,60 @@
+# tests/30_independant/test_register_buffered_output.py
+"""Tests for registerBufferedOutput and its getters."""
+
+import pytest
+
+import apathetic_logging as mod_alogs
+import apathetic_logging.registry_data as mod_registry
+
+
+def test_register_buffered_output_stores_values() -> None:
+    """registerBufferedOutput() should store every setting."""
+    # --- execute ---
+    mod_alogs.registerBufferedOutput(
+        buffered=True, buffer_size=4096, flush_interval=0.5
+    )
+
+    # --- verify ---
+    _registry = mod_registry.ApatheticLogging_Internal_RegistryData
+    assert _registry.registered_internal_buffered_output is True
+    assert _registry.registered_internal_buffer_size == 4096  # noqa: PLR2004
+    assert _registry.registered_internal_buffer_flush_interval == 0.5  # noqa: PLR2004
+
+
+def test_register_buffered_output_accepts_none() -> None:
+    """registerBufferedOutput() should return early when every argument is None."""
+    # --- setup ---
+    mod_alogs.registerBufferedOutput(buffered=True)
+
+    # --- execute ---
+    mod_alogs.registerBufferedOutput(buffered=None)
+
+    # --- verify ---
+    assert mod_alogs.getBufferedOutput() is True
+
+
+@pytest.mark.parametrize(
+    ("buffer_size", "flush_interval"),
+    [(0, None), (None, -1.0)],
+)
+def test_register_buffered_output_rejects_invalid_settings(
+    buffer_size: int | None,
+    flush_interval: float | None,
+) -> None:
+    """registerBufferedOutput() should raise ValueError for invalid thresholds."""
+    # --- execute and verify ---
+    with pytest.raises(ValueError, match=r"Buffer (size|flush interval)"):
+        mod_alogs.registerBufferedOutput(
+            buffered=True, buffer_size=buffer_size, flush_interval=flush_interval
+        )
+    assert mod_alogs.getBufferedOutput() is False
+
+
+def test_get_buffered_output_defaults() -> None:
+    """The getters should fall back to the constants when not registered."""
+    _constants = mod_alogs.apathetic_logging
+    assert mod_alogs.getBufferedOutput() is False
+    assert mod_alogs.getBufferSize() == _constants.DEFAULT_BUFFER_SIZE
+    assert mod_alogs.getBufferFlushInterval() == (
+        _constants.DEFAULT_BUFFER_FLUSH_INTERVAL
+    )
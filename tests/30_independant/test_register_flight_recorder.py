@@ -0,0 +1,54 @@
+# tests/30_independant/test_register_flight_recorder.py
+"""Tests for registerFlightRecorder and its getters."""
+
+import logging
+
+import pytest
+
+import apathetic_logging as mod_alogs
+import apathetic_logging.registry_data as mod_registry
+
+
+def test_register_flight_recorder_stores_values() -> None:
+    """registerFlightRecorder() should store every setting."""
+    # --- execute ---
+    mod_alogs.registerFlightRecorder(
+        enabled=True, capacity=50, level="debug", dump_path="recorder.log"
+    )
+
+    # --- verify ---
+    _registry = mod_registry.ApatheticLogging_Internal_RegistryData
+    assert _registry.registered_internal_flight_recorder is True
+    assert _registry.registered_internal_flight_recorder_capacity == 50  # noqa: PLR2004
+    assert _registry.registered_internal_flight_recorder_level == logging.DEBUG
+    assert _registry.registered_internal_flight_recorder_path == "recorder.log"
+
+
+def test_register_flight_recorder_accepts_none() -> None:
+    """registerFlightRecorder() should return early when every argument is None."""
+    # --- setup ---
+    mod_alogs.registerFlightRecorder(enabled=True)
+
+    # --- execute ---
+    mod_alogs.registerFlightRecorder(enabled=None)
+
+    # --- verify ---
+    assert mod_alogs.getFlightRecorder() is True
+
+
+def test_register_flight_recorder_rejects_invalid_capacity() -> None:
+    """registerFlightRecorder() should raise ValueError for capacity <= 0."""
+    # --- execute and verify ---
+    with pytest.raises(ValueError, match=r"Flight recorder capacity"):
+        mod_alogs.registerFlightRecorder(enabled=True, capacity=0)
+    assert mod_alogs.getFlightRecorder() is False
+
+
+def test_get_flight_recorder_defaults() -> None:
+    """The getters should fall back to the constants when not registered."""
+    _constants = mod_alogs.apathetic_logging
+    assert mod_alogs.getFlightRecorder() is False
+    assert mod_alogs.getFlightRecorderCapacity() == (
+        _constants.DEFAULT_FLIGHT_RECORDER_CAPACITY
+    )
+    assert mod_alogs.getFlightRecorderLevel() == _constants.TRACE_LEVEL
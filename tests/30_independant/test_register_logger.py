@@ -1,7 +1,6 @@
 # tests/30_independant/test_register_logger.py
 """Tests for register_logger function."""
 
-import inspect
 import logging
 import sys
 from typing import Any
@@ -45,21 +44,19 @@ def test_register_logger_auto_infer_from_package(
     """register_logger() should auto-infer from __package__ when None."""
     # --- setup ---
     # Mock frame to have __package__ in caller's globals
-    # Frame chain: register_logger -> resolve_logger_name -> _infer_from_frame
-    # skip_frames=1 means we skip 1 frame from frame.f_back, so we need:
-    # frame -> frame.f_back (register_logger) -> frame.f_back.f_back (caller)
-    frame: Any = type(sys)("frame")
-    frame.f_back = type(sys)("register_logger_frame")
-    frame.f_back.f_back = type(sys)("caller_frame")
-    frame.f_back.f_back.f_globals = {"__package__": "test_package.submodule"}
+    # Frame depths: getDefaultLoggerName (0) -> registerLogger (1) -> caller (2)
+    # skip_frames=1, so getDefaultLoggerName looks up sys._getframe(2)
+    frame: Any = type(sys)("caller_frame")
+    frame.f_globals = {"__package__": "test_package.submodule"}
     mock_frame = MagicMock(return_value=frame)
-    monkeypatch.setattr(inspect, "currentframe", mock_frame)
+    monkeypatch.setattr(sys, "_getframe", mock_frame)
 
     try:
         # --- execute ---
         mod_alogs.registerLogger()
 
         # --- verify ---
+        mock_frame.assert_called_once_with(2)
         _registry = mod_registry.ApatheticLogging_Internal_RegistryData
         assert _registry.registered_internal_logger_name == "test_package"
     finally:
@@ -73,15 +70,12 @@ def test_register_logger_auto_infer_single_package(
     """register_logger() should handle single-level package."""
     # --- setup ---
     # Mock frame to have __package__ in caller's globals
-    # Frame chain: register_logger -> resolve_logger_name -> _infer_from_frame
-    # skip_frames=1 means we skip 1 frame from frame.f_back, so we need:
-    # frame -> frame.f_back (register_logger) -> frame.f_back.f_back (caller)
-    frame: Any = type(sys)("frame")
-    frame.f_back = type(sys)("register_logger_frame")
-    frame.f_back.f_back = type(sys)("caller_frame")
-    frame.f_back.f_back.f_globals = {"__package__": "singlepackage"}
+    # Frame depths: getDefaultLoggerName (0) -> registerLogger (1) -> caller (2)
+    # skip_frames=1, so getDefaultLoggerName looks up sys._getframe(2)
+    frame: Any = type(sys)("caller_frame")
+    frame.f_globals = {"__package__": "singlepackage"}
     mock_frame = MagicMock(return_value=frame)
-    monkeypatch.setattr(inspect, "currentframe", mock_frame)
+    monkeypatch.setattr(sys, "_getframe", mock_frame)
 
     try:
         # --- execute ---
@@ -101,16 +95,13 @@ def test_register_logger_auto_infer_fails_without_package(
     """register_logger() should raise RuntimeError if __package__ missing."""
     # --- setup ---
     # Mock frame to not have __package__ in caller's globals
-    # Frame chain: register_logger -> resolve_logger_name -> _infer_from_frame
-    # skip_frames=1 means we skip 1 frame from frame.f_back, so we need:
-    # frame -> frame.f_back (register_logger) -> frame.f_back.f_back (caller)
-    frame: Any = type(sys)("frame")
-    frame.f_back = type(sys)("register_logger_frame")
-    frame.f_back.f_back = type(sys)("caller_frame")
+    # Frame depths: getDefaultLoggerName (0) -> registerLogger (1) -> caller (2)
+    # skip_frames=1, so getDefaultLoggerName looks up sys._getframe(2)
+    frame: Any = type(sys)("caller_frame")
     # No __package__ in caller's globals
-    frame.f_back.f_back.f_globals = {}
+    frame.f_globals = {}
     mock_frame = MagicMock(return_value=frame)
-    monkeypatch.setattr(inspect, "currentframe", mock_frame)
+    monkeypatch.setattr(sys, "_getframe", mock_frame)
 
     try:
         # --- execute and verify ---
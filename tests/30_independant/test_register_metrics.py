@@ -0,0 +1,51 @@
+# tests/30_independant/test_register_metrics.py
+"""Tests for registerMetrics and getMetrics functions."""
+
+import apathetic_logging as mod_alogs
+import apathetic_logging.registry_data as mod_registry
+
+
+def test_get_metrics_defaults_to_false() -> None:
+    """getMetrics() should be False until metrics are registered."""
+    assert mod_alogs.getMetrics() is False
+
+
+def test_register_metrics_enables_and_disables() -> None:
+    """registerMetrics() should store the setting."""
+    # --- execute ---
+    mod_alogs.registerMetrics(enabled=True)
+
+    # --- verify ---
+    _registry = mod_registry.ApatheticLogging_Internal_RegistryData
+    assert _registry.registered_internal_metrics is True
+    assert mod_alogs.getMetrics() is True
+
+    mod_alogs.registerMetrics(enabled=False)
+    assert mod_alogs.getMetrics() is False
+
+
+def test_register_metrics_none_leaves_setting() -> None:
+    """registerMetrics(enabled=None) should not change anything."""
+    # --- setup ---
+    mod_alogs.registerMetrics(enabled=True)
+
+    # --- execute ---
+    mod_alogs.registerMetrics(enabled=None)
+
+    # --- verify ---
+    assert mod_alogs.getMetrics() is True
+
+
+def test_below_level_hooks_follow_metrics_and_flight_recorder() -> None:
+    """The level methods' one flag should be set while either feature is on."""
+    # --- setup ---
+    _registry = mod_registry.ApatheticLogging_Internal_RegistryData
+
+    # --- execute and verify ---
+    mod_alogs.registerMetrics(enabled=True)
+    assert _registry.registered_internal_below_level_hooks is True
+    mod_alogs.registerFlightRecorder(enabled=True)
+    mod_alogs.registerMetrics(enabled=False)
+    assert _registry.registered_internal_below_level_hooks is True
+    mod_alogs.registerFlightRecorder(enabled=False)
+    assert _registry.registered_internal_below_level_hooks is False
@@ -0,0 +1,43 @@
+# tests/30_independant/test_register_output_format.py
+"""Tests for registerOutputFormat and getOutputFormat functions."""
+
+import pytest
+
+import apathetic_logging as mod_alogs
+import apathetic_logging.registry_data as mod_registry
+
+
+def test_register_output_format_stores_value() -> None:
+    """registerOutputFormat() should store the output format."""
+    # --- execute ---
+    mod_alogs.registerOutputFormat(output_format="json")
+
+    # --- verify ---
+    _registry = mod_registry.ApatheticLogging_Internal_RegistryData
+    assert _registry.registered_internal_output_format == "json"
+    assert mod_alogs.getOutputFormat() == "json"
+
+
+def test_register_output_format_accepts_none() -> None:
+    """registerOutputFormat() should return early when given None."""
+    # --- setup ---
+    mod_alogs.registerOutputFormat(output_format="json")
+
+    # --- execute ---
+    mod_alogs.registerOutputFormat(output_format=None)
+
+    # --- verify ---
+    assert mod_alogs.getOutputFormat() == "json"
+
+
+def test_register_output_format_rejects_unknown_format() -> None:
+    """registerOutputFormat() should raise ValueError for unknown formats."""
+    # --- execute and verify ---
+    with pytest.raises(ValueError, match=r"Unknown output format"):
+        mod_alogs.registerOutputFormat(output_format="xml")
+
+
+def test_get_output_format_defaults_to_text() -> None:
+    """getOutputFormat() should fall back to DEFAULT_OUTPUT_FORMAT."""
+    # --- execute and verify ---
+    assert mod_alogs.getOutputFormat() == "text"
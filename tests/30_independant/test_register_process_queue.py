@@ -0,0 +1,40 @@
+# tests/30_independant/test_register_process_queue.py
+"""Tests for registerProcessQueue and getProcessQueue functions."""
+
+import queue
+
+import apathetic_logging as mod_alogs
+import apathetic_logging.registry_data as mod_registry
+
+
+def test_register_process_queue_stores_value() -> None:
+    """registerProcessQueue() should store the queue."""
+    # --- setup ---
+    process_queue: queue.Queue[bytes] = queue.Queue()
+
+    # --- execute ---
+    mod_alogs.registerProcessQueue(process_queue)
+
+    # --- verify ---
+    _registry = mod_registry.ApatheticLogging_Internal_RegistryData
+    assert _registry.registered_internal_process_queue is process_queue
+    assert mod_alogs.getProcessQueue() is process_queue
+
+
+def test_register_process_queue_accepts_none() -> None:
+    """registerProcessQueue() should return early when given None."""
+    # --- setup ---
+    process_queue: queue.Queue[bytes] = queue.Queue()
+    mod_alogs.registerProcessQueue(process_queue)
+
+    # --- execute ---
+    mod_alogs.registerProcessQueue(None)
+
+    # --- verify ---
+    assert mod_alogs.getProcessQueue() is process_queue
+
+
+def test_get_process_queue_defaults_to_none() -> None:
+    """getProcessQueue() should return None when nothing is registered."""
+    # --- execute and verify ---
+    assert mod_alogs.getProcessQueue() is None
@@ -0,0 +1,89 @@
+# tests/30_independant/test_register_sampling.py
+"""Tests for registerSampling, getSampling and getSamplingKey functions."""
+
+import logging
+
+import pytest
+
+import apathetic_logging as mod_alogs
+import apathetic_logging.registry_data as mod_registry
+
+
+def test_register_sampling_stores_level_numbers() -> None:
+    """registerSampling() should store rates keyed by level number."""
+    # --- execute ---
+    mod_alogs.registerSampling({"trace": 0.01, logging.DEBUG: 0.5})
+
+    # --- verify ---
+    _registry = mod_registry.ApatheticLogging_Internal_RegistryData
+    expected = {mod_alogs.apathetic_logging.TRACE_LEVEL: 0.01, logging.DEBUG: 0.5}
+    assert _registry.registered_internal_sampling == {"": expected}
+    assert mod_alogs.getSampling() == expected
+
+
+def test_register_sampling_per_logger_overrides_by_level() -> None:
+    """Logger-specific rates should override broader ones level by level."""
+    # --- setup ---
+    trace = mod_alogs.apathetic_logging.TRACE_LEVEL
+    detail = mod_alogs.apathetic_logging.DETAIL_LEVEL
+
+    # --- execute ---
+    mod_alogs.registerSampling({"trace": 0.01, "detail": 0.1})
+    mod_alogs.registerSampling({"trace": 1.0}, logger_name="app.db")
+
+    # --- verify ---
+    assert mod_alogs.getSampling("app.db.pool") == {trace: 1.0, detail: 0.1}
+    assert mod_alogs.getSampling("app.web") == {trace: 0.01, detail: 0.1}
+
+
+def test_register_sampling_empty_mapping_removes_scope() -> None:
+    """An empty mapping should remove the rates for that scope."""
+    # --- setup ---
+    mod_alogs.registerSampling({"trace": 0.01})
+
+    # --- execute ---
+    mod_alogs.registerSampling({})
+
+    # --- verify ---
+    _registry = mod_registry.ApatheticLogging_Internal_RegistryData
+    assert _registry.registered_internal_sampling is None
+    assert mod_alogs.getSampling() == {}
+
+
+def test_register_sampling_accepts_none() -> None:
+    """registerSampling(None) should leave the rates unchanged."""
+    # --- setup ---
+    mod_alogs.registerSampling({"trace": 0.01})
+
+    # --- execute ---
+    mod_alogs.registerSampling(None)
+
+    # --- verify ---
+    assert mod_alogs.getSampling() == {mod_alogs.apathetic_logging.TRACE_LEVEL: 0.01}
+
+
+@pytest.mark.parametrize("rate", [-0.1, 1.5])
+def test_register_sampling_rejects_bad_rates(rate: float) -> None:
+    """Rates outside 0.0-1.0 should raise ValueError."""
+    # --- execute and verify ---
+    with pytest.raises(ValueError, match=r"must be 0.0-1.0"):
+        mod_alogs.registerSampling({"trace": rate})
+
+
+def test_register_sampling_rejects_unknown_level() -> None:
+    """Unknown level names should raise ValueError."""
+    # --- execute and verify ---
+    with pytest.raises(ValueError):  # noqa: PT011
+        mod_alogs.registerSampling({"chatty": 0.5})
+
+
+def test_sampling_key_defaults_and_registers() -> None:
+    """getSamplingKey() should fall back to DEFAULT_SAMPLING_KEY."""
+    # --- verify default ---
+    assert mod_alogs.getSamplingKey() == "trace_id"
+
+    # --- execute ---
+    mod_alogs.registerSampling(None, key="request_id")
+
+    # --- verify ---
+    assert mod_alogs.getSamplingKey() == "request_id"
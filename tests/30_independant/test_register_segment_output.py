@@ -0,0 +1,85 @@
+# tests/30_independant/test_register_segment_output.py
+"""Tests for registerSegmentOutput and the segment output getters."""
+
+import logging
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import apathetic_logging as mod_alogs
+
+
+def test_segment_output_getters_default() -> None:
+    """Getters should return the defaults until segment output is registered."""
+    assert mod_alogs.getSegmentOutput() is False
+    assert mod_alogs.getSegmentDirectory() is None
+    assert (
+        mod_alogs.getSegmentSize() == mod_alogs.apathetic_logging.DEFAULT_SEGMENT_SIZE
+    )
+    assert (
+        mod_alogs.getSegmentSyncInterval()
+        == mod_alogs.apathetic_logging.DEFAULT_SEGMENT_SYNC_INTERVAL
+    )
+    assert (
+        mod_alogs.getSegmentSyncLevel()
+        == mod_alogs.apathetic_logging.DEFAULT_SEGMENT_SYNC_LEVEL
+    )
+    assert mod_alogs.getSegmentRecordFormat() == "text"
+
+
+def test_register_segment_output_stores_settings(tmp_path: Path) -> None:
+    """registerSegmentOutput() should store every setting it is given."""
+    # --- execute ---
+    mod_alogs.registerSegmentOutput(
+        enabled=True,
+        directory=tmp_path,
+        segment_size=4096,
+        sync_interval=0.5,
+        sync_level="warning",
+        record_format="binary",
+    )
+
+    # --- verify ---
+    assert mod_alogs.getSegmentOutput() is True
+    assert mod_alogs.getSegmentDirectory() == str(tmp_path)
+    assert mod_alogs.getSegmentSize() == 4096  # noqa: PLR2004
+    assert mod_alogs.getSegmentSyncInterval() == 0.5  # noqa: PLR2004
+    assert mod_alogs.getSegmentSyncLevel() == logging.WARNING
+    assert mod_alogs.getSegmentRecordFormat() == "binary"
+
+
+def test_register_segment_output_none_leaves_settings(tmp_path: Path) -> None:
+    """registerSegmentOutput(enabled=None) alone should not change anything."""
+    # --- setup ---
+    mod_alogs.registerSegmentOutput(enabled=True, directory=tmp_path)
+
+    # --- execute ---
+    mod_alogs.registerSegmentOutput(enabled=None)
+
+    # --- verify ---
+    assert mod_alogs.getSegmentOutput() is True
+
+
+def test_register_segment_output_requires_directory() -> None:
+    """Enabling segment output without a directory should raise ValueError."""
+    with pytest.raises(ValueError, match="directory"):
+        mod_alogs.registerSegmentOutput(enabled=True)
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "match"),
+    [
+        ({"segment_size": 64}, "Segment size"),
+        ({"sync_interval": -1.0}, "sync interval"),
+        ({"record_format": "xml"}, "record format"),
+    ],
+)
+def test_register_segment_output_rejects_invalid_settings(
+    tmp_path: Path,
+    kwargs: dict[str, Any],
+    match: str,
+) -> None:
+    """Invalid sizes, intervals and formats should raise ValueError."""
+    with pytest.raises(ValueError, match=match):
+        mod_alogs.registerSegmentOutput(enabled=True, directory=tmp_path, **kwargs)
@@ -0,0 +1,293 @@
+# tests/50_core/test_async_queue_handler.py
+"""Tests for AsyncQueueHandler, AsyncWriter and async mode."""
+
+import contextlib
+import io
+import logging
+import sys
+import threading
+import uuid
+
+import pytest
+
+import apathetic_logging as mod_alogs
+
+
+class _ListHandler(logging.Handler):
+    """Collects formatted messages, optionally blocking until released."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.messages: list[str] = []
+        self.started = threading.Event()
+        self.gate = threading.Event()
+        self.gate.set()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.started.set()
+        self.gate.wait(timeout=5)
+        self.messages.append(record.getMessage())
+
+
+def _make_logger(handler: logging.Handler) -> logging.Logger:
+    # plain stdlib logger, so ensureHandlers() doesn't replace our handler
+    logger = logging.Logger(f"test_async_{uuid.uuid4().hex[:6]}", logging.DEBUG)  # noqa: LOG001
+    logger.propagate = False
+    logger.addHandler(handler)
+    return logger
+
+
+def test_async_queue_handler_preserves_stream_routing(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Records written by the writer thread should keep stdout/stderr routing."""
+    # --- setup ---
+    out_buf = io.StringIO()
+    err_buf = io.StringIO()
+    monkeypatch.setattr(sys, "stdout", out_buf)
+    monkeypatch.setattr(sys, "stderr", err_buf)
+    writer = mod_alogs.AsyncWriter(queue_size=100, overflow="block")
+    handler = mod_alogs.AsyncQueueHandler(mod_alogs.DualStreamHandler(), writer=writer)
+    logger = _make_logger(handler)
+
+    # --- execute ---
+    logger.info("to stdout")
+    logger.warning("to stderr")
+    handler.flush()
+    writer.stop()
+
+    # --- verify ---
+    assert "to stdout" in out_buf.getvalue()
+    assert "to stdout" not in err_buf.getvalue()
+    assert "to stderr" in err_buf.getvalue()
+    assert "to stderr" not in out_buf.getvalue()
+
+
+def test_async_queue_handler_follows_caller_redirect(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A record logged inside redirect_stdout() should go to the redirect."""
+    # --- setup ---
+    out_buf = io.StringIO()
+    redirected = io.StringIO()
+    monkeypatch.setattr(sys, "stdout", out_buf)
+    writer = mod_alogs.AsyncWriter(queue_size=100, overflow="block")
+    handler = mod_alogs.AsyncQueueHandler(mod_alogs.DualStreamHandler(), writer=writer)
+    logger = _make_logger(handler)
+
+    # --- execute ---
+    with contextlib.redirect_stdout(redirected):
+        logger.info("redirected")
+    logger.info("not redirected")
+    handler.flush()
+    writer.stop()
+
+    # --- verify ---
+    assert redirected.getvalue() == "redirected\n"
+    assert out_buf.getvalue() == "not redirected\n"
+
+
+def test_async_queue_handler_preserves_order() -> None:
+    """Records should be written in the order they were logged."""
+    # --- setup ---
+    target = _ListHandler()
+    writer = mod_alogs.AsyncWriter(queue_size=1000, overflow="block")
+    logger = _make_logger(mod_alogs.AsyncQueueHandler(target, writer=writer))
+
+    # --- execute ---
+    for i in range(200):
+        logger.info("message %d", i)
+    writer.flush()
+    writer.stop()
+
+    # --- verify ---
+    assert target.messages == [f"message {i}" for i in range(200)]
+
+
+def test_async_queue_handler_merges_args_on_caller_thread() -> None:
+    """Mutating an argument after logging should not change the output."""
+    # --- setup ---
+    target = _ListHandler()
+    target.gate.clear()
+    writer = mod_alogs.AsyncWriter(queue_size=10, overflow="block")
+    logger = _make_logger(mod_alogs.AsyncQueueHandler(target, writer=writer))
+    items = ["before"]
+
+    # --- execute ---
+    logger.info("items=%s", items)
+    items.append("after")
+    target.gate.set()
+    writer.stop()
+
+    # --- verify ---
+    assert target.messages == ["items=['before']"]
+
+
+def test_async_queue_handler_keeps_templates_of_immutable_args() -> None:
+    """Records with only immutable scalar arguments should stay unmerged."""
+    # --- setup ---
+    handler = mod_alogs.AsyncQueueHandler(logging.NullHandler())
+    scalars = logging.LogRecord("test", logging.INFO, "", 1, "%s=%d", ("n", 1), None)
+    mutable = logging.LogRecord("test", logging.INFO, "", 1, "%s", (["a"],), None)
+
+    # --- execute ---
+    kept = handler.prepare(scalars)
+    merged = handler.prepare(mutable)
+
+    # --- verify ---
+    assert (kept.msg, kept.args) == ("%s=%d", ("n", 1))
+    assert (merged.msg, merged.args) == ("['a']", None)
+
+
+@pytest.mark.parametrize(
+    ("overflow", "expected"),
+    [
+        ("drop-newest", ["first", "second", "third"]),
+        ("drop-oldest", ["first", "fourth", "fifth"]),
+    ],
+)
+def test_async_writer_overflow_policies(
+    overflow: str,
+    expected: list[str],
+) -> None:
+    """A full queue should drop records according to the overflow policy."""
+    # --- setup ---
+    target = _ListHandler()
+    target.gate.clear()
+    writer = mod_alogs.AsyncWriter(queue_size=2, overflow=overflow)
+    logger = _make_logger(mod_alogs.AsyncQueueHandler(target, writer=writer))
+    logger.info("first")
+    # wait until the writer thread is stuck writing "first"
+    assert target.started.wait(timeout=5)
+
+    # --- execute ---
+    for msg in ("second", "third", "fourth", "fifth"):
+        logger.info(msg)
+    target.gate.set()
+    writer.stop()
+
+    # --- verify ---
+    assert target.messages == expected
+    assert writer.dropped == 2  # noqa: PLR2004
+
+
+@pytest.mark.parametrize(
+    ("queue_size", "overflow"),
+    [(0, "block"), (10, "drop-everything")],
+)
+def test_async_writer_rejects_invalid_settings(
+    queue_size: int,
+    overflow: str,
+) -> None:
+    """AsyncWriter should reject a non-positive size or unknown policy."""
+    # --- execute and verify ---
+    with pytest.raises(ValueError, match=r"Async queue size|overflow policy"):
+        mod_alogs.AsyncWriter(queue_size=queue_size, overflow=overflow)
+
+
+def test_async_queue_handler_close_writes_queued_records() -> None:
+    """Closing the handler should write every record still queued."""
+    # --- setup ---
+    target = _ListHandler()
+    handler = mod_alogs.AsyncQueueHandler(target)
+    logger = _make_logger(handler)
+
+    # --- execute ---
+    for i in range(50):
+        logger.info("queued %d", i)
+    handler.close()
+
+    # --- verify ---
+    assert len(target.messages) == 50  # noqa: PLR2004
+
+
+def test_stop_async_writer_writes_queued_records() -> None:
+    """stopAsyncWriter() should write queued records before stopping."""
+    # --- setup ---
+    target = _ListHandler()
+    logger = _make_logger(mod_alogs.AsyncQueueHandler(target))
+    logger.info("pending")
+    writer = mod_alogs.getAsyncWriter()
+
+    # --- execute ---
+    mod_alogs.stopAsyncWriter()
+
+    # --- verify ---
+    assert target.messages == ["pending"]
+    assert not writer.running
+    assert mod_alogs.getAsyncWriter() is not writer
+
+
+def test_get_async_writer_creates_one_writer_for_concurrent_callers() -> None:
+    """Threads asking for the writer at once should all get the same one."""
+    # --- setup ---
+    thread_count = 8
+    trials = 20
+
+    for _ in range(trials):
+        mod_alogs.stopAsyncWriter()
+        barrier = threading.Barrier(thread_count)
+        writers: list[object] = []
+
+        def get_writer(barrier: threading.Barrier, writers: list[object]) -> None:
+            barrier.wait()
+            writers.append(mod_alogs.getAsyncWriter())
+
+        threads = [
+            threading.Thread(target=get_writer, args=(barrier, writers))
+            for _ in range(thread_count)
+        ]
+
+        # --- execute ---
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # --- verify ---
+        assert len({id(writer) for writer in writers}) == 1
+    mod_alogs.stopAsyncWriter()
+
+
+def test_ensure_handlers_installs_async_front_end_when_registered(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Async mode should wrap the DualStreamHandler in an AsyncQueueHandler."""
+    # --- setup ---
+    out_buf = io.StringIO()
+    monkeypatch.setattr(sys, "stdout", out_buf)
+    logger = mod_alogs.Logger(f"test_async_mode_{uuid.uuid4().hex[:6]}")
+    logger.info("sync first")
+    assert isinstance(logger.handlers[0], mod_alogs.DualStreamHandler)
+
+    # --- execute ---
+    mod_alogs.registerAsyncMode(async_mode=True)
+    logger.info("async now")
+    mod_alogs.stopAsyncWriter()
+
+    # --- verify ---
+    assert len(logger.handlers) == 1
+    handler = logger.handlers[0]
+    assert isinstance(handler, mod_alogs.AsyncQueueHandler)
+    assert isinstance(handler.target, mod_alogs.DualStreamHandler)
+    assert "sync first" in out_buf.getvalue()
+    assert "async now" in out_buf.getvalue()
+
+
+def test_ensure_handlers_drops_async_front_end_when_disabled(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Turning async mode off should go back to a plain DualStreamHandler."""
+    # --- setup ---
+    monkeypatch.setattr(sys, "stdout", io.StringIO())
+    mod_alogs.registerAsyncMode(async_mode=True)
+    logger = mod_alogs.Logger(f"test_async_mode_{uuid.uuid4().hex[:6]}")
+    logger.info("async")
+
+    # --- execute ---
+    mod_alogs.registerAsyncMode(async_mode=False)
+    logger.info("sync again")
+
+    # --- verify ---
+    assert len(logger.handlers) == 1
+    assert isinstance(logger.handlers[0], mod_alogs.DualStreamHandler)
@@ -0,0 +1,171 @@
+# tests/50_core/test_binary_format.py
+"""Tests for BinaryRecordEncoder and BinaryRecordDecoder."""
+
+import logging
+import sys
+
+import pytest
+
+import apathetic_logging as mod_alogs
+
+
+_BASE_TIME = 1_700_000_000.0
+_TAGS = mod_alogs.apathetic_logging.BinaryTags
+
+
+def _make_record(
+    level: int, msg: object, *args: object, name: str = "test"
+) -> logging.LogRecord:
+    record = logging.LogRecord(name, level, __file__, 1, msg, args, None)
+    record.created = _BASE_TIME + 0.25
+    record.msecs = 250.0
+    return record
+
+
+def _round_trip(*records: logging.LogRecord) -> list[logging.LogRecord]:
+    encoder = mod_alogs.BinaryRecordEncoder()
+    encoder.reset(_BASE_TIME)
+    chunks = [encoder.encode(record) for record in records]
+    return list(mod_alogs.decodeBinaryRecords(chunks, _BASE_TIME))
+
+
+def test_binary_round_trip_rebuilds_arguments() -> None:
+    """Each supported argument type should come back as the same value."""
+    # --- setup ---
+    args = ("text", -42, 2**70, 1.5, None, True, False, b"\x00raw")
+    record = _make_record(logging.INFO, "%s %d %d %r %s %s %s %r", *args)
+
+    # --- execute ---
+    (decoded,) = _round_trip(record)
+
+    # --- verify ---
+    assert decoded.name == "test"
+    assert decoded.levelno == logging.INFO
+    assert decoded.levelname == "INFO"
+    assert decoded.msg == record.msg
+    assert decoded.args == args
+    assert decoded.getMessage() == record.getMessage()
+    assert decoded.created == pytest.approx(record.created, abs=1e-6)
+
+
+def test_binary_encoder_interns_templates_once_per_stream() -> None:
+    """Only a call site's first record should carry its template."""
+    # --- setup ---
+    encoder = mod_alogs.BinaryRecordEncoder()
+    encoder.reset(_BASE_TIME)
+
+    # --- execute ---
+    first = encoder.encode(_make_record(logging.INFO, "request %s took %d ms", "a", 5))
+    second = encoder.encode(_make_record(logging.INFO, "request %s took %d ms", "b", 7))
+    encoder.reset(_BASE_TIME)
+    after_reset = encoder.encode(_make_record(logging.INFO, "request %s took %d ms"))
+
+    # --- verify ---
+    assert first[0] == _TAGS.TEMPLATE
+    assert b"request %s took %d ms" in first
+    assert second[0] == _TAGS.EVENT
+    assert b"request" not in second
+    assert len(second) < len("request b took 7 ms")
+    assert after_reset[0] == _TAGS.TEMPLATE
+
+
+def test_binary_encoder_merges_messages_it_cannot_rebuild() -> None:
+    """Other argument types, mappings and non-str messages should be merged."""
+    # --- setup ---
+    records = [
+        _make_record(logging.INFO, "object %s", object),
+        _make_record(logging.INFO, "mapping %(key)s", {"key": "value"}),
+        _make_record(logging.INFO, ValueError("not a str")),
+        _make_record(logging.INFO, "flag %s", True),
+    ]
+
+    # --- execute ---
+    decoded = _round_trip(*records)
+
+    # --- verify ---
+    assert [r.getMessage() for r in decoded] == [r.getMessage() for r in records]
+    assert decoded[0].args == ()
+    assert decoded[3].args == (True,)
+
+
+def test_binary_encoder_merges_messages_beyond_max_templates() -> None:
+    """Call sites past max_templates should be written with merged messages."""
+    # --- setup ---
+    encoder = mod_alogs.BinaryRecordEncoder(max_templates=1)
+    encoder.reset(_BASE_TIME)
+
+    # --- execute ---
+    chunks = [
+        encoder.encode(_make_record(logging.INFO, "first %d", 1)),
+        encoder.encode(_make_record(logging.INFO, "second %d", 2)),
+        encoder.encode(_make_record(logging.INFO, "first %d", 3)),
+    ]
+    decoded = list(mod_alogs.decodeBinaryRecords(chunks, _BASE_TIME))
+
+    # --- verify ---
+    assert encoder.templates == {("test", "first %d"): 1}
+    assert [r.getMessage() for r in decoded] == ["first 1", "second 2", "first 3"]
+    assert decoded[1].msg == "second 2"
+
+
+def test_binary_round_trip_keeps_extras_and_custom_levels() -> None:
+    """Tracebacks, stack info, context and unusual levels should survive."""
+    # --- setup ---
+    try:
+        msg = "boom"
+        raise RuntimeError(msg)  # noqa: TRY301
+    except RuntimeError:
+        exc_info = sys.exc_info()
+    record = logging.LogRecord("test", 300, __file__, 1, "failed", (), exc_info)
+    record.created = _BASE_TIME
+    record.stack_info = "Stack (most recent call last):\n  here"
+    record.log_context = {"request": 7}
+
+    # --- execute ---
+    (decoded,) = _round_trip(record)
+
+    # --- verify ---
+    assert decoded.levelno == 300  # noqa: PLR2004
+    assert decoded.exc_text is not None
+    assert "RuntimeError: boom" in decoded.exc_text
+    assert decoded.stack_info == record.stack_info
+    assert decoded.log_context == {"request": "7"}  # type: ignore[attr-defined]
+
+
+def test_binary_records_format_like_the_originals() -> None:
+    """TagFormatter output of decoded records should match the originals."""
+    # --- setup ---
+    formatter = mod_alogs.TagFormatter("%(asctime)s %(name)s: %(message)s")
+    records = [
+        _make_record(mod_alogs.TRACE_LEVEL, "trace %s", "x", name="app.db"),
+        _make_record(logging.DEBUG, "debug %d", 1),
+        _make_record(logging.WARNING, "careful %.2f", 3.14159),
+        _make_record(logging.ERROR, "failed"),
+    ]
+    records[1].log_context = {"user": "alice"}
+
+    # --- execute ---
+    expected = [formatter.format(record) for record in records]
+    decoded = [formatter.format(record) for record in _round_trip(*records)]
+
+    # --- verify ---
+    assert decoded == expected
+    assert decoded[0].startswith("[TRACE] ")
+    assert decoded[3].startswith("❌ ")
+
+
+def test_binary_decoder_rejects_malformed_input() -> None:
+    """Truncated entries and unknown templates should raise ValueError."""
+    # --- setup ---
+    encoder = mod_alogs.BinaryRecordEncoder()
+    encoder.reset(_BASE_TIME)
+    template_and_event = encoder.encode(_make_record(logging.INFO, "value %d", 1))
+    event_only = encoder.encode(_make_record(logging.INFO, "value %d", 2))
+
+    # --- execute and verify ---
+    with pytest.raises(ValueError, match="Truncated"):
+        mod_alogs.BinaryRecordDecoder(_BASE_TIME).decode(template_and_event[:-3])
+    with pytest.raises(ValueError, match="template id"):
+        mod_alogs.BinaryRecordDecoder(_BASE_TIME).decode(event_only)
+    with pytest.raises(ValueError, match="entry type"):
+        mod_alogs.BinaryRecordDecoder(_BASE_TIME).decode(b"\x7f")
@@ -0,0 +1,285 @@
+# tests/50_core/test_caller_info.py
+"""Tests for skipping findCaller() when no handler reads caller info."""
+
+import io
+import logging
+import logging.handlers
+import sys
+import uuid
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+import apathetic_logging as mod_alogs
+
+
+if TYPE_CHECKING:
+    from apathetic_logging import Logger  # noqa: ICN003
+else:
+    Logger = mod_alogs.Logger
+
+
+@pytest.fixture
+def logger() -> Logger:
+    """Logger at INFO level with its default handlers built."""
+    logger = mod_alogs.Logger(f"test_caller_info_{uuid.uuid4().hex[:6]}")
+    logger.setLevel("info")
+    logger.ensureHandlers()
+    return logger
+
+
+def _count_find_caller(monkeypatch: pytest.MonkeyPatch, logger: Logger) -> list[int]:
+    # one entry per findCaller() call on this logger
+    calls: list[int] = []
+    find_caller = logger.findCaller
+
+    def counting(*args: Any, **kwargs: Any) -> Any:
+        calls.append(1)
+        return find_caller(*args, **kwargs)
+
+    monkeypatch.setattr(logger, "findCaller", counting)
+    return calls
+
+
+def test_default_handlers_skip_find_caller(
+    monkeypatch: pytest.MonkeyPatch,
+    logger: Logger,
+) -> None:
+    """The default %(message)s TagFormatter should not walk the stack."""
+    # --- setup ---
+    out_buf = io.StringIO()
+    err_buf = io.StringIO()
+    monkeypatch.setattr(sys, "stdout", out_buf)
+    monkeypatch.setattr(sys, "stderr", err_buf)
+    calls = _count_find_caller(monkeypatch, logger)
+
+    # --- execute ---
+    logger.info("hello %s", "world")
+    logger.errorIfNotDebug("failed")
+
+    # --- verify ---
+    assert calls == []
+    assert out_buf.getvalue() == "hello world\n"
+    assert "failed" in err_buf.getvalue()
+
+
+def test_unknown_caller_fields_when_skipped(
+    monkeypatch: pytest.MonkeyPatch,
+    logger: Logger,
+) -> None:
+    """Skipped records should carry the stdlib's unknown caller values."""
+    # --- setup ---
+    records: list[logging.LogRecord] = []
+    make_record = logger.makeRecord
+
+    def recording(*args: Any, **kwargs: Any) -> logging.LogRecord:
+        record = make_record(*args, **kwargs)
+        records.append(record)
+        return record
+
+    monkeypatch.setattr(logger, "makeRecord", recording)
+
+    # --- execute ---
+    logger.info("hello")
+
+    # --- verify ---
+    assert records[0].pathname == "(unknown file)"
+    assert records[0].lineno == 0
+    assert records[0].funcName == "(unknown function)"
+
+
+def test_formatter_with_caller_field_finds_caller(
+    monkeypatch: pytest.MonkeyPatch,
+    logger: Logger,
+) -> None:
+    """Setting a formatter that mentions lineno should bring findCaller() back."""
+    # --- setup ---
+    out_buf = io.StringIO()
+    monkeypatch.setattr(sys, "stdout", out_buf)
+    calls = _count_find_caller(monkeypatch, logger)
+
+    # --- execute ---
+    logger.info("before")
+    logger.handlers[0].setFormatter(mod_alogs.TagFormatter("%(lineno)d %(message)s"))
+    logger.info("hello")
+
+    # --- verify ---
+    assert calls == [1]
+    lineno, message = out_buf.getvalue().splitlines()[-1].split(" ", 1)
+    assert int(lineno) > 0
+    assert message == "hello"
+
+
+def test_decision_follows_handler_changes(
+    monkeypatch: pytest.MonkeyPatch,
+    logger: Logger,
+) -> None:
+    """Adding and removing a handler should redo the cached decision."""
+    # --- setup ---
+    calls = _count_find_caller(monkeypatch, logger)
+    handler = logging.StreamHandler(io.StringIO())
+    handler.setFormatter(logging.Formatter("%(funcName)s: %(message)s"))
+
+    # --- execute ---
+    logger.info("before")
+    logger.addHandler(handler)
+    logger.info("with handler")
+    logger.removeHandler(handler)
+    logger.info("after")
+
+    # --- verify ---
+    assert calls == [1]
+
+
+@pytest.mark.parametrize(
+    ("fields", "expected"),
+    [
+        ({"message": "message"}, 0),
+        ({"message": "message", "line": "lineno"}, 1),
+    ],
+)
+def test_json_formatter_fields_decide(
+    monkeypatch: pytest.MonkeyPatch,
+    logger: Logger,
+    fields: dict[str, str],
+    expected: int,
+) -> None:
+    """A JsonFormatter should need caller info only if a field maps to it."""
+    # --- setup ---
+    logger.handlers[0].setFormatter(mod_alogs.JsonFormatter(fields=fields))
+    calls = _count_find_caller(monkeypatch, logger)
+
+    # --- execute ---
+    logger.info("hello")
+
+    # --- verify ---
+    assert len(calls) == expected
+
+
+@pytest.mark.parametrize(
+    "extra_setup",
+    ["logger_filter", "handler_filter", "custom_handler", "stack_info"],
+)
+def test_conservative_cases_find_caller(
+    monkeypatch: pytest.MonkeyPatch,
+    logger: Logger,
+    extra_setup: str,
+) -> None:
+    """Filters, unknown handlers and stack_info should still walk the stack."""
+    # --- setup ---
+    kwargs: dict[str, Any] = {}
+    if extra_setup == "logger_filter":
+        logger.addFilter(lambda _record: True)
+    elif extra_setup == "handler_filter":
+        logger.handlers[0].addFilter(lambda _record: True)
+    elif extra_setup == "custom_handler":
+        logger.addHandler(logging.handlers.BufferingHandler(10))
+    else:
+        kwargs["stack_info"] = True
+    calls = _count_find_caller(monkeypatch, logger)
+
+    # --- execute ---
+    logger.info("hello", **kwargs)
+
+    # --- verify ---
+    assert calls == [1]
+
+
+def test_propagated_handlers_count(
+    monkeypatch: pytest.MonkeyPatch,
+    logger: Logger,
+) -> None:
+    """A parent's handler reached by propagation should be considered."""
+    # --- setup ---
+    parent = mod_alogs.Logger(f"{logger.name}_parent")
+    parent.addHandler(logging.handlers.BufferingHandler(10))
+    logger.parent = parent
+    logger.propagate = True
+    calls = _count_find_caller(monkeypatch, logger)
+
+    # --- execute ---
+    logger.info("hello")
+    logger.propagate = False
+    logger.info("hello again")
+
+    # --- verify ---
+    assert calls == [1]
+
+
+def test_cached_decision_skips_handler_walk(
+    monkeypatch: pytest.MonkeyPatch,
+    logger: Logger,
+) -> None:
+    """With only package handlers, a repeat record shouldn't rebuild the key."""
+    # --- setup ---
+    monkeypatch.setattr(sys, "stdout", io.StringIO())
+    logger.info("warm up")
+    keys: list[int] = []
+    caller_info_key = logger._callerInfoKey  # noqa: SLF001
+
+    def counting() -> tuple[object, ...]:
+        keys.append(1)
+        return caller_info_key()
+
+    monkeypatch.setattr(logger, "_callerInfoKey", counting)
+
+    # --- execute ---
+    logger.info("hello")
+    logger.info("hello again")
+
+    # --- verify ---
+    assert keys == []
+
+
+def test_stdlib_handler_changes_are_seen(
+    monkeypatch: pytest.MonkeyPatch,
+    logger: Logger,
+) -> None:
+    """A stdlib handler doesn't bump the epoch, so its changes are checked."""
+    # --- setup ---
+    handler = logging.StreamHandler(io.StringIO())
+    logger.addHandler(handler)
+    calls = _count_find_caller(monkeypatch, logger)
+
+    # --- execute ---
+    logger.info("before")
+    handler.setFormatter(logging.Formatter("%(lineno)d %(message)s"))
+    logger.info("hello")
+
+    # --- verify ---
+    assert calls == [1]
+
+
+def test_invalidate_caller_info_redoes_decision(
+    monkeypatch: pytest.MonkeyPatch,
+    logger: Logger,
+) -> None:
+    """A formatter assigned directly is seen after invalidateCallerInfo()."""
+    # --- setup ---
+    monkeypatch.setattr(sys, "stdout", io.StringIO())
+    calls = _count_find_caller(monkeypatch, logger)
+
+    # --- execute ---
+    logger.info("before")
+    logger.handlers[0].formatter = logging.Formatter("%(lineno)d %(message)s")
+    mod_alogs.invalidateCallerInfo()
+    logger.info("hello")
+
+    # --- verify ---
+    assert calls == [1]
+
+
+def test_repeated_get_logger_keeps_epoch() -> None:
+    """getLogger() re-applying an unchanged propagate shouldn't bump the epoch."""
+    # --- setup ---
+    name = f"test_caller_info_{uuid.uuid4().hex[:6]}"
+    mod_alogs.getLogger(name)
+    namespace = mod_alogs.apathetic_logging
+    epoch = namespace._caller_info_epoch  # noqa: SLF001
+
+    # --- execute ---
+    for _ in range(5):
+        mod_alogs.getLogger(name)
+
+    # --- verify ---
+    assert namespace._caller_info_epoch == epoch  # noqa: SLF001
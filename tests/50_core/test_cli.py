@@ -0,0 +1,81 @@
+# tests/50_core/test_cli.py
+"""Tests for the apathetic_logging command line (runCli)."""
+
+import logging
+from pathlib import Path
+
+import pytest
+
+import apathetic_logging as mod_alogs
+
+
+def _write_segment(directory: Path, record_format: str) -> None:
+    handler = mod_alogs.MmapSegmentHandler(directory, record_format=record_format)
+    handler.setFormatter(mod_alogs.TagFormatter("%(message)s"))
+    for level, msg, args in [
+        (mod_alogs.TRACE_LEVEL, "trace %s", ("x",)),
+        (logging.INFO, "count %d", (3,)),
+        (logging.WARNING, "careful", ()),
+    ]:
+        handler.handle(logging.LogRecord("test", level, "", 1, msg, args, None))
+    handler.close()
+
+
+@pytest.mark.parametrize("record_format", ["binary", "text"])
+def test_cli_decode_prints_tagged_records(
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+    record_format: str,
+) -> None:
+    """Decode should print the lines TagFormatter would have written."""
+    # --- setup ---
+    _write_segment(tmp_path, record_format)
+
+    # --- execute ---
+    status = mod_alogs.runCli(["decode", "--no-color", str(tmp_path)])
+
+    # --- verify ---
+    assert status == 0
+    assert capsys.readouterr().out == "[TRACE] trace x\ncount 3\n⚠️  careful\n"
+
+
+def test_cli_decode_format_and_color(
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """--format and --color should apply to binary records."""
+    # --- setup ---
+    _write_segment(tmp_path, "binary")
+    (path,) = mod_alogs.listSegments(tmp_path)
+    colors = mod_alogs.apathetic_logging.ANSIColors
+
+    # --- execute ---
+    status = mod_alogs.runCli(
+        ["decode", "--color", "--format", "%(name)s %(message)s", path]
+    )
+
+    # --- verify ---
+    assert status == 0
+    assert capsys.readouterr().out.splitlines()[0] == (
+        f"{colors.GRAY}[TRACE]{colors.RESET} test trace x"
+    )
+
+
+def test_cli_decode_reports_unreadable_paths(
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Missing files and non-segments should be reported with status 1."""
+    # --- setup ---
+    (tmp_path / "notes.txt").write_text("not a segment")
+
+    # --- execute ---
+    status = mod_alogs.runCli(
+        ["decode", str(tmp_path / "notes.txt"), str(tmp_path / "missing.seg")]
+    )
+
+    # --- verify ---
+    assert status == 1
+    err = capsys.readouterr().err
+    assert "Not a log segment" in err
+    assert "missing.seg" in err
@@ -2,7 +2,7 @@
 """Tests for Logger.determine_log_level() method."""
 
 import argparse
-from collections.abc import Generator
+from collections.abc import Callable, Generator
 from typing import TYPE_CHECKING
 
 import pytest
@@ -35,6 +35,7 @@ def reset_namespace_and_env(
         delattr(_ns, "registered_internal_log_level_env_vars")
     if "registered_internal_default_log_level" in _ns.__dict__:
         delattr(_ns, "registered_internal_default_log_level")
+    mod_alogs.invalidateConfigSnapshot()
 
     # Clear environment variables
     monkeypatch.delenv("LOG_LEVEL", raising=False)
@@ -177,3 +178,74 @@ def test_determine_log_level_priority_order(
     # --- verify ---
     # Root should win over default
     assert result == "INFO"
+
+
+def test_determine_log_level_reuses_config_snapshot(
+    direct_logger: Logger,
+) -> None:
+    """determine_log_level() should not re-resolve the registry on every call."""
+    # --- setup ---
+    direct_logger.determineLogLevel()
+    snapshot = mod_alogs.getConfigSnapshot()
+
+    # --- execute ---
+    direct_logger.determineLogLevel()
+    mod_alogs.Logger("test_snapshot_reuse")
+
+    # --- verify ---
+    assert mod_alogs.getConfigSnapshot() is snapshot
+
+
+@pytest.mark.parametrize(
+    ("register", "field", "expected"),
+    [
+        (
+            lambda: mod_alogs.registerDefaultLogLevel("warning"),
+            "default_log_level",
+            "WARNING",
+        ),
+        (
+            lambda: mod_alogs.registerLogLevelEnvVars(["MYAPP_LOG_LEVEL"]),
+            "log_level_env_vars",
+            ("MYAPP_LOG_LEVEL",),
+        ),
+        (lambda: mod_alogs.registerPropagate(propagate=True), "propagate", True),
+        (
+            lambda: mod_alogs.registerCompatibilityMode(compat_mode=True),
+            "compatibility_mode",
+            True,
+        ),
+    ],
+)
+def test_register_functions_invalidate_config_snapshot(
+    register: Callable[[], None],
+    field: str,
+    expected: object,
+) -> None:
+    """register*() functions should replace the memoized snapshot."""
+    # --- setup ---
+    before = mod_alogs.getConfigSnapshot()
+
+    # --- execute ---
+    register()
+    after = mod_alogs.getConfigSnapshot()
+
+    # --- verify ---
+    assert after is not before
+    assert getattr(after, field) == expected
+
+
+def test_determine_log_level_sees_env_changes_with_cached_snapshot(
+    monkeypatch: pytest.MonkeyPatch,
+    direct_logger: Logger,
+) -> None:
+    """Env var values should still be read on each call."""
+    # --- setup ---
+    assert direct_logger.determineLogLevel() == "DETAIL"
+
+    # --- execute ---
+    monkeypatch.setenv("LOG_LEVEL", "error")
+    result = direct_logger.determineLogLevel()
+
+    # --- verify ---
+    assert result == "ERROR"
@@ -0,0 +1,257 @@
+# tests/50_core/test_dual_file_handler.py
+"""Tests for DualFileHandler routing, buffering, and rotation."""
+
+import gzip
+import logging
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TypeAlias
+
+import pytest
+
+import apathetic_logging as mod_alogs
+
+
+if TYPE_CHECKING:
+    from apathetic_logging.dual_file_handler import (
+        ApatheticLogging_Internal_DualFileHandler,
+    )
+
+    DualFileHandler: TypeAlias = (
+        ApatheticLogging_Internal_DualFileHandler.DualFileHandler
+    )
+else:
+    DualFileHandler = mod_alogs.DualFileHandler
+
+
+def _make_record(level: int, msg: str, *args: object) -> logging.LogRecord:
+    return logging.LogRecord("test", level, __file__, 1, msg, args, None)
+
+
+def _make_handler(path: Path, **kwargs: Any) -> DualFileHandler:
+    handler = DualFileHandler(path, **kwargs)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    return handler
+
+
+def test_dual_file_handler_routes_levels_to_files(tmp_path: Path) -> None:
+    """Output, warnings/errors, and diagnostics should go to separate files."""
+    # --- setup ---
+    handler = _make_handler(tmp_path / "app.log")
+
+    # --- execute ---
+    handler.handle(_make_record(mod_alogs.DETAIL_LEVEL, "detail"))
+    handler.handle(_make_record(logging.INFO, "info"))
+    handler.handle(_make_record(mod_alogs.MINIMAL_LEVEL, "minimal"))
+    handler.handle(_make_record(logging.WARNING, "warning"))
+    handler.handle(_make_record(logging.ERROR, "error"))
+    handler.handle(_make_record(logging.DEBUG, "debug"))
+    handler.handle(_make_record(mod_alogs.TRACE_LEVEL, "trace"))
+    handler.close()
+
+    # --- verify ---
+    assert (tmp_path / "app.log").read_text() == "detail\ninfo\nminimal\n"
+    assert (tmp_path / "app.err.log").read_text() == "warning\nerror\n"
+    assert (tmp_path / "app.debug.log").read_text() == "debug\ntrace\n"
+
+
+def test_dual_file_handler_opens_files_on_first_record(tmp_path: Path) -> None:
+    """Routes that never get a record should not leave empty files behind."""
+    # --- setup ---
+    handler = _make_handler(tmp_path / "app.log")
+
+    # --- execute ---
+    handler.handle(_make_record(logging.INFO, "info"))
+    handler.close()
+
+    # --- verify ---
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["app.log"]
+
+
+def test_dual_file_handler_buffers_until_flush(tmp_path: Path) -> None:
+    """Normal output should be held until flush(); warnings written at once."""
+    # --- setup ---
+    handler = _make_handler(tmp_path / "app.log", flush_interval=60)
+
+    # --- execute ---
+    handler.handle(_make_record(logging.INFO, "held"))
+    held = (tmp_path / "app.log").read_text()
+    handler.handle(_make_record(logging.WARNING, "urgent"))
+    urgent = (tmp_path / "app.err.log").read_text()
+    handler.flush()
+    flushed = (tmp_path / "app.log").read_text()
+    handler.close()
+
+    # --- verify ---
+    assert held == ""
+    assert urgent == "urgent\n"
+    assert flushed == "held\n"
+
+
+def test_dual_file_handler_writes_when_buffer_is_full(tmp_path: Path) -> None:
+    """Reaching buffer_size should write without waiting for a flush."""
+    # --- setup ---
+    handler = _make_handler(tmp_path / "app.log", buffer_size=10, flush_interval=60)
+
+    # --- execute ---
+    handler.handle(_make_record(logging.INFO, "12345"))
+    first = (tmp_path / "app.log").read_text()
+    handler.handle(_make_record(logging.INFO, "67890"))
+    second = (tmp_path / "app.log").read_text()
+    handler.close()
+
+    # --- verify ---
+    assert first == ""
+    assert second == "12345\n67890\n"
+
+
+def test_dual_file_handler_rotates_by_size(tmp_path: Path) -> None:
+    """Files should rotate before passing max_bytes, keeping backup_count."""
+    # --- setup ---
+    path = tmp_path / "app.log"
+    # each record is "record N\n" (9 bytes), so two fit in 20 bytes
+    handler = _make_handler(path, max_bytes=20, backup_count=2, buffer_size=1)
+
+    # --- execute ---
+    for i in range(7):
+        handler.handle(_make_record(logging.INFO, "record %d", i))
+    handler.close()
+
+    # --- verify ---
+    assert path.read_text() == "record 6\n"
+    assert Path(f"{path}.1").read_text() == "record 4\nrecord 5\n"
+    assert Path(f"{path}.2").read_text() == "record 2\nrecord 3\n"
+    assert not Path(f"{path}.3").exists()
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "app.log",
+        "app.log.1",
+        "app.log.2",
+    ]
+
+
+def test_dual_file_handler_counts_existing_file_size(tmp_path: Path) -> None:
+    """An existing file's size should count toward max_bytes."""
+    # --- setup ---
+    path = tmp_path / "app.log"
+    path.write_text("x" * 15 + "\n")
+    handler = _make_handler(path, max_bytes=20)
+
+    # --- execute ---
+    handler.handle(_make_record(logging.INFO, "record 1"))
+    handler.close()
+
+    # --- verify ---
+    assert Path(f"{path}.1").read_text() == "x" * 15 + "\n"
+    assert path.read_text() == "record 1\n"
+
+
+def test_dual_file_handler_rotates_by_time(tmp_path: Path) -> None:
+    """A file should rotate once rotate_interval has passed since it opened."""
+    # --- setup ---
+    path = tmp_path / "app.log"
+    handler = _make_handler(path, rotate_interval=0.05)
+
+    # --- execute ---
+    handler.handle(_make_record(logging.INFO, "before"))
+    time.sleep(0.1)
+    handler.handle(_make_record(logging.INFO, "after"))
+    handler.close()
+
+    # --- verify ---
+    assert Path(f"{path}.1").read_text() == "before\n"
+    assert path.read_text() == "after\n"
+
+
+def test_dual_file_handler_compresses_rotated_files(tmp_path: Path) -> None:
+    """With compress=True, rotated segments should end up gzipped."""
+    # --- setup ---
+    path = tmp_path / "app.log"
+    handler = _make_handler(
+        path, max_bytes=20, backup_count=2, buffer_size=1, compress=True
+    )
+
+    # --- execute ---
+    for i in range(7):
+        handler.handle(_make_record(logging.INFO, "record %d", i))
+    handler.close()
+
+    # --- verify ---
+    assert path.read_text() == "record 6\n"
+    assert gzip.decompress(Path(f"{path}.1.gz").read_bytes()) == (
+        b"record 4\nrecord 5\n"
+    )
+    assert gzip.decompress(Path(f"{path}.2.gz").read_bytes()) == (
+        b"record 2\nrecord 3\n"
+    )
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "app.log",
+        "app.log.1.gz",
+        "app.log.2.gz",
+    ]
+
+
+def test_dual_file_handler_never_writes_color(tmp_path: Path) -> None:
+    """Records should be formatted without ANSI colors."""
+    # --- setup ---
+    handler = mod_alogs.DualFileHandler(tmp_path / "app.log")
+    handler.setFormatter(mod_alogs.TagFormatter("%(message)s"))
+    record = _make_record(logging.DEBUG, "debug")
+    record.enable_color = True
+
+    # --- execute ---
+    handler.handle(record)
+    handler.close()
+
+    # --- verify ---
+    assert (tmp_path / "app.debug.log").read_text() == "[DEBUG] debug\n"
+    assert record.__dict__["enable_color"] is True
+
+
+def test_dual_file_handler_flushes_when_idle(tmp_path: Path) -> None:
+    """Buffered output should be written after flush_interval with no new records."""
+    # --- setup ---
+    handler = _make_handler(tmp_path / "app.log", flush_interval=0.05)
+    path = tmp_path / "app.log"
+
+    # --- execute ---
+    handler.handle(_make_record(logging.INFO, "idle"))
+    deadline = time.monotonic() + 5
+    while path.read_text() == "" and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    # --- verify ---
+    assert path.read_text() == "idle\n"
+    handler.close()
+
+
+def test_dual_file_handler_discard_buffer(tmp_path: Path) -> None:
+    """discardBuffer() should drop buffered output without writing it."""
+    # --- setup ---
+    handler = _make_handler(tmp_path / "app.log", flush_interval=60)
+    handler.handle(_make_record(logging.INFO, "parent output"))
+
+    # --- execute ---
+    handler.discardBuffer()
+    handler.close()
+
+    # --- verify ---
+    assert (tmp_path / "app.log").read_text() == ""
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "match"),
+    [
+        ({"max_bytes": 0}, "max_bytes"),
+        ({"rotate_interval": -1.0}, "rotate_interval"),
+        ({"backup_count": 0}, "backup_count"),
+    ],
+)
+def test_dual_file_handler_rejects_invalid_settings(
+    tmp_path: Path,
+    kwargs: dict[str, Any],
+    match: str,
+) -> None:
+    """Non-positive limits should raise ValueError."""
+    # --- execute and verify ---
+    with pytest.raises(ValueError, match=match):
+        mod_alogs.DualFileHandler(tmp_path / "app.log", **kwargs)
@@ -4,6 +4,8 @@
 import io
 import logging
 import sys
+import threading
+import time
 
 import pytest
 
@@ -299,3 +301,302 @@ def test_dual_stream_handler_test_level_bypasses_capture(
         "WARNING messages should not be in bypass buffer. "
         f"Bypass buffer: {bypass_output[:200]}"
     )
+
+
+@pytest.mark.parametrize(
+    ("level", "expected_route"),
+    [
+        (mod_alogs.apathetic_logging.TEST_LEVEL, "ROUTE_DIAGNOSTIC"),
+        (mod_alogs.apathetic_logging.TRACE_LEVEL, "ROUTE_DIAGNOSTIC"),
+        (logging.DEBUG, "ROUTE_DIAGNOSTIC"),
+        (mod_alogs.apathetic_logging.DETAIL_LEVEL, "ROUTE_STDOUT"),
+        (logging.INFO, "ROUTE_STDOUT"),
+        (mod_alogs.apathetic_logging.MINIMAL_LEVEL, "ROUTE_STDOUT"),
+        (logging.WARNING, "ROUTE_STDERR"),
+        (logging.ERROR, "ROUTE_STDERR"),
+        (logging.CRITICAL, "ROUTE_STDERR"),
+    ],
+)
+def test_dual_stream_handler_route_for_level(level: int, expected_route: str) -> None:
+    """RouteForLevel should map each level class to its route code."""
+    # --- setup ---
+    handler_cls = mod_alogs.apathetic_logging.DualStreamHandler
+
+    # --- execute ---
+    route = handler_cls.routeForLevel(level)
+
+    # --- verify ---
+    assert route == getattr(handler_cls, expected_route)
+
+
+def test_dual_stream_handler_routes_unregistered_levels(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Levels outside the prebuilt table should still route by threshold."""
+    # --- setup ---
+    handler = mod_alogs.apathetic_logging.DualStreamHandler()
+    logger = logging.getLogger("test_unregistered_levels")
+    logger.setLevel(1)
+    logger.addHandler(handler)
+
+    out_buf = io.StringIO()
+    err_buf = io.StringIO()
+
+    # --- execute ---
+    monkeypatch.setattr(sys, "stdout", out_buf)
+    monkeypatch.setattr(sys, "stderr", err_buf)
+    logger.log(logging.INFO + 2, "between info and warning")
+    logger.log(logging.ERROR + 2, "above error")
+    logger.log(logging.DEBUG - 1, "below debug")
+
+    # --- verify ---
+    assert "between info and warning" in out_buf.getvalue()
+    assert "above error" in err_buf.getvalue()
+    assert "below debug" in err_buf.getvalue()
+    assert "above error" not in out_buf.getvalue()
+
+
+def test_dual_stream_handler_test_mode_cache_follows_set_level(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Leaving TEST level should stop the bypass on the very next record."""
+    # --- setup ---
+    logger_name = "test_mode_cache_unique"
+    handler = mod_alogs.apathetic_logging.DualStreamHandler()
+    logger = logging.getLogger(logger_name)
+    # see test_dual_stream_handler_test_level_bypasses_capture for why
+    # logging.getLoggerClass() is used here
+    if not isinstance(logger, logging.getLoggerClass()):
+        logger = mod_alogs.Logger(logger_name)
+    logger.setLevel("test")
+    logger.addHandler(handler)
+
+    err_buf = io.StringIO()
+    bypass_buf = io.StringIO()
+    monkeypatch.setattr(sys, "stderr", err_buf)
+    monkeypatch.setattr(sys, "__stderr__", bypass_buf)
+
+    # --- execute ---
+    logger.debug("while in test mode")
+    logger.setLevel("debug")
+    logger.debug("after leaving test mode")
+
+    # --- verify ---
+    assert "while in test mode" in bypass_buf.getvalue()
+    assert "after leaving test mode" in err_buf.getvalue()
+    assert "after leaving test mode" not in bypass_buf.getvalue()
+
+
+class _CountingStream(io.StringIO):
+    """StringIO that counts write() and flush() calls."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.writes = 0
+        self.flushes = 0
+
+    def write(self, s: str) -> int:
+        self.writes += 1
+        return super().write(s)
+
+    def flush(self) -> None:
+        self.flushes += 1
+        super().flush()
+
+
+def _record(level: int, msg: str) -> logging.LogRecord:
+    return logging.LogRecord("test_buffered", level, "", 0, msg, None, None)
+
+
+def test_dual_stream_handler_buffered_coalesces_writes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Buffered mode should write many records in one call on flush()."""
+    # --- setup ---
+    out_buf = _CountingStream()
+    monkeypatch.setattr(sys, "stdout", out_buf)
+    handler = mod_alogs.DualStreamHandler(buffered=True, flush_interval=60)
+
+    # --- execute ---
+    for i in range(100):
+        handler.handle(_record(logging.INFO, f"line {i}"))
+    held = out_buf.getvalue()
+    handler.flush()
+
+    # --- verify ---
+    assert held == ""
+    assert out_buf.writes == 1
+    assert out_buf.getvalue() == "".join(f"line {i}\n" for i in range(100))
+
+
+def test_dual_stream_handler_buffered_flushes_at_size_threshold(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Reaching buffer_size characters should write the buffer."""
+    # --- setup ---
+    out_buf = _CountingStream()
+    monkeypatch.setattr(sys, "stdout", out_buf)
+    handler = mod_alogs.DualStreamHandler(
+        buffered=True, buffer_size=20, flush_interval=60
+    )
+
+    # --- execute ---
+    handler.handle(_record(logging.INFO, "123456789"))  # 10 chars with newline
+    before = out_buf.getvalue()
+    handler.handle(_record(logging.INFO, "abcdefghi"))  # reaches 20
+
+    # --- verify ---
+    assert before == ""
+    assert out_buf.getvalue() == "123456789\nabcdefghi\n"
+
+
+def test_dual_stream_handler_buffered_flushes_after_interval(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A zero flush_interval should write every record as it arrives."""
+    # --- setup ---
+    out_buf = _CountingStream()
+    monkeypatch.setattr(sys, "stdout", out_buf)
+    handler = mod_alogs.DualStreamHandler(buffered=True, flush_interval=0)
+
+    # --- execute ---
+    handler.handle(_record(logging.INFO, "right away"))
+
+    # --- verify ---
+    assert out_buf.getvalue() == "right away\n"
+
+
+def test_dual_stream_handler_buffered_flushes_when_idle(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Buffered output should be written after flush_interval with no more logs."""
+    # --- setup ---
+    out_buf = _CountingStream()
+    monkeypatch.setattr(sys, "stdout", out_buf)
+    handler = mod_alogs.DualStreamHandler(buffered=True, flush_interval=0.05)
+
+    # --- execute ---
+    handler.handle(_record(logging.INFO, "waiting"))
+    held = out_buf.getvalue()
+    deadline = time.monotonic() + 5
+    while not out_buf.getvalue() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    # --- verify ---
+    assert held == ""
+    assert out_buf.getvalue() == "waiting\n"
+    assert out_buf.writes == 1
+
+
+def test_dual_stream_handler_flusher_thread_exits_after_flush(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """flush() should let the timed flusher thread exit instead of waiting."""
+    # --- setup ---
+    monkeypatch.setattr(sys, "stdout", _CountingStream())
+    handler = mod_alogs.DualStreamHandler(buffered=True, flush_interval=60)
+    before = set(threading.enumerate())
+    handler.handle(_record(logging.INFO, "pending"))
+    flushers = [
+        thread
+        for thread in set(threading.enumerate()) - before
+        if thread.name == "apathetic-logging-flusher"
+    ]
+
+    # --- execute ---
+    handler.flush()
+    for thread in flushers:
+        thread.join(5)
+
+    # --- verify ---
+    assert flushers
+    assert not any(thread.is_alive() for thread in flushers)
+
+
+def test_dual_stream_handler_buffered_warning_flushes_immediately(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """WARNING and above should be written without waiting for a threshold."""
+    # --- setup ---
+    err_buf = _CountingStream()
+    monkeypatch.setattr(sys, "stderr", err_buf)
+    handler = mod_alogs.DualStreamHandler(buffered=True, flush_interval=60)
+
+    # --- execute ---
+    handler.handle(_record(logging.DEBUG, "detail first"))
+    handler.handle(_record(logging.WARNING, "then a warning"))
+
+    # --- verify ---
+    assert err_buf.getvalue() == "detail first\nthen a warning\n"
+    assert err_buf.flushes >= 1
+
+
+def test_dual_stream_handler_buffered_flushes_before_stream_switch(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Switching between stdout and stderr should keep the logged order."""
+    # --- setup ---
+    combined: list[str] = []
+
+    class _SharedStream(io.StringIO):
+        def write(self, s: str) -> int:
+            combined.append(s)
+            return super().write(s)
+
+    monkeypatch.setattr(sys, "stdout", _SharedStream())
+    monkeypatch.setattr(sys, "stderr", _SharedStream())
+    handler = mod_alogs.DualStreamHandler(buffered=True, flush_interval=60)
+
+    # --- execute ---
+    handler.handle(_record(logging.INFO, "out 1"))
+    handler.handle(_record(logging.INFO, "out 2"))
+    handler.handle(_record(logging.DEBUG, "err 1"))
+    handler.handle(_record(logging.INFO, "out 3"))
+    handler.flush()
+
+    # --- verify ---
+    assert combined == ["out 1\nout 2\n", "err 1\n", "out 3\n"]
+
+
+def test_dual_stream_handler_buffered_close_writes_pending(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """close() (and so logging.shutdown()) should write pending output."""
+    # --- setup ---
+    out_buf = _CountingStream()
+    monkeypatch.setattr(sys, "stdout", out_buf)
+    handler = mod_alogs.DualStreamHandler(buffered=True, flush_interval=60)
+    handler.handle(_record(logging.INFO, "pending"))
+
+    # --- execute ---
+    handler.close()
+
+    # --- verify ---
+    assert out_buf.getvalue() == "pending\n"
+
+
+def test_ensure_handlers_uses_registered_buffered_output(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """registerBufferedOutput() should apply to rebuilt handlers."""
+    # --- setup ---
+    out_buf = _CountingStream()
+    monkeypatch.setattr(sys, "stdout", out_buf)
+    logger = mod_alogs.Logger("test_buffered_registered")
+    logger.info("unbuffered")
+    first = logger.handlers[0]
+
+    # --- execute ---
+    mod_alogs.registerBufferedOutput(buffered=True, buffer_size=1024, flush_interval=60)
+    logger.info("buffered")
+    held = out_buf.getvalue()
+    logger.handlers[0].flush()
+
+    # --- verify ---
+    handler = logger.handlers[0]
+    assert handler is not first
+    assert isinstance(handler, mod_alogs.DualStreamHandler)
+    assert handler.buffered is True
+    assert handler.buffer_size == 1024  # noqa: PLR2004
+    assert held == "unbuffered\n"
+    assert out_buf.getvalue() == "unbuffered\nbuffered\n"
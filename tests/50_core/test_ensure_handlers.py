@@ -0,0 +1,116 @@
+# tests/50_core/test_ensure_handlers.py
+"""Tests for Logger.ensureHandlers and the stream epoch fast path."""
+
+import io
+import sys
+from typing import TYPE_CHECKING
+
+import pytest
+
+import apathetic_logging as mod_alogs
+
+
+if TYPE_CHECKING:
+    from apathetic_logging import Logger  # noqa: ICN003
+else:
+    Logger = mod_alogs.Logger
+
+
+def test_ensure_handlers_attaches_dual_stream_handler(
+    direct_logger: Logger,
+) -> None:
+    """First log call should attach a single DualStreamHandler."""
+    # --- execute ---
+    direct_logger.ensureHandlers()
+
+    # --- verify ---
+    assert len(direct_logger.handlers) == 1
+    handler = direct_logger.handlers[0]
+    assert type(handler).__name__ == "DualStreamHandler"
+
+
+def test_ensure_handlers_skipped_in_steady_state(
+    direct_logger: Logger,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """_log should not re-validate handlers once they are attached."""
+    # --- setup ---
+    monkeypatch.setattr(sys, "stdout", io.StringIO())
+    direct_logger.info("warm up")
+    calls: list[int] = []
+    original = direct_logger.ensureHandlers
+
+    def counting_ensure() -> None:
+        calls.append(1)
+        original()
+
+    monkeypatch.setattr(direct_logger, "ensureHandlers", counting_ensure)
+
+    # --- execute ---
+    direct_logger.info("one")
+    direct_logger.info("two")
+
+    # --- verify ---
+    assert calls == []
+
+
+def test_ensure_handlers_rebuilds_after_notify_streams_changed(
+    direct_logger: Logger,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """notifyStreamsChanged() should force a rebuild on the next record."""
+    # --- setup ---
+    monkeypatch.setattr(sys, "stdout", io.StringIO())
+    direct_logger.info("warm up")
+    first_handler = direct_logger.handlers[0]
+
+    # --- execute ---
+    direct_logger.notifyStreamsChanged()
+    direct_logger.info("after notify")
+
+    # --- verify ---
+    assert len(direct_logger.handlers) == 1
+    assert direct_logger.handlers[0] is not first_handler
+
+
+def test_ensure_handlers_rebuilds_when_handlers_cleared(
+    direct_logger: Logger,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Clearing handlers should cause them to be reattached on the next record."""
+    # --- setup ---
+    out_buf = io.StringIO()
+    monkeypatch.setattr(sys, "stdout", out_buf)
+    direct_logger.info("warm up")
+
+    # --- execute ---
+    direct_logger.handlers.clear()
+    direct_logger.info("still logged")
+
+    # --- verify ---
+    assert len(direct_logger.handlers) == 1
+    assert "still logged" in out_buf.getvalue()
+
+
+def test_ensure_handlers_detects_stream_swap_when_called_directly(
+    direct_logger: Logger,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Calling ensureHandlers() after a swap should rebuild and bump the epoch."""
+    # --- setup ---
+    monkeypatch.setattr(sys, "stdout", io.StringIO())
+    direct_logger.ensureHandlers()
+    first_handler = direct_logger.handlers[0]
+    # same class family as direct_logger (matters in singlefile mode)
+    other = type(direct_logger)("test_ensure_handlers_other")
+    other.ensureHandlers()
+    other_handler = other.handlers[0]
+
+    # --- execute ---
+    monkeypatch.setattr(sys, "stdout", io.StringIO())
+    direct_logger.ensureHandlers()
+    other.info("picks up the swap")
+
+    # --- verify ---
+    assert direct_logger.handlers[0] is not first_handler
+    assert other.handlers[0] is not other_handler
@@ -0,0 +1,298 @@
+# tests/50_core/test_flight_recorder_handler.py
+"""Tests for FlightRecorderHandler and the registered flight recorder."""
+
+import logging
+import time
+import uuid
+from pathlib import Path
+
+import pytest
+
+import apathetic_logging as mod_alogs
+
+
+class _ListHandler(logging.Handler):
+    """Collects formatted messages."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.messages: list[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.messages.append(record.getMessage())
+
+
+def _make_record(level: int, msg: str, *args: object) -> logging.LogRecord:
+    return logging.LogRecord("test", level, __file__, 1, msg, args, None)
+
+
+def test_flight_recorder_keeps_last_records_in_order() -> None:
+    """Only the newest ``capacity`` records should be kept, oldest first."""
+    # --- setup ---
+    recorder = mod_alogs.FlightRecorderHandler(_ListHandler(), 3)
+
+    # --- execute ---
+    for i in range(5):
+        recorder.store(_make_record(logging.DEBUG, "record %d", i))
+
+    # --- verify ---
+    assert [r.getMessage() for r in recorder.records()] == [
+        "record 2",
+        "record 3",
+        "record 4",
+    ]
+
+
+def test_flight_recorder_dumps_before_error() -> None:
+    """An ERROR record should write the buffered records first, then itself."""
+    # --- setup ---
+    target = _ListHandler()
+    recorder = mod_alogs.FlightRecorderHandler(target, 10, threshold=logging.INFO)
+
+    # --- execute ---
+    recorder.handle(_make_record(logging.DEBUG, "context 1"))
+    recorder.handle(_make_record(logging.INFO, "normal output"))
+    recorder.handle(_make_record(logging.DEBUG, "context 2"))
+    recorder.handle(_make_record(logging.ERROR, "failure"))
+    recorder.handle(_make_record(logging.ERROR, "second failure"))
+
+    # --- verify ---
+    assert target.messages == [
+        "normal output",
+        "context 1",
+        "context 2",
+        "failure",
+        "second failure",
+    ]
+    assert recorder.records() == []
+
+
+def test_flight_recorder_dumps_to_dump_target() -> None:
+    """Buffered records should go to dump_target when one is given."""
+    # --- setup ---
+    target = _ListHandler()
+    dump_target = _ListHandler()
+    recorder = mod_alogs.FlightRecorderHandler(
+        target, 10, dump_target=dump_target, threshold=logging.INFO
+    )
+
+    # --- execute ---
+    recorder.handle(_make_record(logging.DEBUG, "context"))
+    recorder.handle(_make_record(logging.CRITICAL, "failure"))
+
+    # --- verify ---
+    assert dump_target.messages == ["context"]
+    assert target.messages == ["failure"]
+
+
+def test_flight_recorder_does_not_format_until_dump() -> None:
+    """Stored records should not evaluate their arguments."""
+    # --- setup ---
+    calls: list[int] = []
+    recorder = mod_alogs.FlightRecorderHandler(_ListHandler(), 10)
+
+    def _expensive() -> str:
+        calls.append(1)
+        return "value"
+
+    # --- execute ---
+    recorder.store(_make_record(logging.DEBUG, "x=%s", mod_alogs.lazy(_expensive)))
+
+    # --- verify ---
+    assert calls == []
+    recorder.dump()
+    assert calls == [1]
+
+
+def test_flight_recorder_copies_mutable_args() -> None:
+    """Changing a list argument after storing should not change the dump."""
+    # --- setup ---
+    recorder = mod_alogs.FlightRecorderHandler(_ListHandler(), 10)
+    items = [1]
+    label = "items"
+
+    # --- execute ---
+    recorder.store(_make_record(logging.DEBUG, "%s=%s", label, items))
+    items.append(2)
+
+    # --- verify ---
+    record = recorder.records()[0]
+    assert record.getMessage() == "items=[1]"
+    assert isinstance(record.args, tuple)
+    assert record.args[0] is label
+
+
+def test_flight_recorder_rejects_invalid_capacity() -> None:
+    """A capacity <= 0 should raise ValueError."""
+    # --- execute and verify ---
+    with pytest.raises(ValueError, match=r"Flight recorder capacity"):
+        mod_alogs.FlightRecorderHandler(_ListHandler(), 0)
+
+
+def test_registered_flight_recorder_dumps_trace_context_on_error(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """A logger at INFO should show earlier TRACE/DEBUG records only on error."""
+    # --- setup ---
+    mod_alogs.registerFlightRecorder(enabled=True, capacity=10)
+    logger = mod_alogs.Logger(f"test_recorder_{uuid.uuid4().hex[:6]}")
+    logger.setLevel("info")
+
+    # --- execute ---
+    logger.trace("trace context")
+    logger.debug("debug context")
+    logger.info("normal output")
+    quiet = capsys.readouterr()
+    logger.error("it broke")
+    dumped = capsys.readouterr()
+
+    # --- verify ---
+    assert "trace context" not in quiet.err
+    assert "debug context" not in quiet.err
+    assert "normal output" in quiet.out
+    assert dumped.err.index("trace context") < dumped.err.index("debug context")
+    assert dumped.err.index("debug context") < dumped.err.index("it broke")
+
+
+def test_registered_flight_recorder_keeps_error_if_not_debug_short(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """errorIfNotDebug() should dump the recorder without a traceback at INFO."""
+    # --- setup ---
+    mod_alogs.registerFlightRecorder(enabled=True)
+    logger = mod_alogs.Logger(f"test_recorder_{uuid.uuid4().hex[:6]}")
+    logger.setLevel("info")
+    logger.debug("before the failure")
+
+    # --- execute ---
+    try:
+        msg = "boom"
+        raise ValueError(msg)  # noqa: TRY301
+    except ValueError:
+        logger.errorIfNotDebug("failed")
+
+    # --- verify ---
+    err = capsys.readouterr().err
+    assert "before the failure" in err
+    assert "failed" in err
+    assert "Traceback" not in err
+
+
+def test_registered_flight_recorder_records_reach_no_other_handler() -> None:
+    """Records below the logger level should only go to the recorder."""
+    # --- setup ---
+    mod_alogs.registerFlightRecorder(enabled=True)
+    logger = mod_alogs.Logger(f"test_recorder_{uuid.uuid4().hex[:6]}")
+    logger.setLevel("info")
+    logger.info("build handlers")
+    other = _ListHandler()
+    logger.addHandler(other)
+
+    # --- execute ---
+    logger.debug("recorded only")
+    logger.info("visible")
+
+    # --- verify ---
+    assert other.messages == ["visible"]
+
+
+def test_registered_flight_recorder_writes_dump_file(
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """With dump_path, buffered records should be appended to that file."""
+    # --- setup ---
+    dump_path = tmp_path / "recorder.log"
+    mod_alogs.registerFlightRecorder(enabled=True, dump_path=str(dump_path))
+    logger = mod_alogs.Logger(f"test_recorder_{uuid.uuid4().hex[:6]}")
+    logger.setLevel("info")
+
+    # --- execute ---
+    logger.trace("to the file")
+    logger.error("to stderr")
+    for handler in logger.handlers:
+        handler.close()
+
+    # --- verify ---
+    assert "to the file" in dump_path.read_text()
+    assert "TRACE" in dump_path.read_text()
+    err = capsys.readouterr().err
+    assert "to stderr" in err
+    assert "to the file" not in err
+
+
+def test_flight_recorder_off_keeps_levels_unchanged(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Without a registered recorder, records below the level aren't created."""
+    # --- setup ---
+    logger = mod_alogs.Logger(f"test_recorder_{uuid.uuid4().hex[:6]}")
+    logger.setLevel("info")
+
+    # --- execute ---
+    enabled = logger.isEnabledFor(logging.DEBUG)
+    logger.debug("dropped")
+    logger.error("failure")
+
+    # --- verify ---
+    assert enabled is False
+    assert "dropped" not in capsys.readouterr().err
+
+
+def test_registered_flight_recorder_leaves_is_enabled_for_alone(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """isEnabledFor() should answer for the logger's level with the recorder on."""
+    # --- setup ---
+    mod_alogs.registerFlightRecorder(enabled=True)
+    logger = mod_alogs.Logger(f"test_recorder_{uuid.uuid4().hex[:6]}")
+    logger.setLevel("info")
+
+    # --- execute ---
+    enabled = logger.isEnabledFor(logging.DEBUG)
+    logger.debug("recorded")
+    logger.error("failure")
+
+    # --- verify ---
+    assert enabled is False
+    err = capsys.readouterr().err
+    assert err.index("recorded") < err.index("failure")
+
+
+def test_registered_flight_recorder_makes_records_only_on_dump(
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Calls below the level should create their LogRecord only when dumped."""
+    # --- setup ---
+    mod_alogs.registerFlightRecorder(enabled=True)
+    logger = mod_alogs.Logger(f"test_recorder_{uuid.uuid4().hex[:6]}")
+    logger.setLevel("info")
+    made: list[logging.LogRecord] = []
+    make_record = logger.makeRecord
+
+    def recording(*args: object, **kwargs: object) -> logging.LogRecord:
+        record = make_record(*args, **kwargs)  # type: ignore[arg-type]
+        made.append(record)
+        return record
+
+    monkeypatch.setattr(logger, "makeRecord", recording)
+    items = ["a"]
+
+    # --- execute ---
+    with logger.logContext(request_id="r1"):
+        logger.debug("items=%s", items)
+    called_at = time.time()
+    items.append("b")
+    before_dump = len(made)
+    logger.error("failure")
+
+    # --- verify ---
+    assert before_dump == 0
+    error, recorded = made  # the dump happens while the error is handled
+    assert recorded.getMessage() == "items=['a']"
+    assert recorded.levelno == logging.DEBUG
+    assert recorded.created <= called_at
+    assert recorded.__dict__["request_id"] == "r1"
+    assert error.getMessage() == "failure"
+    assert "items=['a'] [request_id=r1]" in capsys.readouterr().err
@@ -1,7 +1,6 @@
 # tests/50_core/test_get_logger.py
 """Tests for get_logger function."""
 
-import inspect
 import logging
 import sys
 from typing import Any
@@ -32,24 +31,12 @@ def test_get_logger_raises_when_not_registered(monkeypatch: pytest.MonkeyPatch)
     """get_logger() should raise RuntimeError when name not registered."""
     # --- setup ---
     # Mock frame to not have __package__ so inference fails
-    # Frame chain from resolve_logger_name: resolve_logger_name -> get_logger_of_type
-    # -> get_logger -> actual caller
-    # skip_frames=3: initial frame.f_back, then 3 iterations
-    # So we need: frame -> f_back (get_logger_of_type) -> f_back (get_logger)
-    # -> f_back (caller) -> f_back (one more level)
-    frame: Any = type(sys)("frame")
-    get_logger_of_type_frame: Any = type(sys)("get_logger_of_type_frame")
-    get_logger_frame: Any = type(sys)("get_logger_frame")
-    caller_frame: Any = type(sys)("caller_frame")
-    final_frame: Any = type(sys)("final_frame")
-
-    frame.f_back = get_logger_of_type_frame
-    get_logger_of_type_frame.f_back = get_logger_frame
-    get_logger_frame.f_back = caller_frame
-    caller_frame.f_back = final_frame
-    final_frame.f_globals = {}  # No __package__
+    # getLogger passes skip_frames=2 to getLoggerOfType, which passes
+    # skip_frames=3 to getDefaultLoggerName, so it looks up sys._getframe(4)
+    frame: Any = type(sys)("final_frame")
+    frame.f_globals = {}  # No __package__
     mock_frame = MagicMock(return_value=frame)
-    monkeypatch.setattr(inspect, "currentframe", mock_frame)
+    monkeypatch.setattr(sys, "_getframe", mock_frame)
 
     try:
         # --- execute and verify ---
@@ -75,28 +62,17 @@ def test_get_logger_auto_infers_from_caller_package(
     fake_globals = {"__package__": "test_package.submodule"}
 
     # Mock the frame to return our fake caller
-    # Frame chain from resolve_logger_name:
-    # resolve_logger_name -> get_logger_of_type -> get_logger -> actual caller
-    # skip_frames=3: initial frame.f_back, then 3 iterations
-    # So we need: frame -> f_back (get_logger_of_type) -> f_back (get_logger)
-    # -> f_back (caller) -> f_back (one more level)
-    frame: Any = type(sys)("frame")
-    get_logger_of_type_frame: Any = type(sys)("get_logger_of_type_frame")
-    get_logger_frame: Any = type(sys)("get_logger_frame")
-    caller_frame: Any = type(sys)("caller_frame")
-    final_frame: Any = type(sys)("final_frame")
-
-    frame.f_back = get_logger_of_type_frame
-    get_logger_of_type_frame.f_back = get_logger_frame
-    get_logger_frame.f_back = caller_frame
-    caller_frame.f_back = final_frame
-    final_frame.f_globals = fake_globals
+    # getLogger passes skip_frames=2 to getLoggerOfType, which passes
+    # skip_frames=3 to getDefaultLoggerName, so it looks up sys._getframe(4)
+    frame: Any = type(sys)("final_frame")
+    frame.f_globals = fake_globals
     mock_frame = MagicMock(return_value=frame)
-    monkeypatch.setattr(inspect, "currentframe", mock_frame)
+    monkeypatch.setattr(sys, "_getframe", mock_frame)
 
     try:
         result = mod_alogs.getLogger()
         # --- verify ---
+        mock_frame.assert_called_once_with(4)
         assert result.name == "test_package"
         _registry = mod_registry.ApatheticLogging_Internal_RegistryData
         assert _registry.registered_internal_logger_name == "test_package"
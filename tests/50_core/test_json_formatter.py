@@ -0,0 +1,203 @@
+# tests/50_core/test_json_formatter.py
+"""Tests for JsonFormatter and the json output format."""
+
+import io
+import json
+import logging
+import sys
+import uuid
+from typing import Any
+
+import pytest
+
+import apathetic_logging as mod_alogs
+
+
+def _make_record(
+    level: int = logging.INFO,
+    msg: str = "test message",
+    *args: object,
+    **extra: Any,
+) -> logging.LogRecord:
+    record = logging.LogRecord("test.json", level, __file__, 1, msg, args, None)
+    record.__dict__.update(extra)
+    return record
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "plain ascii",
+        'quote " and backslash \\',
+        "newline\nand\ttab\r\b\f",
+        "control \x00\x01\x1f",
+        "unicode héllo ✓ 🧪",
+        "",
+    ],
+)
+def test_json_formatter_encode_string_matches_json(value: str) -> None:
+    """encodeString() should produce JSON that decodes to the same string."""
+    # --- execute ---
+    encoded = mod_alogs.JsonFormatter.encodeString(value)
+
+    # --- verify ---
+    assert json.loads(encoded) == value
+    assert "\n" not in encoded
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (42, 42),
+        (1.5, 1.5),
+        (True, True),
+        (False, False),
+        (None, None),
+        ([1, "a"], [1, "a"]),
+        ({"k": "v"}, {"k": "v"}),
+        (float("nan"), "nan"),
+    ],
+)
+def test_json_formatter_encode_value(value: Any, expected: Any) -> None:
+    """encodeValue() should produce valid JSON for common value types."""
+    # --- execute and verify ---
+    assert json.loads(mod_alogs.JsonFormatter.encodeValue(value)) == expected
+
+
+def test_json_formatter_encode_value_falls_back_to_str() -> None:
+    """Values json can't serialize should be written with str()."""
+
+    # --- setup ---
+    class _Opaque:
+        def __str__(self) -> str:
+            return "opaque"
+
+    # --- execute and verify ---
+    assert json.loads(mod_alogs.JsonFormatter.encodeValue(_Opaque())) == "opaque"
+
+
+def test_json_formatter_writes_default_fields() -> None:
+    """format() should write time, level, logger and the merged message."""
+    # --- setup ---
+    formatter = mod_alogs.JsonFormatter()
+    record = _make_record(logging.WARNING, "count=%d", 3)
+
+    # --- execute ---
+    data = json.loads(formatter.format(record))
+
+    # --- verify ---
+    assert list(data) == ["time", "level", "logger", "message"]
+    assert data["time"] == record.created
+    assert data["level"] == "WARNING"
+    assert data["logger"] == "test.json"
+    assert data["message"] == "count=3"
+
+
+@pytest.mark.parametrize("level_name", ["TRACE", "DETAIL", "MINIMAL", "TEST"])
+def test_json_formatter_uses_custom_level_names(level_name: str) -> None:
+    """Custom levels should be written with their registered names."""
+    # --- setup ---
+    formatter = mod_alogs.JsonFormatter()
+    level = mod_alogs.getLevelNumber(level_name)
+    record = _make_record(level)
+
+    # --- execute ---
+    data = json.loads(formatter.format(record))
+
+    # --- verify ---
+    assert data["level"] == level_name
+
+
+def test_json_formatter_includes_extras() -> None:
+    """extra= values should be written after the plan fields."""
+    # --- setup ---
+    formatter = mod_alogs.JsonFormatter()
+    record = _make_record(request_id="abc", attempt=2, enable_color=True)
+
+    # --- execute ---
+    data = json.loads(formatter.format(record))
+
+    # --- verify ---
+    assert data["request_id"] == "abc"
+    assert data["attempt"] == 2  # noqa: PLR2004
+    assert "enable_color" not in data
+    assert "lineno" not in data
+
+
+def test_json_formatter_custom_fields_and_no_extras() -> None:
+    """Custom fields should replace the defaults, in order."""
+    # --- setup ---
+    formatter = mod_alogs.JsonFormatter(
+        {"msg": "message", "lvl": "levelno", "line": "lineno"}, extras=False
+    )
+    record = _make_record(logging.ERROR, user="someone")
+
+    # --- execute ---
+    data = json.loads(formatter.format(record))
+
+    # --- verify ---
+    assert data == {"msg": "test message", "lvl": logging.ERROR, "line": 1}
+
+
+def test_json_formatter_includes_exception() -> None:
+    """A record with exc_info should include the formatted traceback."""
+    # --- setup ---
+    formatter = mod_alogs.JsonFormatter()
+    try:
+        msg = "boom"
+        raise ValueError(msg)  # noqa: TRY301
+    except ValueError:
+        record = _make_record(logging.ERROR)
+        record.exc_info = sys.exc_info()
+
+    # --- execute ---
+    data = json.loads(formatter.format(record))
+
+    # --- verify ---
+    assert "Traceback" in data["exc_info"]
+    assert "ValueError: boom" in data["exc_info"]
+
+
+def test_ensure_handlers_attaches_json_formatter_when_registered(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """The json output format should write one JSON object per record."""
+    # --- setup ---
+    out_buf = io.StringIO()
+    err_buf = io.StringIO()
+    monkeypatch.setattr(sys, "stdout", out_buf)
+    monkeypatch.setattr(sys, "stderr", err_buf)
+    mod_alogs.registerOutputFormat(output_format="json")
+    logger = mod_alogs.Logger(f"test_json_{uuid.uuid4().hex[:6]}")
+    logger.setLevel("trace")
+
+    # --- execute ---
+    logger.info("hello %s", "world", extra={"job": 7})
+    logger.trace("tracing")
+
+    # --- verify ---
+    assert isinstance(logger.handlers[0].formatter, mod_alogs.JsonFormatter)
+    out = json.loads(out_buf.getvalue())
+    assert out["message"] == "hello world"
+    assert out["job"] == 7  # noqa: PLR2004
+    err = json.loads(err_buf.getvalue())
+    assert err["level"] == "TRACE"
+    assert "\033[" not in err_buf.getvalue()
+
+
+def test_ensure_handlers_switches_back_to_text(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Going back to text should attach a TagFormatter on the next record."""
+    # --- setup ---
+    monkeypatch.setattr(sys, "stdout", io.StringIO())
+    mod_alogs.registerOutputFormat(output_format="json")
+    logger = mod_alogs.Logger(f"test_json_{uuid.uuid4().hex[:6]}")
+    logger.info("json")
+
+    # --- execute ---
+    mod_alogs.registerOutputFormat(output_format="text")
+    logger.info("text")
+
+    # --- verify ---
+    assert isinstance(logger.handlers[0].formatter, mod_alogs.TagFormatter)
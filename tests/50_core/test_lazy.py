@@ -0,0 +1,150 @@
+# tests/50_core/test_lazy.py
+"""Tests for lazy() message arguments and messages."""
+
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+import apathetic_logging as mod_alogs
+
+
+if TYPE_CHECKING:
+    from apathetic_logging import Logger  # noqa: ICN003
+else:
+    Logger = mod_alogs.Logger
+
+
+def _counting(value: Any, calls: list[int]) -> Any:
+    calls.append(1)
+    return value
+
+
+def test_lazy_not_evaluated_when_level_disabled(
+    capsys: pytest.CaptureFixture[str],
+    direct_logger: Logger,
+) -> None:
+    """Lazy args and messages should not run below the logger level."""
+    # --- setup ---
+    direct_logger.setLevel("info")
+    calls: list[int] = []
+
+    # --- execute ---
+    direct_logger.trace("payload=%s", mod_alogs.lazy(_counting, "big", calls))
+    direct_logger.detail(mod_alogs.lazy(_counting, "detail msg", calls))
+    direct_logger.test("payload=%s", mod_alogs.lazy(_counting, "big", calls))
+    direct_logger.logDynamic("debug", mod_alogs.lazy(_counting, "dynamic", calls))
+
+    # --- verify ---
+    assert calls == []
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert captured.err == ""
+
+
+def test_lazy_evaluated_once_when_enabled(
+    capsys: pytest.CaptureFixture[str],
+    direct_logger: Logger,
+) -> None:
+    """An enabled record should compute the lazy value exactly once."""
+    # --- setup ---
+    direct_logger.setLevel("trace")
+    calls: list[int] = []
+
+    # --- execute ---
+    direct_logger.trace("payload=%s", mod_alogs.lazy(_counting, {"a": 1}, calls))
+
+    # --- verify ---
+    assert calls == [1]
+    assert "payload={'a': 1}" in capsys.readouterr().err
+
+
+def test_lazy_message_is_evaluated_when_enabled(
+    capsys: pytest.CaptureFixture[str],
+    direct_logger: Logger,
+) -> None:
+    """A lazy() msg should be replaced by its value."""
+    # --- setup ---
+    direct_logger.setLevel("detail")
+
+    # --- execute ---
+    direct_logger.detail(mod_alogs.lazy(lambda: "computed detail"))
+    direct_logger.logDynamic("info", mod_alogs.lazy(lambda: "computed info"))
+
+    # --- verify ---
+    out = capsys.readouterr().out
+    assert "computed detail" in out
+    assert "computed info" in out
+
+
+class _Payload:
+    pass
+
+
+def _takes_an_arg(value: object) -> object:
+    return value
+
+
+def test_plain_callable_messages_are_logged_as_is(
+    capsys: pytest.CaptureFixture[str],
+    direct_logger: Logger,
+) -> None:
+    """Callables not wrapped in lazy() should be logged like the stdlib does."""
+    # --- setup ---
+    direct_logger.setLevel("info")
+
+    # --- execute ---
+    direct_logger.info(_Payload)
+    direct_logger.warning(_takes_an_arg)
+
+    # --- verify ---
+    captured = capsys.readouterr()
+    assert captured.out == f"{_Payload!r}\n"
+    assert f"{_takes_an_arg!r}" in captured.err
+    assert "Logging error" not in captured.err
+
+
+def test_log_dynamic_skips_disabled_levels(
+    capsys: pytest.CaptureFixture[str],
+    direct_logger: Logger,
+) -> None:
+    """logDynamic() should respect the logger level like the level methods."""
+    # --- setup ---
+    direct_logger.setLevel("warning")
+
+    # --- execute ---
+    direct_logger.logDynamic("info", "should not appear")
+
+    # --- verify ---
+    assert "should not appear" not in capsys.readouterr().out
+
+
+@pytest.mark.parametrize(
+    ("fmt", "value", "expected"),
+    [
+        ("%s", [1, 2], "[1, 2]"),
+        ("%r", "text", "'text'"),
+        ("%d", 42, "42"),
+        ("%x", 255, "ff"),
+        ("%.1f", 1.25, "1.2"),
+    ],
+)
+def test_lazy_supports_percent_formats(
+    fmt: str,
+    value: Any,
+    expected: str,
+) -> None:
+    """Lazy should format like the value it wraps."""
+    # --- execute ---
+    result = fmt % (mod_alogs.lazy(lambda: value),)
+
+    # --- verify ---
+    assert result == expected
+
+
+def test_lazy_supports_format_spec() -> None:
+    """Lazy should pass str.format specs through to the value."""
+    # --- execute ---
+    result = f"{mod_alogs.lazy(lambda: 3.14159):.2f}"
+
+    # --- verify ---
+    assert result == "3.14"
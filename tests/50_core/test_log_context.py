@@ -0,0 +1,233 @@
+# tests/50_core/test_log_context.py
+"""Tests for logContext(), bind() and context fields on records."""
+
+import asyncio
+import logging
+import threading
+import uuid
+from typing import TYPE_CHECKING
+
+import pytest
+
+import apathetic_logging as mod_alogs
+
+
+if TYPE_CHECKING:
+    from apathetic_logging import Logger  # noqa: ICN003
+else:
+    Logger = mod_alogs.Logger
+
+
+class _ListHandler(logging.Handler):
+    """Collects records."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+
+@pytest.fixture(autouse=True)
+def clean_context() -> None:
+    """Start every test without bound fields."""
+    mod_alogs.clearLogContext()
+
+
+def _make_logger() -> tuple[Logger, _ListHandler]:
+    logger = mod_alogs.Logger(f"test_context_{uuid.uuid4().hex[:6]}")
+    logger.setLevel("info")
+    logger.ensureHandlers()
+    handler = _ListHandler()
+    logger.handlers = [handler]
+    return logger, handler
+
+
+def test_log_context_adds_fields_inside_block_only() -> None:
+    """Fields should be on records inside the block and gone after it."""
+    # --- setup ---
+    logger, handler = _make_logger()
+
+    # --- execute ---
+    with mod_alogs.logContext(request_id="abc") as fields:
+        logger.info("inside")
+    logger.info("outside")
+
+    # --- verify ---
+    inside, outside = handler.records
+    assert dict(fields) == {"request_id": "abc"}
+    assert inside.request_id == "abc"  # type: ignore[attr-defined]
+    assert inside.log_context == {"request_id": "abc"}  # type: ignore[attr-defined]
+    assert not hasattr(outside, "request_id")
+    assert not hasattr(outside, "log_context")
+    assert dict(mod_alogs.getLogContext()) == {}
+
+
+def test_nested_blocks_and_bind_restore_outer_fields() -> None:
+    """Inner blocks and bind() inside them should not outlive the block."""
+    # --- setup ---
+    logger, handler = _make_logger()
+
+    # --- execute ---
+    with logger.logContext(request_id="abc"):
+        with logger.logContext(job=1):
+            logger.bind(user="u1")
+            logger.info("inner")
+        logger.info("outer")
+
+    # --- verify ---
+    inner, outer = handler.records
+    assert inner.log_context == {"request_id": "abc", "job": 1, "user": "u1"}  # type: ignore[attr-defined]
+    assert outer.log_context == {"request_id": "abc"}  # type: ignore[attr-defined]
+
+
+def test_bind_and_unbind() -> None:
+    """bind() should persist until unbind() removes the field."""
+    # --- setup ---
+    logger, handler = _make_logger()
+
+    # --- execute ---
+    logger.bind(request_id="abc", user="u1")
+    logger.info("bound")
+    logger.unbind("user", "missing")
+    logger.info("unbound")
+
+    # --- verify ---
+    bound, unbound = handler.records
+    assert bound.user == "u1"  # type: ignore[attr-defined]
+    assert not hasattr(unbound, "user")
+    assert unbound.request_id == "abc"  # type: ignore[attr-defined]
+
+
+def test_records_in_one_context_share_the_mapping() -> None:
+    """The context dict should be attached, not copied, per record."""
+    # --- setup ---
+    logger, handler = _make_logger()
+
+    # --- execute ---
+    with mod_alogs.logContext(request_id="abc"):
+        logger.info("one")
+        logger.info("two")
+
+    # --- verify ---
+    one, two = handler.records
+    assert one.log_context is two.log_context  # type: ignore[attr-defined]
+
+
+def test_extra_and_record_attributes_win_over_context() -> None:
+    """extra= values and built-in record attributes should not be replaced."""
+    # --- setup ---
+    logger, handler = _make_logger()
+
+    # --- execute ---
+    with mod_alogs.logContext(request_id="ctx", name="ctx"):
+        logger.info("msg", extra={"request_id": "extra"})
+
+    # --- verify ---
+    record = handler.records[0]
+    assert record.request_id == "extra"  # type: ignore[attr-defined]
+    assert record.name == logger.name
+
+
+def test_tag_formatter_renders_context() -> None:
+    """TagFormatter should append the bound fields to the message."""
+    # --- setup ---
+    formatter = mod_alogs.TagFormatter("%(message)s")
+    logger, handler = _make_logger()
+
+    # --- execute ---
+    with mod_alogs.logContext(request_id="abc", job=3):
+        logger.info("hello")
+    logger.info("plain")
+
+    # --- verify ---
+    with_context, plain = handler.records
+    assert formatter.format(with_context) == "hello [request_id=abc job=3]"
+    assert formatter.format(plain) == "plain"
+
+
+def test_json_formatter_renders_context_fields() -> None:
+    """JsonFormatter should write bound fields like extra= values."""
+    # --- setup ---
+    formatter = mod_alogs.JsonFormatter()
+    logger, handler = _make_logger()
+
+    # --- execute ---
+    with mod_alogs.logContext(request_id="abc"):
+        logger.info("hello")
+
+    # --- verify ---
+    line = formatter.format(handler.records[0])
+    assert '"request_id":"abc"' in line
+    assert "log_context" not in line
+
+
+def test_context_is_isolated_between_asyncio_tasks() -> None:
+    """Each task should log with the fields it bound itself."""
+    # --- setup ---
+    logger, handler = _make_logger()
+
+    async def work(request_id: str) -> None:
+        logger.bind(request_id=request_id)
+        await asyncio.sleep(0)
+        logger.info("task")
+
+    async def main() -> None:
+        with mod_alogs.logContext(parent=True):
+            await asyncio.gather(*(work(f"r{i}") for i in range(5)))
+        logger.info("main")
+
+    # --- execute ---
+    asyncio.run(main())
+
+    # --- verify ---
+    *tasks, main_record = handler.records
+    assert sorted(r.request_id for r in tasks) == [f"r{i}" for i in range(5)]  # type: ignore[attr-defined]
+    assert all(r.parent is True for r in tasks)  # type: ignore[attr-defined]
+    assert not hasattr(main_record, "request_id")
+
+
+def test_context_is_isolated_between_threads() -> None:
+    """Fields bound on one thread should not appear on another."""
+    # --- setup ---
+    logger, handler = _make_logger()
+    bound = threading.Event()
+    logged = threading.Event()
+
+    def other() -> None:
+        bound.wait(timeout=5)
+        logger.info("other thread")
+        logged.set()
+
+    thread = threading.Thread(target=other)
+    thread.start()
+
+    # --- execute ---
+    logger.bind(request_id="main")
+    bound.set()
+    logged.wait(timeout=5)
+    thread.join(timeout=5)
+    logger.info("main thread")
+
+    # --- verify ---
+    other_record, main_record = handler.records
+    assert not hasattr(other_record, "request_id")
+    assert main_record.request_id == "main"  # type: ignore[attr-defined]
+
+
+def test_process_payload_keeps_context() -> None:
+    """Records sent to a ProcessLogListener should keep their context."""
+    # --- setup ---
+    logger, handler = _make_logger()
+    sender = mod_alogs.ProcessQueueHandler(queue=None)
+
+    # --- execute ---
+    with mod_alogs.logContext(request_id="abc"):
+        logger.info("hello")
+    payload = sender.prepare(handler.records[0])
+    record = mod_alogs.ProcessLogListener.makeRecord(payload)
+
+    # --- verify ---
+    assert record.request_id == "abc"  # type: ignore[attr-defined]
+    assert record.log_context == {"request_id": "abc"}  # type: ignore[attr-defined]
@@ -0,0 +1,224 @@
+# tests/50_core/test_logger_asyncio.py
+"""Tests for the awaitable Logger methods (alog(), ainfo(), ...)."""
+
+import asyncio
+import logging
+import threading
+import uuid
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+import apathetic_logging as mod_alogs
+
+
+if TYPE_CHECKING:
+    from apathetic_logging import Logger  # noqa: ICN003
+else:
+    Logger = mod_alogs.Logger
+
+
+class _GatedHandler(logging.Handler):
+    """Collects messages, blocking each write until the gate is opened."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.messages: list[str] = []
+        self.threads: list[threading.Thread] = []
+        self.started = threading.Event()
+        self.gate = threading.Event()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.threads.append(threading.current_thread())
+        self.started.set()
+        self.gate.wait(timeout=5)
+        self.messages.append(record.getMessage())
+
+
+def _make_logger(level: str) -> Logger:
+    # not direct_logger: in singlefile mode it comes from the installed copy
+    logger = mod_alogs.Logger(f"test_alog_{uuid.uuid4().hex[:6]}")
+    logger.setLevel(level)
+    return logger
+
+
+def _counting(value: Any, calls: list[int]) -> Any:
+    calls.append(1)
+    return value
+
+
+def test_ainfo_and_awarning_keep_stream_routing(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Awaitable methods should route like the sync ones once written."""
+    # --- setup ---
+    logger = _make_logger("info")
+
+    async def main() -> None:
+        await logger.ainfo("to stdout %d", 1)
+        await logger.awarning("to stderr %d", 2)
+        await logger.adebug("hidden")
+
+    # --- execute ---
+    asyncio.run(main())
+    mod_alogs.stopAsyncWriter()
+
+    # --- verify ---
+    captured = capsys.readouterr()
+    assert "to stdout 1" in captured.out
+    assert "to stdout 1" not in captured.err
+    assert "to stderr 2" in captured.err
+    assert "to stderr 2" not in captured.out
+    assert "hidden" not in captured.out + captured.err
+
+
+def test_alog_skips_disabled_levels_without_evaluating(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Disabled awaitable calls should not evaluate lazy values."""
+    # --- setup ---
+    logger = _make_logger("warning")
+    calls: list[int] = []
+
+    async def main() -> None:
+        await logger.atrace("x=%s", mod_alogs.lazy(_counting, 1, calls))
+        await logger.ainfo(mod_alogs.lazy(_counting, "msg", calls))
+        await logger.alog("debug", "x=%s", mod_alogs.lazy(_counting, 1, calls))
+
+    # --- execute ---
+    asyncio.run(main())
+    mod_alogs.stopAsyncWriter()
+
+    # --- verify ---
+    assert calls == []
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert captured.err == ""
+
+
+def test_alog_resolves_string_levels_and_merges_args(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """alog() should accept level names and snapshot the arguments."""
+    # --- setup ---
+    logger = _make_logger("detail")
+    items = ["before"]
+
+    async def main() -> None:
+        await logger.alog("detail", "items=%s", items)
+        items.append("after")
+
+    # --- execute ---
+    asyncio.run(main())
+    mod_alogs.stopAsyncWriter()
+
+    # --- verify ---
+    assert "items=['before']" in capsys.readouterr().out
+
+
+def test_alog_writes_on_writer_thread() -> None:
+    """Records should be written by the shared writer, not the loop thread."""
+    # --- setup ---
+    logger = _make_logger("info")
+    logger.ensureHandlers()
+    target = _GatedHandler()
+    target.gate.set()
+    logger.handlers = [target]
+
+    # --- execute ---
+    asyncio.run(logger.ainfo("hello"))
+    mod_alogs.stopAsyncWriter()
+
+    # --- verify ---
+    assert target.messages == ["hello"]
+    assert target.threads[0] is not threading.main_thread()
+
+
+def test_alog_backpressure_does_not_block_the_loop() -> None:
+    """A full "block" queue should make the caller wait, not the whole loop."""
+    # --- setup ---
+    mod_alogs.registerAsyncMode(async_mode=None, queue_size=1, overflow="block")
+    logger = _make_logger("info")
+    logger.ensureHandlers()
+    target = _GatedHandler()
+    logger.handlers = [target]
+    ticks: list[int] = []
+
+    async def ticker(done: asyncio.Event) -> None:
+        while not done.is_set():
+            ticks.append(1)
+            await asyncio.sleep(0.001)
+
+    async def main() -> None:
+        done = asyncio.Event()
+        tick_task = asyncio.create_task(ticker(done))
+        # first record occupies the writer, second fills the queue
+        await logger.ainfo("first")
+        await asyncio.to_thread(target.started.wait, 5)
+        await logger.ainfo("second")
+        ticks.clear()
+        waiting = asyncio.create_task(logger.ainfo("third"))
+        await asyncio.sleep(0.05)
+        # the third record is waiting for room while the ticker keeps running
+        assert not waiting.done()
+        assert len(ticks) > 1
+        target.gate.set()
+        await waiting
+        done.set()
+        await tick_task
+
+    # --- execute ---
+    asyncio.run(main())
+    mod_alogs.stopAsyncWriter()
+
+    # --- verify ---
+    assert target.messages == ["first", "second", "third"]
+
+
+def test_alog_with_async_mode_does_not_deadlock(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """alog() through an AsyncQueueHandler should write, not requeue forever."""
+    # --- setup ---
+    mod_alogs.registerAsyncMode(async_mode=True, queue_size=1)
+    logger = _make_logger("info")
+
+    async def main() -> None:
+        for i in range(5):
+            await logger.ainfo("message %d", i)
+
+    # --- execute ---
+    asyncio.run(main())
+    mod_alogs.stopAsyncWriter(timeout=5)
+
+    # --- verify ---
+    out = capsys.readouterr().out
+    for i in range(5):
+        assert f"message {i}" in out
+
+
+def test_stop_async_writer_writes_queued_alog_records_itself() -> None:
+    """Records queued by alog() in async mode should not start a new writer."""
+    # --- setup ---
+    mod_alogs.registerAsyncMode(async_mode=True)
+    logger = _make_logger("info")
+    logger.ensureHandlers()
+    target = _GatedHandler()
+    logger.handlers = [mod_alogs.AsyncQueueHandler(target)]
+
+    async def main() -> None:
+        for i in range(3):
+            await logger.ainfo("message %d", i)
+
+    # --- execute ---
+    asyncio.run(main())
+    # the first record holds the writer until the gate opens
+    target.started.wait(5)
+    opener = threading.Timer(0.05, target.gate.set)
+    opener.start()
+    mod_alogs.stopAsyncWriter(timeout=5)
+    opener.join()
+
+    # --- verify ---
+    assert target.messages == ["message 0", "message 1", "message 2"]
+    assert len(set(target.threads)) == 1
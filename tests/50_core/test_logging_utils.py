@@ -115,6 +115,73 @@ def test_get_level_number_unknown_level_raises() -> None:
         mod_alogs.getLevelNumber("INVALID")
 
 
+# ---------------------------------------------------------------------------
+# Tests for the level name/number cache
+# ---------------------------------------------------------------------------
+
+
+def test_get_level_number_cached_lookup_skips_logging_module(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A repeated lookup should not touch the logging module attributes."""
+    # --- setup ---
+    assert mod_alogs.getLevelNumber("detail") == mod_alogs.DETAIL_LEVEL
+    # a stale attribute would change the answer if it were read again
+    monkeypatch.setattr(logging, "DETAIL", mod_alogs.DETAIL_LEVEL + 1)
+
+    # --- execute ---
+    result = mod_alogs.getLevelNumber("detail")
+
+    # --- verify ---
+    assert result == mod_alogs.DETAIL_LEVEL
+
+
+def test_add_level_name_invalidates_level_cache() -> None:
+    """Registering a level should make it resolvable in both directions."""
+    # --- setup ---
+    level_value = 23
+    level_name = "CACHE_CHECK"
+    validate_test_level(level_value)
+    with pytest.raises(ValueError, match=r"Unknown log level"):
+        mod_alogs.getLevelNumber(level_name)
+    assert mod_alogs.getLevelName(level_value) == f"Level {level_value}"
+
+    # --- execute ---
+    try:
+        mod_alogs.Logger.addLevelName(level_value, level_name)
+
+        # --- verify ---
+        assert mod_alogs.getLevelNumber(level_name.lower()) == level_value
+        assert mod_alogs.getLevelName(level_value) == level_name
+    finally:
+        delattr(logging, level_name)
+        logging._levelToName.pop(level_value, None)  # noqa: SLF001
+        logging._nameToLevel.pop(level_name, None)  # noqa: SLF001
+        mod_alogs.invalidateLevelNameCache()
+
+
+def test_std_add_level_name_invalidates_level_name_cache() -> None:
+    """The camelCase addLevelName() wrapper should refresh cached names."""
+    # --- setup ---
+    level_value = 27
+    validate_test_level(level_value)
+    assert mod_alogs.getLevelName(level_value) == f"Level {level_value}"
+    mod_alogs.addLevelName(level_value, "FIRST_NAME")
+    assert mod_alogs.getLevelName(level_value) == "FIRST_NAME"
+
+    # --- execute ---
+    try:
+        mod_alogs.addLevelName(level_value, "SECOND_NAME")
+
+        # --- verify ---
+        assert mod_alogs.getLevelName(level_value) == "SECOND_NAME"
+    finally:
+        logging._levelToName.pop(level_value, None)  # noqa: SLF001
+        logging._nameToLevel.pop("FIRST_NAME", None)  # noqa: SLF001
+        logging._nameToLevel.pop("SECOND_NAME", None)  # noqa: SLF001
+        mod_alogs.invalidateLevelNameCache()
+
+
 # ---------------------------------------------------------------------------
 # Tests for snake_case wrappers
 # ---------------------------------------------------------------------------
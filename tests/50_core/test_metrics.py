@@ -0,0 +1,272 @@
+# tests/50_core/test_metrics.py
+"""Tests for logging metrics: counters, handler timings and exporters."""
+
+import logging
+import math
+import threading
+import uuid
+from collections.abc import Generator
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+import apathetic_logging as mod_alogs
+
+
+if TYPE_CHECKING:
+    from apathetic_logging import Logger  # noqa: ICN003
+else:
+    Logger = mod_alogs.Logger
+
+
+class _ListHandler(logging.Handler):
+    """Collects records."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+
+@pytest.fixture(autouse=True)
+def clean_stats() -> Generator[None, None, None]:
+    """Start and end every test with no counters."""
+    mod_alogs.resetLoggingStats()
+    yield
+    mod_alogs.resetLoggingStats()
+
+
+def _make_logger(level: str = "info") -> tuple[Logger, _ListHandler]:
+    logger = mod_alogs.Logger(f"test_metrics_{uuid.uuid4().hex[:6]}")
+    logger.setLevel(level)
+    logger.ensureHandlers()
+    handler = _ListHandler()
+    logger.handlers = [handler]
+    return logger, handler
+
+
+def test_counts_emitted_and_dropped_by_level() -> None:
+    """Records should be counted per level as emitted or dropped by level."""
+    # --- setup ---
+    mod_alogs.registerMetrics(enabled=True)
+    logger, handler = _make_logger("info")
+
+    # --- execute ---
+    for _ in range(3):
+        logger.info("kept")
+        logger.debug("dropped")
+    logger.warning("kept")
+
+    # --- verify ---
+    stats = mod_alogs.getLoggingStats()["loggers"][logger.name]
+    assert stats["INFO"]["emitted"] == 3  # noqa: PLR2004
+    assert stats["DEBUG"]["dropped_level"] == 3  # noqa: PLR2004
+    assert stats["DEBUG"]["emitted"] == 0
+    assert stats["WARNING"]["emitted"] == 1
+    assert len(handler.records) == 4  # noqa: PLR2004
+
+
+def test_level_drops_cached_before_enabling_are_counted() -> None:
+    """isEnabledFor() answers cached before registerMetrics() still count."""
+    # --- setup ---
+    logger = mod_alogs.getLogger(f"test_metrics_{uuid.uuid4().hex[:6]}", level="info")
+    logger.debug("cached as disabled")
+
+    # --- execute ---
+    mod_alogs.registerMetrics(enabled=True)
+    logger.debug("dropped")
+
+    # --- verify ---
+    stats = mod_alogs.getLoggingStats()["loggers"][logger.name]
+    assert stats["DEBUG"]["dropped_level"] == 1
+
+
+def test_is_enabled_for_guards_are_not_counted() -> None:
+    """isEnabledFor() checks should stay cached and never count as drops."""
+    # --- setup ---
+    mod_alogs.registerMetrics(enabled=True)
+    logger, _handler = _make_logger("info")
+
+    # --- execute ---
+    enabled = [logger.isEnabledFor(logging.DEBUG) for _ in range(3)]
+
+    # --- verify ---
+    assert enabled == [False, False, False]
+    assert logger._cache[logging.DEBUG] is False  # type: ignore[attr-defined]  # noqa: SLF001
+    stats = mod_alogs.getLoggingStats()["loggers"].get(logger.name, {})
+    assert stats.get("DEBUG", {}).get("dropped_level", 0) == 0
+
+
+def test_counts_filter_and_sampling_drops() -> None:
+    """Filtered and sampled-out records should have their own counters."""
+    # --- setup ---
+    mod_alogs.registerMetrics(enabled=True)
+    logger, handler = _make_logger("trace")
+    logger.addFilter(lambda record: record.getMessage() != "secret")
+    mod_alogs.registerSampling({"trace": 0.0})
+
+    # --- execute ---
+    logger.info("secret")
+    logger.info("public")
+    logger.trace("sampled out")
+
+    # --- verify ---
+    stats = mod_alogs.getLoggingStats()["loggers"][logger.name]
+    assert stats["INFO"]["dropped_filter"] == 1
+    assert stats["INFO"]["emitted"] == 1
+    assert stats["TRACE"]["dropped_sampled"] == 1
+    assert [r.getMessage() for r in handler.records] == ["public"]
+
+
+def test_nothing_counted_when_disabled() -> None:
+    """With metrics off, logging should leave no counters or timings."""
+    # --- setup ---
+    logger, _ = _make_logger("info")
+
+    # --- execute ---
+    logger.info("kept")
+    logger.debug("dropped")
+
+    # --- verify ---
+    assert mod_alogs.getLoggingStats() == {"loggers": {}, "handlers": {}}
+
+
+def test_dual_stream_handler_write_times(capsys: pytest.CaptureFixture[str]) -> None:
+    """DualStreamHandler writes should land in a cumulative histogram."""
+    # --- setup ---
+    mod_alogs.registerMetrics(enabled=True)
+    logger = mod_alogs.getLogger(f"test_metrics_{uuid.uuid4().hex[:6]}", level="info")
+
+    # --- execute ---
+    for i in range(5):
+        logger.info("line %d", i)
+
+    # --- verify ---
+    assert capsys.readouterr().out.count("line") == 5  # noqa: PLR2004
+    handlers = mod_alogs.getLoggingStats()["handlers"]
+    histogram = handlers["DualStreamHandler"]
+    assert histogram["count"] == 5  # noqa: PLR2004
+    assert histogram["sum"] > 0
+    counts = list(histogram["buckets"].values())
+    assert counts == sorted(counts)
+    assert histogram["buckets"][math.inf] == 5  # noqa: PLR2004
+
+
+def test_counts_from_threads_are_merged() -> None:
+    """Each thread's counters should be added up by getLoggingStats()."""
+    # --- setup ---
+    mod_alogs.registerMetrics(enabled=True)
+    logger, _ = _make_logger("info")
+    threads_count = 4
+    per_thread = 250
+
+    def work() -> None:
+        for _ in range(per_thread):
+            logger.info("x")
+
+    threads = [threading.Thread(target=work) for _ in range(threads_count)]
+
+    # --- execute ---
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # --- verify ---
+    stats = mod_alogs.getLoggingStats()["loggers"][logger.name]
+    assert stats["INFO"]["emitted"] == threads_count * per_thread
+
+
+def test_shards_of_finished_threads_are_folded() -> None:
+    """Short-lived threads shouldn't each leave a shard behind."""
+    # --- setup ---
+    mod_alogs.registerMetrics(enabled=True)
+    logger, _ = _make_logger("info")
+    threads_count = 200
+    shards = mod_alogs.apathetic_logging._metrics_shards  # noqa: SLF001
+
+    def work() -> None:
+        logger.info("x")
+
+    # --- execute ---
+    for _ in range(threads_count):
+        thread = threading.Thread(target=work)
+        thread.start()
+        thread.join()
+
+    # --- verify ---
+    assert len(shards) <= 2  # noqa: PLR2004
+    stats = mod_alogs.getLoggingStats()["loggers"][logger.name]
+    assert stats["INFO"]["emitted"] == threads_count
+    assert all(thread.is_alive() for thread, _ in shards)
+
+
+def test_reset_logging_stats() -> None:
+    """resetLoggingStats() should forget everything counted so far."""
+    # --- setup ---
+    mod_alogs.registerMetrics(enabled=True)
+    logger, _ = _make_logger("info")
+    logger.info("before")
+
+    # --- execute ---
+    mod_alogs.resetLoggingStats()
+    logger.info("after")
+
+    # --- verify ---
+    stats = mod_alogs.getLoggingStats()["loggers"][logger.name]
+    assert stats["INFO"]["emitted"] == 1
+
+
+def test_format_open_metrics() -> None:
+    """Stats should be written as OpenMetrics text ending in # EOF."""
+    # --- setup ---
+    stats = {
+        "loggers": {'app "x"': {"INFO": {"emitted": 2, "dropped_level": 0}}},
+        "handlers": {
+            "DualStreamHandler": {
+                "count": 2,
+                "sum": 0.5,
+                "buckets": {0.1: 1, 1.0: 2, math.inf: 2},
+            }
+        },
+    }
+
+    # --- execute ---
+    text = mod_alogs.formatOpenMetrics(stats)
+
+    # --- verify ---
+    lines = text.splitlines()
+    assert "# TYPE apathetic_logging_records counter" in lines
+    assert (
+        'apathetic_logging_records_total{logger="app \\"x\\"",level="INFO",'
+        'outcome="emitted"} 2'
+    ) in lines
+    assert "# TYPE apathetic_logging_handler_seconds histogram" in lines
+    assert (
+        'apathetic_logging_handler_seconds_bucket{handler="DualStreamHandler",'
+        'le="+Inf"} 2'
+    ) in lines
+    assert (
+        'apathetic_logging_handler_seconds_sum{handler="DualStreamHandler"} 0.5'
+    ) in lines
+    assert text.endswith("# EOF\n")
+
+
+def test_dump_logging_stats(tmp_path: Path) -> None:
+    """dumpLoggingStats() should write the current stats to a file."""
+    # --- setup ---
+    mod_alogs.registerMetrics(enabled=True)
+    logger, _ = _make_logger("info")
+    logger.info("counted")
+    path = tmp_path / "logging.prom"
+
+    # --- execute ---
+    mod_alogs.dumpLoggingStats(path)
+
+    # --- verify ---
+    text = path.read_text(encoding="utf-8")
+    assert f'logger="{logger.name}",level="INFO",outcome="emitted"}} 1' in text
+    assert not (tmp_path / "logging.prom.tmp").exists()
@@ -0,0 +1,257 @@
+# tests/50_core/test_process_handler.py
+"""Tests for ProcessQueueHandler, ProcessLogListener and fork handling."""
+
+import io
+import logging
+import multiprocessing
+import os
+import queue
+import sys
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+import apathetic_logging as mod_alogs
+
+
+_needs_fork = pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(),
+    reason="needs the fork start method",
+)
+
+
+class _ListHandler(logging.Handler):
+    """Collects records."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+
+def _child_work(logger_name: str, index: int) -> int:
+    logger = mod_alogs.getLogger(logger_name, level="info")
+    logger.info("child info %d", index)
+    logger.warning("child warning %d", index)
+    return os.getpid()
+
+
+def _child_log_once(logger_name: str, process_queue: object) -> None:
+    mod_alogs.registerProcessQueue(process_queue)
+    mod_alogs.getLogger(logger_name, level="info").info("from forked child")
+
+
+def test_process_queue_handler_payload_round_trip() -> None:
+    """A payload should rebuild a record with the same name, level and text."""
+    # --- setup ---
+    handler = mod_alogs.ProcessQueueHandler(queue.Queue())
+    record = logging.LogRecord(
+        "test.process", logging.WARNING, __file__, 1, "n=%d", (3,), None
+    )
+    record.job = "build"
+
+    # --- execute ---
+    rebuilt = mod_alogs.ProcessLogListener.makeRecord(handler.prepare(record))
+
+    # --- verify ---
+    assert rebuilt.name == "test.process"
+    assert rebuilt.levelno == logging.WARNING
+    assert rebuilt.levelname == "WARNING"
+    assert rebuilt.getMessage() == "n=3"
+    assert rebuilt.created == record.created
+    assert rebuilt.process == record.process
+    assert rebuilt.job == "build"  # type: ignore[attr-defined]
+    assert not hasattr(rebuilt, "test_mode")
+
+
+def test_process_queue_handler_renders_exception_and_unpicklable_extras() -> None:
+    """Tracebacks should be sent as text and unpicklable extras as repr()."""
+    # --- setup ---
+    handler = mod_alogs.ProcessQueueHandler(queue.Queue())
+    try:
+        msg = "boom"
+        raise ValueError(msg)  # noqa: TRY301
+    except ValueError:
+        record = logging.LogRecord(
+            "test.process", logging.ERROR, __file__, 1, "failed", (), sys.exc_info()
+        )
+    record.lock = os  # modules can't be pickled
+
+    # --- execute ---
+    rebuilt = mod_alogs.ProcessLogListener.makeRecord(handler.prepare(record))
+
+    # --- verify ---
+    assert rebuilt.exc_text is not None
+    assert "ValueError: boom" in rebuilt.exc_text
+    assert rebuilt.lock == repr(os)  # type: ignore[attr-defined]
+
+
+def test_process_queue_handler_marks_test_mode() -> None:
+    """Diagnostic records from a TEST-level logger should carry test_mode."""
+    # --- setup ---
+    process_queue: queue.Queue[bytes] = queue.Queue()
+    mod_alogs.registerProcessQueue(process_queue)
+    logger = mod_alogs.getLogger(f"test_process_{uuid.uuid4().hex[:6]}", level="test")
+
+    # --- execute ---
+    logger.debug("diagnostic")
+    logger.warning("warning")
+
+    # --- verify ---
+    assert isinstance(logger.handlers[0], mod_alogs.ProcessQueueHandler)
+    debug = mod_alogs.ProcessLogListener.makeRecord(process_queue.get_nowait())
+    warning = mod_alogs.ProcessLogListener.makeRecord(process_queue.get_nowait())
+    assert debug.test_mode is True  # type: ignore[attr-defined]
+    assert not hasattr(warning, "test_mode")
+
+
+def test_dual_stream_handler_honors_test_mode_attribute(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A test_mode record should bypass capture like a TEST-level logger."""
+    # --- setup ---
+    err_buf = io.StringIO()
+    dunder_err_buf = io.StringIO()
+    monkeypatch.setattr(sys, "stderr", err_buf)
+    monkeypatch.setattr(sys, "__stderr__", dunder_err_buf)
+    handler = mod_alogs.DualStreamHandler()
+    record = logging.LogRecord(
+        "not_a_test_logger", logging.DEBUG, "", 0, "bypass", (), None
+    )
+    record.test_mode = True
+
+    # --- execute ---
+    handler.emit(record)
+
+    # --- verify ---
+    assert "bypass" in dunder_err_buf.getvalue()
+    assert err_buf.getvalue() == ""
+
+
+def test_listener_writes_to_given_handler() -> None:
+    """The listener should pass rebuilt records to its handler, in order."""
+    # --- setup ---
+    process_queue: queue.Queue[bytes | None] = queue.Queue()
+    target = _ListHandler()
+    sender = mod_alogs.ProcessQueueHandler(process_queue)
+
+    # --- execute ---
+    with mod_alogs.ProcessLogListener(process_queue, target) as listener:
+        for i in range(20):
+            sender.handle(
+                logging.LogRecord("child", logging.INFO, "", 0, "msg %d", (i,), None)
+            )
+    running = listener.running
+
+    # --- verify ---
+    assert running is False
+    assert [r.getMessage() for r in target.records] == [f"msg {i}" for i in range(20)]
+
+
+@_needs_fork
+def test_listener_routes_child_records_through_parent_logger(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Records from pool workers should be written whole by the parent."""
+    # --- setup ---
+    out_buf = io.StringIO()
+    err_buf = io.StringIO()
+    monkeypatch.setattr(sys, "stdout", out_buf)
+    monkeypatch.setattr(sys, "stderr", err_buf)
+    logger_name = f"test_process_{uuid.uuid4().hex[:6]}"
+    context = multiprocessing.get_context("fork")
+
+    # --- execute ---
+    with (
+        mod_alogs.ProcessLogListener(context.Queue()) as listener,
+        ProcessPoolExecutor(
+            max_workers=2,
+            mp_context=context,
+            initializer=mod_alogs.registerProcessQueue,
+            initargs=(listener.queue,),
+        ) as pool,
+    ):
+        pids = set(pool.map(_child_work, [logger_name] * 4, range(4)))
+
+    # --- verify ---
+    assert os.getpid() not in pids
+    out_lines = out_buf.getvalue().splitlines()
+    err_lines = err_buf.getvalue().splitlines()
+    assert sorted(out_lines) == [f"child info {i}" for i in range(4)]
+    assert sorted(line.split("child warning ")[-1] for line in err_lines) == [
+        str(i) for i in range(4)
+    ]
+
+
+def test_listener_writes_child_records_below_parent_level_with_recorder(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A flight recorder in the parent should not swallow child records."""
+    # --- setup ---
+    out_buf = io.StringIO()
+    monkeypatch.setattr(sys, "stdout", out_buf)
+    mod_alogs.registerFlightRecorder(enabled=True)
+    logger_name = f"test_process_{uuid.uuid4().hex[:6]}"
+    mod_alogs.getLogger(logger_name, level="warning")
+    record = logging.LogRecord(
+        logger_name, logging.INFO, __file__, 1, "child info", None, None
+    )
+    payload = mod_alogs.ProcessQueueHandler(queue.Queue()).prepare(record)
+
+    # --- execute ---
+    mod_alogs.ProcessLogListener(queue.Queue()).handlePayload(payload)
+
+    # --- verify ---
+    assert out_buf.getvalue() == "child info\n"
+
+
+def test_reinit_after_fork_discards_inherited_state(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """reinitAfterFork() should drop buffers, recordings and the writer."""
+    # --- setup ---
+    out_buf = io.StringIO()
+    monkeypatch.setattr(sys, "stdout", out_buf)
+    mod_alogs.registerBufferedOutput(buffered=True)
+    mod_alogs.registerFlightRecorder(enabled=True)
+    logger = mod_alogs.getLogger(f"test_process_{uuid.uuid4().hex[:6]}", level="info")
+    logger.info("parent pending")
+    logger.debug("parent recorded")
+    writer = mod_alogs.getAsyncWriter()
+    recorder = logger.handlers[0]
+    assert isinstance(recorder, mod_alogs.FlightRecorderHandler)
+
+    # --- execute ---
+    mod_alogs.reinitAfterFork()
+    logger.handlers[0].flush()
+
+    # --- verify ---
+    assert out_buf.getvalue() == ""
+    assert recorder.records() == []
+    assert mod_alogs.getAsyncWriter() is not writer
+
+
+@_needs_fork
+def test_forked_child_logs_while_parent_is_in_async_mode() -> None:
+    """A child forked from an async-mode parent should log without hanging."""
+    # --- setup ---
+    mod_alogs.registerAsyncMode(async_mode=True)
+    logger_name = f"test_process_{uuid.uuid4().hex[:6]}"
+    mod_alogs.getLogger(logger_name, level="info").info("parent record")
+    context = multiprocessing.get_context("fork")
+    target = _ListHandler()
+
+    # --- execute ---
+    with mod_alogs.ProcessLogListener(context.Queue(), target) as listener:
+        child = context.Process(
+            target=_child_log_once, args=(logger_name, listener.queue)
+        )
+        child.start()
+        child.join(timeout=30)
+
+    # --- verify ---
+    assert child.exitcode == 0
+    assert [r.getMessage() for r in target.records] == ["from forked child"]
@@ -0,0 +1,228 @@
+# tests/50_core/test_rate_limit_filter.py
+"""Tests for RateLimitFilter and the getLogger(rate_limit=...) option."""
+
+import logging
+import time
+import uuid
+from typing import TYPE_CHECKING
+
+import pytest
+
+import apathetic_logging as mod_alogs
+
+
+if TYPE_CHECKING:
+    from apathetic_logging import Logger  # noqa: ICN003
+else:
+    Logger = mod_alogs.Logger
+
+
+class _ListHandler(logging.Handler):
+    """Collects records."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+    def messages(self) -> list[str]:
+        return [record.getMessage() for record in self.records]
+
+
+class _Clock:
+    """Replacement for time.monotonic() that only moves when told to."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> _Clock:
+    fake = _Clock()
+    monkeypatch.setattr(time, "monotonic", fake)
+    return fake
+
+
+def _make_logger(
+    rate_filter: logging.Filter,
+) -> tuple[Logger, _ListHandler]:
+    # registered: summaries are handled by logging.getLogger(record.name)
+    logger = mod_alogs.getLogger(f"test_rate_{uuid.uuid4().hex[:6]}", level="info")
+    logger.ensureHandlers()
+    handler = _ListHandler()
+    logger.handlers = [handler]
+    logger.addFilter(rate_filter)
+    return logger, handler
+
+
+def test_burst_passes_then_repeats_are_dropped(clock: _Clock) -> None:  # noqa: ARG001
+    """Only ``burst`` records of one template should pass at once."""
+    # --- setup ---
+    rate_filter = mod_alogs.RateLimitFilter(1, burst=3)
+    logger, handler = _make_logger(rate_filter)
+
+    # --- execute ---
+    for i in range(10):
+        logger.warning("retrying %s", i)
+
+    # --- verify ---
+    assert handler.messages() == ["retrying 0", "retrying 1", "retrying 2"]
+    assert rate_filter.suppressed == 7  # noqa: PLR2004
+
+
+def test_keys_are_per_template_and_level(clock: _Clock) -> None:  # noqa: ARG001
+    """Different templates or levels should have their own buckets."""
+    # --- setup ---
+    rate_filter = mod_alogs.RateLimitFilter(1, burst=1)
+    logger, handler = _make_logger(rate_filter)
+
+    # --- execute ---
+    for _ in range(3):
+        logger.warning("a")
+        logger.warning("b")
+        logger.error("a")
+
+    # --- verify ---
+    assert [(r.levelname, r.getMessage()) for r in handler.records] == [
+        ("WARNING", "a"),
+        ("WARNING", "b"),
+        ("ERROR", "a"),
+    ]
+
+
+def test_summary_precedes_next_allowed_record(clock: _Clock) -> None:
+    """Suppressed repeats should be reported once the bucket refills."""
+    # --- setup ---
+    rate_filter = mod_alogs.RateLimitFilter(1, burst=1)
+    logger, handler = _make_logger(rate_filter)
+
+    # --- execute ---
+    for i in range(4):
+        logger.warning("retrying %s", i)
+    clock.now += 1
+    logger.warning("retrying %s", "again")
+
+    # --- verify ---
+    assert handler.messages() == [
+        "retrying 0",
+        "[repeated 3 more times] retrying 3",
+        "retrying again",
+    ]
+    summary = handler.records[1]
+    assert summary.repeated == 3  # type: ignore[attr-defined]  # noqa: PLR2004
+    assert summary.levelno == logging.WARNING
+
+
+def test_tokens_refill_at_rate(clock: _Clock) -> None:
+    """Records should pass again at ``rate`` per second."""
+    # --- setup ---
+    rate_filter = mod_alogs.RateLimitFilter(2, burst=1)
+    logger, handler = _make_logger(rate_filter)
+
+    # --- execute ---
+    logger.info("tick")
+    logger.info("tick")
+    clock.now += 0.25
+    logger.info("tick")
+    clock.now += 0.25
+    logger.info("tick")
+
+    # --- verify ---
+    assert handler.messages() == [
+        "tick",
+        "[repeated 2 more times] tick",
+        "tick",
+    ]
+
+
+def test_key_table_is_bounded_and_evicted_keys_report(clock: _Clock) -> None:  # noqa: ARG001
+    """Forgetting a key with suppressed repeats should emit its summary."""
+    # --- setup ---
+    rate_filter = mod_alogs.RateLimitFilter(1, burst=1, max_keys=2)
+    logger, handler = _make_logger(rate_filter)
+
+    # --- execute ---
+    logger.info("first")
+    logger.info("first")
+    logger.info("second")
+    logger.info("third")
+
+    # --- verify ---
+    assert handler.messages() == [
+        "first",
+        "second",
+        "[repeated 1 more times] first",
+        "third",
+    ]
+    # "first" was forgotten, so it starts a fresh bucket
+    logger.info("first")
+    assert handler.messages()[-1] == "first"
+
+
+def test_flush_summaries(clock: _Clock) -> None:  # noqa: ARG001
+    """flushSummaries() should report pending repeats without a new record."""
+    # --- setup ---
+    rate_filter = mod_alogs.RateLimitFilter(1, burst=1)
+    logger, handler = _make_logger(rate_filter)
+    for _ in range(3):
+        logger.error("boom")
+
+    # --- execute ---
+    rate_filter.flushSummaries()
+    rate_filter.flushSummaries()
+
+    # --- verify ---
+    assert handler.messages() == ["boom", "[repeated 2 more times] boom"]
+
+
+def test_lazy_messages_are_not_evaluated_when_dropped(clock: _Clock) -> None:  # noqa: ARG001
+    """Keys for lazy messages should not call them."""
+    # --- setup ---
+    rate_filter = mod_alogs.RateLimitFilter(1, burst=1)
+    logger, handler = _make_logger(rate_filter)
+    calls: list[int] = []
+
+    def build() -> str:
+        calls.append(1)
+        return "built"
+
+    # --- execute ---
+    for _ in range(5):
+        logger.info(mod_alogs.lazy(build))
+
+    # --- verify ---
+    assert calls == []
+    assert rate_filter.suppressed == 4  # noqa: PLR2004
+    assert handler.messages() == ["built"]
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"rate": 0}, {"rate": 1, "burst": 0}, {"rate": 1, "max_keys": -1}],
+)
+def test_invalid_limits_raise(kwargs: dict[str, float]) -> None:
+    """Non-positive limits should be rejected."""
+    with pytest.raises(ValueError, match="must be > 0"):
+        mod_alogs.RateLimitFilter(**kwargs)  # type: ignore[arg-type]
+
+
+def test_get_logger_rate_limit_option() -> None:
+    """getLogger(rate_limit=...) should attach one filter and update it."""
+    # --- setup ---
+    name = f"test_rate_{uuid.uuid4().hex[:6]}"
+
+    # --- execute ---
+    logger = mod_alogs.getLogger(name, rate_limit=5)
+    same = mod_alogs.getLogger(name, rate_limit=2, rate_limit_burst=4)
+
+    # --- verify ---
+    assert same is logger
+    filters = [f for f in logger.filters if isinstance(f, mod_alogs.RateLimitFilter)]
+    assert len(filters) == 1
+    assert filters[0].rate == 2  # noqa: PLR2004
+    assert filters[0].burst == 4  # noqa: PLR2004
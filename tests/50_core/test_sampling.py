@@ -0,0 +1,169 @@
+# tests/50_core/test_sampling.py
+"""Tests for sampling records before they are created."""
+
+import asyncio
+import logging
+import uuid
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+import apathetic_logging as mod_alogs
+
+
+if TYPE_CHECKING:
+    from apathetic_logging import Logger  # noqa: ICN003
+else:
+    Logger = mod_alogs.Logger
+
+
+class _ListHandler(logging.Handler):
+    """Collects records."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+
+def _make_logger(name: str | None = None) -> tuple[Logger, _ListHandler]:
+    logger = mod_alogs.Logger(name or f"test_sampling_{uuid.uuid4().hex[:6]}")
+    logger.setLevel("trace")
+    logger.ensureHandlers()
+    handler = _ListHandler()
+    logger.handlers = [handler]
+    return logger, handler
+
+
+@pytest.fixture(autouse=True)
+def clean_context() -> None:
+    """Start every test without bound fields."""
+    mod_alogs.clearLogContext()
+
+
+def test_rate_zero_drops_before_make_record(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Dropped records should never reach makeRecord()."""
+    # --- setup ---
+    mod_alogs.registerSampling({"trace": 0.0})
+    logger, handler = _make_logger()
+    made: list[Any] = []
+    original = logger.makeRecord
+
+    def counting(*args: Any, **kwargs: Any) -> logging.LogRecord:
+        made.append(1)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(logger, "makeRecord", counting)
+
+    # --- execute ---
+    for _ in range(20):
+        logger.trace("dropped")
+    logger.debug("kept")
+
+    # --- verify ---
+    assert len(made) == 1
+    assert [r.getMessage() for r in handler.records] == ["kept"]
+
+
+def test_rate_keeps_roughly_that_fraction() -> None:
+    """A 10% rate should keep about a tenth of the records."""
+    # --- setup ---
+    mod_alogs.registerSampling({"detail": 0.1})
+    logger, handler = _make_logger()
+
+    # --- execute ---
+    for i in range(5000):
+        logger.detail("record %d", i)
+
+    # --- verify ---
+    assert 300 < len(handler.records) < 700  # noqa: PLR2004
+
+
+def test_per_logger_rates_apply_to_children() -> None:
+    """Rates registered for a logger should cover its children."""
+    # --- setup ---
+    prefix = f"test_sampling_{uuid.uuid4().hex[:6]}"
+    mod_alogs.registerSampling({"trace": 1.0})
+    mod_alogs.registerSampling({"trace": 0.0}, logger_name=prefix)
+    child, child_handler = _make_logger(f"{prefix}.child")
+    other, other_handler = _make_logger()
+
+    # --- execute ---
+    child.trace("child")
+    other.trace("other")
+
+    # --- verify ---
+    assert child_handler.records == []
+    assert len(other_handler.records) == 1
+
+
+def test_registering_again_updates_existing_loggers() -> None:
+    """Loggers should pick up new rates on their next record."""
+    # --- setup ---
+    mod_alogs.registerSampling({"trace": 0.0})
+    logger, handler = _make_logger()
+    logger.trace("dropped")
+
+    # --- execute ---
+    mod_alogs.registerSampling({"trace": 1.0})
+    logger.trace("kept")
+
+    # --- verify ---
+    assert [r.getMessage() for r in handler.records] == ["kept"]
+
+
+def test_sampling_key_keeps_whole_requests() -> None:
+    """Records sharing a trace key should be kept or dropped together."""
+    # --- setup ---
+    mod_alogs.registerSampling({"trace": 0.5})
+    logger, handler = _make_logger()
+
+    # --- execute ---
+    for request in range(40):
+        with mod_alogs.logContext(trace_id=f"req-{request}"):
+            for _ in range(5):
+                logger.trace("step")
+
+    # --- verify ---
+    counts: dict[str, int] = {}
+    for record in handler.records:
+        key = record.trace_id  # type: ignore[attr-defined]
+        counts[key] = counts.get(key, 0) + 1
+    assert set(counts.values()) == {5}
+    assert 0 < len(counts) < 40  # noqa: PLR2004
+
+
+def test_sampling_key_is_nested_across_rates() -> None:
+    """A request kept at a low rate should be kept at any higher rate."""
+    # --- setup ---
+    keep = mod_alogs.apathetic_logging.keepSample
+    kept_low: list[str] = []
+    kept_high: list[str] = []
+
+    # --- execute ---
+    for request in range(200):
+        with mod_alogs.logContext(trace_id=f"req-{request}"):
+            if keep(0.1):
+                kept_low.append(f"req-{request}")
+            if keep(0.5):
+                kept_high.append(f"req-{request}")
+
+    # --- verify ---
+    assert kept_low
+    assert set(kept_low) <= set(kept_high)
+
+
+def test_alog_is_sampled_too() -> None:
+    """Awaitable methods should apply the same sampling."""
+    # --- setup ---
+    mod_alogs.registerSampling({"info": 0.0})
+    logger, handler = _make_logger()
+
+    # --- execute ---
+    asyncio.run(logger.ainfo("dropped"))
+    mod_alogs.stopAsyncWriter()
+
+    # --- verify ---
+    assert handler.records == []
@@ -0,0 +1,337 @@
+# tests/50_core/test_segment_handler.py
+"""Tests for MmapSegmentHandler and the segment reader."""
+
+import logging
+import threading
+import uuid
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TypeAlias
+
+import pytest
+
+import apathetic_logging as mod_alogs
+
+
+if TYPE_CHECKING:
+    from apathetic_logging.segment_handler import (
+        ApatheticLogging_Internal_SegmentHandler,
+    )
+
+    MmapSegmentHandler: TypeAlias = (
+        ApatheticLogging_Internal_SegmentHandler.MmapSegmentHandler
+    )
+else:
+    MmapSegmentHandler = mod_alogs.MmapSegmentHandler
+
+_HEADER_SIZE = mod_alogs.apathetic_logging.SEGMENT_HEADER_SIZE
+
+
+def _make_record(level: int, msg: str, *args: object) -> logging.LogRecord:
+    return logging.LogRecord("test", level, __file__, 1, msg, args, None)
+
+
+def _make_handler(directory: Path, **kwargs: Any) -> MmapSegmentHandler:
+    handler = MmapSegmentHandler(directory, **kwargs)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    return handler
+
+
+def _read_all(directory: Path) -> list[str]:
+    return [str(view, "utf-8") for view in mod_alogs.iterSegments(directory)]
+
+
+def test_segment_handler_round_trip(tmp_path: Path) -> None:
+    """Records written to a segment should read back in order."""
+    # --- setup ---
+    handler = _make_handler(tmp_path)
+
+    # --- execute ---
+    for i in range(5):
+        handler.handle(_make_record(logging.INFO, "record %d", i))
+    handler.close()
+
+    # --- verify ---
+    assert _read_all(tmp_path) == [f"record {i}" for i in range(5)]
+
+
+def test_segment_handler_never_writes_color(tmp_path: Path) -> None:
+    """Text segments should be uncolored without changing the record."""
+    # --- setup ---
+    handler = MmapSegmentHandler(tmp_path)
+    handler.setFormatter(mod_alogs.TagFormatter("%(message)s"))
+    record = _make_record(logging.DEBUG, "debug")
+    record.__dict__["enable_color"] = True
+
+    # --- execute ---
+    handler.handle(record)
+    handler.close()
+
+    # --- verify ---
+    assert _read_all(tmp_path) == ["[DEBUG] debug"]
+    assert record.__dict__["enable_color"] is True
+
+
+def test_segment_handler_creates_nothing_until_first_record(tmp_path: Path) -> None:
+    """A handler that never writes should not leave a segment behind."""
+    # --- execute ---
+    _make_handler(tmp_path / "segments").close()
+
+    # --- verify ---
+    assert not (tmp_path / "segments").exists()
+
+
+def test_segment_handler_starts_new_segments_when_full(tmp_path: Path) -> None:
+    """Records that don't fit should go to a new segment."""
+    # --- setup ---
+    # "record N" is 8 bytes, plus a 4-byte length: 3 fit after the header
+    handler = _make_handler(tmp_path, segment_size=_HEADER_SIZE + 36)
+
+    # --- execute ---
+    for i in range(7):
+        handler.handle(_make_record(logging.INFO, "record %d", i))
+    handler.close()
+
+    # --- verify ---
+    assert len(list(tmp_path.iterdir())) == 3  # noqa: PLR2004
+    assert _read_all(tmp_path) == [f"record {i}" for i in range(7)]
+
+
+def test_segment_handler_fits_oversized_records(tmp_path: Path) -> None:
+    """A record larger than a segment should get a segment of its own."""
+    # --- setup ---
+    handler = _make_handler(tmp_path, segment_size=_HEADER_SIZE + 16)
+    big = "x" * 100
+
+    # --- execute ---
+    handler.handle(_make_record(logging.INFO, "small"))
+    handler.handle(_make_record(logging.INFO, big))
+    handler.handle(_make_record(logging.INFO, "after"))
+    handler.close()
+
+    # --- verify ---
+    assert _read_all(tmp_path) == ["small", big, "after"]
+
+
+def test_segment_handler_close_truncates_to_used_size(tmp_path: Path) -> None:
+    """Closing should shrink the preallocated file to the bytes used."""
+    # --- setup ---
+    handler = _make_handler(tmp_path, segment_size=1024 * 1024)
+    handler.handle(_make_record(logging.INFO, "record"))
+    path = Path(str(handler.path))
+
+    # --- execute ---
+    live_size = path.stat().st_size
+    handler.close()
+
+    # --- verify ---
+    header = mod_alogs.readSegmentHeader(path)
+    assert live_size == 1024 * 1024
+    assert path.stat().st_size == _HEADER_SIZE + 4 + len("record")
+    assert header["capacity"] == header["end"] == path.stat().st_size
+    assert header["count"] == 1
+
+
+def test_segment_index_is_current_before_close(tmp_path: Path) -> None:
+    """A reader should see every record of a segment still being written."""
+    # --- setup ---
+    handler = _make_handler(tmp_path, sync_interval=60)
+
+    # --- execute ---
+    handler.handle(_make_record(logging.INFO, "first"))
+    handler.handle(_make_record(logging.INFO, "second"))
+    header = mod_alogs.readSegmentHeader(str(handler.path))
+    records = _read_all(tmp_path)
+    handler.close()
+
+    # --- verify ---
+    assert header["count"] == 2  # noqa: PLR2004
+    assert records == ["first", "second"]
+
+
+def test_segment_handler_syncs_on_level_and_interval(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Records at sync_level sync at once; others wait for sync_interval."""
+    # --- setup ---
+    handler = _make_handler(tmp_path, sync_interval=60, sync_level=logging.ERROR)
+    syncs: list[int] = []
+    original_sync = handler.sync
+    handler.handle(_make_record(logging.INFO, "first"))  # first record syncs
+
+    def counting_sync() -> None:
+        syncs.append(1)
+        original_sync()
+
+    monkeypatch.setattr(handler, "sync", counting_sync)
+
+    # --- execute ---
+    handler.handle(_make_record(logging.INFO, "quiet"))
+    quiet = len(syncs)
+    handler.handle(_make_record(logging.ERROR, "failure"))
+    handler.close()
+
+    # --- verify ---
+    assert quiet == 0
+    assert len(syncs) == 1
+
+
+def test_segment_handler_detach_segment(tmp_path: Path) -> None:
+    """After detachSegment(), the next record should start a new segment."""
+    # --- setup ---
+    handler = _make_handler(tmp_path)
+    handler.handle(_make_record(logging.INFO, "parent"))
+    first = handler.path
+
+    # --- execute ---
+    handler.detachSegment()
+    handler.handle(_make_record(logging.INFO, "child"))
+    second = handler.path
+    handler.close()
+
+    # --- verify ---
+    assert second != first
+    assert sorted(_read_all(tmp_path)) == ["child", "parent"]
+
+
+def test_read_segment_header_rejects_other_files(tmp_path: Path) -> None:
+    """Files that aren't segments should raise ValueError."""
+    # --- setup ---
+    path = tmp_path / "notes.txt"
+    path.write_text("not a segment")
+
+    # --- execute and verify ---
+    with pytest.raises(ValueError, match="Not a log segment"):
+        mod_alogs.readSegmentHeader(path)
+
+
+def test_iter_segments_skips_other_files(tmp_path: Path) -> None:
+    """iterSegments() should ignore files that aren't segments."""
+    # --- setup ---
+    (tmp_path / "notes.txt").write_text("not a segment")
+    handler = _make_handler(tmp_path)
+    handler.handle(_make_record(logging.INFO, "record"))
+    handler.close()
+
+    # --- execute and verify ---
+    assert _read_all(tmp_path) == ["record"]
+
+
+def test_segment_handler_rejects_invalid_settings(tmp_path: Path) -> None:
+    """A segment too small for its header should raise ValueError."""
+    with pytest.raises(ValueError, match="Segment size"):
+        MmapSegmentHandler(tmp_path, segment_size=_HEADER_SIZE)
+    with pytest.raises(ValueError, match="record format"):
+        MmapSegmentHandler(tmp_path, record_format="xml")
+
+
+def test_binary_segment_decodes_to_records(tmp_path: Path) -> None:
+    """Binary segments should decode to records that format like the originals."""
+    # --- setup ---
+    handler = _make_handler(tmp_path, record_format="binary")
+    formatter = mod_alogs.TagFormatter("%(name)s: %(message)s")
+    records = [
+        _make_record(logging.DEBUG, "request %s took %d ms", "a", 5),
+        _make_record(logging.DEBUG, "request %s took %d ms", "b", 7),
+        _make_record(logging.ERROR, "failed"),
+    ]
+
+    # --- execute ---
+    for record in records:
+        handler.handle(record)
+    handler.close()
+    (path,) = mod_alogs.listSegments(tmp_path)
+    decoded = list(mod_alogs.decodeSegment(path))
+
+    # --- verify ---
+    assert mod_alogs.readSegmentHeader(path)["record_format"] == "binary"
+    assert [formatter.format(r) for r in decoded] == [
+        "[DEBUG] test: request a took 5 ms",
+        "[DEBUG] test: request b took 7 ms",
+        "❌  test: failed",
+    ]
+
+
+def test_binary_segments_each_carry_their_templates(tmp_path: Path) -> None:
+    """Every binary segment should decode on its own after a rollover."""
+    # --- setup ---
+    handler = _make_handler(tmp_path, record_format="binary", segment_size=256)
+
+    # --- execute ---
+    for i in range(40):
+        handler.handle(_make_record(logging.INFO, "record %d", i))
+    handler.close()
+    segments = mod_alogs.listSegments(tmp_path)
+
+    # --- verify ---
+    assert len(segments) > 1
+    messages = [
+        record.getMessage()
+        for path in segments
+        for record in mod_alogs.decodeSegment(path)
+    ]
+    assert messages == [f"record {i}" for i in range(40)]
+
+
+def test_decode_segment_rejects_text_segments(tmp_path: Path) -> None:
+    """decodeSegment() should only accept binary segments."""
+    # --- setup ---
+    handler = _make_handler(tmp_path)
+    handler.handle(_make_record(logging.INFO, "record"))
+    handler.close()
+    (path,) = mod_alogs.listSegments(tmp_path)
+
+    # --- execute and verify ---
+    assert mod_alogs.readSegmentHeader(path)["record_format"] == "text"
+    with pytest.raises(ValueError, match="Not a binary log segment"):
+        list(mod_alogs.decodeSegment(path))
+
+
+def test_registered_segment_output_is_shared_by_loggers(tmp_path: Path) -> None:
+    """With segment output registered, every logger should write to it."""
+    # --- setup ---
+    mod_alogs.registerSegmentOutput(enabled=True, directory=tmp_path)
+    first = mod_alogs.getLogger(f"seg_a_{uuid.uuid4().hex[:6]}", level="info")
+    second = mod_alogs.getLogger(f"seg_b_{uuid.uuid4().hex[:6]}", level="info")
+
+    # --- execute ---
+    first.info("from first")
+    second.info("from second")
+    mod_alogs.closeSegmentHandler()
+
+    # --- verify ---
+    assert first.handlers == second.handlers
+    assert _read_all(tmp_path) == ["from first", "from second"]
+
+
+def test_get_segment_handler_creates_one_handler_for_concurrent_callers(
+    tmp_path: Path,
+) -> None:
+    """Threads asking for the shared handler at once should all get the same one."""
+    # --- setup ---
+    mod_alogs.registerSegmentOutput(enabled=True, directory=tmp_path)
+    thread_count = 8
+    trials = 20
+
+    for _ in range(trials):
+        mod_alogs.closeSegmentHandler()
+        barrier = threading.Barrier(thread_count)
+        handlers: list[object] = []
+
+        def get_handler(barrier: threading.Barrier, handlers: list[object]) -> None:
+            barrier.wait()
+            handlers.append(mod_alogs.getSegmentHandler())
+
+        threads = [
+            threading.Thread(target=get_handler, args=(barrier, handlers))
+            for _ in range(thread_count)
+        ]
+
+        # --- execute ---
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # --- verify ---
+        assert len({id(handler) for handler in handlers}) == 1
+    mod_alogs.closeSegmentHandler()
@@ -0,0 +1,226 @@
+# tests/50_core/test_slot_log_record.py
+"""Tests for the SlotLogRecord record factory."""
+
+import copy
+import io
+import json
+import logging
+import os
+import pickle
+import sys
+import threading
+import uuid
+from collections.abc import Generator
+from typing import TYPE_CHECKING
+
+import pytest
+
+import apathetic_logging as mod_alogs
+
+
+if TYPE_CHECKING:
+    from apathetic_logging import Logger  # noqa: ICN003
+else:
+    Logger = mod_alogs.Logger
+
+
+_FULL_FORMAT = (
+    "%(asctime)s %(levelname)s %(name)s %(module)s %(filename)s:%(lineno)d "
+    "%(funcName)s %(threadName)s %(processName)s %(process)d %(message)s"
+)
+
+
+@pytest.fixture
+def slot_records() -> Generator[None, None, None]:
+    """Install SlotLogRecord as the record factory for one test."""
+    original = mod_alogs.getLogRecordFactory()
+    mod_alogs.setLogRecordFactory(mod_alogs.SlotLogRecord)
+    yield
+    mod_alogs.setLogRecordFactory(original)
+
+
+@pytest.fixture
+def logger() -> Logger:
+    """Create a Logger without shared context fields."""
+    mod_alogs.clearLogContext()
+    return mod_alogs.Logger(f"test_slots_{uuid.uuid4().hex[:6]}")
+
+
+def _make_pair(
+    msg: str = "hello %s", *args: object
+) -> tuple[logging.LogRecord, logging.LogRecord]:
+    # the same record from both factories, with the same timestamp
+    plain = logging.LogRecord("test.slots", logging.INFO, __file__, 7, msg, args, None)
+    slotted = mod_alogs.SlotLogRecord(
+        "test.slots", logging.INFO, __file__, 7, msg, args, None
+    )
+    slotted.created = plain.created
+    slotted.msecs = plain.msecs
+    return plain, slotted
+
+
+def test_slot_log_record_formats_like_log_record() -> None:
+    """Every %-style field, lazy or not, should match a plain LogRecord."""
+    # --- setup ---
+    plain, slotted = _make_pair("hello %s", "world")
+    formatter = mod_alogs.TagFormatter(_FULL_FORMAT)
+
+    # --- execute ---
+    expected = formatter.format(plain)
+    result = formatter.format(slotted)
+
+    # --- verify ---
+    assert result == expected
+    assert isinstance(slotted, logging.LogRecord)
+    assert slotted.module == "test_slot_log_record"
+    assert slotted.process == os.getpid()
+    assert slotted.threadName == threading.current_thread().name
+
+
+def test_slot_log_record_computes_process_when_read(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """The process id should be read when first needed, then kept."""
+    # --- setup ---
+    _plain, slotted = _make_pair()
+    monkeypatch.setattr(os, "getpid", lambda: 4242)
+
+    # --- execute ---
+    first = slotted.process
+    monkeypatch.setattr(os, "getpid", lambda: 1)
+    second = slotted.process
+
+    # --- verify ---
+    assert first == second == 4242  # noqa: PLR2004
+
+
+def test_slot_log_record_lazy_fields_can_be_set() -> None:
+    """Assigning a lazy field should replace the computed value."""
+    # --- setup ---
+    _plain, slotted = _make_pair()
+
+    # --- execute ---
+    slotted.filename = "other.py"
+    slotted.threadName = "worker"
+    slotted.process = None
+
+    # --- verify ---
+    assert slotted.filename == "other.py"
+    assert slotted.module == "other"
+    assert slotted.__dict__["threadName"] == "worker"
+    assert slotted.process is None
+
+
+def test_slot_log_record_through_dual_stream_handler(
+    monkeypatch: pytest.MonkeyPatch,
+    slot_records: None,  # noqa: ARG001
+    logger: Logger,
+) -> None:
+    """extra= values and context fields should reach a DualStreamHandler."""
+    # --- setup ---
+    handler = mod_alogs.DualStreamHandler()
+    handler.setFormatter(mod_alogs.TagFormatter("%(message)s user=%(user)s"))
+    handler.enable_color = False
+    out_buf = io.StringIO()
+    err_buf = io.StringIO()
+    monkeypatch.setattr(sys, "stdout", out_buf)
+    monkeypatch.setattr(sys, "stderr", err_buf)
+    name = logger.name
+
+    # --- execute ---
+    plain = logger.makeRecord(
+        name, logging.INFO, __file__, 1, "plain", (), None, extra={"user": "alice"}
+    )
+    with mod_alogs.logContext(user="bob", request=7):
+        careful = logger.makeRecord(
+            name, logging.WARNING, __file__, 1, "careful", (), None
+        )
+    handler.handle(plain)
+    handler.handle(careful)
+
+    # --- verify ---
+    assert out_buf.getvalue() == "plain user=alice\n"
+    assert err_buf.getvalue() == "⚠️  careful user=bob [user=bob request=7]\n"
+
+
+def test_slot_log_record_extras_in_dict(
+    slot_records: None,  # noqa: ARG001
+    logger: Logger,
+) -> None:
+    """record.__dict__ should hold extras and reject overwriting fields."""
+    # --- setup ---
+    formatter = mod_alogs.JsonFormatter()
+
+    # --- execute ---
+    record = logger.makeRecord(
+        logger.name, logging.INFO, __file__, 1, "msg", (), None,
+        extra={"user": "alice"},
+    )  # fmt: skip
+    output = json.loads(formatter.format(record))
+
+    # --- verify ---
+    assert type(record) is mod_alogs.SlotLogRecord
+    assert record.__dict__["user"] == "alice"
+    assert "user" in record.__dict__
+    assert "process" in record.__dict__
+    assert "log_context" not in record.__dict__
+    assert output["user"] == "alice"
+    assert "process" not in output
+    with pytest.raises(KeyError, match="overwrite"):
+        logger.makeRecord(
+            logger.name, logging.INFO, __file__, 1, "msg", (), None,
+            extra={"lineno": 3},
+        )  # fmt: skip
+
+
+def test_slot_log_record_make_log_record(
+    slot_records: None,  # noqa: ARG001
+) -> None:
+    """makeLogRecord() should fill a SlotLogRecord from a dict."""
+    # --- execute ---
+    record = mod_alogs.makeLogRecord(
+        {"name": "remote", "msg": "hi %s", "args": ("there",), "user": "alice"}
+    )
+
+    # --- verify ---
+    assert type(record) is mod_alogs.SlotLogRecord
+    assert record.name == "remote"
+    assert record.getMessage() == "hi there"
+    assert record.user == "alice"  # type: ignore[attr-defined]
+
+
+def test_slot_log_record_copies_keep_fields() -> None:
+    """copy.copy() and pickle should keep every field and extra."""
+    # --- setup ---
+    _plain, slotted = _make_pair("hello %s", "copy")
+    slotted.user = "alice"
+
+    # --- execute ---
+    copied = copy.copy(slotted)
+    unpickled = pickle.loads(pickle.dumps(slotted))  # noqa: S301
+
+    # --- verify ---
+    for clone in (copied, unpickled):
+        assert type(clone) is mod_alogs.SlotLogRecord
+        assert dict(clone.__dict__) == dict(slotted.__dict__)
+        assert clone.user == "alice"  # type: ignore[attr-defined]
+
+
+def test_slot_log_record_copy_keeps_thread_name() -> None:
+    """A copy made on the logging thread should keep its name after it exits."""
+    # --- setup ---
+    copies: list[logging.LogRecord] = []
+
+    def log_from_worker() -> None:
+        _plain, slotted = _make_pair()
+        copies.append(copy.copy(slotted))
+
+    worker = threading.Thread(target=log_from_worker, name="slot-worker")
+
+    # --- execute ---
+    worker.start()
+    worker.join()
+
+    # --- verify ---
+    assert copies[0].threadName == "slot-worker"
+    assert copies[0].thread == worker.ident
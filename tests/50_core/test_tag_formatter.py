@@ -150,3 +150,79 @@ def test_tag_formatter_unknown_level_no_tag() -> None:
     # --- verify ---
     # Should still format the message even without a tag
     assert "test message" in formatted
+
+
+def test_tag_formatter_untagged_level_returns_message_unchanged() -> None:
+    """Levels without a tag should format to exactly the message."""
+    # --- setup ---
+    formatter = mod_alogs.apathetic_logging.TagFormatter("%(message)s")
+    record = logging.LogRecord(
+        name="test",
+        level=logging.INFO,
+        pathname="",
+        lineno=0,
+        msg="plain %s",
+        args=("message",),
+        exc_info=None,
+    )
+    record.enable_color = True
+
+    # --- execute ---
+    formatted = formatter.format(record)
+
+    # --- verify ---
+    assert formatted == "plain message"
+
+
+def test_tag_formatter_colored_prefix_is_exact() -> None:
+    """Colored tags should wrap only the tag text in color and reset codes."""
+    # --- setup ---
+    formatter = mod_alogs.apathetic_logging.TagFormatter("%(message)s")
+    record = logging.LogRecord(
+        name="test",
+        level=logging.DEBUG,
+        pathname="",
+        lineno=0,
+        msg="test message",
+        args=(),
+        exc_info=None,
+    )
+    record.enable_color = True
+    color, tag_text = mod_alogs.apathetic_logging.TAG_STYLES["DEBUG"]
+    reset = mod_alogs.apathetic_logging.ANSIColors.RESET
+
+    # --- execute ---
+    formatted = formatter.format(record)
+
+    # --- verify ---
+    assert formatted == f"{color}{tag_text}{reset} test message"
+
+
+def test_tag_formatter_invalidate_prefix_cache_picks_up_new_styles(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Changing TAG_STYLES should apply after invalidatePrefixCache()."""
+    # --- setup ---
+    formatter = mod_alogs.apathetic_logging.TagFormatter("%(message)s")
+    record = logging.LogRecord(
+        name="test",
+        level=logging.INFO,
+        pathname="",
+        lineno=0,
+        msg="test message",
+        args=(),
+        exc_info=None,
+    )
+    record.enable_color = False
+    assert formatter.format(record) == "test message"
+
+    # --- execute ---
+    monkeypatch.setitem(mod_alogs.apathetic_logging.TAG_STYLES, "INFO", ("", "[INFO]"))
+    mod_alogs.apathetic_logging.TagFormatter.invalidatePrefixCache()
+    formatted = formatter.format(record)
+    monkeypatch.undo()
+    mod_alogs.apathetic_logging.TagFormatter.invalidatePrefixCache()
+
+    # --- verify ---
+    assert formatted == "[INFO] test message"
+    assert formatter.format(record) == "test message"
@@ -0,0 +1,124 @@
+# tests/90_integration/test_import_time.py
+"""Regression tests for the cost of ``import apathetic_logging``.
+
+Short-lived CLIs pay this on every run, so stdlib modules only some
+features need (argparse, gzip, json, mmap, multiprocessing, pickle, queue,
+random, shutil, struct, zlib) are imported on first use. These tests run
+``python -X importtime`` in a subprocess against whichever build the suite
+is testing (src/ when installed, dist/apathetic_logging.py when
+RUNTIME_MODE=singlefile).
+
+Timings are compared to ``import logging`` in the same process rather than
+to a fixed number of milliseconds, so the bound holds on slow CI machines.
+"""
+
+import compileall
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from tests.utils.constants import PROJ_ROOT
+
+
+# stdlib modules the package must not import eagerly
+DEFERRED_MODULES = {
+    "argparse",
+    "gzip",
+    "json",
+    "mmap",
+    "multiprocessing",
+    "pickle",
+    "queue",
+    "random",
+    "shutil",
+    "struct",
+    "zlib",
+}
+
+# import apathetic_logging may cost at most this many times import logging
+MAX_RATIO_TO_LOGGING = 1.5
+
+RUNS = 5
+
+
+def _path_entry() -> Path:
+    # not apathetic_logging.__file__: other integration tests swap the module
+    if os.getenv("RUNTIME_MODE", "installed") == "singlefile":
+        return PROJ_ROOT / "dist"
+    return PROJ_ROOT / "src"
+
+
+def _run_importtime(path_entry: Path) -> list[tuple[int, str]]:
+    """Return (cumulative us, indented module name) for each import line."""
+    env = {**os.environ, "PYTHONPATH": str(path_entry)}
+    result = subprocess.run(  # noqa: S603
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            "import typing; import logging; import apathetic_logging",
+        ],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    lines: list[tuple[int, str]] = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        lines.append((int(cumulative), name.rstrip()))
+    return lines
+
+
+def _package_imports(lines: list[tuple[int, str]]) -> set[str]:
+    """Return the modules imported while importing apathetic_logging."""
+    names = [name for _, name in lines]
+    # everything reported after logging finished belongs to our import
+    start = names.index(" logging") + 1
+    end = names.index(" apathetic_logging")
+    return {name.strip() for name in names[start:end]}
+
+
+def _cumulative(lines: list[tuple[int, str]], top_level: str) -> int:
+    return next(us for us, name in lines if name == f" {top_level}")
+
+
+def test_deferred_modules_are_not_imported() -> None:
+    """Importing the package should not load feature-only stdlib modules."""
+    # --- setup ---
+    path_entry = _path_entry()
+
+    # --- execute ---
+    imported = _package_imports(_run_importtime(path_entry))
+
+    # --- verify ---
+    eager = sorted(DEFERRED_MODULES & {name.split(".")[0] for name in imported})
+    assert not eager, f"imported at package import: {eager}"
+
+
+def test_cold_import_time_is_bounded() -> None:
+    """Importing the package should cost about as much as importing logging."""
+    # --- setup ---
+    path_entry = _path_entry()
+    # measure imports, not compiling (PYTHONDONTWRITEBYTECODE may be set)
+    compileall.compile_dir(path_entry, quiet=2)
+
+    # --- execute ---
+    logging_us: list[int] = []
+    package_us: list[int] = []
+    for _ in range(RUNS):
+        lines = _run_importtime(path_entry)
+        logging_us.append(_cumulative(lines, "logging"))
+        package_us.append(_cumulative(lines, "apathetic_logging"))
+
+    # --- verify ---
+    # the fastest run of each is the least disturbed by other processes
+    ratio = min(package_us) / min(logging_us)
+    assert ratio <= MAX_RATIO_TO_LOGGING, (
+        f"import apathetic_logging took {min(package_us)}us,"
+        f" {ratio:.2f}x import logging ({min(logging_us)}us)"
+    )
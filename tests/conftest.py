@@ -37,6 +37,38 @@ import apathetic_logging as mod_alogs  # noqa: E402
 import apathetic_logging.registry_data as mod_registry  # noqa: E402
 
 
+# Registry values reset to None around every test
+_RESET_REGISTRY_ATTRS = (
+    "registered_internal_logger_name",
+    "registered_internal_default_log_level",
+    "registered_internal_log_level_env_vars",
+    "registered_internal_compatibility_mode",
+    "registered_internal_propagate",
+    "registered_internal_async_mode",
+    "registered_internal_async_queue_size",
+    "registered_internal_async_overflow",
+    "registered_internal_buffered_output",
+    "registered_internal_buffer_size",
+    "registered_internal_buffer_flush_interval",
+    "registered_internal_flight_recorder",
+    "registered_internal_flight_recorder_capacity",
+    "registered_internal_flight_recorder_level",
+    "registered_internal_flight_recorder_path",
+    "registered_internal_output_format",
+    "registered_internal_process_queue",
+    "registered_internal_sampling",
+    "registered_internal_segment_output",
+    "registered_internal_segment_directory",
+    "registered_internal_segment_size",
+    "registered_internal_segment_sync_interval",
+    "registered_internal_segment_sync_level",
+    "registered_internal_segment_record_format",
+    "registered_internal_sampling_key",
+    "registered_internal_metrics",
+    "registered_internal_below_level_hooks",
+)
+
+
 @pytest.fixture(autouse=True)
 def reset_logger_class_and_registry() -> Generator[None, None, None]:
     """Reset logger class and registry state before and after each test.
@@ -48,10 +80,9 @@ def reset_logger_class_and_registry() -> Generator[None, None, None]:
     # Save original state
     original_logger_class = logging.getLoggerClass()
     _registry = mod_registry.ApatheticLogging_Internal_RegistryData
-    original_name = _registry.registered_internal_logger_name
-    original_default = _registry.registered_internal_default_log_level
-    original_env_vars = _registry.registered_internal_log_level_env_vars
-    original_compatibility_mode = _registry.registered_internal_compatibility_mode
+    original_registry = {
+        attr: getattr(_registry, attr) for attr in _RESET_REGISTRY_ATTRS
+    }
 
     # Clear any existing loggers from the registry
     _logging_utils = mod_alogs.apathetic_logging
@@ -70,13 +101,17 @@ def reset_logger_class_and_registry() -> Generator[None, None, None]:
     mod_alogs.Logger.addLevelName(_constants.DETAIL_LEVEL, "DETAIL")
     mod_alogs.Logger.addLevelName(_constants.MINIMAL_LEVEL, "MINIMAL")
     mod_alogs.Logger.addLevelName(_constants.SILENT_LEVEL, "SILENT")
-    _registry.registered_internal_logger_name = None
-    _registry.registered_internal_default_log_level = None
-    _registry.registered_internal_log_level_env_vars = None
-    _registry.registered_internal_compatibility_mode = None
+    for attr in _RESET_REGISTRY_ATTRS:
+        setattr(_registry, attr, None)
+    mod_alogs.invalidateConfigSnapshot()
 
     yield
 
+    # Write anything a test left queued and stop the async writer thread
+    mod_alogs.stopAsyncWriter()
+    # Close the segment a test left open so the next one starts fresh
+    mod_alogs.closeSegmentHandler()
+
     # Clear loggers again after test
     logger_names = list(logging.Logger.manager.loggerDict.keys())
     for logger_name in logger_names:
@@ -92,10 +127,9 @@ def reset_logger_class_and_registry() -> Generator[None, None, None]:
     mod_alogs.Logger.addLevelName(_constants.DETAIL_LEVEL, "DETAIL")
     mod_alogs.Logger.addLevelName(_constants.MINIMAL_LEVEL, "MINIMAL")
     mod_alogs.Logger.addLevelName(_constants.SILENT_LEVEL, "SILENT")
-    _registry.registered_internal_logger_name = original_name
-    _registry.registered_internal_default_log_level = original_default
-    _registry.registered_internal_log_level_env_vars = original_env_vars
-    _registry.registered_internal_compatibility_mode = original_compatibility_mode
+    for attr, value in original_registry.items():
+        setattr(_registry, attr, value)
+    mod_alogs.invalidateConfigSnapshot()
 
 
 # ----------------------------------------------------------------------